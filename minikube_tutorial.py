@@ -7,14 +7,55 @@ Version: 1.0.0
 
 import os
 import sys
+import queue
+import argparse
+import atexit
+import base64
+import asyncio
+import bisect
+import fnmatch
 import subprocess
+import tempfile
+import gzip
+import hashlib
+import hmac
+import heapq
+import itertools
+import http.client
+import io
 import json
 import logging
-from datetime import datetime
+import marshal
+import math
+import mmap
+import platform
+import random
+import re
+import select
+import shlex
+import ssl
+import struct
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+import zlib
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FutureTimeout, wait
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import time
 
+try:
+    import fcntl
+    import termios
+    import tty
+except ImportError:  # Windows
+    fcntl = termios = None
+
 # Setup logging
 LOG_DIR = Path.home() / ".minikube_tutorial" / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -41,17 +82,5649 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+
+# Manifest parsing (block-style YAML subset used by Kubernetes manifests, stdlib only)
+class ManifestParser:
+    """Parse the YAML subset found in Kubernetes manifests into Python objects"""
+
+    # Part of the manifest cache key: bump whenever parsing output can change
+    VERSION = 3
+    # Anchors, aliases, tags, complex keys, directives and reserved characters: rejected, not read as text
+    INDICATORS = "&*!?%@`"
+    INTEGER = re.compile(r"[-+]?(0b[01_]+|0x[0-9a-fA-F_]+|0[0-7_]+|[1-9][0-9_]*|0)$")
+    SPECIAL_FLOATS = {".inf": math.inf, ".Inf": math.inf, ".INF": math.inf, "+.inf": math.inf, "+.Inf": math.inf,
+                      "+.INF": math.inf, "-.inf": -math.inf, "-.Inf": -math.inf, "-.INF": -math.inf,
+                      ".nan": math.nan, ".NaN": math.nan, ".NAN": math.nan}
+
+    def __init__(self, text: str):
+        self.source = text.splitlines()
+        self.raw = text.expandtabs(2).splitlines()
+        self.lines: List[Optional[Tuple[int, str]]] = []
+        for raw in self.raw:
+            content = self._strip_comment(raw).rstrip()
+            stripped = content.lstrip(" ")
+            self.lines.append((len(content) - len(stripped), stripped) if stripped else None)
+
+    @staticmethod
+    def _strip_comment(line: str) -> str:
+        quote = None
+        for i, ch in enumerate(line):
+            if quote:
+                if ch == quote:
+                    quote = None
+            elif ch in "\"'" and (i == 0 or line[i - 1] in " -[{,:"):
+                quote = ch
+            elif ch == "#" and (i == 0 or line[i - 1] in " \t"):
+                return line[:i]
+        return line
+
+    @staticmethod
+    def _split_key(content: str) -> Optional[Tuple[str, str]]:
+        """Split 'key: value' outside quotes; None when the line is not a mapping entry"""
+        quote = None
+        for i, ch in enumerate(content):
+            if quote:
+                if ch == quote:
+                    quote = None
+            elif ch in "\"'" and i == 0:
+                quote = ch
+            elif ch in "[{" and i == 0:
+                return None
+            elif ch == ":" and (i + 1 == len(content) or content[i + 1] == " "):
+                key = content[:i].strip()
+                if key[:1] in "\"'" and key[-1:] == key[:1]:
+                    key = key[1:-1]
+                return key, content[i + 1:].strip()
+        return None
+
+    def documents(self) -> List:
+        """Every non-empty document in the text; ValueError for lines that fit nowhere"""
+        return [value for value, _ in self.sections()]
+
+    def sections(self) -> List[Tuple[object, str]]:
+        """(parsed value, original text) of every non-empty document, split on '---' lines"""
+        docs, start = [], 0
+        for i, raw in enumerate(self.raw + ["---"]):
+            if raw.startswith("---") and raw[3:].strip()[:1] in ("", "#"):
+                value, stop = self._block(start, i, 0)
+                left = self._next(stop, i)
+                if left < i:
+                    raise ValueError(f"Unsupported YAML at line {left + 1}: {self.lines[left][1]}")
+                if value is not None:
+                    docs.append((value, "\n".join(self.source[start:i]) + "\n"))
+                start = i + 1
+        return docs
+
+    def _next(self, i: int, end: int) -> int:
+        while i < end and self.lines[i] is None:
+            i += 1
+        return i
+
+    def _block(self, i: int, end: int, min_indent: int):
+        i = self._next(i, end)
+        if i >= end or self.lines[i][0] < min_indent:
+            return None, i
+        indent, content = self.lines[i]
+        if content == "-" or content.startswith("- "):
+            return self._sequence(i, end, indent)
+        if self._split_key(content) is None:
+            return self._folded(i, end, indent - 1, content)
+        return self._mapping(i, end, indent)
+
+    def _folded(self, i: int, end: int, indent: int, first: str):
+        """A scalar starting on line i plus its continuation lines (indented deeper than indent)"""
+        parts, j = [first], i + 1
+        quote = first[:1] if first[:1] in "\"'" else None
+        if first[:1] in self.INDICATORS:
+            raise ValueError(f"Unsupported YAML at line {i + 1}: {first}")
+        while True:
+            k = self._next(j, end)
+            if k >= end or self.lines[k][0] <= indent:
+                break
+            if quote is None and self._split_key(self.lines[k][1]) is not None:
+                raise ValueError(f"Unsupported YAML at line {k + 1}: {self.lines[k][1]}")
+            # Each blank line in between becomes a newline, otherwise lines join with a space
+            line = self.raw[k].strip() if quote else self.lines[k][1]
+            parts.append("\n" * (k - j) if k > j else " ")
+            parts.append(line)
+            j = k + 1
+        return self._scalar("".join(parts)), j
+
+    def _mapping(self, i: int, end: int, indent: int):
+        result = {}
+        while True:
+            i = self._next(i, end)
+            if i >= end or self.lines[i][0] != indent:
+                return result, i
+            content = self.lines[i][1]
+            if content == "-" or content.startswith("- "):
+                return result, i
+            split = self._split_key(content)
+            if split is None or content[:1] in self.INDICATORS:
+                raise ValueError(f"Unsupported YAML at line {i + 1}: {content}")
+            key, value = split
+            if value[:1] in ("|", ">"):
+                result[key], i = self._block_scalar(i, end, indent, value)
+                continue
+            if value:
+                result[key], i = self._folded(i, end, indent, value)
+                continue
+            j = self._next(i + 1, end)
+            if j < end and self.lines[j][0] > indent:
+                result[key], i = self._block(j, end, self.lines[j][0])
+            elif j < end and self.lines[j][0] == indent and (self.lines[j][1] == "-" or
+                                                              self.lines[j][1].startswith("- ")):
+                result[key], i = self._sequence(j, end, indent)
+            else:
+                result[key], i = None, i + 1
+
+    def _sequence(self, i: int, end: int, indent: int):
+        result = []
+        while True:
+            i = self._next(i, end)
+            if i >= end or self.lines[i][0] != indent:
+                return result, i
+            content = self.lines[i][1]
+            if not (content == "-" or content.startswith("- ")):
+                return result, i
+            rest = content[1:].lstrip(" ")
+            if not rest:
+                j = self._next(i + 1, end)
+                if j < end and self.lines[j][0] > indent:
+                    value, i = self._block(j, end, self.lines[j][0])
+                else:
+                    value, i = None, i + 1
+            elif rest == "-" or rest.startswith("- "):
+                # "- - x" opens a nested sequence at the inner dash's column
+                self.lines[i] = (indent + len(content) - len(rest), rest)
+                value, i = self._sequence(i, end, self.lines[i][0])
+            elif rest[:1] in ("|", ">"):
+                value, i = self._block_scalar(i, end, indent, rest)
+            elif self._split_key(rest) is not None:
+                # "- key: value" opens a mapping indented at the key's column
+                self.lines[i] = (indent + len(content) - len(rest), rest)
+                value, i = self._mapping(i, end, self.lines[i][0])
+            else:
+                value, i = self._folded(i, end, indent, rest)
+            result.append(value)
+
+    def _block_scalar(self, i: int, end: int, indent: int, header: str):
+        """'|' keeps line breaks, '>' folds them; '-' strips the final newline, '+' keeps every trailing one"""
+        style, chomp = header[0], header[1:]
+        if chomp not in ("", "-", "+"):
+            raise ValueError(f"Unsupported YAML at line {i + 1}: {header}")
+        body, j = [], i + 1
+        while j < end and (not self.raw[j].strip() or len(self.raw[j]) - len(self.raw[j].lstrip(" ")) > indent):
+            body.append(self.raw[j])
+            j += 1
+        trailing = 0
+        while body and not body[-1].strip():
+            body.pop()
+            trailing += 1
+        if body:
+            margin = min(len(line) - len(line.lstrip(" ")) for line in body if line.strip())
+            body = [line[margin:] if line.strip() else "" for line in body]
+        text = "\n".join(body) if style == "|" else self._fold(body)
+        if chomp == "+":
+            text += "\n" * (trailing + 1 if text else trailing)
+        elif chomp != "-" and text:
+            text += "\n"
+        return text, j
+
+    @staticmethod
+    def _fold(lines: List[str]) -> str:
+        """Join folded lines with spaces; blank lines become newlines and more-indented lines keep theirs"""
+        parts, blanks, last = [], 0, None
+        for line in lines:
+            if not line:
+                blanks += 1
+                continue
+            indented = line[:1] == " "
+            if last is None:
+                parts.append("\n" * blanks)
+            elif not last and not indented:
+                parts.append("\n" * blanks if blanks else " ")
+            else:
+                parts.append("\n" * (blanks + 1))
+            parts.append(line)
+            last, blanks = indented, 0
+        return "".join(parts)
+
+    def _scalar(self, text: str):
+        if text[:1] in ("[", "{"):
+            value, _ = self._flow(text, 0)
+            return value
+        if len(text) >= 2 and text[0] == text[-1] == '"':
+            return json.loads(text)
+        if len(text) >= 2 and text[0] == text[-1] == "'":
+            return text[1:-1].replace("''", "'")
+        if text in ("null", "~", "Null", "NULL"):
+            return None
+        if text in ("true", "True", "TRUE", "yes", "Yes", "YES", "on", "On", "ON"):
+            return True
+        if text in ("false", "False", "FALSE", "no", "No", "NO", "off", "Off", "OFF"):
+            return False
+        if self.INTEGER.match(text):
+            # YAML 1.1 integers as Kubernetes reads them: 0x1F, 0b101, and a leading 0 for octal (0644)
+            sign, digits = (-1 if text[0] == "-" else 1), text.lstrip("+-").replace("_", "")
+            if digits[:2] in ("0x", "0b"):
+                return sign * int(digits[2:], 16 if digits[1] == "x" else 2)
+            return sign * int(digits, 8 if len(digits) > 1 and digits[0] == "0" else 10)
+        if text in self.SPECIAL_FLOATS:
+            return self.SPECIAL_FLOATS[text]
+        if any(c.isdigit() for c in text) and all(c in "0123456789.eE+-" for c in text):
+            try:
+                return float(text)
+            except ValueError:
+                pass
+        return text
+
+    def _flow(self, text: str, i: int):
+        """Parse a flow collection ([a, b] / {k: v}) starting at text[i]"""
+        opener = text[i]
+        closer = "]" if opener == "[" else "}"
+        items: List = []
+        mapping: Dict = {}
+        i += 1
+        while True:
+            while i < len(text) and text[i] in " ,":
+                i += 1
+            if i >= len(text):
+                raise ValueError(f"Unterminated flow collection: {text}")
+            if text[i] == closer:
+                return (items if opener == "[" else mapping), i + 1
+            if text[i] in "[{":
+                value, i = self._flow(text, i)
+            else:
+                start = i
+                if text[i] in "\"'":
+                    i = text.index(text[i], i + 1) + 1
+                elif text[i] in self.INDICATORS:
+                    raise ValueError(f"Unsupported YAML in flow collection: {text}")
+                else:
+                    while i < len(text) and text[i] not in ",]}" and text[i:i + 2] != ": ":
+                        i += 1
+                value = self._scalar(text[start:i].strip())
+            while i < len(text) and text[i] == " ":
+                i += 1
+            if opener == "{" and text[i:i + 1] == ":":
+                i += 1
+                while i < len(text) and text[i] == " ":
+                    i += 1
+                if text[i] in "[{":
+                    mapping[value], i = self._flow(text, i)
+                else:
+                    start = i
+                    if text[i] in "\"'":
+                        i = text.index(text[i], i + 1) + 1
+                    elif text[i] in self.INDICATORS:
+                        raise ValueError(f"Unsupported YAML in flow collection: {text}")
+                    else:
+                        while i < len(text) and text[i] not in ",}":
+                            i += 1
+                    mapping[value] = self._scalar(text[start:i].strip())
+            else:
+                items.append(value)
+
+
+class ManifestCache:
+    """Parsed manifests keyed by content hash, kept as marshal blobs on disk and in a bounded LRU
+
+    A path is re-hashed only when its size or mtime changes, and re-parsed only when the
+    hash is new. Each entry also records (kind, name, namespace, labels) per document, so
+    find() can answer lookups from that summary and unmarshal only the files that match.
+    Every load returns freshly decoded objects, so callers may modify what they get.
+    """
+
+    FORMAT = f"1:{ManifestParser.VERSION}:{marshal.version}:{sys.version_info[0]}.{sys.version_info[1]}"
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = 16 << 20, max_files: int = 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.hits = self.misses = self.parses = 0
+        self._lock = threading.RLock()
+        self._blobs: "OrderedDict[str, bytes]" = OrderedDict()
+        self._blob_bytes = 0
+        self._dirty = False
+        self._paths: Optional[Dict[str, List]] = None
+        self._summaries: Dict[str, List[Dict]] = {}
+
+    # Persistence
+    def _paths_file(self) -> Optional[Path]:
+        return self.directory / "paths.marshal" if self.directory else None
+
+    def _load_paths(self) -> Dict[str, List]:
+        if self._paths is None:
+            self._paths = {}
+            try:
+                stored = marshal.loads(self._paths_file().read_bytes())
+                if stored.get("format") == self.FORMAT:
+                    self._paths, self._summaries = stored["paths"], stored["summaries"]
+            except (OSError, ValueError, EOFError, TypeError, AttributeError, KeyError):
+                pass
+        return self._paths
+
+    def _save_paths(self):
+        if not self.directory:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Forget files that are gone (temp manifests and the like) so the map stays bounded
+            for path in [p for p in self._paths if not os.path.exists(p)]:
+                del self._paths[path]
+            live = {entry[2] for entry in self._paths.values()}
+            self._summaries = {key: value for key, value in self._summaries.items() if key in live}
+            tmp = self._paths_file().with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(marshal.dumps({"format": self.FORMAT, "paths": self._paths, "summaries": self._summaries}))
+            os.replace(tmp, self._paths_file())
+        except OSError as e:
+            logger.debug(f"Manifest cache index not saved: {e}")
+
+    def _store(self, key: str, blob: bytes):
+        """Keep a blob in the LRU (and on disk), evicting least recently used entries past max_bytes"""
+        self._blobs[key] = blob
+        self._blobs.move_to_end(key)
+        self._blob_bytes += len(blob)
+        while self._blob_bytes > self.max_bytes and len(self._blobs) > 1:
+            _, evicted = self._blobs.popitem(last=False)
+            self._blob_bytes -= len(evicted)
+
+    def _write_blob(self, key: str, blob: bytes):
+        if not self.directory:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = self.directory / f"{key}.{os.getpid()}.tmp"
+            tmp.write_bytes(blob)
+            os.replace(tmp, self.directory / f"{key}.bin")
+            blobs = list(self.directory.glob("*.bin"))
+            if len(blobs) > self.max_files:
+                for old in sorted(blobs, key=lambda p: p.stat().st_mtime)[:len(blobs) - self.max_files]:
+                    old.unlink()
+        except OSError as e:
+            logger.debug(f"Manifest cache blob not saved: {e}")
+
+    # Loading
+    @staticmethod
+    def summarize(docs: List[Dict]) -> List[Dict]:
+        return [{"kind": doc.get("kind", ""), "name": (doc.get("metadata") or {}).get("name", ""),
+                 "namespace": (doc.get("metadata") or {}).get("namespace", ""),
+                 "labels": dict((doc.get("metadata") or {}).get("labels") or {})} for doc in docs]
+
+    def _key(self, path: str) -> str:
+        """Content hash for a path, recomputed only when its size or mtime changed"""
+        st = os.stat(path)
+        paths = self._load_paths()
+        entry = paths.get(path)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        with open(path, "rb") as f:
+            key = hashlib.sha256(self.FORMAT.encode() + b"\0" + f.read()).hexdigest()
+        paths[path] = [st.st_size, st.st_mtime_ns, key]
+        self._dirty = True
+        return key
+
+    def _blob(self, path: str, key: str) -> bytes:
+        blob = self._blobs.get(key)
+        if blob is not None:
+            self._blobs.move_to_end(key)
+            self.hits += 1
+            return blob
+        if self.directory:
+            try:
+                blob = (self.directory / f"{key}.bin").read_bytes()
+                self.hits += 1
+            except OSError:
+                blob = None
+        if blob is None:
+            self.misses += 1
+            self.parses += 1
+            with open(path) as f:
+                docs = [doc for doc in ManifestParser(f.read()).documents() if isinstance(doc, dict)]
+            blob = marshal.dumps(docs)
+            self._summaries[key] = self.summarize(docs)
+            self._dirty = True
+            self._write_blob(key, blob)
+        self._store(key, blob)
+        return blob
+
+    def load(self, path) -> List[Dict]:
+        path = os.path.abspath(path)
+        with self._lock:
+            self._dirty = False
+            key = self._key(path)
+            blob = self._blob(path, key)
+            if key not in self._summaries:
+                self._summaries[key] = self.summarize(marshal.loads(blob))
+                self._dirty = True
+            if self._dirty:
+                self._save_paths()
+        return marshal.loads(blob)
+
+    def load_many(self, paths: List) -> Dict[str, List[Dict]]:
+        return {str(path): self.load(path) for path in paths}
+
+    # Lookups
+    def summary(self, path) -> List[Dict]:
+        """(kind, name, namespace, labels) per document without decoding the documents"""
+        path = os.path.abspath(path)
+        with self._lock:
+            self._dirty = False
+            key = self._key(path)
+            if key not in self._summaries:
+                self._blob(path, key)
+            if self._dirty:
+                self._save_paths()
+            return self._summaries.get(key) or self.summarize(marshal.loads(self._blob(path, key)))
+
+    def find(self, paths: List, kind: Optional[str] = None, name: Optional[str] = None,
+             labels: Optional[Dict[str, str]] = None) -> List[Tuple[str, Dict]]:
+        """(path, document) pairs matching kind (case-insensitive), name and every given label"""
+        found = []
+        for path in paths:
+            matches = [i for i, row in enumerate(self.summary(path))
+                       if (kind is None or row["kind"].lower() == kind.lower())
+                       and (name is None or row["name"] == name)
+                       and all(row["labels"].get(k) == v for k, v in (labels or {}).items())]
+            if matches:
+                docs = self.load(path)
+                found += [(str(path), docs[i]) for i in matches]
+        return found
+
+    def stats(self) -> Dict:
+        return {"hits": self.hits, "misses": self.misses, "parses": self.parses,
+                "cached_files": len(self._blobs), "cached_bytes": self._blob_bytes}
+
+
+MANIFEST_CACHE = ManifestCache(Path.home() / ".minikube_tutorial" / "manifest_cache")
+
+
+def load_manifest(path) -> List[Dict]:
+    """Parse every document of a Kubernetes YAML manifest (served from the content-hash cache)"""
+    return MANIFEST_CACHE.load(path)
+
+
+def manifest_images(docs: List[Dict]) -> List[str]:
+    """Container images referenced by the workloads in a parsed manifest"""
+    images = []
+    for doc in docs:
+        spec = doc.get("spec") or {}
+        pod_specs = [spec] if doc.get("kind") == "Pod" else []
+        template = (spec.get("jobTemplate") or {}).get("spec", spec).get("template") or {}
+        if template.get("spec"):
+            pod_specs.append(template["spec"])
+        for pod_spec in pod_specs:
+            for container in (pod_spec.get("initContainers") or []) + (pod_spec.get("containers") or []):
+                if container.get("image") and container["image"] not in images:
+                    images.append(container["image"])
+    return images
+
+
+def container_env(container: Dict, docs: List[Dict], namespace: Optional[str] = None) -> Dict[str, str]:
+    """Environment a container sees, resolving envFrom and ConfigMap/Secret key references from the same manifest"""
+    config: Dict[Tuple[str, str, str], Dict[str, str]] = {}
+    for doc in docs:
+        if doc.get("kind") not in ("ConfigMap", "Secret"):
+            continue
+        meta = doc.get("metadata") or {}
+        data = {k: str(v) for k, v in (doc.get("data") or {}).items()}
+        if doc["kind"] == "Secret":
+            try:
+                data = {k: base64.b64decode(v).decode() for k, v in data.items()}
+            except (ValueError, UnicodeDecodeError):
+                data = {}
+        data.update({k: str(v) for k, v in (doc.get("stringData") or {}).items()})
+        config[(doc["kind"], meta.get("namespace") or namespace or "", meta.get("name", ""))] = data
+
+    def lookup(kind: str, ref: Dict) -> Dict[str, str]:
+        return config.get((kind, namespace or "", ref.get("name", ""))) or {}
+
+    env: Dict[str, str] = {}
+    for source in container.get("envFrom") or []:
+        if source.get("configMapRef"):
+            data = lookup("ConfigMap", source["configMapRef"])
+        else:
+            data = lookup("Secret", source.get("secretRef") or {})
+        env.update({source.get("prefix", "") + k: v for k, v in data.items()})
+    for item in container.get("env") or []:
+        if "value" in item:
+            env[item["name"]] = str(item["value"])
+            continue
+        ref_from = item.get("valueFrom") or {}
+        for ref_key, kind in (("configMapKeyRef", "ConfigMap"), ("secretKeyRef", "Secret")):
+            ref = ref_from.get(ref_key)
+            if ref and ref.get("key") in lookup(kind, ref):
+                env[item["name"]] = lookup(kind, ref)[ref["key"]]
+    return env
+
+
+# Image prefetch into the minikube node
+def normalize_image(name: str) -> str:
+    """Canonical short form of an image reference (docker.io/library/nginx -> nginx:latest)"""
+    for prefix in ("docker.io/library/", "docker.io/", "index.docker.io/library/", "index.docker.io/"):
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+            break
+    if "@" not in name and ":" not in name.rsplit("/", 1)[-1]:
+        name += ":latest"
+    return name
+
+
+class ImagePrefetcher:
+    """Load the images a set of recipes needs into the node before they are applied"""
+
+    def __init__(self, runner: Callable[..., Tuple[bool, str]], max_workers: int = 4):
+        self.runner = runner
+        self.max_workers = max(1, max_workers)
+
+    def node_images(self) -> set:
+        """Images already present on the node"""
+        success, output = self.runner(["minikube", "image", "ls"], "Listing node images")
+        return {normalize_image(line.strip()) for line in output.splitlines() if line.strip()} if success else set()
+
+    def _fetch(self, image: str) -> Dict:
+        started = time.monotonic()
+        ok, output = self.runner(["minikube", "image", "load", image], f"Loading {image}", timeout=900)
+        method = "load"
+        if not ok:
+            # Not in the host cache: have the node pull it directly
+            ok, output = self.runner(["minikube", "image", "pull", image], f"Pulling {image}", timeout=900)
+            method = "pull"
+        return {"image": image, "ok": ok, "method": method, "duration": round(time.monotonic() - started, 3),
+                "error": "" if ok else output.strip()}
+
+    def prefetch(self, images: List[str]) -> Dict:
+        """Fetch every image missing from the node concurrently"""
+        started = time.monotonic()
+        wanted = list(dict.fromkeys(normalize_image(i) for i in images))
+        present = self.node_images()
+        missing = [i for i in wanted if i not in present]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(self._fetch, missing))
+        return {"requested": len(wanted), "present": [i for i in wanted if i in present],
+                "fetched": results, "ok": all(r["ok"] for r in results),
+                "duration": round(time.monotonic() - started, 3)}
+
+    @staticmethod
+    def print_report(report: Dict):
+        """Print a prefetch summary"""
+        print(f"\n{Colors.BOLD}Image prefetch: {report['requested']} image(s), "
+              f"{len(report['present'])} already on node, {report['duration']:.1f}s total{Colors.ENDC}")
+        for image in report["present"]:
+            print(f"  {Colors.OKCYAN}= {image}{Colors.ENDC} (cached)")
+        for result in report["fetched"]:
+            if result["ok"]:
+                print(f"  {Colors.OKGREEN}✓ {result['image']}{Colors.ENDC} ({result['method']}, "
+                      f"{result['duration']:.1f}s)")
+            else:
+                print(f"  {Colors.FAIL}✗ {result['image']}: {result['error']}{Colors.ENDC}")
+        print()
+
+
+# Image builds (parallel, skipped when the context is unchanged, delivered by registry push or image load)
+class ImageBuilder:
+    """Build every Dockerfile and compose build context concurrently and deliver the images to the node
+
+    A context's hash covers the files .dockerignore does not exclude, the Dockerfile path
+    and the build args; file digests are reused while size and mtime are unchanged, so an
+    unchanged tree costs only stat calls. Contexts whose hash matches the last delivered
+    build are skipped. Builds run side by side on one BuildKit daemon and share its layer
+    cache. Images reach the node through the registry addon (only new layers travel) or
+    'minikube image load' (the whole image is copied), chosen per image from its size and
+    the throughput measured on earlier deliveries.
+    """
+
+    HASH_LABEL = "minikube-tutorial/context-hash"
+    SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv", ".tox"}
+    COMPOSE_FILES = ("docker-compose*.yml", "docker-compose*.yaml", "compose*.yml", "compose*.yaml")
+    REGISTRY_MIN_BYTES = 150 << 20
+    BUILD_ENV = {"DOCKER_BUILDKIT": "1"}
+
+    def __init__(self, runner: Callable[..., Tuple[bool, str]], cache_file: Path, registry: str = "localhost:5000",
+                 max_workers: int = 4, deliver: str = "auto", tag: str = "latest"):
+        if deliver not in ("auto", "load", "registry"):
+            raise ValueError(f"Unknown delivery method: {deliver}")
+        self.runner = runner
+        self.cache_file = cache_file
+        self.registry = registry
+        self.max_workers = max(1, max_workers)
+        self.deliver_method = deliver
+        self.tag = tag
+        self._registry_up: Optional[bool] = None
+        self._lock = threading.Lock()
+        try:
+            self.cache = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            self.cache = {}
+        for key in ("files", "images", "rates"):
+            self.cache.setdefault(key, {})
+
+    # Discovery
+    @classmethod
+    def discover(cls, root: Path, compose_files: Optional[List[Path]] = None) -> List[Dict]:
+        """Build contexts from compose 'build:' entries plus any other Dockerfile under root"""
+        root = Path(root).resolve()
+        contexts: Dict[Tuple[str, str], Dict] = {}
+        if compose_files is None:
+            compose_files = sorted(p for pattern in cls.COMPOSE_FILES for p in root.glob(pattern))
+        for compose in compose_files:
+            try:
+                doc = next(iter(load_manifest(compose)), {})
+            except (OSError, ValueError):
+                continue
+            project = label_value(compose.resolve().parent.name)
+            for service, spec in (doc.get("services") or {}).items():
+                build = (spec or {}).get("build")
+                if not build:
+                    continue
+                build = {"context": build} if isinstance(build, str) else build
+                context = (compose.resolve().parent / str(build.get("context", "."))).resolve()
+                dockerfile = (context / str(build.get("dockerfile", "Dockerfile"))).resolve()
+                args = build.get("args") or {}
+                if isinstance(args, list):
+                    args = dict(str(a).split("=", 1) if "=" in str(a) else (str(a), "") for a in args)
+                image = str(spec.get("image") or f"{project}-{label_value(service)}")
+                if ":" in image.rsplit("/", 1)[-1]:
+                    image = image.rsplit(":", 1)[0]
+                contexts[(str(context), str(dockerfile))] = {
+                    "name": service, "image": image, "context": str(context), "dockerfile": str(dockerfile),
+                    "args": {str(k): str(v) for k, v in args.items()}, "source": str(compose)}
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d not in cls.SKIP_DIRS)
+            for filename in sorted(filenames):
+                if not (filename == "Dockerfile" or filename.startswith("Dockerfile.") or filename.endswith(".Dockerfile")):
+                    continue
+                context, dockerfile = Path(dirpath).resolve(), Path(dirpath, filename).resolve()
+                if (str(context), str(dockerfile)) in contexts:
+                    continue
+                variant = filename.replace("Dockerfile", "").strip(".")
+                name = label_value(context.name) + (f"-{label_value(variant)}" if variant else "")
+                contexts[(str(context), str(dockerfile))] = {
+                    "name": name, "image": name, "context": str(context), "dockerfile": str(dockerfile),
+                    "args": {}, "source": str(dockerfile)}
+        return sorted(contexts.values(), key=lambda c: c["name"])
+
+    # Hashing
+    @staticmethod
+    def _pattern_regex(pattern: str) -> "re.Pattern":
+        """Docker's .dockerignore glob: '*' and '?' stay within one path segment, '**' spans segments"""
+        out, i = [], 0
+        while i < len(pattern):
+            ch = pattern[i]
+            if pattern.startswith("**", i):
+                i += 2
+                if pattern[i:i + 1] == "/":
+                    out.append("(?:.*/)?")
+                    i += 1
+                else:
+                    out.append(".*")
+                continue
+            if ch == "*":
+                out.append("[^/]*")
+            elif ch == "?":
+                out.append("[^/]")
+            elif ch == "[" and "]" in pattern[i + 1:]:
+                close = pattern.index("]", i + 1)
+                body = pattern[i + 1:close]
+                out.append("[" + ("^" + body[1:] if body[:1] in "!^" and body else body).replace("\\", "\\\\") + "]")
+                i = close
+            elif ch == "\\" and i + 1 < len(pattern):
+                i += 1
+                out.append(re.escape(pattern[i]))
+            else:
+                out.append(re.escape(ch))
+            i += 1
+        return re.compile("".join(out) + r"\Z")
+
+    @classmethod
+    def _ignore_patterns(cls, context: Path) -> List[Tuple[bool, "re.Pattern"]]:
+        try:
+            lines = (context / ".dockerignore").read_text().splitlines()
+        except OSError:
+            return []
+        patterns = []
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                negate = line.startswith("!")
+                pattern = os.path.normpath(line[1:].strip() if negate else line).lstrip("/")
+                if pattern and pattern != ".":
+                    patterns.append((negate, cls._pattern_regex(pattern)))
+        return patterns
+
+    @staticmethod
+    def _ignored(rel: str, patterns: List[Tuple[bool, "re.Pattern"]]) -> bool:
+        """Last matching pattern wins; a pattern matching a parent directory covers everything below it"""
+        parts = rel.split("/")
+        candidates = ["/".join(parts[:n]) for n in range(len(parts), 0, -1)]
+        ignored = False
+        for negate, regex in patterns:
+            if any(regex.match(candidate) for candidate in candidates):
+                ignored = not negate
+        return ignored
+
+    def context_hash(self, ctx: Dict) -> Tuple[str, Dict[str, List]]:
+        """Digest of the build inputs, plus the per-file digests to remember for next time"""
+        context = Path(ctx["context"])
+        patterns = self._ignore_patterns(context)
+        digest = hashlib.sha256(json.dumps([os.path.relpath(ctx["dockerfile"], context), ctx["args"]],
+                                           sort_keys=True).encode())
+        known, seen = self.cache["files"], {}
+        # With '!' exceptions an ignored directory may still hold included files, so only prune without them
+        prune = not any(negate for negate, _ in patterns)
+        for dirpath, dirnames, filenames in os.walk(context):
+            dirnames.sort()
+            rel_dir = os.path.relpath(dirpath, context)
+            if prune:
+                dirnames[:] = [d for d in dirnames
+                               if not self._ignored(os.path.normpath(os.path.join(rel_dir, d)), patterns)]
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                rel = os.path.normpath(os.path.join(rel_dir, filename))
+                if self._ignored(rel, patterns) and path != ctx["dockerfile"]:
+                    continue
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entry = known.get(path)
+                if not entry or entry[0] != st.st_size or entry[1] != st.st_mtime_ns:
+                    with open(path, "rb") as f:
+                        entry = [st.st_size, st.st_mtime_ns, hashlib.sha256(f.read()).hexdigest()]
+                seen[path] = entry
+                digest.update(f"{rel}\0{st.st_mode & 0o111:o}\0{entry[2]}\n".encode())
+        return digest.hexdigest(), seen
+
+    # Delivery
+    def registry_available(self) -> bool:
+        """Whether the registry addon answers on the host (e.g. via 'kubectl port-forward')"""
+        if self._registry_up is None:
+            try:
+                with urllib.request.urlopen(f"http://{self.registry}/v2/", timeout=1) as response:
+                    self._registry_up = response.status in (200, 401)
+            except urllib.error.HTTPError as e:
+                self._registry_up = e.code == 401
+            except (OSError, ValueError):
+                self._registry_up = False
+        return self._registry_up
+
+    def choose_method(self, size: int) -> str:
+        """Registry push or image load, whichever should be faster for an image of this size"""
+        if self.deliver_method != "auto":
+            return self.deliver_method
+        if not self.registry_available():
+            return "load"
+        mb = size / (1 << 20)
+        predicted = {m: self._predict(m, mb) for m in ("load", "registry")}
+        if None not in predicted.values():
+            return min(predicted, key=predicted.get)
+        return "registry" if size >= self.REGISTRY_MIN_BYTES else "load"
+
+    def _predict(self, method: str, mb: float) -> Optional[float]:
+        """Seconds to deliver mb with a method, from a line fitted to its recent deliveries"""
+        samples = self.cache["rates"].get(method) or []
+        if len({x for x, _ in samples}) < 2:
+            return None
+        n = len(samples)
+        mean_x, mean_y = sum(x for x, _ in samples) / n, sum(y for _, y in samples) / n
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in samples) / sum((x - mean_x) ** 2 for x, _ in samples)
+        slope = max(0.0, slope)
+        return max(0.0, mean_y - slope * mean_x) + slope * mb
+
+    def _learn(self, method: str, size: int, seconds: float):
+        with self._lock:
+            samples = self.cache["rates"].setdefault(method, [])
+            samples.append([round(size / (1 << 20), 2), round(seconds, 3)])
+            del samples[:-20]
+
+    def deliver(self, ref: str, image: str, size: int) -> Tuple[bool, str, str]:
+        """(ok, method, reference to use in manifests) for the content-hash tagged ref"""
+        method = self.choose_method(size)
+        started = time.monotonic()
+        tag = ref.rsplit(":", 1)[1]
+        if method == "registry":
+            target = f"{self.registry}/{image}:{tag}"
+            ok = self.runner(["docker", "tag", ref, target], f"Tagging {target}")[0] and \
+                self.runner(["docker", "push", target], f"Pushing {target}", timeout=1800)[0]
+            # Inside the cluster the addon is also reachable as localhost:5000 through its node proxy
+            result = (ok, method, f"localhost:5000/{image}:{tag}")
+        else:
+            ok = self.runner(["minikube", "image", "load", "--overwrite=true", ref], f"Loading {ref} into the node",
+                             timeout=1800)[0]
+            result = (ok, method, ref)
+        if ok:
+            self._learn(method, size, time.monotonic() - started)
+        return result
+
+    def _image_size(self, ref: str) -> int:
+        ok, output = self.runner(["docker", "image", "inspect", "-f", "{{.Size}}", ref], f"Sizing {ref}")
+        try:
+            return int(output.strip()) if ok else 0
+        except ValueError:
+            return 0
+
+    # Pipeline
+    def _build_and_deliver(self, ctx: Dict, digest: str) -> Dict:
+        result = {"name": ctx["name"], "image": ctx["image"], "hash": digest[:12], "status": "failed"}
+        # The hash tag is what gets delivered: a new tag in a manifest is what makes Kubernetes roll out
+        ref = f"{ctx['image']}:{digest[:12]}"
+        cmd = ["docker", "build", "-t", ref, "-t", f"{ctx['image']}:{self.tag}", "-f", ctx["dockerfile"],
+               "--label", f"{self.HASH_LABEL}={digest}"]
+        for key, value in sorted(ctx["args"].items()):
+            cmd += ["--build-arg", f"{key}={value}"]
+        started = time.monotonic()
+        # BuildKit is the default only from Docker 23; the legacy builder neither shares the layer cache
+        # between concurrent builds nor runs independent stages in parallel
+        ok, output = self.runner(cmd + [ctx["context"]], f"Building {ref}", timeout=1800, env=self.BUILD_ENV)
+        result["build_s"] = round(time.monotonic() - started, 3)
+        if not ok:
+            result["error"] = output.strip()[-500:]
+            return result
+        result["size"] = self._image_size(ref)
+        started = time.monotonic()
+        ok, method, deployed = self.deliver(ref, ctx["image"], result["size"])
+        result.update(method=method, deliver_s=round(time.monotonic() - started, 3), ref=deployed,
+                      status="built" if ok else "failed")
+        if ok:
+            with self._lock:
+                self.cache["images"][f"{ctx['context']}|{ctx['dockerfile']}"] = {
+                    "hash": digest, "ref": deployed, "method": method, "size": result["size"], "time": time.time()}
+        else:
+            result["error"] = f"delivery via {method} failed"
+        return result
+
+    def run(self, contexts: List[Dict], force: bool = False, dry_run: bool = False) -> Dict:
+        """Hash every context, then build and deliver the changed ones in parallel"""
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            hashes = list(pool.map(self.context_hash, contexts))
+        files: Dict[str, List] = {}
+        for _, seen in hashes:
+            files.update(seen)
+        self.cache["files"] = files
+        node = ImagePrefetcher(self.runner).node_images() if not force and not dry_run else set()
+        results, pending = [], []
+        for ctx, (digest, _) in zip(contexts, hashes):
+            previous = self.cache["images"].get(f"{ctx['context']}|{ctx['dockerfile']}") or {}
+            on_node = previous.get("method") == "registry" or normalize_image(previous.get("ref", "")) in node
+            if not force and previous.get("hash") == digest and (dry_run or on_node):
+                results.append({"name": ctx["name"], "image": ctx["image"], "hash": digest[:12],
+                                "status": "unchanged", "ref": previous["ref"], "method": previous.get("method")})
+            elif dry_run:
+                results.append({"name": ctx["name"], "image": ctx["image"], "hash": digest[:12], "status": "changed"})
+            else:
+                pending.append((ctx, digest))
+        hashed_s = time.monotonic() - started
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results += list(pool.map(lambda job: self._build_and_deliver(*job), pending))
+        if not dry_run:
+            tmp = self.cache_file.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.cache))
+            os.replace(tmp, self.cache_file)
+        return {"contexts": len(contexts), "results": sorted(results, key=lambda r: r["name"]),
+                "ok": all(r["status"] != "failed" for r in results), "hash_s": round(hashed_s, 3),
+                "serial_s": round(sum(r.get("build_s", 0) + r.get("deliver_s", 0) for r in results), 3),
+                "duration": round(time.monotonic() - started, 3)}
+
+    @staticmethod
+    def print_report(report: Dict):
+        print(f"\n{Colors.BOLD}Image build: {report['contexts']} context(s) in {report['duration']:.1f}s "
+              f"(hashing {report['hash_s']:.2f}s; build+deliver {report['serial_s']:.1f}s if run one by one)"
+              f"{Colors.ENDC}")
+        for r in report["results"]:
+            if r["status"] == "built":
+                print(f"  {Colors.OKGREEN}✓ {r['name']:20s}{Colors.ENDC} {r['ref']}  build {r['build_s']:.1f}s, "
+                      f"{r['method']} {r['deliver_s']:.1f}s, {r['size'] / (1 << 20):.0f}MB")
+            elif r["status"] == "unchanged":
+                print(f"  {Colors.OKCYAN}= {r['name']:20s}{Colors.ENDC} {r['ref']}  unchanged ({r['hash']})")
+            elif r["status"] == "changed":
+                print(f"  {Colors.WARNING}~ {r['name']:20s}{Colors.ENDC} {r['image']}  would rebuild ({r['hash']})")
+            else:
+                print(f"  {Colors.FAIL}✗ {r['name']:20s} {r.get('error', '')}{Colors.ENDC}")
+        print()
+
+
+# Command backends: live (optionally recorded), replay and stub
+class CommandBackend:
+    """Run external commands live, or serve them from a recorded session or fixture file
+
+    Session and fixture files hold one compact JSON object per line
+    ({"cmd": [...], "rc": 0, "out": "...", "err": "...", "ms": 12.5}); a .gz suffix gzips them.
+    Replay serves each command's recorded results in order with its latency scaled by `scale`
+    (0 for instant). Stub matches the longest recorded argv prefix and answers instantly.
+    Streaming commands (watches, logs -f, port-forwards) go through popen(): their output is
+    recorded when they exit ("stream": true) and played back at once.
+    """
+
+    MODES = ("live", "replay", "stub")
+
+    def __init__(self, mode: str = "live", session_file: Optional[str] = None, scale: float = 1.0):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown command backend mode: {mode}")
+        if mode != "live" and not session_file:
+            raise ValueError(f"{mode} mode needs a session file")
+        self.mode = mode
+        self.session_file = Path(session_file) if session_file else None
+        self.scale = max(0.0, scale)
+        self.calls = 0
+        self.misses = 0
+        self.command_ms = 0.0
+        self._lock = threading.Lock()
+        self._records: Dict[Tuple[str, ...], List[Dict]] = {}
+        self._served: Dict[Tuple[str, ...], int] = {}
+        self._writer = None
+        if mode == "live" and self.session_file:
+            self._writer = self._open(self.session_file, "wt")
+        elif mode != "live":
+            with self._open(self.session_file, "rt") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self._records.setdefault(tuple(record["cmd"]), []).append(record)
+
+    @staticmethod
+    def _open(path: Path, mode: str):
+        return gzip.open(path, mode) if path.suffix == ".gz" else open(path, mode)
+
+    @staticmethod
+    def _strip_profile(cmd: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Drop the -p/--context pair with_profile adds, so fixtures work for any profile"""
+        if len(cmd) > 2 and cmd[1] in ("-p", "--context"):
+            return cmd[:1] + cmd[3:]
+        return cmd
+
+    def _lookup(self, cmd: Tuple[str, ...]) -> Optional[Dict]:
+        if self.mode == "replay":
+            records = self._records.get(cmd)
+            if not records:
+                return None
+            # Repeated commands get their recorded results in order; the last one repeats
+            index = self._served.get(cmd, 0)
+            self._served[cmd] = index + 1
+            return records[min(index, len(records) - 1)]
+        cmd = self._strip_profile(cmd)
+        best = None
+        for recorded, records in self._records.items():
+            recorded = self._strip_profile(recorded)
+            if cmd[:len(recorded)] == recorded and (best is None or len(recorded) > len(best[0])):
+                best = (recorded, records[-1])
+        return best[1] if best else None
+
+    @property
+    def direct(self) -> bool:
+        """Live and not recording: callers may run commands themselves (e.g. as asyncio subprocesses)"""
+        return self.mode == "live" and self._writer is None
+
+    def _write(self, record: Dict):
+        with self._lock:
+            self.command_ms += record["ms"]
+            if self._writer:
+                self._writer.write(json.dumps(record, separators=(",", ":")) + "\n")
+                self._writer.flush()
+
+    def run(self, cmd: List[str], timeout: Optional[float] = None, **kwargs) -> subprocess.CompletedProcess:
+        """subprocess.run(cmd, capture_output=True, text=True) with the same result and exceptions"""
+        if self.mode == "live":
+            started = time.perf_counter()
+            record = {"cmd": list(cmd)}
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, **kwargs)
+                record.update(rc=result.returncode, out=result.stdout, err=result.stderr)
+                return result
+            except subprocess.TimeoutExpired:
+                record["timeout"] = True
+                raise
+            except OSError as e:
+                record["error"] = str(e)
+                raise
+            finally:
+                record["ms"] = round((time.perf_counter() - started) * 1000, 3)
+                with self._lock:
+                    self.calls += 1
+                self._write(record)
+
+        record = self._recorded(cmd)
+        if record is None:
+            return subprocess.CompletedProcess(cmd, 127, "", f"{self.mode}: no recorded result for this command")
+        if self.mode == "replay" and self.scale:
+            time.sleep(record.get("ms", 0.0) / 1000 * self.scale)
+        if record.get("timeout"):
+            raise subprocess.TimeoutExpired(cmd, timeout or 0)
+        if "error" in record:
+            raise OSError(record["error"])
+        return subprocess.CompletedProcess(cmd, record.get("rc", 0), record.get("out", ""), record.get("err", ""))
+
+    def _recorded(self, cmd: List[str]) -> Optional[Dict]:
+        with self._lock:
+            self.calls += 1
+            record = self._lookup(tuple(cmd))
+            if record is None:
+                self.misses += 1
+            else:
+                self.command_ms += record.get("ms", 0.0)
+        if record is None:
+            logger.warning(f"No recorded result for: {' '.join(cmd)}")
+        return record
+
+    def popen(self, cmd: List[str], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) -> "BackendProcess":
+        """Start a streaming command; stdout=None detaches it (a browser launcher) and records only the start"""
+        if self.mode == "live":
+            started = time.perf_counter()
+            with self._lock:
+                self.calls += 1
+            try:
+                proc = subprocess.Popen(cmd, stdout=stdout, stderr=stderr, text=True)
+            except OSError as e:
+                self._write({"cmd": list(cmd), "error": str(e), "stream": True,
+                             "ms": round((time.perf_counter() - started) * 1000, 3)})
+                raise
+            return BackendProcess(cmd, proc, on_exit=self._record_stream if self._writer else None)
+        record = self._recorded(cmd)
+        if record is None:
+            return BackendProcess(cmd, output="", returncode=127)
+        if "error" in record:
+            raise OSError(record["error"])
+        return BackendProcess(cmd, output=record.get("out", ""), returncode=record.get("rc") or 0)
+
+    def _record_stream(self, process: "BackendProcess"):
+        self._write({"cmd": process.args, "rc": process.returncode, "out": "".join(process.output), "err": "",
+                     "stream": True, "ms": round((time.perf_counter() - process.started) * 1000, 3)})
+
+    def stats(self) -> Dict:
+        return {"mode": self.mode, "calls": self.calls, "misses": self.misses,
+                "command_ms": round(self.command_ms, 1)}
+
+    def close(self):
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+
+
+class BackendProcess:
+    """A streaming command started by CommandBackend.popen, with the Popen surface its readers use
+
+    Wraps a live process, keeping its output for the session file when recording, or plays a
+    recorded output back; a played-back process exits once its output has been read.
+    """
+
+    def __init__(self, cmd: List[str], proc: Optional[subprocess.Popen] = None, output: str = "",
+                 returncode: int = 0, on_exit: Optional[Callable[["BackendProcess"], None]] = None):
+        self.args = list(cmd)
+        self.output: List[str] = []
+        self.started = time.perf_counter()
+        self._proc = proc
+        self._returncode = returncode
+        self._on_exit = on_exit
+        self._lock = threading.Lock()
+        self._exited = False
+        source = io.StringIO(output) if proc is None else proc.stdout
+        self.stdout = None if source is None else self._read(source)
+        if self.stdout is None:
+            self._exit()
+
+    def _read(self, source):
+        try:
+            for line in source:
+                if self._on_exit:
+                    self.output.append(line)
+                yield line
+        finally:
+            self._exit()
+
+    def _exit(self):
+        with self._lock:
+            if self._exited:
+                return
+            self._exited = True
+        if self._on_exit:
+            if self._proc is not None and self.stdout is not None:
+                # Output ended: the process is exiting, give it a moment to report its status
+                try:
+                    self._proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    pass
+            self._on_exit(self)
+
+    def poll(self) -> Optional[int]:
+        if self._proc is not None:
+            return self._proc.poll()
+        return self._returncode if self._exited else None
+
+    @property
+    def returncode(self) -> Optional[int]:
+        return self.poll()
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if self._proc is not None:
+            return self._proc.wait(timeout=timeout)
+        self._exited = True
+        return self._returncode
+
+    def terminate(self):
+        if self._proc is not None:
+            self._proc.terminate()
+        else:
+            self._exited = True
+
+    def kill(self):
+        if self._proc is not None:
+            self._proc.kill()
+        else:
+            self._exited = True
+
+
+# Session journal (append-only, length-prefixed segments with a per-segment summary index)
+class SessionJournal:
+    """Append-only history of every command the tool runs, queryable across launches
+
+    Each process appends to its own segment file. A record is a fixed binary header
+    (string length, timestamp, duration, exit code, output bytes) followed by the
+    NUL-separated section, command, args and recipe. Sealed segments are summarized in
+    index.json (time range plus the commands, sections and recipes they hold), so a query
+    opens only the segments that can match. compact() merges small segments and drops
+    entries past the retention period; a merge is listed in the index (with the segments
+    it replaces) before the merged file appears, so an interrupted one is finished or
+    discarded by the next compaction and never counted twice.
+    """
+
+    RECORD = struct.Struct("<IdfiQ")
+    SEGMENT_BYTES = 4 << 20
+    RETENTION_DAYS = 90
+    _sequence = itertools.count()
+
+    def __init__(self, directory: Path, segment_bytes: int = SEGMENT_BYTES, retention_days: int = RETENTION_DAYS,
+                 flush_interval: float = 1.0):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.directory / "index.json"
+        self.segment_bytes = segment_bytes
+        self.retention_days = retention_days
+        self.flush_interval = flush_interval
+        self.last_scan = (0, 0)
+        self._lock = threading.Lock()
+        self._file = None
+        self._path: Optional[Path] = None
+        self._size = 0
+        self._meta: Dict = {}
+        self._last_flush = 0.0
+
+    @staticmethod
+    def split_command(cmd: List[str]) -> Tuple[str, str]:
+        """('kubectl apply', '-f app.yaml'): the tool plus its subcommand, then the remaining args"""
+        words = 2 if len(cmd) > 1 and not cmd[1].startswith("-") else 1
+        return " ".join(cmd[:words]), " ".join(shlex.quote(arg) for arg in cmd[words:])
+
+    # Writing
+    def _segment_name(self, millis: int, owner: str) -> str:
+        """<ms>-<owner>-<seq>.seg: the per-process sequence keeps rollovers within one millisecond apart"""
+        return f"{millis:013d}-{owner}-{next(self._sequence)}.seg"
+
+    def _open_segment(self):
+        while True:
+            self._path = self.directory / self._segment_name(int(time.time() * 1000), str(os.getpid()))
+            try:
+                # Never append to a segment that already exists, it may already be sealed in the index
+                self._file = open(self._path, "xb", buffering=1 << 16)
+                break
+            except FileExistsError:
+                continue
+        self._size = 0
+        self._meta = {"start": None, "end": None, "count": 0, "bytes": 0,
+                      "commands": set(), "sections": set(), "recipes": set()}
+
+    def append(self, section: str, command: str, args: str, exit_code: int, duration: float,
+               output_bytes: int, recipe: Optional[str] = None, timestamp: Optional[float] = None):
+        """Buffer one record; flushed at most every flush_interval seconds and on close"""
+        timestamp = time.time() if timestamp is None else timestamp
+        recipe = "" if recipe is None else str(recipe)
+        strings = "\0".join((section or "", command, args, recipe)).encode()
+        record = self.RECORD.pack(len(strings), timestamp, duration, exit_code, output_bytes) + strings
+        with self._lock:
+            if self._file is None:
+                self._open_segment()
+            self._file.write(record)
+            self._size += len(record)
+            meta = self._meta
+            meta["start"] = timestamp if meta["start"] is None else min(meta["start"], timestamp)
+            meta["end"] = timestamp if meta["end"] is None else max(meta["end"], timestamp)
+            meta["count"] += 1
+            meta["commands"].add(command)
+            meta["sections"].add(section or "")
+            meta["recipes"].update(recipe.split(",") if recipe else ())
+            if self._size >= self.segment_bytes:
+                self._seal()
+            elif timestamp - self._last_flush >= self.flush_interval:
+                self._file.flush()
+                self._last_flush = timestamp
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def _seal(self):
+        """Close the active segment and publish its summary (caller holds self._lock)"""
+        self._file.close()
+        meta = dict(self._meta, bytes=self._size)
+        name = self._path.name
+        self._update_index(lambda index: index["segments"].__setitem__(name, self._summary_json(meta)))
+        self._file = self._path = None
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._seal()
+
+    # Index
+    @staticmethod
+    def _summary_json(meta: Dict) -> Dict:
+        return {key: sorted(value) if isinstance(value, set) else value for key, value in meta.items()}
+
+    def _read_index(self) -> Dict:
+        try:
+            return json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return {"version": 1, "segments": {}}
+
+    def _update_index(self, change: Callable[[Dict], None]):
+        """Read-modify-write index.json under an exclusive lock shared by every process"""
+        with open(self.directory / ".lock", "a") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            index = self._read_index()
+            change(index)
+            self._write_index(index)
+
+    def _write_index(self, index: Dict):
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(index))
+        os.replace(tmp, self.index_path)
+
+    @classmethod
+    def read_segment(cls, path: Path):
+        """Yield records in file order, stopping at a torn tail left by an interrupted write"""
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return
+        offset, header = 0, cls.RECORD.size
+        while offset + header <= len(data):
+            length, timestamp, duration, exit_code, output_bytes = cls.RECORD.unpack_from(data, offset)
+            end = offset + header + length
+            fields = data[offset + header:end].decode(errors="replace").split("\0")
+            if end > len(data) or len(fields) != 4:
+                break
+            yield {"time": timestamp, "duration": round(duration, 6), "exit_code": exit_code, "output_bytes": output_bytes,
+                   "section": fields[0], "command": fields[1], "args": fields[2], "recipe": fields[3]}
+            offset = end
+
+    @classmethod
+    def summarize(cls, path: Path) -> Dict:
+        meta = {"start": None, "end": None, "count": 0, "bytes": path.stat().st_size,
+                "commands": set(), "sections": set(), "recipes": set()}
+        for row in cls.read_segment(path):
+            meta["start"] = row["time"] if meta["start"] is None else min(meta["start"], row["time"])
+            meta["end"] = row["time"] if meta["end"] is None else max(meta["end"], row["time"])
+            meta["count"] += 1
+            meta["commands"].add(row["command"])
+            meta["sections"].add(row["section"])
+            meta["recipes"].update(row["recipe"].split(",") if row["recipe"] else ())
+        return cls._summary_json(meta)
+
+    # Queries
+    @staticmethod
+    def _matches(values: List[str], pattern: Optional[str]) -> bool:
+        return pattern is None or any(fnmatch.fnmatchcase(v, pattern) for v in values)
+
+    def query(self, since: Optional[float] = None, until: Optional[float] = None, command: Optional[str] = None,
+              section: Optional[str] = None, recipe: Optional[str] = None, failed: Optional[bool] = None,
+              sort: str = "time", limit: Optional[int] = None) -> List[Dict]:
+        """Matching records; command/section are globs ('kubectl apply*'), sort is time, recent or duration"""
+        self.flush()
+        summaries = self._read_index()["segments"]
+        segments = sorted(self.directory.glob("*.seg"))
+        # Sources of a merge that was interrupted before it could delete them
+        superseded = {source for name, meta in summaries.items() if (self.directory / name).exists()
+                      for source in meta.get("merged_from", ())}
+        scanned = []
+        for path in segments:
+            meta = summaries.get(path.name)
+            if path.name in superseded:
+                continue
+            if meta and (not meta["count"] or (since is not None and meta["end"] < since) or
+                         (until is not None and meta["start"] > until) or
+                         not self._matches(meta["commands"], command) or
+                         not self._matches(meta["sections"], section) or
+                         (recipe is not None and str(recipe) not in meta["recipes"])):
+                continue
+            scanned.append(path)
+        self.last_scan = (len(scanned), len(segments))
+        rows = [row for path in scanned for row in self.read_segment(path)
+                if (since is None or row["time"] >= since) and (until is None or row["time"] <= until)
+                and self._matches([row["command"]], command) and self._matches([row["section"]], section)
+                and (recipe is None or str(recipe) in row["recipe"].split(","))
+                and (failed is None or (row["exit_code"] != 0) == failed)]
+        if sort == "duration":
+            rows.sort(key=lambda r: r["duration"], reverse=True)
+        else:
+            rows.sort(key=lambda r: r["time"], reverse=sort == "recent")
+        return rows[:limit] if limit else rows
+
+    # Compaction
+    def compact(self) -> Dict:
+        """Summarize segments left by finished processes, merge small ones and drop expired entries"""
+        cutoff = time.time() - self.retention_days * 86400
+        report = {"sealed": 0, "merged": 0, "removed": 0}
+
+        def owner_alive(path: Path) -> bool:
+            try:
+                os.kill(int(path.stem.split("-")[1]), 0)
+            except (ValueError, IndexError, ProcessLookupError):
+                return False
+            except PermissionError:
+                pass
+            return True
+
+        def change(index: Dict):
+            segments = index["segments"]
+            # Settle merges an earlier compaction listed but did not finish: a merged segment that exists
+            # replaces its sources, one that never appeared is dropped and the sources stay
+            for name, meta in list(segments.items()):
+                sources = meta.pop("merged_from", None)
+                if sources is None:
+                    continue
+                if not (self.directory / name).exists():
+                    segments.pop(name)
+                    continue
+                for n in sources:
+                    segments.pop(n, None)
+                    if (self.directory / n).exists():
+                        (self.directory / n).unlink()
+            for stray in self.directory.glob("*-c*.tmp"):
+                stray.unlink()
+            for path in sorted(self.directory.glob("*.seg")):
+                if path.name not in segments and path != self._path and not owner_alive(path):
+                    segments[path.name] = self.summarize(path)
+                    report["sealed"] += 1
+            for name, meta in list(segments.items()):
+                if not meta["count"] or meta["end"] < cutoff or not (self.directory / name).exists():
+                    segments.pop(name)
+                    if (self.directory / name).exists():
+                        (self.directory / name).unlink()
+                    report["removed"] += 1
+            small = sorted((meta["start"], name) for name, meta in segments.items()
+                           if meta["bytes"] < self.segment_bytes // 2)
+            batch: List[str] = []
+            for _, name in small + [(None, None)]:
+                if name and sum(segments[n]["bytes"] for n in batch) + segments[name]["bytes"] <= self.segment_bytes:
+                    batch.append(name)
+                    continue
+                if len(batch) > 1:
+                    rows = sorted((row for n in batch for row in self.read_segment(self.directory / n)
+                                   if row["time"] >= cutoff), key=lambda r: r["time"])
+                    merged = self.directory / self._segment_name(int(rows[0]["time"] * 1000) if rows else 0,
+                                                                 f"c{os.getpid()}")
+                    tmp = merged.with_suffix(".tmp")
+                    with open(tmp, "wb") as f:
+                        for row in rows:
+                            strings = "\0".join((row["section"], row["command"], row["args"], row["recipe"])).encode()
+                            f.write(self.RECORD.pack(len(strings), row["time"], row["duration"], row["exit_code"],
+                                                     row["output_bytes"]) + strings)
+                    # Publish the merge before the merged file exists; from then on a crash leaves
+                    # enough in the index for the next compaction to finish it
+                    segments[merged.name] = dict(self.summarize(tmp), merged_from=batch)
+                    self._write_index(index)
+                    os.replace(tmp, merged)
+                    for n in batch:
+                        segments.pop(n)
+                        (self.directory / n).unlink()
+                    del segments[merged.name]["merged_from"]
+                    report["merged"] += len(batch)
+                batch = [name] if name else []
+
+        self._update_index(change)
+        report["segments"] = len(list(self.directory.glob("*.seg")))
+        return report
+
+    def compact_in_background(self) -> threading.Thread:
+        """Compact on a worker thread; non-daemon, so exiting waits for it instead of cutting it off"""
+        def run():
+            try:
+                result = self.compact()
+                if result["sealed"] or result["merged"] or result["removed"]:
+                    logger.info(f"Journal compacted: {result}")
+            except OSError as e:
+                logger.warning(f"Journal compaction failed: {e}")
+        thread = threading.Thread(target=run, name="journal-compact")
+        thread.start()
+        return thread
+
+    @staticmethod
+    def print_rows(rows: List[Dict]):
+        print(f"{Colors.BOLD}{'time':19s} {'secs':>7s} {'exit':>4s} {'out':>8s} {'recipe':>6s}  command{Colors.ENDC}")
+        for row in rows:
+            color = Colors.FAIL if row["exit_code"] else ""
+            print(f"{color}{datetime.fromtimestamp(row['time']).strftime('%Y-%m-%d %H:%M:%S')} "
+                  f"{row['duration']:7.2f} {row['exit_code']:4d} {row['output_bytes']:8d} {row['recipe'] or '-':>6s}  "
+                  f"{row['command']} {row['args']}{Colors.ENDC if color else ''}"[:220])
+
+
+# System checks (read from /proc and statvfs instead of forking shell tools)
+class SystemCheck:
+    """Collect host facts and installation checks into one JSON-serializable report"""
+
+    TOOLS = ("python3", "docker", "minikube", "kubectl", "helm", "uv")
+    VERSION_COMMANDS = {
+        "docker": ["docker", "--version"],
+        "minikube": ["minikube", "version", "--short"],
+        "kubectl": ["kubectl", "version", "--client"],
+        "helm": ["helm", "version", "--short"],
+        "uv": ["uv", "--version"],
+    }
+
+    def __init__(self, profile: Optional[str] = None, timeout: float = 5.0,
+                 backend: Optional[CommandBackend] = None):
+        self.profile = profile
+        self.timeout = timeout
+        self.backend = backend or CommandBackend()
+        self._path_index: Optional[Dict[str, str]] = None
+
+    def which(self, name: str) -> Optional[str]:
+        """Resolve an executable from one scan of PATH"""
+        if self._path_index is None:
+            self._path_index = {}
+            for directory in os.environ.get("PATH", "").split(os.pathsep):
+                try:
+                    with os.scandir(directory or ".") as entries:
+                        for entry in entries:
+                            if entry.name not in self._path_index and entry.is_file() and \
+                                    os.access(entry.path, os.X_OK):
+                                self._path_index[entry.name] = entry.path
+                except OSError:
+                    continue
+        return self._path_index.get(name) or self._path_index.get(name + ".exe")
+
+    @staticmethod
+    def read_meminfo() -> Dict[str, int]:
+        """/proc/meminfo values in kB"""
+        values = {}
+        try:
+            with open("/proc/meminfo") as f:
+                for line in f:
+                    key, _, rest = line.partition(":")
+                    values[key] = int(rest.split()[0])
+        except (OSError, ValueError, IndexError):
+            pass
+        return values
+
+    @staticmethod
+    def read_cpu_flags() -> set:
+        """CPU feature flags from the first processor entry of /proc/cpuinfo"""
+        try:
+            with open("/proc/cpuinfo") as f:
+                for line in f:
+                    if line.startswith(("flags", "Features")):
+                        return set(line.split(":", 1)[1].split())
+        except OSError:
+            pass
+        return set()
+
+    @staticmethod
+    def read_nested(paths=("/sys/module/kvm_intel/parameters/nested",
+                           "/sys/module/kvm_amd/parameters/nested")) -> Optional[bool]:
+        """Whether the loaded KVM module has nesting on ('Y' or '1'); None when no KVM module is loaded"""
+        for path in paths:
+            try:
+                with open(path) as f:
+                    return f.read().strip().upper() in ("Y", "1")
+            except OSError:
+                continue
+        return None
+
+    @staticmethod
+    def cluster_state(status) -> str:
+        """Host state from 'minikube status -o json': one object, or a list of nodes on multi-node clusters"""
+        nodes = [n for n in (status if isinstance(status, list) else [status]) if isinstance(n, dict)]
+        hosts = [n.get("Host") or "Unknown" for n in nodes]
+        if not hosts:
+            return "Unknown"
+        return next((h for h in hosts if h != "Running"), "Running")
+
+    def _probe(self, cmd: List[str]) -> Tuple[bool, str]:
+        try:
+            result = self.backend.run(with_profile(cmd, self.profile), timeout=self.timeout)
+            return result.returncode == 0, (result.stdout or result.stderr).strip()
+        except (OSError, subprocess.TimeoutExpired) as e:
+            return False, str(e)
+
+    def run(self, quick: bool = False) -> Dict:
+        """Run every check; subprocess probes (versions, daemons) run concurrently unless quick"""
+        started = time.perf_counter()
+        report: Dict = {"os": platform.system(), "arch": platform.machine(), "checks": []}
+
+        tools = {name: self.which(name) for name in self.TOOLS}
+        probes: Dict[str, List[str]] = {}
+        if not quick:
+            probes = {name: cmd for name, cmd in self.VERSION_COMMANDS.items() if tools.get(name)}
+            if tools.get("docker"):
+                probes["docker_daemon"] = ["docker", "info", "--format", "{{.ServerVersion}}"]
+            if tools.get("minikube"):
+                probes["minikube_status"] = ["minikube", "status", "-o", "json"]
+            if sys.platform == "darwin":
+                probes["memsize"] = ["sysctl", "-n", "hw.memsize"]
+        pool = ThreadPoolExecutor(max_workers=len(probes)) if probes else None
+        futures = {name: pool.submit(self._probe, cmd) for name, cmd in probes.items()} if pool else {}
+
+        # In-process facts while the probes run
+        meminfo = self.read_meminfo()
+        flags = self.read_cpu_flags()
+        report["cpu"] = {"cores": os.cpu_count() or 0,
+                         "virtualization": "vmx" if "vmx" in flags else "svm" if "svm" in flags else None,
+                         "kvm_device": os.path.exists("/dev/kvm"),
+                         "nested": self.read_nested()}
+        report["memory"] = {"total_gb": round(meminfo.get("MemTotal", 0) / 1048576, 1),
+                            "available_gb": round(meminfo.get("MemAvailable", 0) / 1048576, 1)}
+        disk = os.statvfs(str(Path.home())) if hasattr(os, "statvfs") else None
+        report["disk"] = {"path": str(Path.home()),
+                          "total_gb": round(disk.f_blocks * disk.f_frsize / 1024 ** 3, 1) if disk else None,
+                          "available_gb": round(disk.f_bavail * disk.f_frsize / 1024 ** 3, 1) if disk else None}
+
+        results = {name: future.result() for name, future in futures.items()}
+        if pool:
+            pool.shutdown()
+        if "memsize" in results and results["memsize"][0]:
+            report["memory"]["total_gb"] = round(int(results["memsize"][1]) / 1024 ** 3, 1)
+        report["tools"] = {name: {"path": path, "version": results[name][1].splitlines()[0]
+                                  if name in results and results[name][0] and results[name][1] else None}
+                           for name, path in tools.items()}
+        if "docker_daemon" in results:
+            report["docker_daemon"] = results["docker_daemon"][0]
+        if "minikube_status" in results:
+            try:
+                report["minikube_status"] = self.cluster_state(json.loads(results["minikube_status"][1]))
+            except ValueError:
+                report["minikube_status"] = "Stopped" if results["minikube_status"][1] else "Unknown"
+        self._evaluate(report)
+        report["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return report
+
+    @staticmethod
+    def _evaluate(report: Dict):
+        """Turn the facts into pass/warn/fail checks (same thresholds as the shell scripts)"""
+        checks = report["checks"]
+
+        def add(name, status, detail):
+            checks.append({"name": name, "status": status, "detail": detail})
+
+        for name in ("docker", "minikube", "kubectl"):
+            tool = report["tools"][name]
+            add(name, "pass" if tool["path"] else "fail",
+                tool["version"] or tool["path"] or "not installed")
+        for name in ("helm", "uv"):
+            tool = report["tools"][name]
+            add(name, "pass" if tool["path"] else "warn", tool["version"] or tool["path"] or "not installed")
+        memory = report["memory"]["total_gb"]
+        add("memory", "pass" if memory >= 8 else "warn" if memory >= 4 else "fail", f"{memory}GB total")
+        available = report["disk"]["available_gb"]
+        if available is not None:
+            add("disk", "pass" if available >= 30 else "warn" if available >= 20 else "fail",
+                f"{available}GB available")
+        if report["os"] == "Linux":
+            virt = report["cpu"]["virtualization"]
+            add("virtualization", "pass" if virt else "warn",
+                {"vmx": "Intel VT-x", "svm": "AMD-V"}.get(virt, "not detected"))
+        if "docker_daemon" in report:
+            add("docker daemon", "pass" if report["docker_daemon"] else "warn",
+                "running" if report["docker_daemon"] else "not reachable")
+        if "minikube_status" in report:
+            add("minikube cluster", "pass" if report["minikube_status"] == "Running" else "warn",
+                report["minikube_status"])
+        report["ok"] = not any(c["status"] == "fail" for c in checks)
+
+    @staticmethod
+    def print_report(report: Dict):
+        """Print checks with the tutorial's check marks"""
+        marks = {"pass": (Colors.OKGREEN, "✅"), "warn": (Colors.WARNING, "⚠️ "), "fail": (Colors.FAIL, "❌")}
+        print(f"{Colors.BOLD}{report['os']} {report['arch']}, {report['cpu']['cores']} cores, "
+              f"{report['memory']['total_gb']}GB RAM{Colors.ENDC}\n")
+        for check in report["checks"]:
+            color, mark = marks[check["status"]]
+            print(f"{color}{mark} {check['name']:18s}{Colors.ENDC} {check['detail']}")
+        print(f"\n{Colors.OKCYAN}Checked in {report['duration_ms']:.0f}ms{Colors.ENDC}\n")
+
+
+# minikube start sizing
+def parse_quantity(value, unit: str) -> float:
+    """Kubernetes quantity as CPU cores (unit='cpu') or MiB (unit='mem')"""
+    text = str(value).strip()
+    if unit == "cpu":
+        for suffix, divisor in (("n", 1e9), ("u", 1e6), ("m", 1e3)):
+            if text.endswith(suffix):
+                return float(text[:-1]) / divisor
+        return float(text)
+    factors = {"Ki": 1 / 1024, "Mi": 1, "Gi": 1024, "Ti": 1024 ** 2, "Pi": 1024 ** 3, "Ei": 1024 ** 4,
+               "k": 1e3 / 1048576, "M": 1e6 / 1048576, "G": 1e9 / 1048576, "T": 1e12 / 1048576,
+               "P": 1e15 / 1048576, "E": 1e18 / 1048576}
+    for suffix, factor in factors.items():
+        if text.endswith(suffix):
+            return float(text[:-len(suffix)]) * factor
+    return float(text) / 1048576
+
+
+def read_cgroup_limits() -> Tuple[Optional[float], Optional[int]]:
+    """CPU (cores) and memory (bytes) limits of this process's cgroup, if any"""
+    cpus = memory = None
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            cpus = int(quota) / int(period)
+    except (OSError, ValueError):
+        try:
+            quota = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text())
+            period = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text())
+            cpus = quota / period if quota > 0 else None
+        except (OSError, ValueError):
+            pass
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        try:
+            raw = Path(path).read_text().strip()
+        except OSError:
+            continue
+        # cgroup v1 reports "unlimited" as a huge number
+        if raw != "max" and int(raw) < 1 << 60:
+            memory = int(raw)
+        break
+    return cpus, memory
+
+
+class StartAdvisor:
+    """Size 'minikube start' flags from the host and the recipes planned for it"""
+
+    # Control plane, CoreDNS, kube-proxy and storage-provisioner requests plus node OS
+    BASE_CPUS = 1.0
+    BASE_MEMORY_MB = 2048
+    BASE_DISK_GB = 20
+    MIN_CPUS = 2
+    MIN_MEMORY_MB = 2200
+    HEADROOM = 1.25
+    # Left free for the host's own processes out of what is currently available
+    HOST_RESERVE_MB = 1024
+
+    def __init__(self, check: Optional[SystemCheck] = None):
+        self.check = check or SystemCheck()
+
+    @staticmethod
+    def workload_requests(docs: List[Dict]) -> Dict[str, float]:
+        """Summed CPU/memory requests (x replicas), persistent storage and image count of a manifest"""
+        totals = {"cpu": 0.0, "memory_mb": 0.0, "storage_gb": 0.0, "images": len(manifest_images(docs))}
+        for doc in docs:
+            kind = doc.get("kind")
+            spec = doc.get("spec") or {}
+            if kind == "PersistentVolumeClaim":
+                storage = ((spec.get("resources") or {}).get("requests") or {}).get("storage")
+                totals["storage_gb"] += parse_quantity(storage, "mem") / 1024 if storage else 0
+                continue
+            if kind == "Pod":
+                pod_spec, replicas = spec, 1
+            elif (spec.get("template") or {}).get("spec"):
+                pod_spec, replicas = spec["template"]["spec"], spec.get("replicas", 1)
+            else:
+                continue
+            for container in pod_spec.get("containers") or []:
+                requests = (container.get("resources") or {}).get("requests") or {}
+                totals["cpu"] += parse_quantity(requests.get("cpu", "100m"), "cpu") * replicas
+                totals["memory_mb"] += parse_quantity(requests.get("memory", "128Mi"), "mem") * replicas
+            for claim in spec.get("volumeClaimTemplates") or []:
+                storage = (((claim.get("spec") or {}).get("resources") or {}).get("requests") or {}).get("storage")
+                totals["storage_gb"] += parse_quantity(storage, "mem") / 1024 * replicas if storage else 0
+        return totals
+
+    @staticmethod
+    def vm_stat_available(output: str) -> int:
+        """Free + inactive + speculative pages from macOS 'vm_stat', in MB"""
+        page_size = 4096
+        pages = {}
+        for line in output.splitlines():
+            match = re.search(r"page size of (\d+) bytes", line)
+            if match:
+                page_size = int(match.group(1))
+                continue
+            key, _, value = line.partition(":")
+            if value.strip().rstrip(".").isdigit():
+                pages[key.strip()] = int(value.strip().rstrip("."))
+        free = sum(pages.get(f"Pages {kind}", 0) for kind in ("free", "inactive", "speculative"))
+        return free * page_size // 1048576
+
+    def host(self) -> Dict:
+        """Cores, memory and virtualization usable by minikube on this host
+
+        Memory is sized from what is available now (MemAvailable, which counts reclaimable cache),
+        not MemTotal: on a shared host the difference is already in use by something else.
+        """
+        cg_cpus, cg_memory = read_cgroup_limits()
+        meminfo = self.check.read_meminfo()
+        cores = os.cpu_count() or 1
+        memory_mb = meminfo.get("MemTotal", 0) // 1024
+        # MemAvailable needs Linux 3.14+; MemFree is the conservative fallback
+        available_mb = meminfo.get("MemAvailable", meminfo.get("MemFree", 0)) // 1024
+        if sys.platform == "darwin":
+            ok, output = self.check._probe(["sysctl", "-n", "hw.memsize"])
+            memory_mb = int(output) // 1048576 if ok else memory_mb
+            ok, output = self.check._probe(["vm_stat"])
+            available_mb = self.vm_stat_available(output) if ok else 0
+        available_mb = available_mb or memory_mb
+        flags = self.check.read_cpu_flags()
+        return {
+            "cores": cores, "memory_mb": memory_mb, "available_memory_mb": available_mb,
+            "cgroup_cpus": cg_cpus, "cgroup_memory_mb": cg_memory // 1048576 if cg_memory else None,
+            "usable_cpus": min(cores, cg_cpus) if cg_cpus else cores,
+            "usable_memory_mb": min(available_mb, cg_memory // 1048576) if cg_memory else available_mb,
+            "kvm": os.path.exists("/dev/kvm") and bool(flags & {"vmx", "svm"}) and bool(self.check.which("virsh")),
+            "docker": bool(self.check.which("docker")),
+            "arch": platform.machine(),
+        }
+
+    def choose_driver(self, host: Dict) -> str:
+        if sys.platform.startswith("linux"):
+            if host["kvm"] and host["arch"] in ("x86_64", "amd64"):
+                return "kvm2"
+            return "docker" if host["docker"] else "qemu"
+        if sys.platform == "darwin":
+            return "docker" if host["docker"] else "qemu"
+        return "docker" if host["docker"] else "hyperv"
+
+    def advise(self, recipes: List[Dict], driver: Optional[str] = None, runtime: str = "docker") -> Dict:
+        """Recommended driver, cpus, memory, disk size and runtime for the given recipes"""
+        host = self.host()
+        need = {"cpu": 0.0, "memory_mb": 0.0, "storage_gb": 0.0, "images": 0}
+        for recipe in recipes:
+            if Path(recipe['yaml']).exists():
+                for key, value in self.workload_requests(load_manifest(recipe['yaml'])).items():
+                    need[key] += value
+        driver = driver or self.choose_driver(host)
+        warnings = []
+
+        cpus = max(self.MIN_CPUS, math.ceil((need["cpu"] + self.BASE_CPUS) * self.HEADROOM))
+        memory = max(self.MIN_MEMORY_MB, int((need["memory_mb"] + self.BASE_MEMORY_MB) * self.HEADROOM))
+        memory = int(math.ceil(memory / 512.0) * 512)
+
+        # Leave a core for the host when there is room to. Memory is capped at three quarters of the
+        # host (or cgroup) and at what is available now minus HOST_RESERVE_MB, whichever is lower
+        max_cpus = max(self.MIN_CPUS, int(host["usable_cpus"]) - (1 if host["usable_cpus"] > 2 else 0))
+        max_memory = memory
+        if host["memory_mb"]:
+            capacity = min(host["memory_mb"], host["cgroup_memory_mb"] or host["memory_mb"])
+            max_memory = min(int(capacity * 0.75), host["usable_memory_mb"] - self.HOST_RESERVE_MB)
+            if max_memory < self.MIN_MEMORY_MB:
+                warnings.append(f"Only {host['usable_memory_mb']}MB is available; minikube needs "
+                                f"{self.MIN_MEMORY_MB}MB plus {self.HOST_RESERVE_MB}MB left for the host")
+                max_memory = self.MIN_MEMORY_MB
+        if cpus > max_cpus:
+            warnings.append(f"Recipes need ~{cpus} CPUs with cluster overhead; capped at {max_cpus} for this host")
+            cpus = max_cpus
+        if memory > max_memory:
+            warnings.append(f"Recipes need ~{memory}MB with cluster overhead; capped at {max_memory}MB for this host")
+            memory = max_memory
+        disk = self.BASE_DISK_GB + need["images"] * 0.5 + need["storage_gb"]
+        disk = int(math.ceil(disk / 5.0) * 5)
+        if runtime != "docker":
+            warnings.append(f"'eval $(minikube docker-env)' (used by the scripts and guides) needs the docker "
+                            f"runtime, not {runtime}")
+
+        flags = [f"--driver={driver}", f"--cpus={cpus}", f"--memory={memory}", f"--disk-size={disk}g",
+                 f"--container-runtime={runtime}"]
+        return {"host": host, "requests": {k: round(v, 2) for k, v in need.items()}, "driver": driver,
+                "cpus": cpus, "memory_mb": memory, "disk_gb": disk, "container_runtime": runtime,
+                "flags": flags, "command": "minikube start " + " ".join(flags), "warnings": warnings}
+
+    @staticmethod
+    def print_advice(advice: Dict):
+        """Print a recommendation"""
+        host, need = advice["host"], advice["requests"]
+        print(f"{Colors.BOLD}Host:{Colors.ENDC} {host['usable_cpus']:g} usable CPUs, "
+              f"{host['usable_memory_mb']}MB of {host['memory_mb']}MB memory available, KVM {'available' if host['kvm'] else 'unavailable'}")
+        print(f"{Colors.BOLD}Recipes request:{Colors.ENDC} {need['cpu']:.2f} CPUs, {need['memory_mb']:.0f}MB, "
+              f"{need['storage_gb']:.1f}GB storage, {need['images']} images")
+        for warning in advice["warnings"]:
+            print(f"{Colors.WARNING}⚠️  {warning}{Colors.ENDC}")
+        print(f"\n{Colors.BOLD}Recommended:{Colors.ENDC}\n{Colors.OKGREEN}{advice['command']}{Colors.ENDC}\n")
+
+
+# Workstation setup (resumable step graph behind .setup_state)
+class SetupEngine:
+    """Run setup steps as a dependency graph, skipping steps whose inputs have not changed"""
+
+    def __init__(self, project_dir: Path, check: Optional[SystemCheck] = None,
+                 backend: Optional[CommandBackend] = None):
+        self.project_dir = project_dir
+        self.backend = backend or CommandBackend()
+        self.state_file = project_dir / ".setup_state"
+        self.venv_dir = project_dir / ".venv"
+        self.requirements = project_dir / "requirements.txt"
+        self.check = check or SystemCheck()
+        # Steps whose failure does not block dependents (venv falls back to python -m venv)
+        self.optional = {"uv_install"}
+        # name -> (dependencies, inputs for the content hash, action)
+        self.steps: Dict[str, Tuple[Tuple[str, ...], Callable[[], bytes], Callable[[], Tuple[bool, str]]]] = {
+            "python_check": ((), lambda: sys.version.encode(), self._python_check),
+            "uv_install": ((), lambda: str(bool(self._which("uv"))).encode(), self._install_uv),
+            "venv_create": (("python_check", "uv_install"), lambda: str(self._venv_ready()).encode(),
+                            self._create_venv),
+            "requirements_install": (("venv_create",),
+                                     lambda: self.requirements.read_bytes() if self.requirements.exists() else b"",
+                                     self._install_requirements),
+        }
+        # What a finished step leaves behind; a step whose output is gone is pending again
+        self.outputs: Dict[str, Callable[[], bool]] = {
+            "venv_create": self._venv_ready,
+            "requirements_install": self._venv_ready,
+        }
+
+    def _venv_ready(self) -> bool:
+        return (self.venv_dir / "bin" / "python").exists() or (self.venv_dir / "Scripts" / "python.exe").exists()
+
+    def _which(self, name: str) -> Optional[str]:
+        self.check._path_index = None
+        return self.check.which(name)
+
+    def load_state(self) -> Dict[str, str]:
+        """key=value pairs; '<step>=done' lines stay compatible with scripts/setup.sh"""
+        state = {}
+        if self.state_file.exists():
+            for line in self.state_file.read_text().splitlines():
+                key, sep, value = line.partition("=")
+                if sep:
+                    state[key.strip()] = value.strip()
+        return state
+
+    def save_state(self, state: Dict[str, str]):
+        tmp = self.state_file.with_suffix(".tmp")
+        tmp.write_text("".join(f"{k}={v}\n" for k, v in state.items()))
+        os.replace(tmp, self.state_file)
+
+    def step_hash(self, name: str, state: Dict[str, str]) -> str:
+        """Hash of a step's inputs chained with its dependencies' recorded hashes"""
+        deps, inputs, _ = self.steps[name]
+        digest = hashlib.sha256(name.encode() + inputs())
+        for dep in deps:
+            digest.update(state.get(f"{dep}.hash", "").encode())
+        return digest.hexdigest()[:16]
+
+    def status(self) -> Dict[str, str]:
+        """done / stale / pending for every step
+
+        A '<step>=done' line without a recorded hash (written by the old shell setup) is stale: there
+        is nothing to tell whether its inputs changed since.
+        """
+        state = self.load_state()
+        result = {}
+        for name in self.steps:
+            output = self.outputs.get(name)
+            if state.get(name) != "done" or (output and not output()):
+                result[name] = "pending"
+            elif state.get(f"{name}.hash") != self.step_hash(name, state):
+                result[name] = "stale"
+            else:
+                result[name] = "done"
+        return result
+
+    def run(self, force: Tuple[str, ...] = (), max_workers: int = 4) -> Dict:
+        """Run pending/stale steps, independent ones concurrently; state is saved after each step"""
+        state = self.load_state()
+        current = self.status()
+        lock = threading.Lock()
+        results: Dict[str, Dict] = {}
+        remaining = dict(self.steps)
+        running: Dict = {}
+        started = time.monotonic()
+
+        def execute(name: str) -> Dict:
+            began = time.monotonic()
+            try:
+                ok, detail = self.steps[name][2]()
+            except (OSError, subprocess.SubprocessError) as e:
+                ok, detail = False, str(e)
+            return {"ok": ok, "detail": detail, "duration": round(time.monotonic() - began, 3)}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while remaining or running:
+                for name in list(remaining):
+                    deps = remaining[name][0]
+                    if any(dep not in results for dep in deps):
+                        continue
+                    del remaining[name]
+                    if any(not results[dep]["ok"] and dep not in self.optional for dep in deps):
+                        results[name] = {"ok": False, "skipped": True, "detail": "dependency failed", "duration": 0}
+                    elif current[name] == "done" and name not in force and \
+                            not any(results[dep].get("ran") for dep in deps):
+                        results[name] = {"ok": True, "skipped": True, "detail": "up to date", "duration": 0}
+                    else:
+                        running[pool.submit(execute, name)] = name
+                if not running:
+                    continue
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    result = dict(future.result(), ran=True)
+                    results[name] = result
+                    if result["ok"]:
+                        with lock:
+                            state[name] = "done"
+                            state[f"{name}.hash"] = self.step_hash(name, state)
+                            state[f"{name}.duration"] = str(result["duration"])
+                            self.save_state(state)
+        return {"steps": {name: results[name] for name in self.steps},
+                "ok": all(r["ok"] for name, r in results.items() if name not in self.optional),
+                "duration": round(time.monotonic() - started, 3)}
+
+    def reset(self):
+        if self.state_file.exists():
+            self.state_file.unlink()
+
+    def _env(self) -> Dict[str, str]:
+        env = dict(os.environ)
+        local_bin = str(Path.home() / ".local" / "bin")
+        env["PATH"] = local_bin + os.pathsep + env.get("PATH", "")
+        return env
+
+    def _run(self, cmd: List[str], env: Optional[Dict[str, str]] = None) -> Tuple[bool, str]:
+        result = self.backend.run(cmd, env=env or self._env())
+        return result.returncode == 0, (result.stdout + result.stderr).strip()
+
+    def _python_check(self) -> Tuple[bool, str]:
+        return sys.version_info >= (3, 6), f"Python {platform.python_version()}"
+
+    def _install_uv(self) -> Tuple[bool, str]:
+        if self._which("uv"):
+            return True, "uv already installed"
+        if self._which("curl"):
+            installer = self.project_dir / ".uv-install.sh"
+            try:
+                return self._run(["sh", "-c", 'curl -LsSf https://astral.sh/uv/install.sh -o "$0" && sh "$0"',
+                                  str(installer)])
+            finally:
+                if installer.exists():
+                    installer.unlink()
+        return self._run([sys.executable, "-m", "pip", "install", "--user", "uv"])
+
+    def _create_venv(self) -> Tuple[bool, str]:
+        if self._venv_ready():
+            return True, f"Virtual environment exists at {self.venv_dir}"
+        if self._which("uv") or (Path.home() / ".local" / "bin" / "uv").exists():
+            return self._run(["uv", "venv", str(self.venv_dir), "--python", "python3"])
+        return self._run([sys.executable, "-m", "venv", str(self.venv_dir)])
+
+    def _install_requirements(self) -> Tuple[bool, str]:
+        if not self.requirements.exists():
+            return True, "No requirements.txt found"
+        env = self._env()
+        env["VIRTUAL_ENV"] = str(self.venv_dir)
+        if self._which("uv"):
+            cmd = ["uv", "pip", "install", "-r", str(self.requirements)]
+        else:
+            cmd = [str(self.venv_dir / "bin" / "pip"), "install", "-r", str(self.requirements)]
+        return self._run(cmd, env)
+
+    @staticmethod
+    def print_report(report: Dict):
+        """Print step outcomes and durations"""
+        print(f"\n{Colors.BOLD}Setup finished in {report['duration']:.2f}s{Colors.ENDC}\n")
+        for name, result in report["steps"].items():
+            if not result["ok"]:
+                print(f"  {Colors.FAIL}✗ {name}{Colors.ENDC}: {result['detail'].splitlines()[-1] if result['detail'] else ''}")
+            elif result.get("skipped"):
+                print(f"  {Colors.WARNING}⊘ {name}{Colors.ENDC} ({result['detail']})")
+            else:
+                print(f"  {Colors.OKGREEN}✓ {name}{Colors.ENDC} ({result['duration']:.2f}s)")
+        print()
+
+
+# Recipe catalogs (recipes.json plus optional shard directory)
+def iter_json_array(path: Path, key: str = "recipes", chunk_size: int = 1 << 16):
+    """Yield the elements of a top-level JSON array (or of obj[key]) without loading the whole file"""
+    decoder = json.JSONDecoder()
+    with open(path) as f:
+        buffer = f.read(chunk_size)
+        # Find the array: either the document itself or the value of "key"
+        while True:
+            match = re.search(r'^\s*\[|"%s"\s*:\s*\[' % re.escape(key), buffer)
+            if match:
+                buffer = buffer[match.end():]
+                break
+            more = f.read(chunk_size)
+            if not more:
+                return
+            buffer += more
+        eof = False
+        while True:
+            buffer = buffer.lstrip(" \t\r\n,")
+            if buffer.startswith("]"):
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except ValueError:
+                if eof:
+                    raise
+                more = f.read(chunk_size)
+                eof = not more
+                buffer += more
+                continue
+            yield item
+            buffer = buffer[end:]
+
+
+def iter_recipe_file(path: Path):
+    """Recipes from a catalog shard: {"recipes": [...]}, a JSON array, or JSON Lines"""
+    if path.suffix == ".jsonl":
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        yield from iter_json_array(path)
+
+
+class RecipeCatalog:
+    """Recipes spread over recipes.json and recipes.d/ shards, loaded one shard at a time"""
+
+    SUMMARY_FIELDS = ("id", "name", "category", "difficulty", "time")
+
+    def __init__(self, base_dir: Path, cache_file: Optional[Path] = None, max_loaded_shards: int = 4):
+        self.base_dir = base_dir
+        self.cache_file = cache_file
+        self.max_loaded_shards = max_loaded_shards
+        self._summaries: Optional[List[Dict]] = None
+        self._by_id: Dict[int, Dict] = {}
+        self._shards: "OrderedDict[str, Dict[int, Dict]]" = OrderedDict()
+
+    def shard_paths(self) -> List[Path]:
+        paths = [self.base_dir / "recipes.json"] if (self.base_dir / "recipes.json").exists() else []
+        shard_dir = self.base_dir / "recipes.d"
+        if shard_dir.is_dir():
+            paths += sorted(p for p in shard_dir.iterdir() if p.suffix in (".json", ".jsonl"))
+        return paths
+
+    def summaries(self) -> List[Dict]:
+        """Lightweight rows (id, name, category, difficulty, time, shard) for every recipe"""
+        if self._summaries is not None:
+            return self._summaries
+        cache = {}
+        if self.cache_file and self.cache_file.exists():
+            try:
+                cache = json.loads(self.cache_file.read_text())
+            except ValueError:
+                cache = {}
+        rows, fresh = [], {}
+        for path in self.shard_paths():
+            stat = path.stat()
+            entry = cache.get(str(path))
+            if not entry or entry["mtime"] != stat.st_mtime or entry["size"] != stat.st_size:
+                entry = {"mtime": stat.st_mtime, "size": stat.st_size,
+                         "rows": [[r.get(f, "") for f in self.SUMMARY_FIELDS] for r in iter_recipe_file(path)]}
+            fresh[str(path)] = entry
+            rows += [dict(zip(self.SUMMARY_FIELDS, row), shard=str(path)) for row in entry["rows"]]
+        if self.cache_file and fresh != cache:
+            self.cache_file.write_text(json.dumps(fresh, separators=(",", ":")))
+        self._summaries = sorted(rows, key=lambda r: r["id"])
+        self._by_id = {r["id"]: r for r in self._summaries}
+        return self._summaries
+
+    def _shard(self, shard: str) -> Dict[int, Dict]:
+        recipes = self._shards.get(shard)
+        if recipes is None:
+            recipes = self._shards[shard] = {r["id"]: r for r in iter_recipe_file(Path(shard))}
+            while len(self._shards) > self.max_loaded_shards:
+                self._shards.popitem(last=False)
+        else:
+            self._shards.move_to_end(shard)
+        return recipes
+
+    def get(self, recipe_id: int) -> Optional[Dict]:
+        """Full recipe, loading only the shard that holds it"""
+        self.summaries()
+        row = self._by_id.get(recipe_id)
+        return self._shard(row["shard"]).get(recipe_id) if row else None
+
+    def filter(self, text: str = "") -> List[Dict]:
+        """Summary rows whose name, category or difficulty contains every word of text"""
+        words = text.lower().split()
+        if not words:
+            return self.summaries()
+        return [r for r in self.summaries()
+                if all(w in f"{r['name']} {r['category']} {r['difficulty']}".lower() for w in words)]
+
+    def page(self, rows: List[Dict], number: int, size: int = 15) -> Tuple[List[Dict], int]:
+        """Rows of one page (0-based) and the page count"""
+        pages = max(1, math.ceil(len(rows) / size))
+        number = min(max(0, number), pages - 1)
+        return rows[number * size:(number + 1) * size], pages
+
+    def __iter__(self):
+        for path in self.shard_paths():
+            yield from iter_recipe_file(path)
+
+
+# Search over recipes and bundled guides
+class SearchIndex:
+    """Persisted inverted index over recipe fields and markdown sections with trigram fuzzy matching"""
+
+    FORMAT = 1
+    TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9_.\-]*[a-z0-9]|[a-z0-9]")
+
+    def __init__(self, index_file: Path):
+        self.index_file = index_file
+        self.files: Dict[str, List] = {}          # source -> [mtime, size, [doc ids]]
+        self.docs: Dict[str, Dict] = {}           # doc id -> {source, title, snippet, hash, terms}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.trigrams: Dict[str, set] = {}
+        self.vocabulary: List[str] = []
+        self._cache: "OrderedDict[Tuple[Tuple[str, ...], bool, int], List[Dict]]" = OrderedDict()
+        self._load()
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        return cls.TOKEN_RE.findall(text.lower())
+
+    @staticmethod
+    def _grams(token: str) -> List[str]:
+        padded = f"  {token} "
+        return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+    def _load(self):
+        try:
+            with open(self.index_file) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("format") != self.FORMAT:
+            return
+        self.files, self.docs = data["files"], data["docs"]
+        for doc_id, doc in self.docs.items():
+            self._post(doc_id, doc["terms"])
+        self._finish()
+
+    def save(self):
+        tmp = self.index_file.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"format": self.FORMAT, "files": self.files, "docs": self.docs}, f, separators=(",", ":"))
+        os.replace(tmp, self.index_file)
+
+    def _post(self, doc_id: str, terms: Dict[str, int]):
+        for term, tf in terms.items():
+            bucket = self.postings.get(term)
+            if bucket is None:
+                bucket = self.postings[term] = {}
+                for gram in self._grams(term):
+                    self.trigrams.setdefault(gram, set()).add(term)
+            bucket[doc_id] = tf
+
+    def _unpost(self, doc_id: str):
+        for term in self.docs[doc_id]["terms"]:
+            bucket = self.postings.get(term)
+            if bucket is not None:
+                bucket.pop(doc_id, None)
+                if not bucket:
+                    del self.postings[term]
+                    for gram in self._grams(term):
+                        self.trigrams.get(gram, set()).discard(term)
+        del self.docs[doc_id]
+
+    def _finish(self):
+        self.vocabulary = sorted(self.postings)
+        self._cache.clear()
+
+    @staticmethod
+    def markdown_sections(text: str) -> List[Tuple[str, str]]:
+        """(heading, body) per markdown heading; text before the first heading is its own section"""
+        sections, title, body = [], "", []
+        in_code = False
+        for line in text.splitlines():
+            if line.startswith("```"):
+                in_code = not in_code
+            if not in_code and line.startswith("#"):
+                if title or any(b.strip() for b in body):
+                    sections.append((title, "\n".join(body)))
+                title, body = line.lstrip("#").strip(), []
+            else:
+                body.append(line)
+        sections.append((title, "\n".join(body)))
+        return sections
+
+    def _index_source(self, source: str, mtime: float, size: int, sections: List[Tuple[str, str, str]]) -> int:
+        """Replace a source's sections, re-tokenizing only those whose content changed"""
+        old_ids = self.files.get(source, [0, 0, []])[2]
+        old_by_hash = {self.docs[d]["hash"]: d for d in old_ids if d in self.docs}
+        new_ids, changed = [], 0
+        for ordinal, (title, body, snippet) in enumerate(sections):
+            digest = hashlib.sha1(f"{title}\0{body}".encode()).hexdigest()[:16]
+            doc_id = old_by_hash.pop(digest, None)
+            if doc_id is None:
+                doc_id = f"{source}#{ordinal}:{digest[:6]}"
+                terms: Dict[str, int] = {}
+                for token in self.tokenize(body):
+                    terms[token] = terms.get(token, 0) + 1
+                for token in self.tokenize(title):
+                    # Heading words weigh like several mentions in the body
+                    terms[token] = terms.get(token, 0) + 5
+                self.docs[doc_id] = {"source": source, "title": title, "snippet": snippet, "hash": digest,
+                                     "terms": terms}
+                self._post(doc_id, terms)
+                changed += 1
+            new_ids.append(doc_id)
+        for doc_id in old_by_hash.values():
+            self._unpost(doc_id)
+        self.files[source] = [mtime, size, new_ids]
+        return changed
+
+    def update(self, guides: List[Path], recipe_files: List[Path]) -> int:
+        """Bring the index up to date; returns the number of (re)indexed sections"""
+        changed = 0
+        seen = set()
+        for path in guides + recipe_files:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            source = str(path)
+            seen.add(source)
+            known = self.files.get(source)
+            if known and known[0] == stat.st_mtime and known[1] == stat.st_size:
+                continue
+            if path.suffix in (".json", ".jsonl"):
+                sections = []
+                for recipe in iter_recipe_file(path):
+                    body = " ".join([recipe.get("description", ""), recipe.get("category", ""),
+                                     recipe.get("difficulty", ""), recipe.get("yaml", ""),
+                                     recipe.get("access", "")] + list((recipe.get("commands") or {}).values()))
+                    sections.append((f"Recipe {recipe['id']}: {recipe['name']}", body,
+                                     recipe.get("description", "")))
+            else:
+                sections = [(title, body, " ".join(body.split())[:160])
+                            for title, body in self.markdown_sections(path.read_text(errors="replace"))]
+            changed += self._index_source(source, stat.st_mtime, stat.st_size, sections)
+        for source in [s for s in self.files if s not in seen]:
+            for doc_id in self.files.pop(source)[2]:
+                if doc_id in self.docs:
+                    self._unpost(doc_id)
+            changed += 1
+        if changed:
+            self._finish()
+            self.save()
+        return changed
+
+    def _expand(self, token: str, prefix: bool) -> Dict[str, float]:
+        """Vocabulary terms matching a query token, with a similarity weight"""
+        matches: Dict[str, float] = {}
+        if token in self.postings:
+            matches[token] = 1.0
+        if prefix:
+            start = bisect.bisect_left(self.vocabulary, token)
+            for term in self.vocabulary[start:start + 50]:
+                if not term.startswith(token):
+                    break
+                matches.setdefault(term, 0.9)
+        if len(token) >= 3:
+            grams = self._grams(token)
+            overlap: Dict[str, int] = {}
+            for gram in grams:
+                for term in self.trigrams.get(gram, ()):
+                    overlap[term] = overlap.get(term, 0) + 1
+            for term, shared in overlap.items():
+                score = shared / (len(grams) + len(term) + 2 - shared)
+                if score >= 0.4 and term not in matches:
+                    matches[term] = score * 0.8
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """Ranked sections for a (possibly partial, possibly misspelled) query"""
+        tokens = self.tokenize(query)
+        # The word being typed is matched as a prefix; a trailing space means it is finished
+        typing = not query.endswith(" ")
+        key = (tuple(tokens), typing, limit)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        total = len(self.docs) or 1
+        scores: Dict[str, float] = {}
+        for i, token in enumerate(tokens):
+            prefix = typing and i == len(tokens) - 1
+            for term, weight in self._expand(token, prefix).items():
+                bucket = self.postings[term]
+                idf = math.log(1 + total / len(bucket))
+                for doc_id, tf in bucket.items():
+                    scores[doc_id] = scores.get(doc_id, 0.0) + weight * idf * (1 + math.log(tf))
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        results = [{"source": self.docs[d]["source"], "title": self.docs[d]["title"],
+                    "snippet": self.docs[d]["snippet"], "score": round(score, 3)} for d, score in best]
+        self._cache[key] = results
+        if len(self._cache) > 256:
+            self._cache.popitem(last=False)
+        return results
+
+
+# Section text content packs (compressed, loaded when a section is opened)
+class ContentPack:
+    """Section text kept out of the module: content/*.txt sources compiled into a zlib pack
+
+    A source file holds 'key: value' metadata lines (title, emoji) followed by blocks
+    that start with '=== name ==='. The pack stores a small JSON index (per section:
+    title, block names, blob offset/size) followed by one compressed blob per section,
+    so only the index is read at startup and a section is decompressed on first use.
+    Color tags like {bold} or {code} and caller values like {start_command} are filled
+    in at render time; anything else in braces is left as written.
+    """
+
+    MAGIC = b"MKTP"
+    FORMAT_VERSION = 1
+    HEADER = struct.Struct("<4sHI")
+    COLOR_TAGS = {"bold": "BOLD", "endc": "ENDC", "code": "OKGREEN", "ok": "OKGREEN", "cyan": "OKCYAN",
+                  "blue": "OKBLUE", "warn": "WARNING", "fail": "FAIL", "header": "HEADER", "underline": "UNDERLINE"}
+    TAG = re.compile(r"\{(\w+)\}")
+
+    def __init__(self, paths: List[Path], max_rendered: int = 64):
+        self.paths = [Path(p) for p in paths]
+        self.max_rendered = max_rendered
+        self.sections: Dict[str, Dict] = {}
+        self._blobs: Dict[str, Dict[str, str]] = {}
+        self._rendered: "OrderedDict[tuple, str]" = OrderedDict()
+        for path in self.paths:
+            self._read_index(path)
+
+    def _read_index(self, path: Path):
+        with open(path, "rb") as f:
+            magic, version, index_size = self.HEADER.unpack(f.read(self.HEADER.size))
+            if magic != self.MAGIC or version != self.FORMAT_VERSION:
+                raise ValueError(f"{path}: not a content pack (format {version})")
+            index = json.loads(f.read(index_size))
+        data_start = self.HEADER.size + index_size
+        for name, entry in index["sections"].items():
+            # Later packs override earlier ones section by section
+            self.sections[name] = dict(entry, path=path, offset=data_start + entry["offset"],
+                                       content_version=index["content_version"])
+            self._blobs.pop(name, None)
+
+    # Building
+    @staticmethod
+    def parse_source(text: str) -> Tuple[Dict, Dict[str, str]]:
+        meta, blocks, current, lines = {}, {}, None, []
+        for line in text.splitlines():
+            match = re.match(r"^=== (\S+) ===$", line)
+            if match:
+                if current:
+                    blocks[current] = "\n".join(lines).rstrip("\n") + "\n"
+                current, lines = match.group(1), []
+            elif current:
+                lines.append(line)
+            elif ":" in line:
+                key, _, value = line.partition(":")
+                meta[key.strip()] = value.strip()
+        if current:
+            blocks[current] = "\n".join(lines).rstrip("\n") + "\n"
+        return meta, blocks
+
+    @classmethod
+    def build(cls, source_dir: Path, output: Path) -> Dict:
+        """Compile every <section>.txt under source_dir into one pack (byte-identical for identical sources)"""
+        sources = sorted(Path(source_dir).glob("*.txt"))
+        digest, blobs, sections, offset = hashlib.sha256(), [], {}, 0
+        for source in sources:
+            text = source.read_text(encoding="utf-8")
+            digest.update(source.name.encode() + b"\0" + text.encode())
+            meta, blocks = cls.parse_source(text)
+            blob = zlib.compress(json.dumps(blocks, ensure_ascii=False, sort_keys=True).encode(), 9)
+            sections[source.stem] = {"title": meta.get("title", source.stem.replace("_", " ").title()),
+                                     "emoji": meta.get("emoji", ""), "blocks": list(blocks),
+                                     "offset": offset, "size": len(blob),
+                                     "raw_size": sum(len(b) for b in blocks.values())}
+            blobs.append(blob)
+            offset += len(blob)
+        index = json.dumps({"content_version": digest.hexdigest()[:12], "sections": sections},
+                           ensure_ascii=False, sort_keys=True).encode()
+        output.parent.mkdir(parents=True, exist_ok=True)
+        tmp = output.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.FORMAT_VERSION, len(index)))
+            f.write(index)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp, output)
+        return {"sections": len(sections), "bytes": output.stat().st_size,
+                "raw_bytes": sum(s["raw_size"] for s in sections.values()),
+                "content_version": digest.hexdigest()[:12]}
+
+    @classmethod
+    def ensure_built(cls, source_dir: Path, pack: Path, fallback: Optional[Path] = None) -> Optional[Path]:
+        """The pack for source_dir, rebuilt if any source is newer (into fallback when pack is not writable)"""
+        sources = list(Path(source_dir).glob("*.txt")) if Path(source_dir).is_dir() else []
+        newest = max((s.stat().st_mtime for s in sources), default=0)
+        for candidate in filter(None, (pack, fallback)):
+            if candidate.exists() and candidate.stat().st_mtime >= newest:
+                return candidate
+        if not sources:
+            return pack if pack.exists() else None
+        for candidate in filter(None, (pack, fallback)):
+            try:
+                cls.build(source_dir, candidate)
+                return candidate
+            except OSError as e:
+                logger.warning(f"Could not write content pack {candidate}: {e}")
+        return None
+
+    # Reading and rendering
+    def _blocks(self, section: str) -> Dict[str, str]:
+        if section not in self._blobs:
+            entry = self.sections[section]
+            with open(entry["path"], "rb") as f:
+                f.seek(entry["offset"])
+                self._blobs[section] = json.loads(zlib.decompress(f.read(entry["size"])))
+        return self._blobs[section]
+
+    def has(self, section: str, block: Optional[str] = None) -> bool:
+        return section in self.sections and (block is None or block in self.sections[section]["blocks"])
+
+    def render(self, section: str, block: str = "main", **values) -> str:
+        """Block text with the current Colors and the given values substituted (LRU cached)"""
+        colors = tuple(getattr(Colors, attr) for attr in self.COLOR_TAGS.values())
+        key = (section, block, colors, tuple(sorted((k, str(v)) for k, v in values.items())))
+        if key in self._rendered:
+            self._rendered.move_to_end(key)
+            return self._rendered[key]
+        fills = dict(zip(self.COLOR_TAGS, colors), **{k: str(v) for k, v in values.items()})
+        text = self.TAG.sub(lambda m: fills.get(m.group(1), m.group(0)), self._blocks(section)[block])
+        self._rendered[key] = text
+        if len(self._rendered) > self.max_rendered:
+            self._rendered.popitem(last=False)
+        return text
+
+    def render_section(self, section: str, **values) -> str:
+        return "".join(self.render(section, block, **values) for block in self.sections[section]["blocks"])
+
+
+# Kubernetes API client (pooled keep-alive connections instead of kubectl forks)
+class KubeAPIError(Exception):
+    """Non-2xx answer from the Kubernetes API server"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class KubeClient:
+    """Minimal Kubernetes API client built from the kubeconfig minikube writes"""
+
+    DISCOVERY_TTL = 600
+    # Workload readiness, read from the object status the way 'kubectl rollout status' does
+    READY_CHECKS = {
+        "Deployment": lambda o, s: s.get("observedGeneration", 0) >= o["metadata"].get("generation", 0)
+        and s.get("updatedReplicas", 0) == s.get("availableReplicas", 0) == (o["spec"].get("replicas", 1)),
+        "StatefulSet": lambda o, s: s.get("observedGeneration", 0) >= o["metadata"].get("generation", 0)
+        and s.get("readyReplicas", 0) == o["spec"].get("replicas", 1),
+        "DaemonSet": lambda o, s: s.get("desiredNumberScheduled", -1) == s.get("numberReady"),
+        "Pod": lambda o, s: any(c.get("type") == "Ready" and c.get("status") == "True"
+                                for c in s.get("conditions") or []),
+        "Job": lambda o, s: any(c.get("type") == "Complete" and c.get("status") == "True"
+                                for c in s.get("conditions") or []),
+    }
+
+    def __init__(self, server: str, ssl_context=None, headers: Optional[Dict[str, str]] = None,
+                 namespace: str = "default", pool_size: int = 8, timeout: float = 30.0,
+                 cache_file: Optional[Path] = None):
+        parsed = urllib.parse.urlsplit(server)
+        self.server = server.rstrip("/")
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        self.base_path = parsed.path.rstrip("/")
+        self.ssl_context = ssl_context
+        self.headers = dict(headers or {})
+        self.namespace = namespace
+        self.timeout = timeout
+        self.cache_file = cache_file
+        self.on_request: Optional[Callable[[str, str, int, float, int], None]] = None
+        self._pool: "queue.LifoQueue" = queue.LifoQueue(maxsize=max(1, pool_size))
+        self._resources: Dict[str, Dict] = {}
+        self._groups: Optional[Dict[str, str]] = None
+        self._discovered: set = set()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self._load_discovery()
+
+    @classmethod
+    def from_kubeconfig(cls, path: Optional[str] = None, context: Optional[str] = None,
+                        cache_file: Optional[Path] = None) -> "KubeClient":
+        """Build a client from KUBECONFIG (or ~/.kube/config) and a context, default the current one"""
+        paths = [Path(p) for p in (path or os.environ.get("KUBECONFIG") or
+                                   str(Path.home() / ".kube" / "config")).split(os.pathsep) if p]
+        merged: Dict = {"clusters": {}, "users": {}, "contexts": {}, "current-context": None}
+        bases: Dict[Tuple[str, str], Path] = {}
+        for config_path in paths:
+            if not config_path.exists():
+                continue
+            docs = load_manifest(config_path)
+            config = docs[0] if docs else {}
+            for section, key in (("clusters", "cluster"), ("users", "user"), ("contexts", "context")):
+                for entry in config.get(section) or []:
+                    if entry.get("name") not in merged[section]:
+                        merged[section][entry["name"]] = entry.get(key) or {}
+                        bases[(section, entry["name"])] = config_path.parent
+            merged["current-context"] = merged["current-context"] or config.get("current-context")
+        name = context or merged["current-context"]
+        if not name or name not in merged["contexts"]:
+            raise ValueError(f"kubeconfig has no context '{name}'" if name else "kubeconfig has no current context")
+        ctx = merged["contexts"][name]
+        cluster = merged["clusters"].get(ctx.get("cluster"))
+        user = merged["users"].get(ctx.get("user"), {})
+        if cluster is None or not cluster.get("server"):
+            raise ValueError(f"kubeconfig context '{name}' has no cluster server")
+
+        def resolve(section: str, owner: str, value: str) -> str:
+            return str((bases[(section, owner)] / value).resolve())
+
+        ssl_context = None
+        if cluster["server"].startswith("https"):
+            ssl_context = ssl.create_default_context()
+            if cluster.get("insecure-skip-tls-verify"):
+                ssl_context.check_hostname = False
+                ssl_context.verify_mode = ssl.CERT_NONE
+            elif cluster.get("certificate-authority-data"):
+                ssl_context.load_verify_locations(
+                    cadata=base64.b64decode(cluster["certificate-authority-data"]).decode())
+            elif cluster.get("certificate-authority"):
+                ssl_context.load_verify_locations(resolve("clusters", ctx["cluster"],
+                                                          cluster["certificate-authority"]))
+            if user.get("client-certificate-data") and user.get("client-key-data"):
+                with tempfile.TemporaryDirectory() as tmp:
+                    cert, key = Path(tmp) / "client.crt", Path(tmp) / "client.key"
+                    cert.write_bytes(base64.b64decode(user["client-certificate-data"]))
+                    key.write_bytes(base64.b64decode(user["client-key-data"]))
+                    ssl_context.load_cert_chain(str(cert), str(key))
+            elif user.get("client-certificate") and user.get("client-key"):
+                ssl_context.load_cert_chain(resolve("users", ctx["user"], user["client-certificate"]),
+                                            resolve("users", ctx["user"], user["client-key"]))
+        headers = {"Authorization": f"Bearer {user['token']}"} if user.get("token") else {}
+        return cls(cluster["server"], ssl_context, headers, ctx.get("namespace") or "default",
+                   cache_file=cache_file)
+
+    # Connections
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout, context=self.ssl_context)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        """A pooled connection the server has not closed (readable while idle means EOF), else a new one"""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return self._new_connection()
+            try:
+                if conn.sock is not None and not select.select([conn.sock], [], [], 0)[0]:
+                    return conn
+            except (OSError, ValueError):
+                pass
+            conn.close()
+
+    def _release(self, conn: http.client.HTTPConnection):
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def request(self, method: str, path: str, body: Optional[Dict] = None, params: Optional[Dict] = None,
+                content_type: str = "application/json", raw: Optional[bytes] = None) -> Dict:
+        """One API call on a pooled keep-alive connection; retried once if the server dropped it
+
+        Only GETs are retried after the request went out: a PATCH or DELETE the server may already have
+        acted on is not sent twice. `raw` is sent as the body unchanged (e.g. YAML for server-side apply)
+        instead of JSON-encoding `body`.
+        """
+        if params:
+            path += "?" + urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
+        headers = dict(self.headers, Accept="application/json")
+        payload = raw
+        if body is not None:
+            payload = json.dumps(body).encode()
+        if payload is not None:
+            headers["Content-Type"] = content_type
+        started = time.perf_counter()
+        for attempt in (1, 2):
+            conn = self._acquire()
+            sent = False
+            try:
+                conn.request(method, self.base_path + path, body=payload, headers=headers)
+                sent = True
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, ConnectionError, BrokenPipeError):
+                conn.close()
+                if attempt == 2 or (sent and method != "GET"):
+                    raise
+                continue
+            self.requests += 1
+            if self.on_request and method != "GET":
+                self.on_request(method, path, response.status, time.perf_counter() - started, len(data))
+            if response.getheader("Connection", "").lower() == "close":
+                conn.close()
+            else:
+                self._release(conn)
+            try:
+                result = json.loads(data) if data else {}
+            except ValueError:
+                result = {"message": data.decode(errors="replace").strip()}
+            if response.status >= 400:
+                raise KubeAPIError(response.status, result.get("message") or response.reason)
+            return result
+        return {}
+
+    # Discovery
+    def _load_discovery(self):
+        if not self.cache_file or not self.cache_file.exists():
+            return
+        try:
+            cached = json.loads(self.cache_file.read_text()).get(self.server) or {}
+        except (OSError, ValueError):
+            return
+        if time.time() - cached.get("time", 0) < self.DISCOVERY_TTL:
+            self._resources = cached.get("resources", {})
+            self._groups = cached.get("groups")
+            self._discovered = set(cached.get("discovered", []))
+
+    def _save_discovery(self):
+        if not self.cache_file:
+            return
+        try:
+            data = json.loads(self.cache_file.read_text()) if self.cache_file.exists() else {}
+        except (OSError, ValueError):
+            data = {}
+        data[self.server] = {"time": time.time(), "resources": self._resources, "groups": self._groups,
+                             "discovered": sorted(self._discovered)}
+        try:
+            self.cache_file.write_text(json.dumps(data))
+        except OSError:
+            pass
+
+    def _discover(self, group_version: str):
+        if group_version in self._discovered:
+            return
+        path = "/api/v1" if group_version == "v1" else f"/apis/{group_version}"
+        for resource in self.request("GET", path).get("resources", []):
+            if "/" in resource["name"]:
+                continue
+            entry = {"gv": group_version, "plural": resource["name"], "namespaced": resource["namespaced"],
+                     "kind": resource["kind"]}
+            for alias in [resource["kind"].lower(), resource["name"], resource.get("singularName") or ""] + \
+                    (resource.get("shortNames") or []):
+                if alias:
+                    self._resources.setdefault(f"{group_version}:{alias.lower()}", entry)
+                    self._resources.setdefault(alias.lower(), entry)
+        self._discovered.add(group_version)
+        self._save_discovery()
+
+    def resource(self, kind: str, api_version: Optional[str] = None) -> Dict:
+        """gv, plural and scope for a kind ('Deployment', 'deploy', 'pods', ...), discovered once and cached"""
+        key = f"{api_version}:{kind.lower()}" if api_version else kind.lower()
+        with self._lock:
+            if key not in self._resources:
+                if api_version:
+                    self._discover(api_version)
+                else:
+                    self._discover("v1")
+                    if key not in self._resources:
+                        if self._groups is None:
+                            self._groups = {g["name"]: g["preferredVersion"]["groupVersion"]
+                                            for g in self.request("GET", "/apis").get("groups", [])}
+                            self._save_discovery()
+                        for group_version in self._groups.values():
+                            self._discover(group_version)
+                            if key in self._resources:
+                                break
+            if key not in self._resources:
+                raise KubeAPIError(404, f"the server doesn't have a resource type '{kind}'")
+            return self._resources[key]
+
+    def path(self, kind: str, name: Optional[str] = None, namespace: Optional[str] = None,
+             api_version: Optional[str] = None) -> str:
+        info = self.resource(kind, api_version)
+        path = "/api/v1" if info["gv"] == "v1" else f"/apis/{info['gv']}"
+        if info["namespaced"] and namespace:
+            path += f"/namespaces/{namespace}"
+        path += f"/{info['plural']}"
+        return path + (f"/{name}" if name else "")
+
+    # Operations
+    def get(self, kind: str, name: str, namespace: Optional[str] = None) -> Dict:
+        return self.request("GET", self.path(kind, name, namespace or self.namespace))
+
+    def list(self, kind: str, namespace: Optional[str] = None, label_selector: Optional[str] = None) -> List[Dict]:
+        """Objects of a kind in one namespace, or across all namespaces when namespace is None"""
+        info = self.resource(kind)
+        result = self.request("GET", self.path(kind, namespace=namespace),
+                              params={"labelSelector": label_selector})
+        for item in result.get("items", []):
+            item.setdefault("kind", info["kind"])
+        return result.get("items", [])
+
+    def apply(self, doc: Dict, field_manager: str = "minikube-tutorial", source: Optional[str] = None) -> Dict:
+        """Server-side apply of one manifest object; `source` sends its YAML text in place of the parsed doc"""
+        meta = doc.get("metadata") or {}
+        namespace = meta.get("namespace") or self.namespace
+        return self.request("PATCH", self.path(doc["kind"], meta["name"], namespace, doc.get("apiVersion")),
+                            body=None if source else doc, raw=source.encode() if source else None,
+                            params={"fieldManager": field_manager, "force": "true"},
+                            content_type="application/apply-patch+yaml")
+
+    def delete(self, kind: str, name: str, namespace: Optional[str] = None, ignore_not_found: bool = True) -> bool:
+        """Delete with background propagation; False when it was already gone"""
+        try:
+            self.request("DELETE", self.path(kind, name, namespace or self.namespace),
+                         body={"propagationPolicy": "Background"})
+            return True
+        except KubeAPIError as e:
+            if e.status == 404 and ignore_not_found:
+                return False
+            raise
+
+    def watch(self, kind: str, namespace: Optional[str] = None, label_selector: Optional[str] = None,
+              resource_version: Optional[str] = None, timeout: int = 300):
+        """Yield watch events ({"type": ..., "object": ...}) on a dedicated streaming connection"""
+        params = {"watch": "1", "labelSelector": label_selector, "resourceVersion": resource_version,
+                  "timeoutSeconds": str(timeout), "allowWatchBookmarks": "true"}
+        conn = self._new_connection()
+        conn.timeout = timeout + 10
+        try:
+            conn.request("GET", self.base_path + self.path(kind, namespace=namespace) + "?" +
+                         urllib.parse.urlencode({k: v for k, v in params.items() if v is not None}),
+                         headers=dict(self.headers, Accept="application/json"))
+            response = conn.getresponse()
+            if response.status >= 400:
+                raise KubeAPIError(response.status, response.read().decode(errors="replace").strip())
+            while True:
+                line = response.readline()
+                if not line:
+                    return
+                if line.strip():
+                    yield json.loads(line)
+        finally:
+            conn.close()
+
+    def is_ready(self, doc: Dict) -> bool:
+        """Whether a workload object has rolled out (non-workloads are ready once they exist)"""
+        check = self.READY_CHECKS.get(doc.get("kind", ""))
+        meta = doc.get("metadata") or {}
+        live = self.get(doc["kind"], meta["name"], meta.get("namespace"))
+        live.setdefault("spec", {})
+        return check is None or bool(check(live, live.get("status") or {}))
+
+    def wait_ready(self, doc: Dict, timeout: float = 300, interval: float = 1.0) -> Tuple[bool, str]:
+        """Poll one object until ready or the deadline passes"""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                if self.is_ready(doc):
+                    return True, "ready"
+            except KubeAPIError as e:
+                if e.status != 404:
+                    return False, str(e)
+            if time.monotonic() >= deadline:
+                return False, f"timed out after {timeout:.0f}s"
+            time.sleep(interval)
+
+
+# Bulk teardown of recipe resources
+MANAGED_LABEL = "minikube-tutorial/managed"
+RECIPE_LABEL = "minikube-tutorial/recipe"
+CATEGORY_LABEL = "minikube-tutorial/category"
+
+
+def label_value(text) -> str:
+    """Turn free text (e.g. a recipe category) into a valid label value"""
+    return re.sub(r"[^a-z0-9]+", "-", str(text).lower()).strip("-")[:63] or "none"
+
+
+def recipe_labels(recipe: Dict) -> List[str]:
+    """key=value labels the tutorial puts on every object of a deployed recipe"""
+    return [f"{MANAGED_LABEL}=true", f"{RECIPE_LABEL}={recipe['id']}",
+            f"{CATEGORY_LABEL}={label_value(recipe.get('category', 'none'))}"]
+
+
+_STAGED_LOCK = threading.Lock()
+_STAGED_USERS: Dict[Path, int] = {}
+
+
+def apply_labelled(runner: Callable[..., Tuple[bool, str]], path, labels: List[str], description: str,
+                   timeout: int = 120) -> Tuple[bool, str]:
+    """kubectl apply a manifest with its objects labelled so bulk teardown finds them
+
+    The labels go in before the apply: 'kubectl label --local' relabels the file as kubectl parses it
+    (so nothing is lost to our parser) and the result is what gets applied. Labelling afterwards left
+    the objects unlabelled, and invisible to teardown, whenever the second call failed.
+    """
+    if not labels:
+        return runner(["kubectl", "apply", "-f", str(path)], description, timeout=timeout)
+    ok, labelled = runner(["kubectl", "label", "--local", "-f", str(path), "--overwrite", "-o", "json"] + labels,
+                          f"Labeling {Path(path).name}", timeout=timeout)
+    if not ok:
+        return False, labelled
+    try:
+        json.loads(labelled)
+    except ValueError:
+        return False, f"kubectl label --local gave no manifest for {path}"
+    # Named by content so a recorded session replays the same command line; profiles deploying the same
+    # recipe in parallel share the file, and the last one out removes it
+    digest = hashlib.sha256(labelled.encode()).hexdigest()[:16]
+    staged = Path(tempfile.gettempdir()) / f"minikube-tutorial-{digest}.json"
+    with _STAGED_LOCK:
+        if not _STAGED_USERS.get(staged):
+            staged.write_text(labelled)
+        _STAGED_USERS[staged] = _STAGED_USERS.get(staged, 0) + 1
+    try:
+        return runner(["kubectl", "apply", "-f", str(staged)], description, timeout=timeout)
+    finally:
+        with _STAGED_LOCK:
+            _STAGED_USERS[staged] -= 1
+            if not _STAGED_USERS[staged]:
+                del _STAGED_USERS[staged]
+                try:
+                    staged.unlink()
+                except OSError:
+                    pass
+
+
+class BulkTeardown:
+    """Delete many recipes (or everything the tutorial deployed) in one batched, waited call"""
+
+    # Kinds swept by the label-based prune when no manifest lists them
+    KINDS = ("deployment", "statefulset", "daemonset", "job", "cronjob", "pod", "service", "configmap",
+             "secret", "horizontalpodautoscaler", "networkpolicy", "ingress", "serviceaccount", "resourcequota",
+             "clusterrole", "clusterrolebinding")
+    # Only swept with purge_volumes: deleting a namespace takes its volume claims with it
+    VOLUME_KINDS = ("persistentvolumeclaim", "namespace")
+
+    def __init__(self, runner: Callable[..., Tuple[bool, str]], timeout: int = 180):
+        self.runner = runner
+        self.timeout = max(1, timeout)
+        self._parsed: Dict[str, List[Dict]] = {}
+
+    @staticmethod
+    def select(recipes: List[Dict], ids: Optional[List[int]] = None,
+               category: Optional[str] = None) -> List[Dict]:
+        """Recipes matching an id list and/or a category (case-insensitive)"""
+        selected = [r for r in recipes if ids is None or r['id'] in ids]
+        if category:
+            selected = [r for r in selected if label_value(r.get('category', '')) == label_value(category)]
+        return selected
+
+    def _manifests(self, recipes: List[Dict]) -> List[Dict]:
+        docs = []
+        for recipe in recipes:
+            if recipe['yaml'] not in self._parsed:
+                try:
+                    self._parsed[recipe['yaml']] = load_manifest(recipe['yaml'])
+                except (OSError, ValueError):
+                    self._parsed[recipe['yaml']] = []
+            docs.extend(self._parsed[recipe['yaml']])
+        return docs
+
+    def kinds(self, recipes: List[Dict], purge_volumes: bool = False) -> List[str]:
+        """Kinds to sweep: the fixed list plus anything the recipe manifests declare"""
+        kinds = list(self.KINDS) + (list(self.VOLUME_KINDS) if purge_volumes else [])
+        for doc in self._manifests(recipes):
+            kind = str(doc.get("kind", "")).lower()
+            if kind and kind not in kinds and kind != "list" and (purge_volumes or kind not in self.VOLUME_KINDS):
+                kinds.append(kind)
+        return kinds
+
+    @staticmethod
+    def claim_prefixes(docs: List[Dict]) -> List[Tuple[Optional[str], str]]:
+        """(namespace, name prefix) of PVCs created from StatefulSet volumeClaimTemplates
+
+        Deleting a StatefulSet leaves these claims behind, so they have to be found by name.
+        """
+        prefixes = []
+        for doc in docs:
+            if doc.get("kind") != "StatefulSet":
+                continue
+            meta = doc.get("metadata") or {}
+            for template in (doc.get("spec") or {}).get("volumeClaimTemplates") or []:
+                claim = (template.get("metadata") or {}).get("name")
+                if claim:
+                    prefixes.append((meta.get("namespace"), f"{claim}-{meta.get('name')}-"))
+        return prefixes
+
+    def selection(self, recipes: List[Dict], everything: bool = False, purge_volumes: bool = False) -> List[str]:
+        """kubectl arguments naming the objects to tear down"""
+        if everything:
+            return [",".join(self.kinds(recipes, purge_volumes)), "-l", f"{MANAGED_LABEL}=true", "--all-namespaces"]
+        args = []
+        for recipe in recipes:
+            if Path(recipe['yaml']).exists():
+                args += ["-f", recipe['yaml']]
+        return args
+
+    def delete_command(self, recipes: List[Dict], everything: bool = False,
+                       purge_volumes: bool = False) -> List[str]:
+        """One kubectl delete for the whole selection, waiting up to the deadline; [] when nothing is selected"""
+        selection = self.selection(recipes, everything, purge_volumes)
+        if not selection:
+            return []
+        return ["kubectl", "delete"] + selection + ["--ignore-not-found", "--wait=true", f"--timeout={self.timeout}s"]
+
+    def _get_items(self, cmd: List[str]) -> List[Dict]:
+        ok, output = self.runner(cmd, "Checking for leftovers", timeout=30)
+        if not ok or not output.strip():
+            return []
+        try:
+            data = json.loads(output)
+        except ValueError:
+            return []
+        return data.get("items", [data]) if isinstance(data, dict) else []
+
+    def leftovers(self, recipes: List[Dict], everything: bool = False,
+                  purge_volumes: bool = False) -> Tuple[List[Dict], List[Dict]]:
+        """Objects still present after the delete, and claims left behind by StatefulSets"""
+        selection = self.selection(recipes, everything, purge_volumes)
+        claims_cmd = ["kubectl", "get", "persistentvolumeclaim", "--all-namespaces", "-o", "json"]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            claims_future = pool.submit(self._get_items, claims_cmd)
+            remaining = self._get_items(["kubectl", "get"] + selection + ["-o", "json", "--ignore-not-found"]) \
+                if selection else []
+            claims = claims_future.result()
+
+        def describe(item: Dict) -> Dict:
+            meta = item.get("metadata") or {}
+            return {"kind": item.get("kind", "?"), "namespace": meta.get("namespace"),
+                    "name": meta.get("name", "?"), "finalizers": meta.get("finalizers") or [],
+                    "terminating": bool(meta.get("deletionTimestamp")),
+                    "phase": (item.get("status") or {}).get("phase")}
+
+        prefixes = self.claim_prefixes(self._manifests(recipes))
+        volumes = []
+        for item in claims:
+            meta = item.get("metadata") or {}
+            labels = meta.get("labels") or {}
+            if (everything and labels.get(MANAGED_LABEL) == "true") or any(
+                    meta.get("name", "").startswith(prefix) and namespace in (None, meta.get("namespace"))
+                    for namespace, prefix in prefixes):
+                volumes.append(describe(item))
+        return [describe(item) for item in remaining], volumes
+
+    def run(self, recipes: List[Dict], everything: bool = False, purge_volumes: bool = False) -> Dict:
+        """Delete the selection, wait for it to be gone, then report what is still holding on"""
+        started = time.monotonic()
+        report = {"recipes": [r['name'] for r in recipes], "everything": everything, "ok": True,
+                  "timed_out": False, "deleted": [], "remaining": [], "volumes": [], "purged": []}
+        command = self.delete_command(recipes, everything, purge_volumes)
+        if command:
+            label = "everything deployed by the tutorial" if everything else f"{len(recipes)} recipe(s)"
+            ok, output = self.runner(command, f"Tearing down {label}", timeout=self.timeout + 30)
+            report["ok"] = ok
+            report["timed_out"] = not ok and ("timed out" in output or output == "Command timeout")
+            report["deleted"] = [line.split(" deleted")[0].strip('"') for line in output.splitlines()
+                                 if line.endswith("deleted")]
+            if not ok:
+                report["error"] = output.strip()
+        report["remaining"], report["volumes"] = self.leftovers(recipes, everything, purge_volumes)
+
+        if purge_volumes and report["volumes"]:
+            by_namespace: Dict[str, List[str]] = {}
+            for volume in report["volumes"]:
+                by_namespace.setdefault(volume["namespace"] or "default", []).append(volume["name"])
+            with ThreadPoolExecutor(max_workers=min(8, len(by_namespace))) as pool:
+                futures = {pool.submit(self.runner, ["kubectl", "delete", "persistentvolumeclaim", "-n", ns]
+                                       + names + ["--ignore-not-found", "--wait=true",
+                                                  f"--timeout={self.timeout}s"],
+                                       f"Deleting {len(names)} volume claim(s) in {ns}",
+                                       timeout=self.timeout + 30): names
+                           for ns, names in by_namespace.items()}
+                for future, names in futures.items():
+                    if future.result()[0]:
+                        report["purged"].extend(names)
+            report["volumes"] = [v for v in report["volumes"] if v["name"] not in report["purged"]]
+
+        report["duration"] = time.monotonic() - started
+        return report
+
+    @staticmethod
+    def print_report(report: Dict):
+        """Print a teardown summary, including anything blocking cleanup"""
+        target = "everything deployed by the tutorial" if report["everything"] else \
+            ", ".join(report["recipes"]) or "nothing"
+        color = Colors.OKGREEN if report["ok"] and not report["remaining"] else Colors.WARNING
+        print(f"\n{color}{Colors.BOLD}Teardown of {target}: {len(report['deleted'])} object(s) deleted "
+              f"in {report['duration']:.1f}s{Colors.ENDC}")
+        if report["timed_out"]:
+            print(f"{Colors.FAIL}✗ Deadline reached before every object was gone{Colors.ENDC}")
+        elif not report["ok"]:
+            print(f"{Colors.FAIL}✗ {report.get('error', 'kubectl delete failed')}{Colors.ENDC}")
+        for item in report["remaining"]:
+            where = f"{item['namespace']}/" if item["namespace"] else ""
+            state = "terminating" if item["terminating"] else "still present"
+            finalizers = f", finalizers: {', '.join(item['finalizers'])}" if item["finalizers"] else ""
+            print(f"  {Colors.WARNING}! {item['kind']} {where}{item['name']} ({state}{finalizers}){Colors.ENDC}")
+        for volume in report["volumes"]:
+            finalizers = f", finalizers: {', '.join(volume['finalizers'])}" if volume["finalizers"] else ""
+            print(f"  {Colors.WARNING}! PersistentVolumeClaim {volume['namespace']}/{volume['name']} "
+                  f"({volume['phase'] or 'unknown'}{finalizers}){Colors.ENDC}")
+        if report["volumes"]:
+            print(f"  {Colors.OKCYAN}Volume claims are kept on purpose; rerun with --purge-volumes "
+                  f"to delete them{Colors.ENDC}")
+        for name in report["purged"]:
+            print(f"  {Colors.OKGREEN}✓ Deleted volume claim {name}{Colors.ENDC}")
+        print()
+
+
+# Dependency-ordered deploys
+class TieredDeploy:
+    """Apply a manifest level by level, waiting for each level's workloads before the next"""
+
+    WORKLOADS = ("Deployment", "StatefulSet", "DaemonSet", "Job", "Pod")
+    # Applied before any workload: namespaces first, then everything pods mount or are admitted against
+    FOUNDATION = ("Namespace", "CustomResourceDefinition")
+    CONFIG = ("ConfigMap", "Secret", "ServiceAccount", "Role", "RoleBinding", "ClusterRole",
+              "ClusterRoleBinding", "PersistentVolumeClaim", "ResourceQuota", "LimitRange", "Service")
+
+    def __init__(self, runner: Callable[..., Tuple[bool, str]], timeout: int = 300, max_workers: int = 8,
+                 client: Optional[KubeClient] = None):
+        self.runner = runner
+        self.timeout = max(1, timeout)
+        self.max_workers = max(1, max_workers)
+        self.client = client
+
+    @staticmethod
+    def _ref(doc: Dict) -> Tuple[str, str]:
+        meta = doc.get("metadata") or {}
+        return meta.get("namespace") or "default", meta.get("name", "")
+
+    @staticmethod
+    def _pod_spec(doc: Dict) -> Dict:
+        spec = doc.get("spec") or {}
+        if doc.get("kind") == "Pod":
+            return spec
+        return ((spec.get("jobTemplate") or {}).get("spec", spec).get("template") or {}).get("spec") or {}
+
+    @classmethod
+    def _references(cls, doc: Dict, config: Dict[Tuple[str, str], Dict]) -> List[Tuple[str, str]]:
+        """(key, value) for every string a workload's containers see: args, env and referenced config"""
+        namespace = cls._ref(doc)[0]
+        pod_spec = cls._pod_spec(doc)
+        pairs = []
+        for container in (pod_spec.get("initContainers") or []) + (pod_spec.get("containers") or []):
+            pairs += [("", str(x)) for x in (container.get("command") or []) + (container.get("args") or [])]
+            for env in container.get("env") or []:
+                if "value" in env:
+                    pairs.append((env.get("name", ""), str(env["value"])))
+                source = env.get("valueFrom") or {}
+                for ref_key in ("configMapKeyRef", "secretKeyRef"):
+                    ref = source.get(ref_key)
+                    if ref:
+                        data = config.get((namespace, ref.get("name", ""))) or {}
+                        pairs.append((env.get("name", ""), str(data.get(ref.get("key"), ""))))
+            for env_from in container.get("envFrom") or []:
+                ref = env_from.get("configMapRef") or env_from.get("secretRef") or {}
+                pairs += [(k, str(v)) for k, v in (config.get((namespace, ref.get("name", ""))) or {}).items()]
+        return pairs
+
+    @staticmethod
+    def _mentions(service: str, key: str, value: str) -> bool:
+        """Whether a setting points at a Service: a URL/host:port anywhere, or a bare name in a *_HOST-like key"""
+        name = re.escape(service)
+        if re.search(rf"(?:^|[/@\s,=]){name}(?::\d+|\.[a-z0-9-]+\.svc\b|\.[a-z0-9-]+(?=[:/]|$))", value) or \
+                re.search(rf"//{name}(?![\w-])", value):
+            return True
+        return bool(re.search(r"HOST|ADDR|SERVER|URL|URI|ENDPOINT|BROKER|DSN", key.upper())) and \
+            bool(re.search(rf"(?<![\w.-]){name}(?![\w-])", value))
+
+    @classmethod
+    def plan(cls, docs: List[Dict], declared: Optional[Dict[str, List[str]]] = None,
+             sources: Optional[List[str]] = None) -> List[Dict]:
+        """Group manifest objects into levels
+
+        Workload A depends on workload B when A's environment points at a Service selecting B's
+        pods (DATABASE_HOST=postgres-service, http://backend-service:5000, ...) or when the recipe
+        declares it in `depends_on` ({"frontend": ["backend"]}). `sources` holds each document's
+        original YAML text; when given, levels carry it and run() applies that text, not the parsed form.
+        """
+        foundation = [d for d in docs if d.get("kind") in cls.FOUNDATION]
+        config_docs = [d for d in docs if d.get("kind") in cls.CONFIG]
+        workloads = [d for d in docs if d.get("kind") in cls.WORKLOADS]
+        rest = [d for d in docs if d not in foundation and d not in config_docs and d not in workloads]
+
+        config = {}
+        for doc in config_docs:
+            if doc.get("kind") in ("ConfigMap", "Secret"):
+                data = dict(doc.get("data") or {})
+                data.update(doc.get("stringData") or {})
+                config[cls._ref(doc)] = data
+        by_name = {cls._ref(w): w for w in workloads}
+
+        def selects(service: Dict, workload: Dict) -> bool:
+            selector = (service.get("spec") or {}).get("selector") or {}
+            template = (workload.get("spec") or {}).get("template") or {}
+            labels = (template.get("metadata") or workload.get("metadata") or {}).get("labels") or {}
+            return bool(selector) and cls._ref(service)[0] == cls._ref(workload)[0] and \
+                all(labels.get(k) == v for k, v in selector.items())
+
+        depends: Dict[Tuple[str, str], set] = {cls._ref(w): set() for w in workloads}
+        services = [d for d in config_docs if d.get("kind") == "Service"]
+        for workload in workloads:
+            ref = cls._ref(workload)
+            pairs = cls._references(workload, config)
+            for service in services:
+                name = cls._ref(service)[1]
+                if name and any(cls._mentions(name, key, value) for key, value in pairs):
+                    depends[ref] |= {cls._ref(w) for w in workloads if w is not workload and selects(service, w)}
+            for target in (declared or {}).get(ref[1], []):
+                depends[ref] |= {r for r in by_name if r[1] == target and r[0] == ref[0] and r != ref}
+
+        # Longest-path layering; anything left in a cycle is deployed together at the end
+        levels: List[List[Dict]] = []
+        placed: Dict[Tuple[str, str], int] = {}
+        pending = [cls._ref(w) for w in workloads]
+        while pending:
+            ready = [r for r in pending if depends[r] <= set(placed)]
+            if not ready:
+                ready = pending
+            level = len(levels)
+            for r in ready:
+                placed[r] = level
+            levels.append([by_name[r] for r in ready])
+            pending = [r for r in pending if r not in placed]
+
+        plan = []
+        if foundation:
+            plan.append({"name": "namespaces", "objects": foundation, "gate": False})
+        if config_docs:
+            plan.append({"name": "config, storage and services", "objects": config_docs, "gate": False})
+        for index, level in enumerate(levels):
+            names = ", ".join(cls._ref(w)[1] for w in level)
+            plan.append({"name": f"tier {index + 1}: {names}", "objects": level, "gate": True,
+                         "depends": sorted({d[1] for w in level for d in depends[cls._ref(w)]})})
+        if rest:
+            plan.append({"name": "autoscalers and policies", "objects": rest, "gate": False})
+        if sources:
+            text_of = {id(doc): text for doc, text in zip(docs, sources)}
+            for level in plan:
+                level["sources"] = [text_of.get(id(doc)) for doc in level["objects"]]
+        return plan
+
+    def _wait_command(self, doc: Dict) -> List[str]:
+        namespace, name = self._ref(doc)
+        kind = doc["kind"].lower()
+        if kind == "pod":
+            cmd = ["kubectl", "wait", "--for=condition=Ready", f"pod/{name}"]
+        elif kind == "job":
+            cmd = ["kubectl", "wait", "--for=condition=complete", f"job/{name}"]
+        else:
+            cmd = ["kubectl", "rollout", "status", f"{kind}/{name}"]
+        return cmd + ["-n", namespace, f"--timeout={self.timeout}s"]
+
+    def _apply(self, doc: Dict, path: Path, source: Optional[str], labels: Dict[str, str]) -> Tuple[bool, str]:
+        """Apply one object from its YAML text when known, labelled like a plain 'kubectl apply' deploy"""
+        name = f"{doc.get('kind')}/{self._ref(doc)[1]}"
+        if self.client:
+            try:
+                self.client.apply(doc, source=source)
+                if source and labels:
+                    meta = doc.get("metadata") or {}
+                    self.client.request("PATCH", self.client.path(doc["kind"], meta["name"], meta.get("namespace")
+                                                                  or self.client.namespace, doc.get("apiVersion")),
+                                        body={"metadata": {"labels": labels}},
+                                        content_type="application/merge-patch+json")
+                return True, "applied"
+            except (KubeAPIError, OSError, http.client.HTTPException) as e:
+                return False, f"{name}: {e}"
+        return apply_labelled(self.runner, path, [f"{k}={v}" for k, v in labels.items()] if source else [],
+                              f"Applying {name}")
+
+    def _wait(self, doc: Dict) -> Tuple[bool, str]:
+        if self.client:
+            try:
+                return self.client.wait_ready(dict(doc, metadata=dict(doc["metadata"], namespace=self._ref(doc)[0])),
+                                              self.timeout)
+            except (OSError, http.client.HTTPException) as e:
+                return False, str(e)
+        return self.runner(self._wait_command(doc), f"Waiting for {doc['kind']}/{self._ref(doc)[1]}",
+                           timeout=self.timeout + 30)
+
+    @staticmethod
+    def recipe_plan(recipe: Dict) -> List[Dict]:
+        """Dependency levels for a recipe's manifest (empty when it cannot be parsed)"""
+        try:
+            sections = [(doc, text) for doc, text in ManifestParser(Path(recipe['yaml']).read_text()).sections()
+                        if isinstance(doc, dict)]
+        except (OSError, ValueError):
+            return []
+        return TieredDeploy.plan([doc for doc, _ in sections], recipe.get('depends_on'),
+                                 [text for _, text in sections])
+
+    @staticmethod
+    def tiered(plan: List[Dict]) -> bool:
+        """Whether a plan needs more than one readiness gate, i.e. a level-by-level deploy"""
+        return sum(1 for level in plan if level["gate"]) > 1
+
+    def deploy_recipe(self, recipe: Dict, plan: Optional[List[Dict]] = None) -> Tuple[bool, str, Optional[Dict]]:
+        """Deploy a recipe with its labels: level by level when tiered, else one apply; (ok, errors, report)"""
+        plan = self.recipe_plan(recipe) if plan is None else plan
+        if self.tiered(plan):
+            report = self.run(plan, recipe_labels(recipe))
+            return report["ok"], "\n".join(e for level in report["levels"] for e in level["errors"]), report
+        ok, out = apply_labelled(self.runner, recipe['yaml'], recipe_labels(recipe), f"Deploying {recipe['name']}")
+        return ok, out, None
+
+    def run(self, plan: List[Dict], labels: Optional[List[str]] = None) -> Dict:
+        """Apply each level's objects in parallel, then gate on readiness before the next level"""
+        report = {"ok": True, "levels": []}
+        extra = dict(label.split("=", 1) for label in labels or [])
+        started = time.monotonic()
+        with tempfile.TemporaryDirectory(prefix="minikube-tutorial-") as workdir, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for number, level in enumerate(plan):
+                level_started = time.monotonic()
+                paths = []
+                sources = level.get("sources") or [None] * len(level["objects"])
+                for index, (doc, source) in enumerate(zip(level["objects"], sources)):
+                    if source:
+                        path = Path(workdir) / f"{number:02d}-{index:03d}.yaml"
+                        path.write_text(source)
+                    else:
+                        if extra:
+                            meta = doc.setdefault("metadata", {})
+                            meta["labels"] = dict(meta.get("labels") or {}, **extra)
+                        path = Path(workdir) / f"{number:02d}-{index:03d}.json"
+                        path.write_text(json.dumps(doc))
+                    paths.append((doc, path, source, extra))
+                applied = list(pool.map(lambda item: self._apply(*item), paths))
+                entry = {"name": level["name"], "objects": len(paths),
+                         "errors": [out.strip() for ok, out in applied if not ok]}
+                applied_at = time.monotonic()
+                if not entry["errors"] and level["gate"]:
+                    waits = list(pool.map(self._wait, level["objects"]))
+                    entry["errors"] = [f"{doc['kind']}/{self._ref(doc)[1]} not ready: {out.strip()}"
+                                       for doc, (ok, out) in zip(level["objects"], waits) if not ok]
+                entry["apply_s"] = applied_at - level_started
+                entry["ready_s"] = time.monotonic() - applied_at
+                report["levels"].append(entry)
+                if entry["errors"]:
+                    report["ok"] = False
+                    break
+        report["duration"] = time.monotonic() - started
+        return report
+
+    @staticmethod
+    def print_plan(plan: List[Dict]):
+        """Show the levels a manifest will be applied in"""
+        for number, level in enumerate(plan, 1):
+            gate = " (wait until ready)" if level["gate"] else ""
+            after = f" after {', '.join(level['depends'])}" if level.get("depends") else ""
+            print(f"  {Colors.BOLD}{number}. {level['name']}{Colors.ENDC}{gate}{after}")
+            for doc in level["objects"]:
+                meta = doc.get("metadata") or {}
+                print(f"       {doc.get('kind')}/{meta.get('name')}")
+        print()
+
+    @staticmethod
+    def print_report(report: Dict):
+        """Print per-level apply and readiness times"""
+        for level in report["levels"]:
+            mark = f"{Colors.OKGREEN}✓" if not level["errors"] else f"{Colors.FAIL}✗"
+            print(f"{mark} {level['name']}{Colors.ENDC}: {level['objects']} object(s), applied in "
+                  f"{level['apply_s']:.1f}s, ready after {level['ready_s']:.1f}s")
+            for error in level["errors"]:
+                print(f"    {Colors.FAIL}{error}{Colors.ENDC}")
+        color = Colors.OKGREEN if report["ok"] else Colors.FAIL
+        print(f"\n{color}{Colors.BOLD}{'Converged' if report['ok'] else 'Stopped'} in "
+              f"{report['duration']:.1f}s{Colors.ENDC}\n")
+
+
+# Minikube add-ons (cached state, concurrent enable/disable, readiness by pod)
+class AddonManager:
+    """Enable or disable several add-ons at once and wait until their pods are ready
+
+    'minikube addons list -o json' is read once per profile and kept in a small cache file;
+    enable/disable results update it in place, so it is only re-listed when stale or on refresh.
+    minikube takes a per-profile lock on the cluster config for every 'minikube addons' call,
+    so concurrent calls on one profile only queue or fail with lock timeouts: the commands run
+    one at a time per profile, and what overlaps (max_workers at a time) is the wait for each
+    add-on's pods to become ready (or gone, when disabling), which is where the time goes.
+    """
+
+    STANDARD = ("dashboard", "metallb", "registry", "metrics-server", "ingress")
+    # (namespace, label selector) of each add-on's pods; others fall back to minikube's add-on label
+    PODS = {
+        "dashboard": ("kubernetes-dashboard", "k8s-app=kubernetes-dashboard"),
+        "metallb": ("metallb-system", "app=metallb"),
+        "registry": ("kube-system", "kubernetes.io/minikube-addons=registry"),
+        "metrics-server": ("kube-system", "k8s-app=metrics-server"),
+        "ingress": ("ingress-nginx", "app.kubernetes.io/component=controller"),
+        "ingress-dns": ("kube-system", "app=minikube-ingress-dns"),
+        "storage-provisioner": ("kube-system", "integration-test=storage-provisioner"),
+    }
+    PODLESS = {"default-storageclass", "volumesnapshots"}
+    # How long an add-on without known pods may take to show any before it counts as pod-less
+    POD_GRACE = 20.0
+    # minikube's profile lock errors ("unable to acquire lock", "acquiring lock ... timed out")
+    LOCK_ERROR = re.compile(r"acquir\w* (the )?lock|lock.*tim(ed|e) ?out|juju-mk", re.IGNORECASE)
+    _profile_locks: Dict[str, threading.Lock] = {}
+    _profile_locks_guard = threading.Lock()
+
+    def __init__(self, runner: Callable[..., Tuple[bool, str]], cache_file: Path,
+                 poll: Optional[Callable[[List[str]], Tuple[bool, str]]] = None, client: Optional[KubeClient] = None,
+                 profile: Optional[str] = None, max_workers: int = 3, timeout: float = 300, ttl: float = 300,
+                 interval: float = 2.0):
+        self.runner = runner
+        self.poll = poll or (lambda cmd: runner(cmd, ""))
+        self.client = client
+        self.cache_file = cache_file
+        self.profile = profile or "minikube"
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.ttl = ttl
+        self.interval = interval
+        self._lock = threading.Lock()
+        try:
+            self.cache = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            self.cache = {}
+
+    # Cached state
+    def _save(self):
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_text(json.dumps(self.cache, indent=2))
+        except OSError as e:
+            logger.debug(f"Add-on cache not saved: {e}")
+
+    def status(self, refresh: bool = False) -> Dict[str, str]:
+        """Add-on name -> 'enabled'/'disabled', listed once and then served from the cache"""
+        entry = self.cache.get(self.profile) or {}
+        if not refresh and entry.get("addons") and time.time() - entry.get("listed_at", 0) < self.ttl:
+            return dict(entry["addons"])
+        ok, output = self.runner(["minikube", "addons", "list", "-o", "json"], "Listing add-ons")
+        if not ok:
+            return dict(entry.get("addons") or {})
+        try:
+            listed = json.loads(output)
+        except ValueError:
+            return dict(entry.get("addons") or {})
+        addons = {name: (info or {}).get("Status", "unknown") for name, info in sorted(listed.items())}
+        with self._lock:
+            self.cache[self.profile] = {"listed_at": time.time(), "addons": addons}
+            self._save()
+        return dict(addons)
+
+    def _record(self, name: str, state: str):
+        with self._lock:
+            entry = self.cache.setdefault(self.profile, {"listed_at": 0, "addons": {}})
+            entry.setdefault("addons", {})[name] = state
+            self._save()
+
+    # Readiness
+    def _pods(self, name: str) -> Optional[List[Dict]]:
+        namespace, selector = self.PODS.get(name, (None, f"kubernetes.io/minikube-addons={name}"))
+        if self.client:
+            try:
+                return self.client.list("Pod", namespace, selector)
+            except (KubeAPIError, OSError, http.client.HTTPException):
+                return None
+        cmd = ["kubectl", "get", "pods", "-l", selector, "-o", "json"]
+        cmd += ["-n", namespace] if namespace else ["-A"]
+        ok, output = self.poll(cmd)
+        try:
+            return json.loads(output).get("items", []) if ok else None
+        except ValueError:
+            return None
+
+    @staticmethod
+    def pods_ready(pods: List[Dict]) -> bool:
+        """Every running pod has all containers ready (completed job pods are ignored)"""
+        running = [p for p in pods if (p.get("status") or {}).get("phase") != "Succeeded"]
+        return bool(running) and all(
+            (p.get("status") or {}).get("phase") == "Running" and
+            all(c.get("ready") for c in (p.get("status") or {}).get("containerStatuses") or [{}])
+            for p in running)
+
+    def _wait(self, name: str, enabled: bool, started: float) -> Tuple[bool, str]:
+        if enabled and name in self.PODLESS:
+            return True, "no pods"
+        deadline = started + self.timeout
+        while True:
+            pods = self._pods(name)
+            if pods is not None:
+                if not enabled and not pods:
+                    return True, "pods gone"
+                if enabled and self.pods_ready(pods):
+                    return True, f"{len(pods)} pod(s) ready"
+                if enabled and not pods and name not in self.PODS and time.monotonic() - started > self.POD_GRACE:
+                    return True, "no pods"
+            if time.monotonic() >= deadline:
+                return False, f"pods not {'ready' if enabled else 'gone'} after {self.timeout:.0f}s"
+            time.sleep(self.interval)
+
+    def _profile_lock(self) -> threading.Lock:
+        """One lock per profile shared by every manager in this process"""
+        with self._profile_locks_guard:
+            return self._profile_locks.setdefault(self.profile, threading.Lock())
+
+    def _toggle(self, name: str, enable: bool) -> Dict:
+        action = "enable" if enable else "disable"
+        started = time.monotonic()
+        with self._profile_lock():
+            began = time.monotonic()
+            ok, output = self.runner(["minikube", "addons", action, name], f"{action.capitalize()} add-on {name}",
+                                     timeout=int(self.timeout))
+        command_s = round(time.monotonic() - began, 3)
+        if not ok:
+            detail = output.strip().splitlines()[-1] if output.strip() else "failed"
+            if self.LOCK_ERROR.search(output):
+                detail = (f"profile '{self.profile}' is locked by another minikube command; "
+                          f"retry when it finishes ({detail})")
+            return {"addon": name, "action": action, "ok": False, "command_s": command_s, "ready_s": None,
+                    "duration": round(time.monotonic() - started, 3), "detail": detail}
+        self._record(name, "enabled" if enable else "disabled")
+        ready, detail = self._wait(name, enable, started)
+        duration = round(time.monotonic() - started, 3)
+        return {"addon": name, "action": action, "ok": ready, "command_s": command_s,
+                "ready_s": duration if ready else None, "duration": duration, "detail": detail}
+
+    def apply(self, names: List[str], enable: bool = True, refresh: bool = False) -> Dict:
+        """Enable (or disable) every add-on not already in that state; readiness waits overlap"""
+        started = time.monotonic()
+        state = self.status(refresh)
+        wanted = "enabled" if enable else "disabled"
+        names = list(dict.fromkeys(names))
+        unknown = [n for n in names if state and n not in state]
+        if unknown:
+            raise ValueError(f"Unknown add-on(s): {', '.join(unknown)}")
+        pending = [n for n in names if state.get(n) != wanted]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(lambda n: self._toggle(n, enable), pending))
+        return {"action": "enable" if enable else "disable", "profile": self.profile,
+                "unchanged": [n for n in names if n not in pending], "results": results,
+                "ok": all(r["ok"] for r in results), "duration": round(time.monotonic() - started, 3),
+                "sequential_estimate": round(sum(r["duration"] for r in results), 3)}
+
+    @staticmethod
+    def print_status(state: Dict[str, str], highlight: Tuple[str, ...] = ()):
+        for name, status in state.items():
+            if highlight and name not in highlight and status != "enabled":
+                continue
+            color = Colors.OKGREEN if status == "enabled" else Colors.WARNING
+            print(f"  {color}{'●' if status == 'enabled' else '○'} {name:28s}{Colors.ENDC} {status}")
+
+    @staticmethod
+    def print_report(report: Dict):
+        print(f"\n{Colors.BOLD}Add-ons {report['action']}d on {report['profile']} in {report['duration']:.1f}s "
+              f"(one at a time: ~{report['sequential_estimate']:.1f}s){Colors.ENDC}")
+        for name in report["unchanged"]:
+            print(f"  {Colors.OKCYAN}= {name}{Colors.ENDC} (already {report['action']}d)")
+        for result in sorted(report["results"], key=lambda r: r["duration"]):
+            if result["ok"]:
+                print(f"  {Colors.OKGREEN}✓ {result['addon']:20s}{Colors.ENDC} {result['duration']:6.1f}s "
+                      f"(command {result['command_s']:.1f}s, {result['detail']})")
+            else:
+                print(f"  {Colors.FAIL}✗ {result['addon']:20s} {result['duration']:6.1f}s {result['detail']}{Colors.ENDC}")
+        print()
+
+
+# Multi-profile execution
+def with_profile(cmd: List[str], profile: Optional[str]) -> List[str]:
+    """Pin a minikube/kubectl command to a profile (minikube names the kubectl context after it)"""
+    if not profile or not cmd:
+        return cmd
+    tool = os.path.basename(cmd[0])
+    if tool == "minikube" and not any(a in ("-p", "--profile") or a.startswith("--profile=") for a in cmd):
+        return [cmd[0], "-p", profile] + cmd[1:]
+    if tool == "kubectl" and not any(a == "--context" or a.startswith("--context=") for a in cmd):
+        return [cmd[0], "--context", profile] + cmd[1:]
+    return cmd
+
+
+class ProfileFanout:
+    """Run deploy/verify/teardown against several minikube profiles at once"""
+
+    ACTIONS = ("deploy", "verify", "teardown")
+
+    def __init__(self, runner: Callable[..., Tuple[bool, str]], per_profile_limit: int = 2,
+                 max_workers: int = 16):
+        self.runner = runner
+        self.per_profile_limit = max(1, per_profile_limit)
+        self.max_workers = max(1, max_workers)
+
+    def plan(self, action: str, recipes: List[Dict]) -> List[Tuple[str, object, int]]:
+        """Steps (name, argv or deploy function, timeout) to run on every profile for an action
+
+        Deploys go through TieredDeploy.deploy_recipe, like the single-profile deploy, so the objects carry
+        the recipe labels that teardown --all and the dashboard rely on.
+        """
+        if action == "deploy":
+            return [(f"deploy {r['yaml']}", lambda runner, r=r: TieredDeploy(runner).deploy_recipe(r)[:2], 600)
+                    for r in recipes]
+        if action == "teardown":
+            command = BulkTeardown(self.runner).delete_command(recipes)
+            return [(f"delete {len(recipes)} recipe(s)", command, 210)] if command else []
+        if action == "verify":
+            steps = [("minikube status", ["minikube", "status"], 30),
+                     ("get nodes", ["kubectl", "get", "nodes"], 30)]
+            return steps + [(f"get {r['yaml']}", ["kubectl", "get", "-f", r['yaml']], 30) for r in recipes]
+        raise ValueError(f"Unknown action: {action}")
+
+    def run(self, action: str, profiles: List[str], recipes: List[Dict]) -> Dict:
+        """Fan the action's steps out to every profile and collect one report"""
+        steps = self.plan(action, recipes)
+        limits = {p: threading.BoundedSemaphore(self.per_profile_limit) for p in profiles}
+        report = {"action": action, "profiles": {p: {"ok": True, "steps": [None] * len(steps)} for p in profiles}}
+        lock = threading.Lock()
+
+        def execute(profile: str, index: int):
+            name, cmd, timeout = steps[index]
+            with limits[profile]:
+                started = time.monotonic()
+                if callable(cmd):
+                    ok, output = cmd(lambda argv, description, timeout=30: self.runner(
+                        argv, f"[{profile}] {description}", profile=profile, timeout=timeout))
+                else:
+                    ok, output = self.runner(cmd, f"[{profile}] {name}", profile=profile, timeout=timeout)
+                elapsed = time.monotonic() - started
+            with lock:
+                entry = report["profiles"][profile]
+                entry["steps"][index] = {"step": name, "ok": ok, "duration": round(elapsed, 3),
+                                         "output": output.strip()}
+                entry["ok"] = entry["ok"] and ok
+
+        started = time.monotonic()
+        workers = min(self.max_workers, max(1, len(profiles) * min(self.per_profile_limit, len(steps) or 1)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(execute, p, i) for p in profiles for i in range(len(steps))]
+            for future in futures:
+                future.result()
+        report["duration"] = round(time.monotonic() - started, 3)
+        report["ok"] = all(entry["ok"] for entry in report["profiles"].values())
+        return report
+
+    @staticmethod
+    def print_report(report: Dict):
+        """Print a per-profile summary of a fan-out run"""
+        print(f"\n{Colors.BOLD}Fan-out {report['action']} across {len(report['profiles'])} profile(s) "
+              f"in {report['duration']:.2f}s{Colors.ENDC}\n")
+        for profile, entry in report["profiles"].items():
+            color = Colors.OKGREEN if entry["ok"] else Colors.FAIL
+            mark = "✓" if entry["ok"] else "✗"
+            total = sum(s["duration"] for s in entry["steps"])
+            print(f"{color}{mark} {profile}{Colors.ENDC} ({len(entry['steps'])} steps, {total:.2f}s)")
+            for step in entry["steps"]:
+                if not step["ok"]:
+                    first_line = step["output"].split(chr(10))[0] if step["output"] else ""
+                    print(f"    {Colors.FAIL}✗ {step['step']}: {first_line}{Colors.ENDC}")
+        print()
+
+
+# Cluster event stream
+class EventBuffer:
+    """Fixed-size, deduplicating store of cluster events indexed by involved object"""
+
+    def __init__(self, capacity: int = 2000):
+        self.capacity = capacity
+        self._events = OrderedDict()
+        self._by_object: Dict[Tuple[str, str, str], set] = {}
+        self._lock = threading.Lock()
+        self.received = 0
+
+    @staticmethod
+    def _object_key(event: Dict) -> Tuple[str, str, str]:
+        obj = event.get("involvedObject") or {}
+        namespace = obj.get("namespace") or (event.get("metadata") or {}).get("namespace", "")
+        return namespace, obj.get("kind", ""), obj.get("name", "")
+
+    def add(self, event: Dict):
+        """Record an event; repeats of the same object/reason/message only bump its count"""
+        obj_key = self._object_key(event)
+        key = obj_key + (event.get("reason", ""), event.get("message", ""))
+        seen = event.get("lastTimestamp") or event.get("eventTime") or \
+            (event.get("metadata") or {}).get("creationTimestamp") or ""
+        with self._lock:
+            self.received += 1
+            entry = self._events.get(key)
+            if entry:
+                entry["count"] = max(entry["count"] + 1, event.get("count") or 0)
+                entry["last_seen"] = seen or entry["last_seen"]
+                self._events.move_to_end(key)
+                return
+            self._events[key] = {
+                "namespace": obj_key[0], "kind": obj_key[1], "name": obj_key[2],
+                "reason": key[3], "message": key[4], "type": event.get("type", "Normal"),
+                "count": event.get("count") or 1, "first_seen": event.get("firstTimestamp") or seen,
+                "last_seen": seen,
+            }
+            self._by_object.setdefault(obj_key, set()).add(key)
+            while len(self._events) > self.capacity:
+                old_key, _ = self._events.popitem(last=False)
+                keys = self._by_object.get(old_key[:3])
+                if keys is not None:
+                    keys.discard(old_key)
+                    if not keys:
+                        del self._by_object[old_key[:3]]
+
+    def for_object(self, namespace: str, kind: str, name: str) -> List[Dict]:
+        """Events recorded for one involved object, oldest first"""
+        with self._lock:
+            keys = self._by_object.get((namespace, kind, name), ())
+            return sorted((dict(self._events[k]) for k in keys), key=lambda e: e["last_seen"])
+
+    def objects(self) -> List[Tuple[str, str, str]]:
+        """(namespace, kind, name) of every object with buffered events"""
+        with self._lock:
+            return list(self._by_object)
+
+    def query(self, namespace: Optional[str] = None, reason: Optional[str] = None,
+              name_prefixes: Optional[List[str]] = None, warnings_only: bool = False,
+              limit: Optional[int] = None) -> List[Dict]:
+        """Filter buffered events, oldest first"""
+        with self._lock:
+            matches = []
+            for entry in self._events.values():
+                if namespace and entry["namespace"] != namespace:
+                    continue
+                if reason and entry["reason"].lower() != reason.lower():
+                    continue
+                if name_prefixes and not any(entry["name"].startswith(p) for p in name_prefixes):
+                    continue
+                if warnings_only and entry["type"] != "Warning":
+                    continue
+                matches.append(dict(entry))
+        return matches[-limit:] if limit else matches
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+class EventWatcher:
+    """Background consumer of 'kubectl get events -w -o json' feeding an EventBuffer"""
+
+    def __init__(self, buffer: EventBuffer, profile: Optional[str] = None, backend: Optional[CommandBackend] = None):
+        self.buffer = buffer
+        self.profile = profile
+        self.backend = backend or CommandBackend()
+        self._process = None
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start streaming events from every namespace"""
+        if self.running:
+            return
+        cmd = with_profile(["kubectl", "get", "events", "--all-namespaces", "--watch", "-o", "json"], self.profile)
+        self._process = self.backend.popen(cmd)
+        self._thread = threading.Thread(target=self._consume, args=(self._process.stdout,), daemon=True)
+        self._thread.start()
+        logger.info("Event watcher started")
+
+    def stop(self):
+        """Stop the kubectl watch"""
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
+        self._process = None
+
+    def _consume(self, stream):
+        """Decode the concatenated JSON documents kubectl writes while watching"""
+        lines: List[str] = []
+        for line in stream:
+            lines.append(line)
+            # kubectl pretty-prints each document; a top-level "}" closes one
+            if not line.startswith("}"):
+                continue
+            try:
+                obj = json.loads("".join(lines))
+            except ValueError:
+                # A closing brace that did not complete a document; drop it rather than grow forever
+                lines = []
+                continue
+            lines = []
+            # Initial listings arrive as a List; watch updates as single Events
+            for event in obj.get("items", [obj]) if isinstance(obj, dict) else []:
+                self.buffer.add(event)
+
+
+# Multi-pod log aggregation
+def parse_k8s_timestamp(value: str) -> float:
+    """Parse an RFC3339 timestamp with up to nanosecond precision to epoch seconds"""
+    value = value.rstrip("Z")
+    if "." in value:
+        value, fraction = value.split(".", 1)
+        fraction = "." + fraction[:6]
+    else:
+        fraction = ""
+    return datetime.fromisoformat(value + fraction).replace(tzinfo=timezone.utc).timestamp()
+
+
+class LogAggregator:
+    """Follow every container of every pod matching some selectors and merge lines by timestamp"""
+
+    PREFIX_COLORS = (Colors.OKCYAN, Colors.OKGREEN, Colors.WARNING, Colors.OKBLUE, Colors.HEADER)
+
+    def __init__(self, targets: List[Tuple[Optional[str], str]], profile: Optional[str] = None,
+                 tail: int = 10, window: float = 1.0, queue_size: int = 500, max_pending: int = 5000,
+                 discovery_interval: float = 5.0, output: Callable[[str], None] = print,
+                 backend: Optional[CommandBackend] = None):
+        self.targets = targets
+        self.profile = profile
+        self.backend = backend or CommandBackend()
+        self.tail = tail
+        self.window = window
+        self.queue_size = queue_size
+        self.max_pending = max_pending
+        self.discovery_interval = discovery_interval
+        self.output = output
+        self._queues: Dict[Tuple[str, str, str], asyncio.Queue] = {}
+        self._followers: Dict[Tuple[str, str, str], asyncio.Task] = {}
+        # restartCount each follower was started for, so a finished container is not re-tailed
+        self._generations: Dict[Tuple[str, str, str], int] = {}
+        # asyncio subprocesses when running live, BackendProcess when recording or replaying
+        self._processes: List = []
+        self._colors: Dict[str, str] = {}
+        self.lines_emitted = 0
+
+    def _kubectl(self, *args: str) -> List[str]:
+        return with_profile(["kubectl"] + list(args), self.profile)
+
+    async def _discover(self) -> Dict[Tuple[str, str, str], int]:
+        """restartCount keyed by (namespace, pod, container) for every running container matching the targets"""
+        found = {}
+        for namespace, selector in self.targets:
+            args = ["get", "pods", "-l", selector, "-o", "json"]
+            args += ["-n", namespace] if namespace else []
+            if self.backend.direct:
+                proc = await asyncio.create_subprocess_exec(*self._kubectl(*args), stdout=asyncio.subprocess.PIPE,
+                                                            stderr=asyncio.subprocess.DEVNULL)
+                stdout, _ = await proc.communicate()
+                returncode = proc.returncode
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(None, self.backend.run, self._kubectl(*args))
+                stdout, returncode = result.stdout, result.returncode
+            if returncode != 0:
+                continue
+            for pod in json.loads(stdout or b"{}").get("items", []):
+                status = pod.get("status") or {}
+                if status.get("phase") != "Running":
+                    continue
+                meta = pod["metadata"]
+                for container in status.get("containerStatuses") or []:
+                    if "running" not in (container.get("state") or {}):
+                        continue
+                    key = (meta.get("namespace", namespace or ""), meta["name"], container["name"])
+                    found[key] = container.get("restartCount", 0)
+        return found
+
+    async def _follow(self, key: Tuple[str, str, str]):
+        """Stream one container's log into its bounded queue"""
+        namespace, pod, container = key
+        args = ["logs", "-f", "--timestamps", f"--tail={self.tail}", pod, "-c", container]
+        args += ["-n", namespace] if namespace else []
+        if self.backend.direct:
+            proc = await asyncio.create_subprocess_exec(*self._kubectl(*args), stdout=asyncio.subprocess.PIPE,
+                                                        stderr=asyncio.subprocess.DEVNULL)
+            readline = proc.stdout.readline
+        else:
+            proc = self.backend.popen(self._kubectl(*args))
+            readline = self._pipe(proc)
+        self._processes.append(proc)
+        queue = self._queues[key]
+        prefix = f"{pod}/{container}"
+        try:
+            while True:
+                raw = await readline()
+                if not raw:
+                    break
+                line = (raw.decode(errors="replace") if isinstance(raw, bytes) else raw).rstrip("\n")
+                stamp, _, text = line.partition(" ")
+                try:
+                    ts = parse_k8s_timestamp(stamp)
+                except ValueError:
+                    ts, text = time.time(), line
+                # A full queue blocks here, so a flooding pod stops being read instead of growing memory
+                await queue.put((ts, prefix, text))
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+            if not isinstance(proc, BackendProcess):
+                await proc.wait()
+
+    def _pipe(self, proc: BackendProcess) -> Callable:
+        """An async readline over a backend process, fed by a thread that blocks while the reader is behind"""
+        loop = asyncio.get_running_loop()
+        lines = asyncio.Queue(maxsize=self.queue_size)
+
+        def pump():
+            for line in itertools.chain(proc.stdout, [""]):
+                try:
+                    put = asyncio.run_coroutine_threadsafe(lines.put(line), loop)
+                except RuntimeError:
+                    return
+                while True:
+                    try:
+                        put.result(timeout=1)
+                        break
+                    except FutureTimeout:
+                        # The follower is gone (killed, or the loop stopped): stop feeding it
+                        if proc.poll() is not None or loop.is_closed():
+                            put.cancel()
+                            return
+
+        threading.Thread(target=pump, daemon=True).start()
+        return lines.get
+
+    def _emit(self, prefix: str, text: str):
+        color = self._colors.setdefault(prefix, self.PREFIX_COLORS[len(self._colors) % len(self.PREFIX_COLORS)])
+        self.output(f"{color}[{prefix}]{Colors.ENDC} {text}")
+        self.lines_emitted += 1
+
+    async def _merge(self):
+        """Emit queued lines in timestamp order, holding each back at most `window` seconds"""
+        pending: List[Tuple[float, int, float, str, str]] = []
+        seq = 0
+        while True:
+            moved = False
+            for queue in list(self._queues.values()):
+                while not queue.empty() and len(pending) < self.max_pending:
+                    ts, prefix, text = queue.get_nowait()
+                    heapq.heappush(pending, (ts, seq, time.monotonic(), prefix, text))
+                    seq += 1
+                    moved = True
+            now = time.monotonic()
+            while pending and (len(pending) >= self.max_pending or now - pending[0][2] >= self.window):
+                _, _, _, prefix, text = heapq.heappop(pending)
+                self._emit(prefix, text)
+            if not moved:
+                await asyncio.sleep(0.05)
+
+    async def _discovery_loop(self):
+        """Start followers for new containers as pods appear and forget the ones that are gone"""
+        while True:
+            found = await self._discover()
+            for key, restarts in found.items():
+                task = self._followers.get(key)
+                if task is not None and (not task.done() or self._generations.get(key) == restarts):
+                    continue
+                self._queues.setdefault(key, asyncio.Queue(maxsize=self.queue_size))
+                self._generations[key] = restarts
+                self._followers[key] = asyncio.ensure_future(self._follow(key))
+            for key, task in list(self._followers.items()):
+                if key not in found and task.done() and self._queues[key].empty():
+                    del self._followers[key], self._queues[key], self._generations[key]
+            self._processes = [proc for proc in self._processes if proc.returncode is None]
+            await asyncio.sleep(self.discovery_interval)
+
+    async def run(self, duration: Optional[float] = None):
+        """Aggregate until cancelled or `duration` seconds have passed"""
+        tasks = [asyncio.ensure_future(self._discovery_loop()), asyncio.ensure_future(self._merge())]
+        try:
+            await asyncio.wait(tasks, timeout=duration)
+        finally:
+            for task in tasks + list(self._followers.values()):
+                task.cancel()
+            await asyncio.gather(*tasks, *self._followers.values(), return_exceptions=True)
+            for proc in self._processes:
+                if proc.returncode is None:
+                    proc.kill()
+
+    def follow(self, duration: Optional[float] = None):
+        """Blocking entry point; Ctrl+C stops following"""
+        try:
+            asyncio.run(self.run(duration))
+        except KeyboardInterrupt:
+            pass
+
+
+# Structured (JSON lines) log analysis
+class LogAnalyzer:
+    """Filter and group JSON log lines into per-window counts without keeping the lines"""
+
+    def __init__(self, group_by: List[str], filters: Optional[List[str]] = None, window: int = 60,
+                 horizon: int = 10, time_field: str = "timestamp"):
+        self.group_by = group_by
+        self.window = window
+        self.horizon = horizon
+        self.time_field = time_field
+        self.equals: List[Tuple[str, str]] = []
+        self.not_equals: List[Tuple[str, str]] = []
+        for expr in filters or []:
+            if "!=" in expr:
+                self.not_equals.append(tuple(expr.split("!=", 1)))
+            elif "=" in expr:
+                self.equals.append(tuple(expr.split("=", 1)))
+            else:
+                raise ValueError(f"Invalid filter (use field=value or field!=value): {expr}")
+        # Values a matching line must contain somewhere, checked before paying for json.loads. Only plain
+        # strings qualify: true/5/null may be spelled differently in the line, and escapes may hide the text
+        self._needles = [value for _, value in self.equals if self._plain_string(value)]
+        self.buckets: Dict[int, Dict[Tuple, int]] = {}
+        self.totals: Dict[Tuple, int] = {}
+        self.lines = 0
+        self.matched = 0
+        self.unparsed = 0
+        self._ts_cache: Tuple[str, float] = ("", 0.0)
+
+    @staticmethod
+    def _plain_string(value: str) -> bool:
+        try:
+            json.loads(value)
+            return False
+        except ValueError:
+            return all(" " <= c < "\x7f" and c not in '"\\' for c in value)
+
+    @staticmethod
+    def _text(value) -> str:
+        """A field as filters spell it: strings as they are, anything else as JSON (true, 5, null, {...})"""
+        return value if isinstance(value, str) else json.dumps(value, sort_keys=True)
+
+    @staticmethod
+    def _group(value):
+        """Hashable group key part; objects and lists become their JSON text"""
+        return json.dumps(value, sort_keys=True) if isinstance(value, (dict, list)) else value
+
+    def _timestamp(self, value) -> float:
+        """Epoch seconds for a log timestamp; parses each distinct second only once"""
+        if isinstance(value, (int, float)):
+            return float(value)
+        if not isinstance(value, str) or len(value) < 19:
+            return time.time()
+        # The offset follows the fractional seconds; it is part of the key so "+02:00" lines are not read as UTC
+        offset = value[19:].lstrip(".0123456789")
+        key = value[:19] + offset
+        if self._ts_cache[0] != key:
+            zone = offset if offset not in ("", "Z", "z") else "+00:00"
+            try:
+                parsed = datetime.fromisoformat(value[:19] + zone).timestamp()
+            except ValueError:
+                return time.time()
+            self._ts_cache = (key, parsed)
+        return self._ts_cache[1]
+
+    def feed(self, line: str):
+        """Account for one log line"""
+        self.lines += 1
+        for needle in self._needles:
+            if needle not in line:
+                return
+        try:
+            record = json.loads(line)
+        except ValueError:
+            self.unparsed += 1
+            return
+        if not isinstance(record, dict):
+            self.unparsed += 1
+            return
+        text = self._text
+        for field, value in self.equals:
+            if text(record.get(field)) != value:
+                return
+        for field, value in self.not_equals:
+            if text(record.get(field)) == value:
+                return
+        self.matched += 1
+
+        bucket = int(self._timestamp(record.get(self.time_field)) // self.window) * self.window
+        key = tuple(self._group(record.get(field)) for field in self.group_by)
+        counts = self.buckets.get(bucket)
+        if counts is None:
+            counts = self.buckets[bucket] = {}
+            # Slide the window: only the newest `horizon` buckets are kept
+            if len(self.buckets) > self.horizon:
+                for old in sorted(self.buckets)[:len(self.buckets) - self.horizon]:
+                    del self.buckets[old]
+        counts[key] = counts.get(key, 0) + 1
+        self.totals[key] = self.totals.get(key, 0) + 1
+
+    def consume(self, lines) -> "LogAnalyzer":
+        """Feed every line of an iterable (file, pipe, generator)"""
+        feed = self.feed
+        for line in lines:
+            feed(line)
+        return self
+
+    def summary(self) -> Dict:
+        """Counts and per-second rates for every retained window"""
+        windows = []
+        for bucket in sorted(self.buckets):
+            groups = sorted(self.buckets[bucket].items(), key=lambda item: -item[1])
+            windows.append({
+                "start": datetime.fromtimestamp(bucket, tz=timezone.utc).isoformat(),
+                "groups": [{"key": dict(zip(self.group_by, key)), "count": count,
+                            "rate": round(count / self.window, 3)} for key, count in groups],
+            })
+        return {"lines": self.lines, "matched": self.matched, "unparsed": self.unparsed,
+                "group_by": self.group_by, "window_seconds": self.window, "windows": windows,
+                "totals": [{"key": dict(zip(self.group_by, key)), "count": count}
+                           for key, count in sorted(self.totals.items(), key=lambda item: -item[1])]}
+
+    @staticmethod
+    def print_summary(summary: Dict):
+        """Print a summary as a table per window"""
+        print(f"\n{Colors.BOLD}{summary['lines']} lines, {summary['matched']} matched, "
+              f"{summary['unparsed']} not JSON{Colors.ENDC}")
+        for window in summary["windows"]:
+            print(f"\n{Colors.OKCYAN}{window['start']} ({summary['window_seconds']}s){Colors.ENDC}")
+            for group in window["groups"]:
+                label = " ".join(f"{k}={v}" for k, v in group["key"].items()) or "(all)"
+                print(f"  {label:50s} {group['count']:>8d}  {group['rate']:>8.2f}/s")
+        print()
+
+
+# Local trace collection (OTLP/HTTP JSON)
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+class SpanStore:
+    """Bounded in-memory span store indexed by trace id and service"""
+
+    def __init__(self, max_spans: int = 200000):
+        self.max_spans = max_spans
+        self.span_count = 0
+        # trace id -> [(span_id, parent_id, service_idx, operation_idx, start_ns, end_ns)]
+        self._traces: "OrderedDict[str, List[Tuple[str, str, int, int, int, int]]]" = OrderedDict()
+        self._by_service: Dict[int, set] = {}
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _intern(self, value: str) -> int:
+        idx = self._string_ids.get(value)
+        if idx is None:
+            idx = self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+        return idx
+
+    def add_otlp(self, payload: Dict) -> int:
+        """Store every span of an OTLP/JSON ExportTraceServiceRequest; returns the number accepted"""
+        accepted = 0
+        with self._lock:
+            for resource_spans in payload.get("resourceSpans", []):
+                service = "unknown"
+                for attr in (resource_spans.get("resource") or {}).get("attributes", []):
+                    if attr.get("key") == "service.name":
+                        service = (attr.get("value") or {}).get("stringValue", service)
+                service_idx = self._intern(service)
+                scopes = resource_spans.get("scopeSpans") or resource_spans.get("instrumentationLibrarySpans") or []
+                for scope in scopes:
+                    for span in scope.get("spans", []):
+                        trace_id = span.get("traceId", "")
+                        if not trace_id:
+                            continue
+                        self._traces.setdefault(trace_id, []).append((
+                            span.get("spanId", ""), span.get("parentSpanId", ""), service_idx,
+                            self._intern(span.get("name", "")), int(span.get("startTimeUnixNano", 0)),
+                            int(span.get("endTimeUnixNano", 0))))
+                        self._traces.move_to_end(trace_id)
+                        self._by_service.setdefault(service_idx, set()).add(trace_id)
+                        self.span_count += 1
+                        accepted += 1
+            while self.span_count > self.max_spans and self._traces:
+                trace_id, spans = self._traces.popitem(last=False)
+                self.span_count -= len(spans)
+                for service_idx in {s[2] for s in spans}:
+                    self._by_service[service_idx].discard(trace_id)
+        return accepted
+
+    def trace(self, trace_id: str) -> List[Dict]:
+        """Spans of one trace, ordered by start time"""
+        with self._lock:
+            spans = list(self._traces.get(trace_id, []))
+        return [{"span_id": s[0], "parent_id": s[1], "service": self._strings[s[2]],
+                 "operation": self._strings[s[3]], "start": s[4], "end": s[5],
+                 "duration_ms": (s[5] - s[4]) / 1e6} for s in sorted(spans, key=lambda s: s[4])]
+
+    def trace_ids(self, service: Optional[str] = None) -> List[str]:
+        """Trace ids, optionally only those touching a service"""
+        with self._lock:
+            if service is None:
+                return list(self._traces)
+            idx = self._string_ids.get(service)
+            return list(self._by_service.get(idx, ())) if idx is not None else []
+
+    def critical_path(self, trace_id: str) -> List[Dict]:
+        """Chain of spans that determined the trace's end-to-end latency"""
+        spans = self.trace(trace_id)
+        ids = {s["span_id"] for s in spans}
+        children: Dict[str, List[Dict]] = {}
+        for span in spans:
+            children.setdefault(span["parent_id"] if span["parent_id"] in ids else "", []).append(span)
+        roots = children.get("", [])
+        if not roots:
+            return []
+        path = []
+        current = max(roots, key=lambda s: s["end"] - s["start"])
+        while current:
+            kids = children.get(current["span_id"], [])
+            child_time = sum(k["end"] - k["start"] for k in kids)
+            path.append(dict(current, self_ms=max(0.0, current["duration_ms"] - child_time / 1e6)))
+            # The child finishing last is the one the parent was waiting on
+            current = max(kids, key=lambda s: s["end"]) if kids else None
+        return path
+
+    def latency_report(self, top: int = 5) -> Dict:
+        """Per-service and per-operation latency percentiles plus the slowest traces"""
+        with self._lock:
+            snapshot = [(trace_id, list(spans)) for trace_id, spans in self._traces.items()]
+        services: Dict[str, List[float]] = {}
+        operations: Dict[Tuple[str, str], List[float]] = {}
+        trace_durations = []
+        for trace_id, spans in snapshot:
+            for span in spans:
+                duration = (span[5] - span[4]) / 1e6
+                services.setdefault(self._strings[span[2]], []).append(duration)
+                operations.setdefault((self._strings[span[2]], self._strings[span[3]]), []).append(duration)
+            trace_durations.append(((max(s[5] for s in spans) - min(s[4] for s in spans)) / 1e6, trace_id))
+
+        def stats(values: List[float]) -> Dict:
+            values.sort()
+            return {"count": len(values), "p50": round(percentile(values, 50), 3),
+                    "p90": round(percentile(values, 90), 3), "p99": round(percentile(values, 99), 3),
+                    "max": round(values[-1], 3)}
+
+        slowest = sorted(trace_durations, reverse=True)[:top]
+        return {
+            "traces": len(snapshot), "spans": self.span_count,
+            "services": {name: stats(values) for name, values in sorted(services.items())},
+            "operations": [dict(stats(values), service=svc, operation=op)
+                           for (svc, op), values in sorted(operations.items())],
+            "slowest": [{"trace_id": trace_id, "duration_ms": round(duration, 3),
+                         "critical_path": [f"{s['service']}:{s['operation']} ({s['self_ms']:.1f}ms self)"
+                                           for s in self.critical_path(trace_id)]}
+                        for duration, trace_id in slowest],
+        }
+
+    @staticmethod
+    def print_report(report: Dict):
+        """Print a latency report"""
+        print(f"\n{Colors.BOLD}{report['traces']} traces, {report['spans']} spans{Colors.ENDC}\n")
+        print(f"{Colors.BOLD}{'SERVICE / OPERATION':45s} {'COUNT':>7s} {'P50 ms':>9s} {'P90 ms':>9s} "
+              f"{'P99 ms':>9s}{Colors.ENDC}")
+        for name, s in report["services"].items():
+            print(f"{Colors.OKCYAN}{name:45s}{Colors.ENDC} {s['count']:7d} {s['p50']:9.2f} {s['p90']:9.2f} "
+                  f"{s['p99']:9.2f}")
+            for op in (o for o in report["operations"] if o["service"] == name):
+                print(f"  {op['operation'][:43]:43s} {op['count']:7d} {op['p50']:9.2f} {op['p90']:9.2f} "
+                      f"{op['p99']:9.2f}")
+        if report["slowest"]:
+            print(f"\n{Colors.BOLD}Slowest traces (critical path):{Colors.ENDC}")
+            for trace in report["slowest"]:
+                print(f"  {trace['trace_id'][:16]} {trace['duration_ms']:.1f}ms")
+                print(f"    {' → '.join(trace['critical_path'])}")
+        print()
+
+
+class TraceCollector:
+    """OTLP/HTTP JSON receiver (POST /v1/traces) feeding a SpanStore"""
+
+    def __init__(self, store: SpanStore, host: str = "127.0.0.1", port: int = 4318):
+        self.store = store
+        self.host = host
+        self.port = port
+        self._server = None
+
+    def start(self) -> int:
+        """Serve in a background thread; returns the bound port"""
+        store = self.store
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path.split("?")[0] != "/v1/traces":
+                    self.send_error(404)
+                    return
+                if "json" not in self.headers.get("Content-Type", "application/json"):
+                    self.send_error(415, "Only OTLP/HTTP JSON is supported")
+                    return
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                try:
+                    store.add_otlp(json.loads(body or b"{}"))
+                except (ValueError, TypeError, AttributeError):
+                    self.send_error(400, "Invalid OTLP JSON")
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        logger.info(f"Trace collector listening on http://{self.host}:{self.port}/v1/traces")
+        return self.port
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def generate_demo_traces(endpoint: str, traces: int = 50, batch: int = 10):
+    """Send synthetic frontend → backend → postgres traces to an OTLP/HTTP endpoint"""
+    def span(trace_id, span_id, parent, name, start, duration_ms):
+        return {"traceId": trace_id, "spanId": span_id, "parentSpanId": parent, "name": name,
+                "startTimeUnixNano": str(start), "endTimeUnixNano": str(start + int(duration_ms * 1e6))}
+
+    def resource(service, spans):
+        return {"resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service}}]},
+                "scopeSpans": [{"scope": {"name": "demo"}, "spans": spans}]}
+
+    sent = 0
+    while sent < traces:
+        by_service: Dict[str, List[Dict]] = {"frontend": [], "backend": [], "postgres": []}
+        for _ in range(min(batch, traces - sent)):
+            trace_id = os.urandom(16).hex()
+            ids = [os.urandom(8).hex() for _ in range(4)]
+            start = time.time_ns()
+            db_ms = random.expovariate(1 / 8.0)
+            cache_ms = random.uniform(0.5, 2.0)
+            backend_ms = db_ms + cache_ms + random.uniform(1, 5)
+            total_ms = backend_ms + random.uniform(2, 10)
+            by_service["frontend"].append(span(trace_id, ids[0], "", "GET /", start, total_ms))
+            by_service["backend"].append(span(trace_id, ids[1], ids[0], "GET /api/items", start + 1000000,
+                                              backend_ms))
+            by_service["backend"].append(span(trace_id, ids[2], ids[1], "cache.get", start + 1500000, cache_ms))
+            by_service["postgres"].append(span(trace_id, ids[3], ids[1], "SELECT items",
+                                               start + 1500000 + int(cache_ms * 1e6), db_ms))
+            sent += 1
+        payload = {"resourceSpans": [resource(name, spans) for name, spans in by_service.items()]}
+        request = urllib.request.Request(endpoint, data=json.dumps(payload).encode(),
+                                         headers={"Content-Type": "application/json"})
+        urllib.request.urlopen(request, timeout=5).read()
+    return sent
+
+
+# Endpoint health probing
+class PortForwarder:
+    """Forward each probe target's Service to its own free local port for as long as the probes run
+
+    Recipe local ports collide (nginx and jenkins both use 8080), so a probe of 127.0.0.1:<local>
+    may reach another recipe. Targets that name a Service get a 'kubectl port-forward svc/... :<port>'
+    started here instead, and are probed through it.
+    """
+
+    PATTERN = re.compile(r"Forwarding from 127\.0\.0\.1:(\d+) ->")
+
+    def __init__(self, profile: Optional[str] = None, timeout: float = 15.0, backend: Optional[CommandBackend] = None):
+        self.profile = profile
+        self.timeout = timeout
+        self.backend = backend or CommandBackend()
+        self._processes: List[BackendProcess] = []
+
+    def _spawn(self, target: Dict) -> queue.Queue:
+        """Start one forward; the queue receives (local port or None, last kubectl output line)"""
+        cmd = ["kubectl", "port-forward", f"svc/{target['service']}", f":{target['service_port']}",
+               "--address", "127.0.0.1"] + (["-n", target["namespace"]] if target.get("namespace") else [])
+        ready = queue.Queue()
+        try:
+            proc = self.backend.popen(with_profile(cmd, self.profile), stderr=subprocess.STDOUT)
+        except OSError as e:
+            ready.put((None, str(e)))
+            return ready
+        self._processes.append(proc)
+
+        def pump(out):
+            # Keep draining after the first line: kubectl logs every forwarded connection
+            sent, last = False, ""
+            for line in out:
+                match = self.PATTERN.search(line)
+                if match and not sent:
+                    ready.put((int(match.group(1)), line.strip()))
+                    sent = True
+                elif line.strip():
+                    last = line.strip()
+            if not sent:
+                ready.put((None, last or "kubectl port-forward exited"))
+
+        threading.Thread(target=pump, args=(proc.stdout,), daemon=True).start()
+        return ready
+
+    def start(self, targets: List[Dict]) -> List[Dict]:
+        """Copies of the targets pointed at their forwards; targets without a Service are returned unchanged"""
+        pending = [(target, self._spawn(target) if target.get("service") else None) for target in targets]
+        deadline = time.monotonic() + self.timeout
+        result = []
+        for target, ready in pending:
+            if ready is None:
+                result.append(target)
+                continue
+            try:
+                port, message = ready.get(timeout=max(0.1, deadline - time.monotonic()))
+            except queue.Empty:
+                port, message = None, f"no forward after {self.timeout:g}s"
+            forwarded = dict(target, host="127.0.0.1", shared_with=[])
+            if port:
+                forwarded["port"] = port
+            else:
+                forwarded["error"] = f"port-forward to svc/{target['service']} failed: {message}"
+            result.append(forwarded)
+        return result
+
+    def close(self):
+        for proc in self._processes:
+            if proc.poll() is None:
+                proc.terminate()
+        for proc in self._processes:
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        self._processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class HealthProber:
+    """Probe recipe endpoints concurrently (TCP connect or HTTP first byte) and keep latency history"""
+
+    # Port service names answered over HTTP; everything else gets a TCP connect check
+    HTTP_SERVICES = {"nginx", "httpbin", "kong", "kong-admin", "jenkins", "rabbitmq-management",
+                     "frontend", "backend", "app"}
+
+    def __init__(self, targets: List[Dict], timeout: float = 2.0, history: int = 60):
+        self.targets = targets
+        self.timeout = timeout
+        self.history = {self.key(t): deque(maxlen=max(1, history)) for t in targets}
+        self.rounds = 0
+
+    @staticmethod
+    def key(target: Dict) -> str:
+        return f"{target['name']}@{target['host']}:{target['port']}"
+
+    @staticmethod
+    def _service_for(port: Dict, services: List[Dict]) -> Optional[Tuple[Optional[str], str, int]]:
+        """(namespace, name, port) of the Service behind a recipe port: by port number, then by name"""
+        wanted = port.get('service', '')
+
+        def named(service: Dict) -> bool:
+            name = service["metadata"]["name"]
+            return name == wanted or wanted in name.split("-") or name in wanted.split("-")
+
+        matches = [(svc, p) for svc in services for p in (svc.get("spec") or {}).get("ports") or []
+                   if port.get('container') in (p.get("port"), p.get("targetPort"))]
+        matches = [m for m in matches if named(m[0])] or (matches if len(matches) == 1 else [])
+        if not matches:
+            matches = [(svc, ((svc.get("spec") or {}).get("ports") or [{}])[0]) for svc in services if named(svc)]
+        if not matches or not matches[0][1].get("port"):
+            return None
+        service, service_port = matches[0]
+        return service["metadata"].get("namespace"), service["metadata"]["name"], int(service_port["port"])
+
+    @classmethod
+    def targets_for(cls, recipes: List[Dict], host: str = "127.0.0.1") -> List[Dict]:
+        """One probe target per recipe port, with its Service and any recipes sharing its local port
+
+        Without a PortForwarder the target is the recipe's local (port-forwarded) port on `host`.
+        """
+        targets = []
+        for recipe in recipes:
+            try:
+                docs = load_manifest(recipe['yaml']) if Path(recipe['yaml']).exists() else []
+            except (OSError, ValueError):
+                docs = []
+            services = [d for d in docs if d.get("kind") == "Service" and (d.get("metadata") or {}).get("name")]
+            for port in recipe.get('ports') or []:
+                service = port.get('service', 'service')
+                kind = port.get('probe') or ("http" if service in cls.HTTP_SERVICES else "tcp")
+                target = {"name": f"{recipe['name']}: {service}", "recipe": recipe['id'], "kind": kind,
+                          "host": host, "port": int(port['local']), "path": port.get('path', '/')}
+                resolved = cls._service_for(port, services)
+                if resolved:
+                    target["namespace"], target["service"], target["service_port"] = resolved
+                targets.append(target)
+        for target in targets:
+            target["shared_with"] = [t["name"] for t in targets if t is not target and t["port"] == target["port"]
+                                     and t["recipe"] != target["recipe"]]
+        return targets
+
+    @staticmethod
+    def parse_target(spec: str) -> Dict:
+        """Target from a URL such as tcp://127.0.0.1:6379 or http://localhost:8080/health"""
+        match = re.match(r"^(tcp|http)://([^:/]+):(\d+)(/.*)?$", spec)
+        if not match:
+            raise ValueError(f"Bad target '{spec}', expected tcp://host:port or http://host:port/path")
+        kind, host, port, path = match.groups()
+        return {"name": spec, "recipe": None, "kind": kind, "host": host, "port": int(port), "path": path or "/"}
+
+    async def probe(self, target: Dict) -> Dict:
+        """Connect (and for HTTP, send GET and wait for the status line) with one deadline"""
+        result = {"time": time.time(), "ok": False, "connect_ms": None, "first_byte_ms": None,
+                  "status": None, "error": None}
+        if target.get("error"):
+            result["error"] = target["error"]
+            return result
+        if target.get("shared_with"):
+            # Whichever recipe holds the local port would answer; do not report it for this one
+            result["error"] = (f"local port {target['port']} is shared with {', '.join(target['shared_with'])}; "
+                               f"probe through a port-forward of its Service")
+            return result
+        started = time.perf_counter()
+        writer = None
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(target["host"], target["port"]),
+                                                    self.timeout)
+            result["connect_ms"] = (time.perf_counter() - started) * 1000
+            if target["kind"] == "http":
+                writer.write(f"GET {target['path']} HTTP/1.1\r\nHost: {target['host']}\r\n"
+                             f"User-Agent: minikube-tutorial\r\nConnection: close\r\n\r\n".encode())
+                await writer.drain()
+                remaining = self.timeout - (time.perf_counter() - started)
+                line = await asyncio.wait_for(reader.readline(), max(0.01, remaining))
+                result["first_byte_ms"] = (time.perf_counter() - started) * 1000
+                parts = line.decode(errors="replace").split()
+                if len(parts) < 2 or not parts[0].startswith("HTTP/") or not parts[1].isdigit():
+                    raise ValueError("not an HTTP response")
+                result["status"] = int(parts[1])
+                # 4xx still means the server is up (Kong without routes, Jenkins asking for login)
+                result["ok"] = result["status"] < 500
+                if not result["ok"]:
+                    result["error"] = f"HTTP {result['status']}"
+            else:
+                result["ok"] = True
+        except asyncio.TimeoutError:
+            result["error"] = f"timeout after {self.timeout:.1f}s"
+        except (OSError, ValueError) as e:
+            result["error"] = str(e) or e.__class__.__name__
+        finally:
+            if writer is not None:
+                writer.close()
+        return result
+
+    async def probe_all(self) -> List[Dict]:
+        """Probe every target at the same time and record the results"""
+        results = await asyncio.gather(*(self.probe(t) for t in self.targets))
+        for target, result in zip(self.targets, results):
+            self.history[self.key(target)].append(result)
+        self.rounds += 1
+        return results
+
+    async def run(self, interval: float = 5.0, rounds: Optional[int] = None,
+                  on_round: Optional[Callable[[Dict], None]] = None):
+        """Probe every `interval` seconds, calling on_round with the summary after each round"""
+        while rounds is None or self.rounds < rounds:
+            started = time.monotonic()
+            await self.probe_all()
+            if on_round:
+                on_round(self.summary())
+            if rounds is not None and self.rounds >= rounds:
+                break
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    def summary(self) -> Dict:
+        """Latest state, availability and latency percentiles per target"""
+        rows = []
+        for target in self.targets:
+            samples = list(self.history[self.key(target)])
+            if not samples:
+                continue
+            latest = samples[-1]
+            latency = "first_byte_ms" if target["kind"] == "http" else "connect_ms"
+            values = sorted(s[latency] for s in samples if s["ok"] and s[latency] is not None)
+            rows.append({"name": target["name"], "kind": target["kind"],
+                         "endpoint": f"{target['host']}:{target['port']}", "up": latest["ok"],
+                         "status": latest["status"], "error": latest["error"],
+                         "last_ms": latest[latency], "p50_ms": percentile(values, 50) if values else None,
+                         "p95_ms": percentile(values, 95) if values else None,
+                         "availability": 100.0 * sum(1 for s in samples if s["ok"]) / len(samples),
+                         "samples": len(samples)})
+        return {"rounds": self.rounds, "up": sum(1 for r in rows if r["up"]), "total": len(rows), "targets": rows}
+
+    @staticmethod
+    def print_summary(summary: Dict):
+        """Print one screen with every endpoint's state and latency"""
+        def ms(value):
+            return f"{value:7.1f}" if value is not None else "      -"
+
+        color = Colors.OKGREEN if summary["up"] == summary["total"] else Colors.FAIL
+        print(f"{color}{Colors.BOLD}{summary['up']}/{summary['total']} endpoints up{Colors.ENDC} "
+              f"(round {summary['rounds']})\n")
+        print(f"  {'ENDPOINT':40s} {'CHECK':5s} {'ADDRESS':21s} {'LAST ms':>7s} {'p50':>7s} {'p95':>7s} {'UP %':>6s}")
+        for row in summary["targets"]:
+            mark = f"{Colors.OKGREEN}✓" if row["up"] else f"{Colors.FAIL}✗"
+            print(f"{mark} {row['name'][:40]:40s} {row['kind']:5s} {row['endpoint']:21s} {ms(row['last_ms'])} "
+                  f"{ms(row['p50_ms'])} {ms(row['p95_ms'])} {row['availability']:5.1f}%{Colors.ENDC}")
+            if row["error"]:
+                print(f"    {Colors.WARNING}{row['error']}{Colors.ENDC}")
+        print()
+
+
+# Metrics history (memory-mapped ring buffers with downsampling)
+def parse_duration(text: str) -> float:
+    """Seconds from '90', '30s', '15m', '2h' or '1d'"""
+    match = re.match(r"^\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*$", str(text))
+    if not match:
+        raise ValueError(f"Bad duration '{text}', expected e.g. 30s, 15m, 2h, 1d")
+    return float(match.group(1)) * {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}[match.group(2)]
+
+
+class MetricsStore:
+    """Fixed-size float32 ring buffers per series, one per resolution tier, in one mmap'd file
+
+    Every sample updates each tier's current bucket mean, so the 1-minute and 10-minute
+    tiers are exact averages without a separate rollup pass. Missing buckets read as NaN
+    and are skipped by queries. When the directory is full, series with no sample inside
+    the longest tier (pods gone since a rollout) give up their slots. New series are
+    added under an fcntl lock on <path>.lock after re-reading the directory, so several
+    processes can record into one file.
+    """
+
+    MAGIC = b"MKTSDB1\0"
+    HEADER = struct.Struct("<8sIII8I")
+    STATE = struct.Struct("<qdII")     # head bucket, running sum, sample count, padding
+    KEY_SIZE = 96
+    # (resolution seconds, slots): 30 minutes raw, 6 hours of minutes, 2 days of 10 minutes
+    TIERS = ((15, 120), (60, 360), (600, 288))
+
+    def __init__(self, path: Path, max_series: int = 4096, tiers: Tuple[Tuple[int, int], ...] = TIERS):
+        self.path = Path(path)
+        self.max_series = max_series
+        self.tiers = tuple(tiers)
+        self.slots = sum(slots for _, slots in self.tiers)
+        self._offsets = [sum(slots for _, slots in self.tiers[:i]) for i in range(len(self.tiers))]
+        self._dir_offset = self.HEADER.size
+        self._state_offset = self._dir_offset + max_series * self.KEY_SIZE
+        self._data_offset = self._state_offset + max_series * len(self.tiers) * self.STATE.size
+        self._data_offset += -self._data_offset % 4
+        size = self._data_offset + max_series * self.slots * 4
+        self._lock = threading.Lock()
+
+        fresh = not self.path.exists() or self.path.stat().st_size == 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w+b" if fresh else "r+b")
+        if fresh:
+            self._file.truncate(size)
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        header = self.HEADER.unpack_from(self._mm, 0)
+        if fresh:
+            flat = [x for tier in self.tiers for x in tier] + [0] * (8 - 2 * len(self.tiers))
+            self.HEADER.pack_into(self._mm, 0, self.MAGIC, 1, max_series, len(self.tiers), *flat)
+        elif header[0] != self.MAGIC or header[2] != max_series or \
+                tuple(zip(header[4:4 + 2 * header[3]:2], header[5:5 + 2 * header[3]:2])) != self.tiers:
+            self.close()
+            raise ValueError(f"{self.path} was written with a different layout; move it away to start over")
+        self._data = memoryview(self._mm)[self._data_offset:].cast("f")
+        self._index: Dict[str, int] = {}
+        self._reload()
+
+    def _reload(self):
+        """Re-read the series directory (other processes may have added or reclaimed slots)"""
+        index = {}
+        for i in range(self.max_series):
+            start = self._dir_offset + i * self.KEY_SIZE
+            if self._mm[start] != 0:
+                index[self._mm[start:start + self.KEY_SIZE].rstrip(b"\0").decode(errors="replace")] = i
+        self._index = index
+
+    def _owns(self, key: str, index: int) -> bool:
+        start = self._dir_offset + index * self.KEY_SIZE
+        return self._mm[start:start + self.KEY_SIZE] == key.encode().ljust(self.KEY_SIZE, b"\0")
+
+    def _newest(self, index: int) -> float:
+        """End of the newest bucket of a series in the longest tier (-inf when it has none)"""
+        resolution = self.tiers[-1][0]
+        head = self.STATE.unpack_from(self._mm, self._state_at(index, len(self.tiers) - 1))[0]
+        return (head + 1) * resolution if head >= 0 else -math.inf
+
+    def _reclaim(self, now: float) -> int:
+        """Free the slots of series without samples inside the longest tier; returns how many"""
+        resolution, slots = self.tiers[-1]
+        stale = [(key, i) for key, i in self._index.items() if self._newest(i) <= now - resolution * slots]
+        for key, i in stale:
+            start = self._dir_offset + i * self.KEY_SIZE
+            self._mm[start:start + self.KEY_SIZE] = bytes(self.KEY_SIZE)
+            del self._index[key]
+        if stale:
+            logger.info(f"Metrics store reclaimed {len(stale)} stale series")
+        return len(stale)
+
+    def _fit(self, key: str) -> str:
+        encoded = key.encode()
+        if len(encoded) < self.KEY_SIZE:
+            return key
+        digest = hashlib.sha1(encoded).hexdigest()[:8]
+        return encoded[:self.KEY_SIZE - 10].decode(errors="ignore") + "~" + digest
+
+    def _series(self, key: str, now: float) -> int:
+        key = self._fit(key)
+        index = self._index.get(key)
+        if index is not None and self._owns(key, index):
+            return index
+        with open(self.path.with_name(self.path.name + ".lock"), "a") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            self._reload()
+            index = self._index.get(key)
+            if index is not None:
+                return index
+            used = set(self._index.values())
+            free = next((i for i in range(self.max_series) if i not in used), None)
+            if free is None and self._reclaim(now):
+                used = set(self._index.values())
+                free = next(i for i in range(self.max_series) if i not in used)
+            if free is None:
+                raise ValueError(f"Metrics store is full ({self.max_series} series)")
+            self._data[free * self.slots:(free + 1) * self.slots] = array("f", [math.nan]) * self.slots
+            for tier in range(len(self.tiers)):
+                self.STATE.pack_into(self._mm, self._state_at(free, tier), -1, 0.0, 0, 0)
+            start = self._dir_offset + free * self.KEY_SIZE
+            self._mm[start:start + self.KEY_SIZE] = key.encode().ljust(self.KEY_SIZE, b"\0")
+            self._index[key] = free
+            return free
+
+    def _state_at(self, index: int, tier: int) -> int:
+        return self._state_offset + (index * len(self.tiers) + tier) * self.STATE.size
+
+    def record(self, key: str, timestamp: float, value: float):
+        """Add one sample; each tier's current bucket holds the mean of the samples in it"""
+        with self._lock:
+            index = self._series(key, timestamp)
+            for tier, (resolution, slots) in enumerate(self.tiers):
+                bucket = int(timestamp // resolution)
+                offset = self._state_at(index, tier)
+                head, total, count, _ = self.STATE.unpack_from(self._mm, offset)
+                base = index * self.slots + self._offsets[tier]
+                if bucket > head:
+                    for skipped in range(max(head + 1, bucket - slots + 1), bucket):
+                        self._data[base + skipped % slots] = math.nan
+                    head, total, count = bucket, 0.0, 0
+                elif bucket < head:
+                    continue  # late sample for a closed bucket
+                total += value
+                count += 1
+                self._data[base + bucket % slots] = total / count
+                self.STATE.pack_into(self._mm, offset, head, total, count, 0)
+
+    def series(self, pattern: str = "*") -> List[str]:
+        with self._lock:
+            self._reload()
+            return sorted(k for k in self._index if fnmatch.fnmatchcase(k, pattern))
+
+    def query(self, key: str, start: float, end: float, resolution: Optional[int] = None) -> Tuple[int, List[Tuple[float, float]]]:
+        """(resolution, [(bucket start, value)]) from the finest tier that still covers `start`"""
+        key = self._fit(key)
+        index = self._index.get(key)
+        if index is None or not self._owns(key, index):
+            with self._lock:
+                self._reload()
+            index = self._index.get(key)
+        if index is None:
+            return 0, []
+        tiers = [t for t, (res, _) in enumerate(self.tiers) if resolution is None or res == resolution]
+        if not tiers:
+            raise ValueError(f"No tier with resolution {resolution}s (have {[r for r, _ in self.tiers]})")
+        with self._lock:
+            heads = {t: self.STATE.unpack_from(self._mm, self._state_at(index, t))[0] for t in tiers}
+            tier = next((t for t in tiers if (heads[t] - self.tiers[t][1] + 1) * self.tiers[t][0] <= start),
+                        tiers[-1])
+            resolution, slots = self.tiers[tier]
+            base = index * self.slots + self._offsets[tier]
+            first = max(int(start // resolution), heads[tier] - slots + 1)
+            last = min(int(end // resolution), heads[tier])
+            points = []
+            for bucket in range(first, last + 1):
+                value = self._data[base + bucket % slots]
+                if not math.isnan(value):
+                    points.append((bucket * resolution, value))
+        return resolution, points
+
+    def export(self, keys: List[str], start: float, end: float, fmt: str = "csv",
+               resolution: Optional[int] = None) -> str:
+        """Series as CSV (series,timestamp,time,value) or JSON ({series: [[timestamp, value], ...]})"""
+        results = {key: self.query(key, start, end, resolution)[1] for key in keys}
+        if fmt == "json":
+            return json.dumps({k: [[t, round(v, 3)] for t, v in points] for k, points in results.items()})
+        lines = ["series,timestamp,time,value"]
+        for key, points in results.items():
+            lines += [f"{key},{int(t)},{datetime.fromtimestamp(t, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')},"
+                      f"{v:.3f}" for t, v in points]
+        return "\n".join(lines) + "\n"
+
+    def used_bytes(self) -> int:
+        """Bytes actually occupied by the series written so far"""
+        return self._data_offset + (max(self._index.values()) + 1 if self._index else 0) * self.slots * 4
+
+    def flush(self):
+        self._mm.flush()
+
+    def close(self):
+        if getattr(self, "_data", None) is not None:
+            self._data.release()
+            self._data = None
+        self._mm.close()
+        self._file.close()
+
+
+class MetricsSampler:
+    """Record node, pod and container usage from dashboard-style snapshots into a MetricsStore"""
+
+    def __init__(self, store: MetricsStore, fetch: Callable[[], Dict]):
+        self.store = store
+        self.fetch = fetch
+        self.samples = 0
+        self.dropped = 0
+
+    def _put(self, key: str, timestamp: float, value: float):
+        try:
+            self.store.record(key, timestamp, value)
+        except ValueError as e:
+            # A full store must not take the dashboard down; the sample is just not kept
+            if not self.dropped:
+                logger.warning(f"Metrics sample dropped: {e}")
+            self.dropped += 1
+
+    def record(self, data: Dict, timestamp: Optional[float] = None):
+        timestamp = timestamp or time.time()
+        for node in data.get("nodes") or []:
+            self._put(f"node/{node['name']}/cpu_m", timestamp, node["cpu_m"])
+            self._put(f"node/{node['name']}/mem_mi", timestamp, node["mem_mi"])
+        for (namespace, pod), (cpu_m, mem_mi) in (data.get("pod_usage") or {}).items():
+            self._put(f"pod/{namespace}/{pod}/cpu_m", timestamp, cpu_m)
+            self._put(f"pod/{namespace}/{pod}/mem_mi", timestamp, mem_mi)
+        for (namespace, pod, container), (cpu_m, mem_mi) in (data.get("container_usage") or {}).items():
+            self._put(f"container/{namespace}/{pod}/{container}/cpu_m", timestamp, cpu_m)
+            self._put(f"container/{namespace}/{pod}/{container}/mem_mi", timestamp, mem_mi)
+        self.samples += 1
+
+    def run(self, interval: float = 15.0, duration: Optional[float] = None):
+        """Sample every `interval` seconds until the duration passes or Ctrl+C"""
+        deadline = time.monotonic() + duration if duration else None
+        try:
+            while deadline is None or time.monotonic() < deadline:
+                started = time.monotonic()
+                self.record(self.fetch())
+                self.store.flush()
+                time.sleep(max(0.0, interval - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.store.flush()
+
+
+# Autoscaling experiments for the load-test recipe
+class LoadProfile:
+    """Target request rate over time for ramp, step and spike experiments"""
+
+    SHAPES = ("ramp", "step", "spike")
+
+    def __init__(self, shape: str, base_rps: float, peak_rps: float, duration: float):
+        if shape not in self.SHAPES:
+            raise ValueError(f"Unknown load profile: {shape}")
+        self.shape = shape
+        self.base_rps = max(0.0, base_rps)
+        self.peak_rps = max(self.base_rps, peak_rps)
+        self.duration = duration
+
+    def rate(self, t: float) -> float:
+        fraction = t / self.duration if self.duration else 1.0
+        if self.shape == "ramp":
+            # Linear climb over the first half, then hold the peak
+            return self.base_rps + (self.peak_rps - self.base_rps) * min(1.0, fraction / 0.5)
+        if self.shape == "step":
+            return self.peak_rps if fraction >= 0.25 else self.base_rps
+        return self.peak_rps if 0.4 <= fraction < 0.6 else self.base_rps
+
+    def load_starts(self) -> float:
+        """Seconds into the run when the rate first rises above the base"""
+        return {"ramp": 0.0, "step": 0.25, "spike": 0.4}[self.shape] * self.duration
+
+
+def parse_schedule(text: str) -> List[Tuple[float, int]]:
+    """[(seconds, replicas)] from '0:1,1m:3,3m:1'"""
+    steps = []
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        at, _, replicas = part.rpartition(":")
+        if not at or not replicas.isdigit():
+            raise ValueError(f"Bad schedule step '{part}', expected TIME:REPLICAS like 1m:3")
+        steps.append((parse_duration(at), int(replicas)))
+    return sorted(steps)
+
+
+class AutoscaleExperiment:
+    """Drive an open-loop HTTP load profile while sampling replicas, readiness and CPU on one timeline"""
+
+    def __init__(self, url: str, profile: LoadProfile, observe: Callable[[], Dict],
+                 scale: Optional[Callable[[int], None]] = None, schedule: Optional[List[Tuple[float, int]]] = None,
+                 sample_interval: float = 2.0, max_in_flight: int = 256, timeout: float = 5.0,
+                 slo_p95_ms: float = 250.0, slo_error_pct: float = 1.0):
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme != "http" or not parsed.hostname:
+            raise ValueError(f"Load target must be an http:// URL, got '{url}'")
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.path = (parsed.path or "/") + (f"?{parsed.query}" if parsed.query else "")
+        self.profile = profile
+        self.observe = observe
+        self.scale = scale
+        self.schedule = sorted(schedule or [])
+        self.sample_interval = sample_interval
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.slo_p95_ms = slo_p95_ms
+        self.slo_error_pct = slo_error_pct
+        self._seconds: Dict[int, Dict] = {}
+        self._samples: List[Dict] = []
+
+    def _second(self, t: float) -> Dict:
+        return self._seconds.setdefault(int(t), {"sent": 0, "ok": 0, "errors": 0, "dropped": 0, "latencies": []})
+
+    async def _request(self, started_at: float, t0: float):
+        bucket = self._second(started_at - t0)
+        bucket["sent"] += 1
+        writer = None
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+            writer.write(f"GET {self.path} HTTP/1.1\r\nHost: {self.host}\r\nConnection: close\r\n\r\n".encode())
+            await writer.drain()
+            status_line = await asyncio.wait_for(reader.readline(), self.timeout)
+            await asyncio.wait_for(reader.read(), self.timeout)
+            parts = status_line.split()
+            ok = len(parts) >= 2 and parts[1].isdigit() and int(parts[1]) < 500
+        except (OSError, asyncio.TimeoutError, ValueError):
+            ok = False
+        finally:
+            if writer is not None:
+                writer.close()
+        if ok:
+            bucket["ok"] += 1
+            bucket["latencies"].append((time.monotonic() - started_at) * 1000)
+        else:
+            bucket["errors"] += 1
+
+    async def _drive_load(self, t0: float):
+        in_flight: set = set()
+        next_at = t0
+        while True:
+            now = time.monotonic()
+            t = now - t0
+            if t >= self.profile.duration:
+                break
+            rate = self.profile.rate(t)
+            if rate <= 0:
+                await asyncio.sleep(0.1)
+                next_at = time.monotonic()
+                continue
+            if now >= next_at:
+                if len(in_flight) >= self.max_in_flight:
+                    self._second(t)["dropped"] += 1
+                else:
+                    task = asyncio.ensure_future(self._request(now, t0))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+                # Evenly spaced arrivals; never burst to catch up more than a second behind
+                next_at = max(next_at + 1.0 / rate, now - 1.0)
+            await asyncio.sleep(max(0.0, min(next_at - time.monotonic(), 0.05)))
+        if in_flight:
+            await asyncio.wait(in_flight, timeout=self.timeout)
+
+    async def _watch_cluster(self, t0: float):
+        loop = asyncio.get_event_loop()
+        pending = list(self.schedule)
+        while time.monotonic() - t0 < self.profile.duration:
+            t = time.monotonic() - t0
+            # Sample before scaling, so the first sample shows the deployment as it was before the run
+            sample = await loop.run_in_executor(None, self.observe)
+            sample["t"] = round(time.monotonic() - t0, 2)
+            self._samples.append(sample)
+            while pending and pending[0][0] <= t and self.scale:
+                _, replicas = pending.pop(0)
+                await loop.run_in_executor(None, self.scale, replicas)
+            await asyncio.sleep(max(0.0, self.sample_interval - (time.monotonic() - t0 - t)))
+
+    async def _run(self) -> Dict:
+        t0 = time.monotonic()
+        await asyncio.gather(self._drive_load(t0), self._watch_cluster(t0))
+        return self.report()
+
+    def run(self) -> Dict:
+        return asyncio.run(self._run())
+
+    def timeline(self) -> List[Dict]:
+        """One row per second: load and latency from the client, cluster state from the latest sample"""
+        rows = []
+        samples = iter(self._samples)
+        current = {}
+        upcoming = next(samples, None)
+        for second in range(int(math.ceil(self.profile.duration))):
+            while upcoming is not None and upcoming["t"] < second + 1:
+                current, upcoming = upcoming, next(samples, None)
+            bucket = self._seconds.get(second, {"sent": 0, "ok": 0, "errors": 0, "dropped": 0, "latencies": []})
+            latencies = sorted(bucket["latencies"])
+            attempts = bucket["sent"] + bucket["dropped"]
+            rows.append({"t": second, "target_rps": round(self.profile.rate(second + 0.5), 1), "sent": bucket["sent"],
+                         "ok": bucket["ok"], "errors": bucket["errors"] + bucket["dropped"],
+                         "error_pct": round(100.0 * (bucket["errors"] + bucket["dropped"]) / attempts, 2)
+                         if attempts else 0.0,
+                         "p50_ms": round(percentile(latencies, 50), 1) if latencies else None,
+                         "p95_ms": round(percentile(latencies, 95), 1) if latencies else None,
+                         "desired": current.get("desired"), "replicas": current.get("replicas"),
+                         "ready": current.get("ready"), "cpu_m": current.get("cpu_m"),
+                         "hpa_cpu_pct": current.get("hpa_cpu_pct")})
+        return rows
+
+    def report(self) -> Dict:
+        """Scale-up reaction times, SLO violations and the full timeline"""
+        rows = self.timeline()
+        start = self.profile.load_starts()
+        # The first sample is taken before any load or scheduled scaling
+        initial = next((s for s in self._samples if s.get("desired") is not None), {})
+
+        def first_after(field: str) -> Optional[float]:
+            baseline = initial.get(field)
+            if baseline is None:
+                return None
+            hit = next((s["t"] for s in self._samples if s["t"] >= start and (s.get(field) or 0) > baseline), None)
+            return round(hit - start, 1) if hit is not None else None
+
+        violations = [r["t"] for r in rows if r["sent"] and
+                      ((r["p95_ms"] or 0) > self.slo_p95_ms or r["error_pct"] > self.slo_error_pct)]
+        longest = streak = 0
+        for previous, current in zip([None] + violations, violations):
+            streak = streak + 1 if previous is not None and current == previous + 1 else 1
+            longest = max(longest, streak)
+        latencies = sorted(l for b in self._seconds.values() for l in b["latencies"])
+        sent = sum(b["sent"] for b in self._seconds.values())
+        failed = sum(b["errors"] + b["dropped"] for b in self._seconds.values())
+        return {"profile": self.profile.shape, "duration": self.profile.duration,
+                "base_rps": self.profile.base_rps, "peak_rps": self.profile.peak_rps,
+                "load_starts_s": start, "requests": sent, "failed": failed,
+                "p50_ms": round(percentile(latencies, 50), 1) if latencies else None,
+                "p95_ms": round(percentile(latencies, 95), 1) if latencies else None,
+                "p99_ms": round(percentile(latencies, 99), 1) if latencies else None,
+                "initial_replicas": initial.get("replicas"),
+                "max_replicas": max((s["replicas"] for s in self._samples if s.get("replicas") is not None),
+                                    default=None),
+                "scale_decision_s": first_after("desired"), "scale_ready_s": first_after("ready"),
+                "slo": {"p95_ms": self.slo_p95_ms, "error_pct": self.slo_error_pct,
+                        "violating_seconds": len(violations), "longest_violation_s": longest,
+                        "first_violation_s": violations[0] if violations else None},
+                "timeline": rows}
+
+    @staticmethod
+    def to_csv(report: Dict) -> str:
+        fields = list(report["timeline"][0]) if report["timeline"] else []
+        lines = [",".join(fields)]
+        lines += [",".join("" if row[f] is None else str(row[f]) for f in fields) for row in report["timeline"]]
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def print_report(report: Dict):
+        """Condensed timeline plus reaction times and SLO outcome"""
+        def show(value, unit=""):
+            return "-" if value is None else f"{value}{unit}"
+
+        print(f"\n{Colors.BOLD}{'t':>4s} {'rps':>6s} {'sent':>5s} {'err%':>5s} {'p95ms':>7s} "
+              f"{'want':>4s} {'pods':>4s} {'rdy':>4s} {'cpu m':>6s} {'hpa%':>5s}{Colors.ENDC}")
+        step = max(1, len(report["timeline"]) // 40)
+        for row in report["timeline"][::step]:
+            bad = (row["p95_ms"] or 0) > report["slo"]["p95_ms"] or row["error_pct"] > report["slo"]["error_pct"]
+            color = Colors.FAIL if bad and row["sent"] else ""
+            print(f"{color}{row['t']:4d} {row['target_rps']:6.1f} {row['sent']:5d} {row['error_pct']:5.1f} "
+                  f"{show(row['p95_ms']):>7s} {show(row['desired']):>4s} {show(row['replicas']):>4s} "
+                  f"{show(row['ready']):>4s} {show(row['cpu_m']):>6s} {show(row['hpa_cpu_pct']):>5s}"
+                  f"{Colors.ENDC if color else ''}")
+        slo = report["slo"]
+        print(f"\n{Colors.BOLD}{report['profile']} {report['base_rps']:g}→{report['peak_rps']:g} rps over "
+              f"{report['duration']:g}s: {report['requests']} requests, {report['failed']} failed, "
+              f"p50/p95/p99 {show(report['p50_ms'])}/{show(report['p95_ms'])}/{show(report['p99_ms'])} ms{Colors.ENDC}")
+        print(f"  Replicas {show(report['initial_replicas'])} → max {show(report['max_replicas'])}; "
+              f"scale decision after {show(report['scale_decision_s'], 's')}, "
+              f"new pods ready after {show(report['scale_ready_s'], 's')} (from load increase at "
+              f"{report['load_starts_s']:g}s)")
+        color = Colors.OKGREEN if not slo["violating_seconds"] else Colors.FAIL
+        print(f"  {color}SLO p95 ≤ {slo['p95_ms']:g}ms, errors ≤ {slo['error_pct']:g}%: "
+              f"{slo['violating_seconds']}s violating, longest streak {slo['longest_violation_s']}s"
+              f"{', first at ' + str(slo['first_violation_s']) + 's' if slo['first_violation_s'] is not None else ''}"
+              f"{Colors.ENDC}\n")
+
+
+# Datastore throughput benchmarks (Redis RESP, Postgres wire protocol, raw TCP echo)
+class BenchmarkError(Exception):
+    """A datastore replied with an error or broke the protocol"""
+
+
+class RespConnection:
+    """Minimal asyncio Redis client: commands are written as a pipeline and replies read in order"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host: str, port: int, password: Optional[str] = None, timeout: float = 5.0):
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        conn = cls(reader, writer)
+        if password:
+            reply = (await conn.pipeline([[b"AUTH", password.encode()]]))[0]
+            if isinstance(reply, BenchmarkError):
+                conn.close()
+                raise reply
+        return conn
+
+    @staticmethod
+    def encode(command: List[bytes]) -> bytes:
+        parts = [b"*%d\r\n" % len(command)]
+        for arg in command:
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    async def read_reply(self):
+        line = await self.reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise BenchmarkError("connection closed mid-reply")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body
+        if kind == b"-":
+            return BenchmarkError(body.decode(errors="replace"))
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            size = int(body)
+            return None if size < 0 else (await self.reader.readexactly(size + 2))[:-2]
+        if kind == b"*":
+            size = int(body)
+            return None if size < 0 else [await self.read_reply() for _ in range(size)]
+        raise BenchmarkError(f"unexpected RESP reply {line[:20]!r}")
+
+    async def pipeline(self, commands: List[List[bytes]]) -> List:
+        """Send every command in one write, then read one reply per command (errors are returned, not raised)"""
+        self.writer.write(b"".join(self.encode(c) for c in commands))
+        await self.writer.drain()
+        return [await self.read_reply() for _ in commands]
+
+    def close(self):
+        self.writer.close()
+
+
+class PostgresConnection:
+    """Minimal asyncio PostgreSQL client speaking protocol 3.0 with the simple query flow
+
+    Supports trust, cleartext, md5 and SCRAM-SHA-256 authentication. Several Query messages
+    can be written at once; the server answers them in order, one ReadyForQuery each.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.parameters: Dict[str, str] = {}
+
+    @classmethod
+    async def connect(cls, host: str, port: int, user: str, password: Optional[str], database: str,
+                      timeout: float = 5.0):
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        conn = cls(reader, writer)
+        try:
+            await asyncio.wait_for(conn._startup(user, password or "", database), timeout)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _send(self, kind: bytes, payload: bytes):
+        self.writer.write(kind + struct.pack("!I", len(payload) + 4) + payload)
+
+    async def _message(self) -> Tuple[bytes, bytes]:
+        header = await self.reader.readexactly(5)
+        size = struct.unpack("!I", header[1:])[0]
+        return header[:1], await self.reader.readexactly(size - 4)
+
+    @staticmethod
+    def _error_text(payload: bytes) -> str:
+        fields = {part[:1]: part[1:].decode(errors="replace") for part in payload.split(b"\0") if part}
+        return f"{fields.get(b'S', 'ERROR')} {fields.get(b'C', '')}: {fields.get(b'M', '')}".strip()
+
+    @staticmethod
+    def scram_client_final(password: str, client_nonce: str, server_first: str) -> Tuple[str, bytes]:
+        """Client-final message and expected server signature for SCRAM-SHA-256 (RFC 5802/7677)"""
+        attrs = dict(item.split("=", 1) for item in server_first.split(","))
+        if not attrs["r"].startswith(client_nonce):
+            raise BenchmarkError("SCRAM server nonce does not extend the client nonce")
+        salted = hashlib.pbkdf2_hmac("sha256", password.encode(), base64.b64decode(attrs["s"]), int(attrs["i"]))
+        client_key = hmac.new(salted, b"Client Key", hashlib.sha256).digest()
+        without_proof = f"c=biws,r={attrs['r']}"
+        auth_message = f"n=,r={client_nonce},{server_first},{without_proof}".encode()
+        signature = hmac.new(hashlib.sha256(client_key).digest(), auth_message, hashlib.sha256).digest()
+        proof = base64.b64encode(bytes(a ^ b for a, b in zip(client_key, signature))).decode()
+        server_key = hmac.new(salted, b"Server Key", hashlib.sha256).digest()
+        return f"{without_proof},p={proof}", hmac.new(server_key, auth_message, hashlib.sha256).digest()
+
+    async def _startup(self, user: str, password: str, database: str):
+        params = b"".join(k.encode() + b"\0" + v.encode() + b"\0"
+                          for k, v in (("user", user), ("database", database), ("client_encoding", "UTF8")))
+        payload = struct.pack("!I", 196608) + params + b"\0"
+        self.writer.write(struct.pack("!I", len(payload) + 4) + payload)
+        await self.writer.drain()
+        client_nonce = server_signature = None
+        while True:
+            kind, body = await self._message()
+            if kind == b"E":
+                raise BenchmarkError(self._error_text(body))
+            if kind == b"S":
+                name, value = body.rstrip(b"\0").split(b"\0", 1)
+                self.parameters[name.decode()] = value.decode()
+            elif kind == b"Z":
+                return
+            elif kind == b"R":
+                code = struct.unpack("!I", body[:4])[0]
+                if code == 3:
+                    self._send(b"p", password.encode() + b"\0")
+                elif code == 5:
+                    inner = hashlib.md5((password + user).encode()).hexdigest()
+                    self._send(b"p", b"md5" + hashlib.md5(inner.encode() + body[4:8]).hexdigest().encode() + b"\0")
+                elif code == 10:
+                    if b"SCRAM-SHA-256\0" not in body[4:]:
+                        raise BenchmarkError("server offers no supported SASL mechanism")
+                    client_nonce = base64.b64encode(os.urandom(18)).decode()
+                    first = f"n,,n=,r={client_nonce}".encode()
+                    self._send(b"p", b"SCRAM-SHA-256\0" + struct.pack("!I", len(first)) + first)
+                elif code == 11:
+                    final, server_signature = self.scram_client_final(password, client_nonce, body[4:].decode())
+                    self._send(b"p", final.encode())
+                elif code == 12:
+                    attrs = dict(item.split("=", 1) for item in body[4:].decode().split(","))
+                    if base64.b64decode(attrs.get("v", "")) != server_signature:
+                        raise BenchmarkError("SCRAM server signature mismatch")
+                elif code != 0:
+                    raise BenchmarkError(f"unsupported authentication method {code}")
+                await self.writer.drain()
+
+    async def pipeline(self, queries: List[str]) -> List:
+        """Send every query at once; per query return its rows (lists of text or None) or a BenchmarkError"""
+        for query in queries:
+            self._send(b"Q", query.encode() + b"\0")
+        await self.writer.drain()
+        results = []
+        rows, error = [], None
+        while len(results) < len(queries):
+            kind, body = await self._message()
+            if kind == b"D":
+                count = struct.unpack("!H", body[:2])[0]
+                offset, row = 2, []
+                for _ in range(count):
+                    size = struct.unpack("!i", body[offset:offset + 4])[0]
+                    offset += 4
+                    row.append(None if size < 0 else body[offset:offset + size])
+                    offset += max(size, 0)
+                rows.append(row)
+            elif kind == b"E":
+                error = BenchmarkError(self._error_text(body))
+            elif kind == b"Z":
+                results.append(error or rows)
+                rows, error = [], None
+        return results
+
+    async def execute(self, query: str) -> List:
+        result = (await self.pipeline([query]))[0]
+        if isinstance(result, BenchmarkError):
+            raise result
+        return result
+
+    def close(self):
+        try:
+            self._send(b"X", b"")
+        except (OSError, RuntimeError):
+            pass
+        self.writer.close()
+
+
+class DatastoreBenchmark:
+    """Closed-loop throughput benchmark over concurrent connections, one phase per value size
+
+    Modes:
+      redis     GET/SET mix over a pre-filled keyspace, pipelined with RESP
+      postgres  the same mix against a key/value table, or a fixed --query, pipelined simple queries
+      tcp       write value_size bytes and read them back (any echo server)
+
+    Each connection keeps `pipeline` operations in flight per round trip. Latency is measured per
+    round trip, so with pipelining it is the time for the whole batch, as in redis-benchmark -P.
+    """
+
+    MODES = ("redis", "postgres", "tcp")
+    TABLE = "minikube_tutorial_bench"
+
+    def __init__(self, mode: str, host: str, port: int, connections: int = 8, pipeline: int = 1,
+                 duration: float = 10.0, value_sizes: Optional[List[int]] = None, get_ratio: float = 0.8,
+                 keyspace: int = 10000, query: Optional[str] = None, user: str = "postgres",
+                 password: Optional[str] = None, database: str = "postgres", timeout: float = 5.0,
+                 warmup: float = 1.0, keep: bool = False):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown benchmark mode '{mode}', expected one of {', '.join(self.MODES)}")
+        if connections < 1 or pipeline < 1 or duration <= 0 or not 0.0 <= get_ratio <= 1.0 or keyspace < 1:
+            raise ValueError("connections, pipeline, duration and keyspace must be positive and get_ratio within 0-1")
+        self.mode = mode
+        self.host = host
+        self.port = port
+        self.connections = connections
+        self.pipeline = pipeline
+        self.duration = duration
+        # A fixed query ignores value sizes, so it runs as a single phase
+        self.value_sizes = [0] if query else value_sizes or [64]
+        self.get_ratio = get_ratio
+        self.keyspace = keyspace
+        self.query = query
+        self.user = user
+        self.password = password
+        self.database = database
+        self.timeout = timeout
+        self.warmup = warmup
+        self.keep = keep
+
+    async def _connect(self):
+        if self.mode == "redis":
+            return await RespConnection.connect(self.host, self.port, self.password, self.timeout)
+        if self.mode == "postgres":
+            return await PostgresConnection.connect(self.host, self.port, self.user, self.password,
+                                                    self.database, self.timeout)
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+        return reader, writer
+
+    @staticmethod
+    def _close(conn):
+        if isinstance(conn, tuple):
+            conn[1].close()
+        else:
+            conn.close()
+
+    async def _prefill(self, conn, value: bytes):
+        """Make every key readable so GETs return value-sized replies"""
+        batch = 1000
+        for start in range(0, self.keyspace, batch):
+            keys = range(start, min(start + batch, self.keyspace))
+            if self.mode == "redis":
+                replies = await conn.pipeline([[b"SET", b"bench:%d" % k, value] for k in keys])
+            else:
+                text = value.decode()
+                replies = await conn.pipeline([
+                    f"INSERT INTO {self.TABLE} (k, v) SELECT g, '{text}' FROM generate_series({keys[0]}, {keys[-1]}) g "
+                    f"ON CONFLICT (k) DO UPDATE SET v = EXCLUDED.v"])
+            error = next((r for r in replies if isinstance(r, BenchmarkError)), None)
+            if error:
+                raise error
+
+    def _batch(self, rng: random.Random, value: bytes) -> Tuple[List, int]:
+        """One pipeline worth of operations and how many of them are reads"""
+        if self.mode == "tcp":
+            return [value] * self.pipeline, 0
+        ops, reads = [], 0
+        for _ in range(self.pipeline):
+            key = rng.randrange(self.keyspace)
+            read = rng.random() < self.get_ratio
+            reads += read
+            if self.mode == "redis":
+                ops.append([b"GET", b"bench:%d" % key] if read else [b"SET", b"bench:%d" % key, value])
+            elif self.query:
+                ops.append(self.query)
+            elif read:
+                ops.append(f"SELECT v FROM {self.TABLE} WHERE k = {key}")
+            else:
+                ops.append(f"UPDATE {self.TABLE} SET v = '{value.decode()}' WHERE k = {key}")
+        return ops, reads
+
+    async def _round_trip(self, conn, ops: List) -> List[BenchmarkError]:
+        """Run one batch; returns the errors the server replied with"""
+        if self.mode == "tcp":
+            reader, writer = conn
+            payload = b"".join(ops)
+            writer.write(payload)
+            await writer.drain()
+            await reader.readexactly(len(payload))
+            return []
+        return [r for r in await conn.pipeline(ops) if isinstance(r, BenchmarkError)]
+
+    async def _worker(self, conn, value: bytes, start: float, stop: float, stats: Dict, seed: int):
+        rng = random.Random(seed)
+        while True:
+            ops, reads = self._batch(rng, value)
+            began = time.monotonic()
+            if began >= stop:
+                return
+            try:
+                failed = await asyncio.wait_for(self._round_trip(conn, ops), self.timeout)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, BenchmarkError, ValueError) as e:
+                # The connection is out of step with the server now; this worker stops
+                stats["errors"] += len(ops)
+                stats["last_error"] = str(e) or type(e).__name__
+                return
+            ended = time.monotonic()
+            if began >= start:
+                stats["ops"] += len(ops)
+                stats["reads"] += reads
+                stats["errors"] += len(failed)
+                if failed:
+                    stats["last_error"] = str(failed[-1])
+                stats["latencies"].append((ended - began) * 1000)
+
+    async def _phase(self, conns: List, value_size: int) -> Dict:
+        value = (b"x" * value_size)
+        if self.mode != "tcp" and not self.query:
+            await self._prefill(conns[0], value)
+        stats = {"ops": 0, "reads": 0, "errors": 0, "latencies": [], "last_error": None}
+        start = time.monotonic() + self.warmup
+        stop = start + self.duration
+        await asyncio.gather(*(self._worker(conn, value, start, stop, stats, i) for i, conn in enumerate(conns)))
+        elapsed = min(time.monotonic(), stop) - start
+        latencies = sorted(stats["latencies"])
+        return {"value_size": value_size, "ops": stats["ops"], "errors": stats["errors"],
+                "read_pct": round(100.0 * stats["reads"] / stats["ops"], 1) if stats["ops"] else 0.0,
+                "ops_per_s": round(stats["ops"] / elapsed, 1) if elapsed > 0 else 0.0,
+                "round_trips": len(latencies),
+                "p50_ms": round(percentile(latencies, 50), 3) if latencies else None,
+                "p95_ms": round(percentile(latencies, 95), 3) if latencies else None,
+                "p99_ms": round(percentile(latencies, 99), 3) if latencies else None,
+                "max_ms": round(latencies[-1], 3) if latencies else None,
+                "last_error": stats["last_error"]}
+
+    async def _run(self) -> Dict:
+        conns = await asyncio.gather(*(self._connect() for _ in range(self.connections)))
+        report = {"mode": self.mode, "target": f"{self.host}:{self.port}", "connections": self.connections,
+                  "pipeline": self.pipeline, "duration": self.duration, "warmup": self.warmup,
+                  "get_ratio": None if self.mode == "tcp" or self.query else self.get_ratio,
+                  "keyspace": None if self.mode == "tcp" or self.query else self.keyspace,
+                  "query": self.query, "phases": []}
+        try:
+            if self.mode == "postgres":
+                report["server_version"] = conns[0].parameters.get("server_version")
+                if not self.query:
+                    await conns[0].execute(f"CREATE TABLE IF NOT EXISTS {self.TABLE} (k integer PRIMARY KEY, v text)")
+            for size in self.value_sizes:
+                report["phases"].append(await self._phase(conns, size))
+            if self.mode == "redis" and not self.keep:
+                for start in range(0, self.keyspace, 1000):
+                    await conns[0].pipeline([[b"DEL"] + [b"bench:%d" % k for k in
+                                                         range(start, min(start + 1000, self.keyspace))]])
+            elif self.mode == "postgres" and not self.query and not self.keep:
+                await conns[0].execute(f"DROP TABLE IF EXISTS {self.TABLE}")
+        finally:
+            for conn in conns:
+                self._close(conn)
+        report["ok"] = bool(report["phases"]) and all(p["ops"] and not p["errors"] for p in report["phases"])
+        return report
+
+    def run(self) -> Dict:
+        return asyncio.run(self._run())
+
+    @staticmethod
+    def print_report(report: Dict):
+        def show(value):
+            return "-" if value is None else f"{value:.2f}"
+
+        workload = report["query"] or ("echo" if report["mode"] == "tcp" else f"{report['get_ratio'] * 100:g}% GET")
+        print(f"\n{Colors.BOLD}{report['mode']} @ {report['target']}  {report['connections']} conn × "
+              f"pipeline {report['pipeline']}, {report['duration']:g}s per phase, {workload}"
+              f"{'  (server ' + report['server_version'] + ')' if report.get('server_version') else ''}{Colors.ENDC}")
+        env = report.get("environment")
+        if env:
+            print(f"  driver {env.get('driver') or '?'}, {env.get('cpus') or '?'} CPUs, {env.get('memory_mb') or '?'} MB; "
+                  f"limits {env.get('limits') or 'none'}")
+        print(f"{Colors.BOLD}{'size':>7s} {'ops/s':>11s} {'ops':>9s} {'err':>5s} {'p50 ms':>8s} {'p95 ms':>8s} "
+              f"{'p99 ms':>8s} {'max ms':>8s}{Colors.ENDC}")
+        for phase in report["phases"]:
+            color = Colors.FAIL if phase["errors"] or not phase["ops"] else ""
+            size = "-" if report["query"] else str(phase["value_size"])
+            print(f"{color}{size:>7s} {phase['ops_per_s']:>11,.0f} {phase['ops']:>9d} {phase['errors']:>5d} "
+                  f"{show(phase['p50_ms']):>8s} {show(phase['p95_ms']):>8s} {show(phase['p99_ms']):>8s} "
+                  f"{show(phase['max_ms']):>8s}{Colors.ENDC if color else ''}")
+            if phase["last_error"]:
+                print(f"        {Colors.FAIL}{phase['last_error']}{Colors.ENDC}")
+        if report.get("files"):
+            print(f"{Colors.OKGREEN}Saved to {report['files'][0]}{Colors.ENDC}")
+        print()
+
+
+# Live cluster dashboard
+class ClusterDashboard:
+    """Top-style view of node/pod usage and pod status that redraws only the cells that changed"""
+
+    SORT_KEYS = {"cpu": lambda r: -r["cpu_m"], "memory": lambda r: -r["mem_mi"],
+                 "restarts": lambda r: -r["restarts"], "name": lambda r: (r["namespace"], r["name"])}
+    # (field, heading, width, right-aligned)
+    COLUMNS = (("namespace", "NAMESPACE", 16, False), ("name", "POD", 38, False), ("status", "STATUS", 18, False),
+               ("ready", "READY", 6, True), ("restarts", "RESTARTS", 9, True), ("cpu", "CPU(m)", 8, True),
+               ("mem", "MEM(Mi)", 8, True), ("node", "NODE", 14, False))
+    BAD_STATES = ("CrashLoopBackOff", "Error", "ImagePullBackOff", "ErrImagePull", "OOMKilled", "Failed",
+                  "CreateContainerConfigError", "Evicted")
+
+    def __init__(self, fetch: Callable[[], Dict], recipe_names: Optional[Dict[str, str]] = None,
+                 sort: str = "cpu", group: bool = True):
+        self.fetch = fetch
+        self.recipe_names = recipe_names or {}
+        self.sort = sort if sort in self.SORT_KEYS else "cpu"
+        self.group = group
+        self._frame: List[List[Tuple[int, str, str]]] = []
+        self._size: Optional[Tuple[int, int]] = None
+
+    @staticmethod
+    def pod_status(pod: Dict) -> Tuple[str, str, int]:
+        """kubectl-style STATUS, READY and RESTARTS for a pod object"""
+        status = pod.get("status") or {}
+        containers = status.get("containerStatuses") or []
+        reason = status.get("reason") or status.get("phase") or "Unknown"
+        for container in containers:
+            state = container.get("state") or {}
+            detail = state.get("waiting") or state.get("terminated") or {}
+            if detail.get("reason") and not (state.get("terminated") and detail.get("reason") == "Completed"):
+                reason = detail["reason"]
+                break
+        if (pod.get("metadata") or {}).get("deletionTimestamp"):
+            reason = "Terminating"
+        total = len((pod.get("spec") or {}).get("containers") or []) or len(containers)
+        ready = sum(1 for c in containers if c.get("ready"))
+        return reason, f"{ready}/{total}", sum(c.get("restartCount", 0) for c in containers)
+
+    def rows(self, data: Dict) -> Tuple[List[Dict], List[Dict]]:
+        """Pod rows (status joined with usage) and node rows from one fetch"""
+        usage = data.get("pod_usage") or {}
+        pods = []
+        for pod in data.get("pods") or []:
+            meta = pod.get("metadata") or {}
+            status, ready, restarts = self.pod_status(pod)
+            cpu_m, mem_mi = usage.get((meta.get("namespace", ""), meta.get("name", "")), (0.0, 0.0))
+            recipe = (meta.get("labels") or {}).get(RECIPE_LABEL)
+            pods.append({"namespace": meta.get("namespace", ""), "name": meta.get("name", ""), "status": status,
+                         "ready": ready, "restarts": restarts, "cpu_m": cpu_m, "mem_mi": mem_mi,
+                         "node": (pod.get("spec") or {}).get("nodeName") or "-",
+                         "group": self.recipe_names.get(recipe, f"recipe {recipe}") if recipe else
+                         f"namespace {meta.get('namespace', '')}"})
+        pods.sort(key=self.SORT_KEYS[self.sort])
+        if self.group:
+            # Groups ordered by their heaviest member under the current sort
+            first = {}
+            for index, row in enumerate(pods):
+                first.setdefault(row["group"], index)
+            pods.sort(key=lambda r: first[r["group"]])
+        return pods, data.get("nodes") or []
+
+    def frame(self, data: Dict, width: int, height: int, interval: float) -> List[List[Tuple[int, str, str]]]:
+        """Screen as lines of (column, color, text) cells, cut to the terminal size"""
+        pods, nodes = self.rows(data)
+        lines: List[List[Tuple[int, str, str]]] = []
+        problems = sum(1 for p in pods if p["status"] in self.BAD_STATES or p["restarts"])
+        lines.append([(0, Colors.BOLD, f"Cluster dashboard  {len(pods)} pods, {problems} with problems  "
+                                       f"sort={self.sort} group={'recipe' if self.group else 'off'}  "
+                                       f"every {interval:g}s  {time.strftime('%H:%M:%S')}")])
+        lines.append([(0, Colors.OKCYAN, "keys: c=cpu m=memory r=restarts n=name g=group +/- interval q=quit")])
+        for node in nodes:
+            lines.append([(0, Colors.OKBLUE, f"node {node['name'][:20]:20s}"),
+                          (26, "", f"cpu {node['cpu_m']:7.0f}m {node['cpu_pct']:3.0f}%"),
+                          (46, "", f"mem {node['mem_mi']:7.0f}Mi {node['mem_pct']:3.0f}%"),
+                          (68, Colors.OKGREEN if node.get("ready", True) else Colors.FAIL,
+                           "Ready" if node.get("ready", True) else "NotReady")])
+        lines.append([])
+        header, column = [], 0
+        for _, heading, size, right in self.COLUMNS:
+            header.append((column, Colors.BOLD, heading.rjust(size) if right else heading.ljust(size)))
+            column += size + 1
+        lines.append(header)
+        group = None
+        for row in pods:
+            if len(lines) >= height - 1:
+                break
+            if self.group and row["group"] != group:
+                group = row["group"]
+                members = [p for p in pods if p["group"] == group]
+                lines.append([(0, Colors.HEADER, f"▸ {group}: {len(members)} pods, "
+                                                 f"{sum(p['cpu_m'] for p in members):.0f}m cpu, "
+                                                 f"{sum(p['mem_mi'] for p in members):.0f}Mi")])
+                if len(lines) >= height - 1:
+                    break
+            values = {"namespace": row["namespace"], "name": row["name"], "status": row["status"],
+                      "ready": row["ready"], "restarts": str(row["restarts"]), "cpu": f"{row['cpu_m']:.0f}",
+                      "mem": f"{row['mem_mi']:.0f}", "node": row["node"]}
+            color = Colors.FAIL if row["status"] in self.BAD_STATES else \
+                Colors.WARNING if row["status"] not in ("Running", "Succeeded", "Completed") or row["restarts"] \
+                else ""
+            cells, column = [], 0
+            for field, _, size, right in self.COLUMNS:
+                text = values[field][:size]
+                cells.append((column, color, text.rjust(size) if right else text.ljust(size)))
+                column += size + 1
+            lines.append(cells)
+        if len(pods) and len(lines) >= height - 1:
+            lines.append([(0, Colors.OKCYAN, f"... more pods than fit on screen")])
+        return [[(col, color, text[:max(0, width - col)]) for col, color, text in line if col < width]
+                for line in lines[:height]]
+
+    @staticmethod
+    def plain(line: List[Tuple[int, str, str]]) -> str:
+        """One frame line as text for non-terminal output"""
+        out, visible = [], 0
+        for col, color, text in line:
+            out.append(" " * max(0, col - visible) + color + text + (Colors.ENDC if color else ""))
+            visible = max(visible, col) + len(text)
+        return "".join(out)
+
+    def draw(self, frame: List[List[Tuple[int, str, str]]], size: Tuple[int, int]) -> str:
+        """Escape sequences turning the previous frame into this one, touching only changed cells"""
+        out = []
+        if size != self._size:
+            out.append("\033[2J")
+            self._frame = []
+            self._size = size
+        for row, line in enumerate(frame):
+            previous = self._frame[row] if row < len(self._frame) else None
+            if previous == line:
+                continue
+            if previous is None or len(previous) != len(line) or \
+                    any(a[0] != b[0] for a, b in zip(previous, line)):
+                # Layout of this line changed: rewrite it whole
+                out.append(f"\033[{row + 1};1H\033[K")
+                out.extend(f"\033[{row + 1};{col + 1}H{color}{text}{Colors.ENDC}" for col, color, text in line)
+                continue
+            for old, new in zip(previous, line):
+                if old != new:
+                    col, color, text = new
+                    pad = " " * max(0, len(old[2]) - len(text))
+                    out.append(f"\033[{row + 1};{col + 1}H{color}{text}{Colors.ENDC}{pad}")
+        for row in range(len(frame), len(self._frame)):
+            out.append(f"\033[{row + 1};1H\033[K")
+        self._frame = frame
+        return "".join(out)
+
+    def run(self, interval: float = 2.0, once: bool = False):
+        """Poll and redraw until 'q' or Ctrl+C; without a terminal print plain frames"""
+        interactive = sys.stdin.isatty() and sys.stdout.isatty() and termios is not None and not once
+        fd = sys.stdin.fileno() if interactive else None
+        saved = termios.tcgetattr(fd) if interactive else None
+        try:
+            if interactive:
+                tty.setcbreak(fd)
+                print("\033[?25l", end="")
+            while True:
+                started = time.monotonic()
+                size = tuple(os.get_terminal_size()) if sys.stdout.isatty() else (140, 10 ** 6)
+                if not all(size):
+                    size = (120, 40)
+                frame = self.frame(self.fetch(), size[0], size[1], interval)
+                if interactive:
+                    sys.stdout.write(self.draw(frame, size))
+                    sys.stdout.flush()
+                else:
+                    for line in frame:
+                        print(self.plain(line))
+                    print()
+                if once:
+                    return
+                while True:
+                    remaining = interval - (time.monotonic() - started)
+                    if remaining <= 0:
+                        break
+                    if not interactive:
+                        time.sleep(remaining)
+                        break
+                    ready, _, _ = select.select([sys.stdin], [], [], remaining)
+                    if not ready:
+                        break
+                    key = sys.stdin.read(1).lower()
+                    if key == "q":
+                        return
+                    if key in "cmrn" and key:
+                        self.sort = {"c": "cpu", "m": "memory", "r": "restarts", "n": "name"}[key]
+                        break
+                    if key == "g":
+                        self.group = not self.group
+                        break
+                    if key in "+-" and key:
+                        interval = max(0.5, interval + (1 if key == "+" else -1) * (1 if interval >= 1 else 0.5))
+                        break
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if interactive:
+                termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+                print(f"\033[?25h\033[{len(self._frame) + 1};1H")
+
+
 class MinikubeTutorial:
     """Main tutorial class managing the interactive experience"""
 
     VERSION = "1.0.0"
     TUTORIAL_DIR = Path.home() / ".minikube_tutorial"
+    CONTENT_DIR = Path(__file__).resolve().parent / "content"
 
-    def __init__(self):
+    def __init__(self, profile: Optional[str] = None, backend: Optional[CommandBackend] = None):
         self.tutorial_dir = self.TUTORIAL_DIR
         self.tutorial_dir.mkdir(parents=True, exist_ok=True)
         self.config_file = self.tutorial_dir / "config.json"
         self.config = self._load_config()
+        self.profile = profile or os.environ.get("MINIKUBE_PROFILE")
+        self.backend = backend or CommandBackend()
+        self.events = EventBuffer()
+        self.event_watcher: Optional[EventWatcher] = None
+        self._recipe_catalog: Optional[RecipeCatalog] = None
+        self._metrics = None  # MetricsStore once opened, False when it cannot be
+        self._kube = None  # KubeClient once connected, False when the API is unreachable
+        self.section = "menu"
+        self.current_recipe: Optional[str] = None
+        self.journal: Optional[SessionJournal] = None
+        if self.backend.mode == "live":
+            self.journal = SessionJournal(self.tutorial_dir / "journal")
+            atexit.register(self.journal.close)
         logger.info(f"Tutorial initialized. Version: {self.VERSION}")
 
     def _load_config(self) -> Dict:
@@ -99,20 +5772,33 @@ class MinikubeTutorial:
         print("11. 🎛️  Manage Minikube Add-ons (Dashboard, Registry, Metrics)")
         print("12. 📦 Install Helm Packages (20+ Development & Analytics Tools)")
         print("13. 📋 Browse & Deploy Recipes (12 Ready-to-Use Apps)")
+        print("14. 🌐 Multi-Profile Operations (Deploy, Verify, Teardown)")
+        print("15. 📡 Live Cluster Events")
+        print("16. ⏱️  Local Trace Collector & Latency Summary")
+        print("17. 🔎 Search Recipes & Guides")
+        print("18. 📊 Live Cluster Dashboard (CPU, Memory, Restarts)")
+        print("19. 📚 Extra Guides (your own content packs)")
         print("0. 🚪 Exit\n")
+        if self.profile:
+            print(f"{Colors.OKCYAN}Active profile: {self.profile}{Colors.ENDC}\n")
 
     def print_section_header(self, title: str, emoji: str = ""):
         """Print section header"""
+        self.section, self.current_recipe = title, None
         header = f"\n{Colors.OKCYAN}{Colors.BOLD}{emoji} {title}{Colors.ENDC}"
         print(header)
         print(Colors.OKCYAN + "─" * 70 + Colors.ENDC)
 
-    def run_command(self, cmd: List[str], description: str = "") -> Tuple[bool, str]:
-        """Execute command and return result"""
+    def run_command(self, cmd: List[str], description: str = "", profile: Optional[str] = None,
+                    timeout: int = 30, env: Optional[Dict[str, str]] = None) -> Tuple[bool, str]:
+        """Execute command and return result; env adds to (not replaces) this process's environment"""
+        cmd = with_profile(cmd, profile or self.profile)
         if description:
             logger.info(f"Running: {description}")
+        started = time.perf_counter()
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = self.backend.run(cmd, timeout=timeout, **({"env": dict(os.environ, **env)} if env else {}))
+            self._journal_command(cmd, result.returncode, started, len(result.stdout or "") + len(result.stderr or ""))
             if result.returncode == 0:
                 logger.info(f"✅ {description}")
                 return True, result.stdout
@@ -120,12 +5806,46 @@ class MinikubeTutorial:
                 logger.warning(f"❌ {description}: {result.stderr}")
                 return False, result.stderr
         except subprocess.TimeoutExpired:
+            self._journal_command(cmd, 124, started, 0)
             logger.error(f"⏱️  Command timeout: {description}")
             return False, "Command timeout"
         except Exception as e:
+            self._journal_command(cmd, 127, started, 0)
             logger.error(f"❌ Error executing command: {str(e)}")
             return False, str(e)
 
+    def _journal_command(self, cmd: List[str], exit_code: int, started: float, output_bytes: int):
+        """Append one command to the session journal (124 = timed out, 127 = could not run)"""
+        if self.journal:
+            command, args = SessionJournal.split_command(cmd)
+            self.journal.append(self.section, command, args, exit_code, time.perf_counter() - started,
+                                output_bytes, self.current_recipe)
+
+    def kube(self) -> Optional[KubeClient]:
+        """Pooled API client for the active context, or None to fall back to kubectl
+
+        Recorded, replayed and stubbed sessions always use kubectl, so every call lands in the session file.
+        """
+        if self.backend.mode != "live" or self.backend.session_file or os.environ.get("MINIKUBE_TUTORIAL_KUBECTL"):
+            return None
+        if self._kube is None:
+            try:
+                client = KubeClient.from_kubeconfig(context=self.profile,
+                                                    cache_file=self.tutorial_dir / "discovery.json")
+                # One quick reachability check so a stopped cluster falls back to kubectl right away
+                client.timeout, timeout = 3.0, client.timeout
+                client.request("GET", "/version")
+                client.timeout = timeout
+                if self.journal:
+                    client.on_request = lambda method, path, status, seconds, size: self.journal.append(
+                        self.section, f"api {method}", path, 0 if status < 400 else status, seconds, size,
+                        self.current_recipe)
+                self._kube = client
+            except (OSError, ValueError, ssl.SSLError, KeyError, KubeAPIError, http.client.HTTPException) as e:
+                logger.info(f"API client unavailable, using kubectl: {e}")
+                self._kube = False
+        return self._kube or None
+
     def section_introduction(self):
         """Interactive introduction section"""
         self.print_section_header("Introduction to Minikube", "📖")
@@ -201,38 +5921,7 @@ experience with:
             print(f"{Colors.WARNING}⚠️  Docker is not installed{Colors.ENDC}")
             print(f"\n{Colors.BOLD}Installation Instructions:{Colors.ENDC}\n")
 
-            if system == "Darwin":
-                docker_instructions = """
-{bold}macOS - Docker Desktop:{endc}
-1. Download from: https://www.docker.com/products/docker-desktop
-2. Double-click the .dmg file
-3. Drag Docker.app to Applications folder
-4. Launch Docker from Applications
-5. Allow privileged helper installation when prompted
-6. Verify: docker --version
-""".format(bold=Colors.BOLD, endc=Colors.ENDC)
-            elif system == "Linux":
-                docker_instructions = """
-{bold}Linux - Docker Installation:{endc}
-{code}
-curl -fsSL https://get.docker.com -o get-docker.sh
-sudo sh get-docker.sh
-sudo usermod -aG docker $USER
-newgrp docker
-{endc}
-6. Verify: docker --version
-""".format(bold=Colors.BOLD, code=Colors.OKGREEN, endc=Colors.ENDC)
-            else:
-                docker_instructions = """
-{bold}Windows - Docker Desktop:{endc}
-1. Download from: https://www.docker.com/products/docker-desktop
-2. Run the installer
-3. Enable WSL 2 backend when prompted
-4. Restart your computer
-5. Verify: docker --version
-""".format(bold=Colors.BOLD, endc=Colors.ENDC)
-
-            print(docker_instructions)
+            print(self._content_for_os("installation", "docker", system))
             install_docker = input(f"\n{Colors.BOLD}Have you installed Docker? (y/n): {Colors.ENDC}").lower()
 
             if install_docker == 'y':
@@ -254,62 +5943,11 @@ newgrp docker
 
         if success:
             print(f"{Colors.OKGREEN}✓ Minikube is already installed: {output.strip()}{Colors.ENDC}\n")
-        else:
-            print(f"{Colors.WARNING}⚠️  Minikube is not installed{Colors.ENDC}")
-            print(f"\n{Colors.BOLD}Installation Instructions:{Colors.ENDC}\n")
-
-            if system == "Darwin":
-                minikube_instructions = """
-{bold}macOS - Minikube Installation:{endc}
-
-{bold}Option 1: Using Homebrew (recommended):{endc}
-{code}
-brew install minikube
-{endc}
-
-{bold}Option 2: Direct download:{endc}
-{code}
-curl -LO https://github.com/kubernetes/minikube/releases/latest/download/minikube-darwin-amd64
-sudo install minikube-darwin-amd64 /usr/local/bin/minikube
-{endc}
-
-Verify: minikube version
-""".format(bold=Colors.BOLD, code=Colors.OKGREEN, endc=Colors.ENDC)
-            elif system == "Linux":
-                minikube_instructions = """
-{bold}Linux - Minikube Installation:{endc}
-
-{bold}For Intel/AMD x86_64:{endc}
-{code}
-curl -LO https://github.com/kubernetes/minikube/releases/latest/download/minikube-linux-amd64
-sudo install minikube-linux-amd64 /usr/local/bin/minikube
-{endc}
-
-{bold}For ARM64:{endc}
-{code}
-curl -LO https://github.com/kubernetes/minikube/releases/latest/download/minikube-linux-arm64
-sudo install minikube-linux-arm64 /usr/local/bin/minikube
-{endc}
-
-Verify: minikube version
-""".format(bold=Colors.BOLD, code=Colors.OKGREEN, endc=Colors.ENDC)
-            else:
-                minikube_instructions = """
-{bold}Windows - Minikube Installation:{endc}
-
-{bold}Option 1: Using Chocolatey:{endc}
-{code}
-choco install minikube
-{endc}
-
-{bold}Option 2: Direct download:{endc}
-Download from: https://github.com/kubernetes/minikube/releases
-Add to PATH
-
-Verify: minikube version
-""".format(bold=Colors.BOLD, code=Colors.OKGREEN, endc=Colors.ENDC)
+        else:
+            print(f"{Colors.WARNING}⚠️  Minikube is not installed{Colors.ENDC}")
+            print(f"\n{Colors.BOLD}Installation Instructions:{Colors.ENDC}\n")
 
-            print(minikube_instructions)
+            print(self._content_for_os("installation", "minikube", system))
             install_minikube = input(f"\n{Colors.BOLD}Have you installed Minikube? (y/n): {Colors.ENDC}").lower()
 
             if install_minikube == 'y':
@@ -335,58 +5973,7 @@ Verify: minikube version
             print(f"{Colors.WARNING}⚠️  kubectl is not installed{Colors.ENDC}")
             print(f"\n{Colors.BOLD}Installation Instructions:{Colors.ENDC}\n")
 
-            if system == "Darwin":
-                kubectl_instructions = """
-{bold}macOS - kubectl Installation:{endc}
-
-{bold}Option 1: Using Homebrew (recommended):{endc}
-{code}
-brew install kubectl
-{endc}
-
-{bold}Option 2: Direct download:{endc}
-{code}
-curl -LO "https://dl.k8s.io/release/$(curl -L -s https://dl.k8s.io/release/stable.txt)/bin/darwin/amd64/kubectl"
-sudo install -o root -g root -m 0755 kubectl /usr/local/bin/kubectl
-{endc}
-
-Verify: kubectl version --client
-""".format(bold=Colors.BOLD, code=Colors.OKGREEN, endc=Colors.ENDC)
-            elif system == "Linux":
-                kubectl_instructions = """
-{bold}Linux - kubectl Installation:{endc}
-
-{bold}For Intel/AMD x86_64:{endc}
-{code}
-curl -LO "https://dl.k8s.io/release/$(curl -L -s https://dl.k8s.io/release/stable.txt)/bin/linux/amd64/kubectl"
-sudo install -o root -g root -m 0755 kubectl /usr/local/bin/kubectl
-{endc}
-
-{bold}For ARM64:{endc}
-{code}
-curl -LO "https://dl.k8s.io/release/$(curl -L -s https://dl.k8s.io/release/stable.txt)/bin/linux/arm64/kubectl"
-sudo install -o root -g root -m 0755 kubectl /usr/local/bin/kubectl
-{endc}
-
-Verify: kubectl version --client
-""".format(bold=Colors.BOLD, code=Colors.OKGREEN, endc=Colors.ENDC)
-            else:
-                kubectl_instructions = """
-{bold}Windows - kubectl Installation:{endc}
-
-{bold}Option 1: Using Chocolatey:{endc}
-{code}
-choco install kubernetes-cli
-{endc}
-
-{bold}Option 2: Download from:{endc}
-https://kubernetes.io/docs/tasks/tools/
-
-Add to PATH
-Verify: kubectl version --client
-""".format(bold=Colors.BOLD, code=Colors.OKGREEN, endc=Colors.ENDC)
-
-            print(kubectl_instructions)
+            print(self._content_for_os("installation", "kubectl", system))
             install_kubectl = input(f"\n{Colors.BOLD}Have you installed kubectl? (y/n): {Colors.ENDC}").lower()
 
             if install_kubectl == 'y':
@@ -418,9 +6005,10 @@ Verify: kubectl version --client
                 if system == "Linux":
                     driver_choice = input(f"\n{Colors.BOLD}Which driver to use? (1=docker, 2=kvm2): {Colors.ENDC}").strip()
                     driver = "kvm2" if driver_choice == "2" else "docker"
-                    print(f"\nStarting with {driver} driver...\n")
-                    self.run_command(["minikube", "start", f"--driver={driver}", "--cpus=4", "--memory=8192"],
-                                   "Starting Minikube with KVM2")
+                    advice = StartAdvisor().advise([], driver=driver)
+                    print(f"\nStarting with {driver} driver ({advice['cpus']} CPUs, {advice['memory_mb']}MB)...\n")
+                    self.run_command(["minikube", "start"] + advice["flags"], f"Starting Minikube with {driver}",
+                                     timeout=600)
                 else:
                     print(f"\nStarting with docker driver...\n")
                     self.run_command(["minikube", "start", "--driver=docker"], "Starting Minikube")
@@ -433,22 +6021,7 @@ Verify: kubectl version --client
                     print(f"\n{Colors.FAIL}❌ Failed to start Minikube. Check your system configuration.{Colors.ENDC}\n")
 
         # Final summary
-        print(f"""
-{Colors.OKGREEN}{Colors.BOLD}✓ Installation Complete!{Colors.ENDC}
-
-{Colors.BOLD}Next Steps:{Colors.ENDC}
-1. Verify everything is working: minikube status
-2. Deploy an app: kubectl create deployment hello --image=nginx
-3. Access dashboard: minikube dashboard
-4. Or continue with the tutorial!
-
-{Colors.BOLD}Useful Commands:{Colors.ENDC}
-  minikube start         # Start cluster
-  minikube stop          # Stop cluster
-  minikube delete        # Delete cluster
-  kubectl get pods       # List pods
-  minikube dashboard     # Open dashboard
-""")
+        print(self.content_pack().render("installation", "summary"))
 
         self.config["completed_sections"].append("installation")
         self._save_config()
@@ -490,89 +6063,7 @@ Verify: kubectl version --client
         print(f"{Colors.WARNING}⚠️  Minikube is not installed{Colors.ENDC}\n")
         print(f"{Colors.BOLD}Installation Instructions:{Colors.ENDC}\n")
 
-        if system == "macOS":
-            instructions = f"""
-{Colors.BOLD}macOS - Install via Homebrew (Recommended):{Colors.ENDC}
-
-{Colors.OKGREEN}
-# Install Minikube
-brew install minikube
-
-# Install kubectl (if not already installed)
-brew install kubectl
-
-# Verify installation
-minikube version
-kubectl version --client
-{Colors.ENDC}
-
-{Colors.BOLD}Or download manually:{Colors.ENDC}
-  1. Visit: https://minikube.sigs.k8s.io/docs/start/
-  2. Download the macOS binary
-  3. Move to /usr/local/bin: sudo mv minikube /usr/local/bin/
-  4. Verify: minikube version
-"""
-        elif system == "Linux":
-            instructions = f"""
-{Colors.BOLD}Linux - Install via Package Manager:{Colors.ENDC}
-
-{Colors.BOLD}Option 1: Using curl (Universal):{Colors.ENDC}
-{Colors.OKGREEN}
-# Download latest release
-curl -LO https://github.com/kubernetes/minikube/releases/latest/download/minikube-linux-amd64
-sudo install minikube-linux-amd64 /usr/local/bin/minikube
-
-# Install kubectl
-curl -LO "https://dl.k8s.io/release/$(curl -L -s https://dl.k8s.io/release/stable.txt)/bin/linux/amd64/kubectl"
-sudo install -o root -g root -m 0755 kubectl /usr/local/bin/kubectl
-
-# Verify
-minikube version
-kubectl version --client
-{Colors.ENDC}
-
-{Colors.BOLD}Option 2: Using apt (Ubuntu/Debian):{Colors.ENDC}
-{Colors.OKGREEN}
-sudo apt-get update
-sudo apt-get install -y curl
-curl -LO https://github.com/kubernetes/minikube/releases/latest/download/minikube-linux-amd64
-sudo install minikube-linux-amd64 /usr/local/bin/minikube
-{Colors.ENDC}
-
-{Colors.BOLD}Choose driver (for Linux):{Colors.ENDC}
-  • {Colors.OKGREEN}Docker (Recommended if Docker installed):{Colors.ENDC} minikube start --driver=docker
-  • {Colors.OKGREEN}KVM2 (Faster, requires libvirt):{Colors.ENDC} minikube start --driver=kvm2
-  • {Colors.OKGREEN}QEMU (No special setup needed):{Colors.ENDC} minikube start --driver=qemu
-"""
-        else:  # Windows
-            instructions = f"""
-{Colors.BOLD}Windows - Install Minikube:{Colors.ENDC}
-
-{Colors.BOLD}Option 1: Using Chocolatey (Recommended):{Colors.ENDC}
-{Colors.OKGREEN}
-choco install minikube kubectl
-{Colors.ENDC}
-
-{Colors.BOLD}Option 2: Using Windows Package Manager:{Colors.ENDC}
-{Colors.OKGREEN}
-winget install Kubernetes.minikube
-winget install Kubernetes.kubectl
-{Colors.ENDC}
-
-{Colors.BOLD}Option 3: Download Manually:{Colors.ENDC}
-  1. Visit: https://minikube.sigs.k8s.io/docs/start/
-  2. Download Windows installer
-  3. Run the installer
-  4. Add to PATH if not automatic
-  5. Verify: minikube version
-
-{Colors.BOLD}Requirements:{Colors.ENDC}
-  • Docker Desktop for Windows OR
-  • Hyper-V (built into Windows Pro/Enterprise)
-  • WSL 2 (recommended)
-"""
-
-        print(instructions)
+        print(self._content_for_os("minikube_install", "instructions", system))
 
         # Ask if user has installed Minikube
         install = input(f"\n{Colors.BOLD}Have you installed Minikube? (y/n): {Colors.ENDC}").lower()
@@ -594,7 +6085,7 @@ winget install Kubernetes.kubectl
 
                 if system == "Linux":
                     print(f"2. {Colors.OKGREEN}Or start with KVM2 driver (faster):{Colors.ENDC}")
-                    print(f"   {Colors.OKCYAN}minikube start --driver=kvm2 --cpus=4 --memory=8192{Colors.ENDC}\n")
+                    print(f"   {Colors.OKCYAN}{StartAdvisor().advise([], driver='kvm2')['command']}{Colors.ENDC}\n")
 
                 print(f"3. {Colors.OKGREEN}Check Minikube status:{Colors.ENDC}")
                 print(f"   {Colors.OKCYAN}minikube status{Colors.ENDC}\n")
@@ -645,49 +6136,9 @@ winget install Kubernetes.kubectl
             input(f"{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
             return
 
-        print(f"""
-{Colors.BOLD}Why KVM?{Colors.ENDC}
-KVM (Kernel Virtual Machine) is faster and more efficient than Docker as a Minikube driver.
-
-{Colors.BOLD}Installation Steps:{Colors.ENDC}
-
-1️⃣  Check if KVM is supported:
-{Colors.OKGREEN}
-grep -cw vmx /proc/cpuinfo    # For Intel
-grep -cw svm /proc/cpuinfo    # For AMD
-{Colors.ENDC}
-(Output should be > 0)
-
-2️⃣  Install KVM packages:
-{Colors.OKGREEN}
-sudo apt-get update
-sudo apt-get install -y qemu-kvm libvirt-daemon-system libvirt-clients
-sudo apt-get install -y virt-manager docker.io
-{Colors.ENDC}
-
-3️⃣  Add your user to libvirt group:
-{Colors.OKGREEN}
-sudo usermod -a -G libvirt $USER
-newgrp libvirt
-{Colors.ENDC}
-
-4️⃣  Install Minikube with KVM:
-{Colors.OKGREEN}
-curl -LO https://github.com/kubernetes/minikube/releases/latest/download/minikube-linux-amd64
-sudo install minikube-linux-amd64 /usr/local/bin/minikube
-{Colors.ENDC}
-
-5️⃣  Start Minikube with KVM driver:
-{Colors.OKGREEN}
-minikube start --driver=kvm2 --cpus=4 --memory=8192
-{Colors.ENDC}
-
-6️⃣  Verify KVM is working:
-{Colors.OKGREEN}
-minikube config view
-virsh list
-{Colors.ENDC}
-""")
+        advice = StartAdvisor().advise([], driver="kvm2")
+
+        print(self.content_pack().render("kvm_setup", "main", start_command=advice['command']))
 
         self.config["completed_sections"].append("kvm_setup")
         self._save_config()
@@ -777,102 +6228,7 @@ kubectl delete deployment {app_name}
         """Setup logging"""
         self.print_section_header("Setup Logging", "📊")
 
-        print(f"""
-{Colors.BOLD}Kubernetes Logging Strategies:{Colors.ENDC}
-
-{Colors.BOLD}1. Basic Pod Logs (Built-in):{Colors.ENDC}
-{Colors.OKGREEN}
-# View logs from a pod
-kubectl logs <pod-name>
-
-# View logs from a deployment
-kubectl logs deployment/<deployment-name>
-
-# Stream logs (like tail -f)
-kubectl logs -f pod/<pod-name>
-
-# View logs from previous container (if crashed)
-kubectl logs <pod-name> --previous
-
-# Show timestamps
-kubectl logs <pod-name> --timestamps=true
-{Colors.ENDC}
-
-{Colors.BOLD}2. Structured Logging with ELK Stack:{Colors.ENDC}
-
-Create a sample logging deployment:
-{Colors.OKGREEN}
-cat > logging-deployment.yaml << 'EOF'
-apiVersion: apps/v1
-kind: Deployment
-metadata:
-  name: logging-app
-spec:
-  replicas: 2
-  selector:
-    matchLabels:
-      app: logging-app
-  template:
-    metadata:
-      labels:
-        app: logging-app
-    spec:
-      containers:
-      - name: app
-        image: python:3.9
-        command: ["python", "-c"]
-        args:
-        - |
-          import json
-          import time
-          from datetime import datetime
-
-          while True:
-            log_entry = {{
-              "timestamp": datetime.utcnow().isoformat(),
-              "level": "INFO",
-              "message": "Application running",
-              "component": "app"
-            }}
-            print(json.dumps(log_entry))
-            time.sleep(2)
-EOF
-
-kubectl apply -f logging-deployment.yaml
-{Colors.ENDC}
-
-{Colors.BOLD}3. View Logs in JSON Format:{Colors.ENDC}
-{Colors.OKGREEN}
-kubectl logs deployment/logging-app -f | jq '.'
-{Colors.ENDC}
-
-{Colors.BOLD}4. Multi-container Pod Logging:{Colors.ENDC}
-{Colors.OKGREEN}
-# If pod has multiple containers
-kubectl logs <pod-name> -c <container-name>
-
-# Get logs from all containers
-kubectl logs <pod-name> --all-containers=true
-{Colors.ENDC}
-
-{Colors.BOLD}5. Event Logging:{Colors.ENDC}
-{Colors.OKGREEN}
-# View cluster events
-kubectl get events --sort-by=.metadata.creationTimestamp
-
-# Watch events in real-time
-kubectl get events -w
-{Colors.ENDC}
-
-{Colors.BOLD}6. Persistent Logging Setup (Manual):{Colors.ENDC}
-{Colors.OKGREEN}
-# Create a ConfigMap with logging configuration
-kubectl create configmap app-logs --from-literal=log_level=INFO --dry-run=client -o yaml | kubectl apply -f -
-
-# Mount logs to persistent volume
-# (See deployment configuration in next section)
-{Colors.ENDC}
-""")
+        print(self.content_pack().render("logging", "main"))
 
         self.config["completed_sections"].append("logging")
         self._save_config()
@@ -883,105 +6239,7 @@ kubectl create configmap app-logs --from-literal=log_level=INFO --dry-run=client
         """Setup distributed tracing"""
         self.print_section_header("Setup Distributed Tracing", "🔍")
 
-        print(f"""
-{Colors.BOLD}What is Distributed Tracing?{Colors.ENDC}
-Distributed tracing helps you track requests across multiple services in your application.
-
-{Colors.BOLD}Popular Solutions:{Colors.ENDC}
-  • Jaeger (OpenTelemetry)
-  • Zipkin
-  • DataDog
-  • New Relic
-
-{Colors.BOLD}1. Install Jaeger in Minikube:{Colors.ENDC}
-{Colors.OKGREEN}
-kubectl create namespace observability
-kubectl create -f https://github.com/jaegertracing/jaeger-kubernetes/raw/master/jaeger-all-in-one-template.yml -n observability
-{Colors.ENDC}
-
-{Colors.BOLD}2. Access Jaeger UI:{Colors.ENDC}
-{Colors.OKGREEN}
-# Port forward to local machine
-kubectl port-forward -n observability svc/jaeger-query 16686:16686
-
-# Visit: http://localhost:16686
-{Colors.ENDC}
-
-{Colors.BOLD}3. Sample App with OpenTelemetry (Python):{Colors.ENDC}
-{Colors.OKGREEN}
-cat > traced-app.yaml << 'EOF'
-apiVersion: v1
-kind: Service
-metadata:
-  name: traced-app
-spec:
-  selector:
-    app: traced-app
-  ports:
-  - port: 8000
-    targetPort: 8000
----
-apiVersion: apps/v1
-kind: Deployment
-metadata:
-  name: traced-app
-spec:
-  replicas: 1
-  selector:
-    matchLabels:
-      app: traced-app
-  template:
-    metadata:
-      labels:
-        app: traced-app
-    spec:
-      containers:
-      - name: app
-        image: python:3.9
-        env:
-        - name: OTEL_EXPORTER_OTLP_ENDPOINT
-          value: "http://jaeger-collector:4317"
-        - name: OTEL_SERVICE_NAME
-          value: "traced-app"
-        command: ["python", "-c"]
-        args:
-        - |
-          from opentelemetry import trace
-          from opentelemetry.exporter.jaeger.thrift import JaegerExporter
-          from opentelemetry.sdk.trace import TracerProvider
-          from opentelemetry.sdk.trace.export import BatchSpanProcessor
-          import time
-
-          jaeger_exporter = JaegerExporter(
-              agent_host_name="jaeger-agent",
-              agent_port=6831,
-          )
-
-          trace.set_tracer_provider(TracerProvider())
-          trace.get_tracer_provider().add_span_processor(
-              BatchSpanProcessor(jaeger_exporter)
-          )
-
-          tracer = trace.get_tracer(__name__)
-
-          while True:
-              with tracer.start_as_current_span("work"):
-                  print("Doing work...")
-                  time.sleep(1)
-EOF
-
-kubectl apply -f traced-app.yaml
-{Colors.ENDC}
-
-{Colors.BOLD}4. View Traces in Jaeger:{Colors.ENDC}
-Open http://localhost:16686 and search for "traced-app" service
-
-{Colors.BOLD}5. Manual Tracing with Logs:{Colors.ENDC}
-{Colors.OKGREEN}
-# Each request gets a trace ID
-kubectl logs -l app=traced-app | grep "trace_id"
-{Colors.ENDC}
-""")
+        print(self.content_pack().render("tracing", "main"))
 
         self.config["completed_sections"].append("tracing")
         self._save_config()
@@ -992,38 +6250,21 @@ kubectl logs -l app=traced-app | grep "trace_id"
         """Verify installation"""
         self.print_section_header("Verify Installation", "✅")
 
-        checks = {
-            "Docker": (["docker", "--version"], "Docker"),
-            "Minikube": (["minikube", "version"], "Minikube"),
-            "kubectl": (["kubectl", "version", "--client"], "kubectl"),
-        }
-
         print(f"\n{Colors.BOLD}Running system checks...{Colors.ENDC}\n")
 
-        all_ok = True
-        for name, (cmd, display_name) in checks.items():
-            success, output = self.run_command(cmd, f"Checking {display_name}")
-            if success:
-                print(f"{Colors.OKGREEN}✅ {display_name}{Colors.ENDC}")
-                if output:
-                    print(f"   {output.strip().split(chr(10))[0]}\n")
-            else:
-                print(f"{Colors.FAIL}❌ {display_name} not found{Colors.ENDC}\n")
-                all_ok = False
-
-        # Check Minikube status
-        print(f"\n{Colors.BOLD}Minikube Status:{Colors.ENDC}\n")
-        success, output = self.run_command(["minikube", "status"], "Checking Minikube status")
-        if success:
-            print(f"{Colors.OKGREEN}{output}{Colors.ENDC}")
-        else:
-            print(f"{Colors.WARNING}Minikube is not running. Start it with: minikube start{Colors.ENDC}\n")
+        report = SystemCheck(profile=self.profile, backend=self.backend).run()
+        SystemCheck.print_report(report)
 
         # Check cluster info
-        print(f"\n{Colors.BOLD}Kubernetes Cluster Info:{Colors.ENDC}\n")
-        self.run_command(["kubectl", "cluster-info"], "Getting cluster info")
+        if report.get("minikube_status") == "Running":
+            print(f"\n{Colors.BOLD}Kubernetes Cluster Info:{Colors.ENDC}\n")
+            success, output = self.run_command(["kubectl", "cluster-info"], "Getting cluster info")
+            if success:
+                print(output)
+        elif report["tools"]["minikube"]["path"]:
+            print(f"{Colors.WARNING}Minikube is not running. Start it with: minikube start{Colors.ENDC}\n")
 
-        if all_ok:
+        if report["ok"]:
             print(f"\n{Colors.OKGREEN}{Colors.BOLD}✓ All systems ready!{Colors.ENDC}\n")
         else:
             print(f"\n{Colors.WARNING}⚠️  Please install missing components. See Installation Guide.{Colors.ENDC}\n")
@@ -1046,9 +6287,17 @@ kubectl logs -l app=traced-app | grep "trace_id"
         for i, log_file in enumerate(log_files[:10], 1):
             print(f"{i}. {log_file.name}")
 
-        choice = input(f"\n{Colors.BOLD}View log file (1-{min(10, len(log_files))}) or 'q' to quit: {Colors.ENDC}")
-
-        if choice.lower() != 'q' and choice.isdigit():
+        choice = input(f"\n{Colors.BOLD}View log file (1-{min(10, len(log_files))}), 'j' for command history "
+                       f"or 'q' to quit: {Colors.ENDC}")
+
+        if choice.lower() == 'j' and self.journal:
+            rows = self.journal.query(sort="recent", limit=25)
+            print(f"\n{Colors.OKGREEN}=== Last {len(rows)} commands ==={Colors.ENDC}\n")
+            SessionJournal.print_rows(rows)
+            slowest = self.journal.query(since=time.time() - 7 * 86400, sort="duration", limit=5)
+            print(f"\n{Colors.OKGREEN}=== Slowest this week ==={Colors.ENDC}\n")
+            SessionJournal.print_rows(slowest)
+        elif choice.lower() != 'q' and choice.isdigit():
             idx = int(choice) - 1
             if 0 <= idx < len(log_files):
                 with open(log_files[idx]) as f:
@@ -1099,6 +6348,26 @@ kubectl logs -l app=traced-app | grep "trace_id"
         print(info)
         input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
 
+    def content_pack(self) -> ContentPack:
+        """Bundled section text plus user packs from ~/.minikube_tutorial/content (only indexes are read here)"""
+        if getattr(self, "_content", None) is None:
+            user_dir = self.tutorial_dir / "content"
+            paths = [ContentPack.ensure_built(self.CONTENT_DIR, self.CONTENT_DIR / "sections.pack",
+                                              self.tutorial_dir / "sections.pack")]
+            if user_dir.is_dir():
+                paths += sorted(p for p in user_dir.glob("*.pack") if p.name != "user.pack")
+                paths.append(ContentPack.ensure_built(user_dir, user_dir / "user.pack"))
+            if not paths[0]:
+                logger.error(f"No section content found in {self.CONTENT_DIR}")
+            self._content = ContentPack([p for p in paths if p])
+        return self._content
+
+    def _content_for_os(self, section: str, topic: Optional[str], system: str) -> str:
+        """The block for this OS ('docker.Linux'), falling back to the Windows text like the old else-branches"""
+        pack = self.content_pack()
+        prefix = f"{topic}." if topic else ""
+        return pack.render(section, f"{prefix}{system}" if pack.has(section, f"{prefix}{system}") else f"{prefix}Windows")
+
     def _detect_os(self) -> str:
         """Detect operating system"""
         if sys.platform == "darwin":
@@ -1168,125 +6437,106 @@ spec:
           periodSeconds: 5
 """
 
+    def addon_manager(self, max_workers: int = 3, timeout: float = 300) -> AddonManager:
+        return AddonManager(self.run_command, self.tutorial_dir / "addons_cache.json", poll=self._poll_command,
+                            client=self.kube(), profile=self.profile, max_workers=max_workers, timeout=timeout)
+
     def section_addons(self):
         """Manage Minikube add-ons"""
         self.print_section_header("Minikube Add-ons Management", "🎛️")
 
-        addons_info = f"""
-{Colors.BOLD}Available Add-ons:{Colors.ENDC}
-  1. 🖥️  Dashboard - Web UI for cluster management
-  2. 🔗 Tunnel (MetalLB) - LoadBalancer service support
-  3. 📦 Registry - Local Docker image registry
-  4. 📈 Metrics Server - Resource monitoring
-  5. 🔌 Ingress Controller - HTTP/HTTPS routing
-
-{Colors.BOLD}Quick Start:{Colors.ENDC}
-  Run: ./scripts/minikube-addons.sh
-  Or:  ./scripts/minikube-addons.sh auto (for full setup)
-
-{Colors.BOLD}What Each Add-on Does:{Colors.ENDC}
-
-{Colors.OKCYAN}Dashboard:{Colors.ENDC}
-  • Web-based cluster visualization
-  • Pod and deployment management
-  • Real-time cluster insights
-  • Access: minikube dashboard
-
-{Colors.OKCYAN}Tunnel (MetalLB):{Colors.ENDC}
-  • LoadBalancer service support
-  • External IP assignment
-  • Service discovery
-  • Access: minikube tunnel (separate terminal)
-
-{Colors.OKCYAN}Registry:{Colors.ENDC}
-  • Local Docker image registry
-  • No Docker Hub push needed
-  • Fast image distribution
-  • Available at: localhost:5000
-
-{Colors.OKCYAN}Metrics Server:{Colors.ENDC}
-  • CPU/Memory monitoring
-  • kubectl top commands
-  • HPA (Horizontal Pod Autoscaler) support
-  • Commands: kubectl top nodes/pods
-
-{Colors.BOLD}Documentation:{Colors.ENDC}
-  Read detailed guide: ADDONS_GUIDE.md
-"""
-        print(addons_info)
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        print(self.content_pack().render("addons", "main"))
+        manager = self.addon_manager()
+        while True:
+            state = manager.status()
+            if state:
+                print(f"\n{Colors.BOLD}Add-ons on {manager.profile}:{Colors.ENDC}")
+                AddonManager.print_status(state, AddonManager.STANDARD)
+            choice = input(f"\n{Colors.BOLD}[E]nable the standard set, [S]elect add-ons to enable, [D]isable, "
+                           f"[R]efresh, Enter to return: {Colors.ENDC}").strip().lower()
+            if choice == 'r':
+                manager.status(refresh=True)
+                continue
+            if choice not in ('e', 's', 'd'):
+                break
+            if choice == 'e':
+                names = list(AddonManager.STANDARD)
+            else:
+                names = [n.strip() for n in input(f"{Colors.BOLD}Add-on names (comma-separated): "
+                                                  f"{Colors.ENDC}").split(",") if n.strip()]
+            if not names:
+                continue
+            print(f"{Colors.OKCYAN}Working on {', '.join(names)} ({manager.max_workers} at a time)...{Colors.ENDC}")
+            try:
+                AddonManager.print_report(manager.apply(names, enable=choice != 'd'))
+            except ValueError as e:
+                print(f"{Colors.FAIL}{e}{Colors.ENDC}")
+            except KeyboardInterrupt:
+                print(f"\n{Colors.WARNING}Stopped waiting; the add-ons keep starting in the cluster{Colors.ENDC}")
 
     def section_helm_packages(self):
         """Install Helm packages"""
         self.print_section_header("Helm Packages Installation", "📦")
 
-        helm_info = f"""
-{Colors.BOLD}20 Production-Ready Packages Available:{Colors.ENDC}
-
-{Colors.OKCYAN}Monitoring Stack (3 packages):{Colors.ENDC}
-  • Prometheus - Metrics collection and storage
-  • Grafana - Visualization and dashboards
-  • Thanos - Long-term metrics storage
-
-{Colors.OKCYAN}Logging Stack (3 packages):{Colors.ENDC}
-  • Loki - Log aggregation
-  • Elasticsearch - Log storage and analysis
-  • Kibana - Log visualization
-
-{Colors.OKCYAN}Tracing Stack (2 packages):{Colors.ENDC}
-  • Jaeger - Distributed tracing
-  • OpenTelemetry Collector - Unified telemetry
-
-{Colors.OKCYAN}Databases (6 packages):{Colors.ENDC}
-  • PostgreSQL - Relational database
-  • MongoDB - NoSQL document database
-  • Redis - In-memory cache
-  • RabbitMQ - Message broker
-  • Kafka - Event streaming
-  • MinIO - Object storage
-
-{Colors.OKCYAN}Infrastructure Tools (6 packages):{Colors.ENDC}
-  • Nginx Ingress - HTTP/HTTPS routing
-  • Cert-Manager - SSL certificate management
-  • Sealed Secrets - Secret encryption
-  • ArgoCD - GitOps deployment
-  • Vault - Secret management
-
-{Colors.BOLD}Quick Start:{Colors.ENDC}
-  Install all: ./scripts/helm-packages.sh auto
-  Interactive: ./scripts/helm-packages.sh
-
-{Colors.BOLD}Installation Times:{Colors.ENDC}
-  • Single package: ~5 minutes
-  • Full stack: ~15 minutes
-  • All 20 packages: ~30 minutes
-
-{Colors.BOLD}Namespaces Created:{Colors.ENDC}
-  • monitoring - Prometheus, Grafana, Thanos
-  • logging - Loki, Elasticsearch, Kibana
-  • tracing - Jaeger, OpenTelemetry
-  • databases - All database packages
-  • management - ArgoCD, infrastructure tools
-  • security - Vault, Sealed Secrets
-
-{Colors.BOLD}Documentation:{Colors.ENDC}
-  Read detailed guide: HELM_PACKAGES_GUIDE.md
-"""
-        print(helm_info)
+        print(self.content_pack().render("helm_packages", "main"))
         input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
 
+    def section_extra_guides(self):
+        """Sections added through content packs in ~/.minikube_tutorial/content"""
+        self.print_section_header("Extra Guides", "📚")
+        pack = self.content_pack()
+        builtin = pack.paths[0] if pack.paths else None
+        extra = sorted((name for name, entry in pack.sections.items() if entry["path"] != builtin),
+                       key=lambda name: pack.sections[name]["title"])
+        if not extra:
+            print(f"""
+{Colors.WARNING}No extra guides installed.{Colors.ENDC}
+
+Add a text file to {self.tutorial_dir / 'content'}, e.g. {Colors.OKCYAN}oncall.txt{Colors.ENDC}:
+
+  title: On-call Runbook
+  emoji: 📟
+
+  === main ===
+  {{bold}}Restart the ingress controller:{{endc}}
+  {{code}}kubectl -n ingress-nginx rollout restart deploy/ingress-nginx-controller{{endc}}
+
+It is compiled into a pack the next time the tutorial starts. Packs built with
+'python3 minikube_tutorial.py content build --source DIR --output FILE.pack' can be dropped there too.
+""")
+            input(f"{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            return
+        for i, name in enumerate(extra, 1):
+            entry = pack.sections[name]
+            print(f"  {i}. {entry['emoji']} {entry['title']}")
+        choice = input(f"\n{Colors.BOLD}Open guide (1-{len(extra)}) or Enter to go back: {Colors.ENDC}").strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(extra):
+            name = extra[int(choice) - 1]
+            self.print_section_header(pack.sections[name]["title"], pack.sections[name]["emoji"])
+            print(pack.render_section(name))
+            input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+
+    def _catalog(self) -> RecipeCatalog:
+        """Recipe catalog rooted at the working directory (recipes.json + recipes.d/)"""
+        if self._recipe_catalog is None or self._recipe_catalog.base_dir != Path.cwd():
+            self._recipe_catalog = RecipeCatalog(Path.cwd(), self.tutorial_dir / "recipe_catalog.json")
+        return self._recipe_catalog
+
     def _load_recipes(self) -> List[Dict]:
-        """Load recipes from recipes.json"""
-        recipes_file = Path.cwd() / "recipes.json"
-        if recipes_file.exists():
-            with open(recipes_file) as f:
-                data = json.load(f)
-                return data.get("recipes", [])
-        return []
+        """Load every recipe from recipes.json and recipes.d/ shards"""
+        return list(self._catalog())
+
+    def _find_recipe(self, recipe_id) -> Optional[Dict]:
+        """Look up one recipe by id, loading only its shard"""
+        try:
+            return self._catalog().get(int(recipe_id))
+        except (TypeError, ValueError):
+            return None
 
     def _deploy_recipe(self, recipe: Dict) -> bool:
         """Deploy a selected recipe"""
         recipe_id = recipe['id']
+        self.current_recipe = str(recipe_id)
         recipe_name = recipe['name']
         yaml_path = recipe['yaml']
 
@@ -1327,9 +6577,17 @@ spec:
             print(f"{Colors.WARNING}Deployment cancelled.{Colors.ENDC}")
             return False
 
-        # Deploy using kubectl
-        print(f"\n{Colors.BOLD}Deploying {recipe_name}...{Colors.ENDC}")
-        success, output = self.run_command(["kubectl", "apply", "-f", yaml_path], f"Deploying {recipe_name}")
+        # Multi-tier stacks go level by level so apps never start before their database; labels let
+        # bulk teardown find everything the tutorial deployed
+        plan = self.deploy_plan(recipe)
+        if TieredDeploy.tiered(plan):
+            print(f"\n{Colors.BOLD}Deploying {recipe_name} in dependency order...{Colors.ENDC}\n")
+            TieredDeploy.print_plan(plan)
+        else:
+            print(f"\n{Colors.BOLD}Deploying {recipe_name}...{Colors.ENDC}")
+        success, output, report = TieredDeploy(self.run_command, client=self.kube()).deploy_recipe(recipe, plan)
+        if report:
+            TieredDeploy.print_report(report)
 
         if success:
             print(f"\n{Colors.OKGREEN}✓ {recipe_name} deployed successfully!{Colors.ENDC}\n")
@@ -1357,8 +6615,13 @@ spec:
         else:
             print(f"{Colors.FAIL}✗ Failed to deploy {recipe_name}{Colors.ENDC}")
             print(f"{Colors.FAIL}Error: {output}{Colors.ENDC}")
+            self._print_recipe_warnings(recipe)
             return False
 
+    def deploy_plan(self, recipe: Dict) -> List[Dict]:
+        """Dependency levels for a recipe's manifest (empty when it cannot be parsed)"""
+        return TieredDeploy.recipe_plan(recipe)
+
     def _open_url(self, url_or_file: str):
         """Open URL or file in browser"""
         if url_or_file.startswith('http'):
@@ -1372,7 +6635,7 @@ spec:
 
             if cmd:
                 try:
-                    subprocess.Popen(cmd)
+                    self.backend.popen(cmd, stdout=None, stderr=None)
                 except Exception as e:
                     print(f"{Colors.WARNING}Could not open browser: {e}{Colors.ENDC}")
                     print(f"{Colors.WARNING}Please visit: {url_or_file}{Colors.ENDC}")
@@ -1380,42 +6643,574 @@ spec:
             # It's a local file
             if Path(url_or_file).exists():
                 if sys.platform == 'darwin':
-                    subprocess.Popen(['open', str(Path(url_or_file).absolute())])
+                    self.backend.popen(['open', str(Path(url_or_file).absolute())], stdout=None, stderr=None)
                 elif sys.platform == 'linux':
-                    subprocess.Popen(['xdg-open', str(Path(url_or_file).absolute())])
+                    self.backend.popen(['xdg-open', str(Path(url_or_file).absolute())], stdout=None, stderr=None)
                 elif sys.platform == 'win32':
-                    subprocess.Popen(['start', str(Path(url_or_file).absolute())])
+                    self.backend.popen(['start', str(Path(url_or_file).absolute())], stdout=None, stderr=None)
+
+    def _recipe_log_targets(self, recipe: Dict) -> List[Tuple[Optional[str], str]]:
+        """(namespace, label selector) pairs covering every workload in a recipe"""
+        targets = []
+        success, output = self.run_command(["kubectl", "get", "-f", recipe['yaml'], "-o", "json"],
+                                           f"Resolving workloads of {recipe['name']}")
+        if success:
+            data = json.loads(output)
+            for item in data.get("items", [data]):
+                meta = item.get("metadata") or {}
+                if item.get("kind") == "Pod":
+                    labels = meta.get("labels") or {}
+                else:
+                    labels = ((item.get("spec") or {}).get("selector") or {}).get("matchLabels") or {}
+                if labels and item.get("kind") in ("Deployment", "StatefulSet", "DaemonSet", "Job", "Pod"):
+                    selector = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+                    if (meta.get("namespace"), selector) not in targets:
+                        targets.append((meta.get("namespace"), selector))
+        if not targets:
+            check = (recipe.get('commands') or {}).get('check', '').split()
+            if "-l" in check and check.index("-l") + 1 < len(check):
+                targets.append((None, check[check.index("-l") + 1]))
+        return targets
+
+    def teardown(self, recipes: List[Dict], everything: bool = False, timeout: int = 180,
+                 purge_volumes: bool = False) -> Dict:
+        """Tear recipes down in one batched delete and report what blocks cleanup"""
+        self.current_recipe = ",".join(str(r['id']) for r in recipes) or None
+        return BulkTeardown(self.run_command, timeout=timeout).run(recipes, everything, purge_volumes)
+
+    def _poll_command(self, cmd: List[str]) -> Tuple[bool, str]:
+        """run_command without per-call logging, for screens that poll every few seconds"""
+        try:
+            result = self.backend.run(with_profile(cmd, self.profile), timeout=15)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            return False, str(e)
+        return result.returncode == 0, result.stdout if result.returncode == 0 else result.stderr
+
+    def dashboard_data(self, namespace: Optional[str] = None) -> Dict:
+        """Pods, per-pod/per-container usage and node usage for the dashboard (API client, else kubectl)"""
+        pods, nodes, container_metrics, node_metrics = [], [], {}, {}
+        client = self.kube()
+        if client:
+            def metrics(kind: str) -> List[Dict]:
+                try:
+                    path = f"/apis/metrics.k8s.io/v1beta1" + (f"/namespaces/{namespace}" if namespace and
+                                                              kind == "pods" else "") + f"/{kind}"
+                    return client.request("GET", path).get("items", [])
+                except KubeAPIError:
+                    return []
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [pool.submit(client.list, "pods", namespace), pool.submit(client.list, "nodes"),
+                           pool.submit(metrics, "pods"), pool.submit(metrics, "nodes")]
+                try:
+                    pods, nodes, pod_items, node_items = [f.result() for f in futures]
+                except (KubeAPIError, OSError, http.client.HTTPException):
+                    client = None
+            if client:
+                for item in pod_items:
+                    meta = item.get("metadata") or {}
+                    for container in item.get("containers") or []:
+                        usage = container.get("usage") or {}
+                        container_metrics[(meta.get("namespace", ""), meta.get("name", ""), container.get("name", ""))] \
+                            = (parse_quantity(usage.get("cpu", "0"), "cpu") * 1000,
+                               parse_quantity(usage.get("memory", "0"), "mem"))
+                for item in node_items:
+                    usage = item.get("usage") or {}
+                    node_metrics[(item.get("metadata") or {}).get("name", "")] = (
+                        parse_quantity(usage.get("cpu", "0"), "cpu") * 1000, parse_quantity(usage.get("memory", "0"), "mem"))
+        if not client:
+            scope = ["-n", namespace] if namespace else ["--all-namespaces"]
+            commands = [["kubectl", "get", "pods"] + scope + ["-o", "json"], ["kubectl", "get", "nodes", "-o", "json"],
+                        ["kubectl", "top", "pods", "--containers"] + scope + ["--no-headers"], ["kubectl", "top", "nodes", "--no-headers"]]
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(self._poll_command, commands))
+            try:
+                pods = json.loads(results[0][1]).get("items", []) if results[0][0] else []
+                nodes = json.loads(results[1][1]).get("items", []) if results[1][0] else []
+            except ValueError:
+                pass
+            for line in (results[2][1] if results[2][0] else "").splitlines():
+                # NAMESPACE POD CONTAINER CPU MEMORY (no NAMESPACE column with -n)
+                parts = ([namespace] if namespace else []) + line.split()
+                if len(parts) >= 5:
+                    container_metrics[(parts[0], parts[1], parts[2])] = (
+                        parse_quantity(parts[3], "cpu") * 1000, parse_quantity(parts[4], "mem"))
+            for line in (results[3][1] if results[3][0] else "").splitlines():
+                parts = line.split()
+                if len(parts) >= 4:
+                    node_metrics[parts[0]] = (parse_quantity(parts[1], "cpu") * 1000, parse_quantity(parts[3], "mem"))
+        pod_metrics: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        for (ns, pod, _), (cpu_m, mem_mi) in container_metrics.items():
+            total = pod_metrics.get((ns, pod), (0.0, 0.0))
+            pod_metrics[(ns, pod)] = (total[0] + cpu_m, total[1] + mem_mi)
+        node_rows = []
+        for node in nodes:
+            name = (node.get("metadata") or {}).get("name", "")
+            status = node.get("status") or {}
+            allocatable = status.get("allocatable") or {}
+            cpu_m, mem_mi = node_metrics.get(name, (0.0, 0.0))
+            cpu_total = parse_quantity(allocatable.get("cpu", "0"), "cpu") * 1000
+            mem_total = parse_quantity(allocatable.get("memory", "0"), "mem")
+            node_rows.append({"name": name, "cpu_m": cpu_m, "mem_mi": mem_mi,
+                              "cpu_pct": 100 * cpu_m / cpu_total if cpu_total else 0,
+                              "mem_pct": 100 * mem_mi / mem_total if mem_total else 0,
+                              "ready": any(c.get("type") == "Ready" and c.get("status") == "True"
+                                           for c in status.get("conditions") or [])})
+        return {"pods": pods, "pod_usage": pod_metrics, "container_usage": container_metrics, "nodes": node_rows}
+
+    def metrics_store(self) -> Optional[MetricsStore]:
+        """Usage history in ~/.minikube_tutorial/metrics.tsdb (None if it cannot be opened)"""
+        if self._metrics is None:
+            try:
+                self._metrics = MetricsStore(self.tutorial_dir / "metrics.tsdb")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Metrics history disabled: {e}")
+                self._metrics = False
+        return self._metrics or None
+
+    def dashboard(self, interval: float = 2.0, sort: str = "cpu", group: bool = True,
+                  namespace: Optional[str] = None, once: bool = False):
+        """Run the live dashboard, recording every snapshot into the metrics history"""
+        names = {str(r['id']): r['name'] for r in self._catalog().summaries()}
+        store = self.metrics_store()
+        sampler = MetricsSampler(store, lambda: self.dashboard_data(namespace)) if store else None
+
+        def fetch() -> Dict:
+            data = self.dashboard_data(namespace)
+            if sampler:
+                sampler.record(data)
+            return data
+
+        ClusterDashboard(fetch, names, sort, group).run(interval, once)
+        if store:
+            store.flush()
+
+    def section_dashboard(self):
+        """Live top-style view of nodes and pods"""
+        self.print_section_header("Live Cluster Dashboard", "📊")
+        print(f"{Colors.OKCYAN}CPU and memory come from metrics-server "
+              f"('minikube addons enable metrics-server'); status and restarts work without it.{Colors.ENDC}")
+        interval = input(f"{Colors.BOLD}Refresh interval in seconds (default 2): {Colors.ENDC}").strip()
+        try:
+            interval_s = max(0.5, float(interval)) if interval else 2.0
+        except ValueError:
+            interval_s = 2.0
+        self.dashboard(interval_s)
+        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+
+    def deployed_recipes(self) -> List[Dict]:
+        """Recipes with objects labeled as deployed by the tutorial"""
+        client = self.kube()
+        if client:
+            try:
+                items = [item for kind in ("deployment", "statefulset", "pod")
+                         for item in client.list(kind, label_selector=f"{MANAGED_LABEL}=true")]
+            except (KubeAPIError, OSError, http.client.HTTPException):
+                items = None
+        if not client or items is None:
+            success, output = self.run_command(["kubectl", "get", "deployment,statefulset,pod", "--all-namespaces",
+                                                "-l", f"{MANAGED_LABEL}=true", "-o", "json"],
+                                               "Finding deployed recipes")
+            if not success:
+                return []
+            try:
+                items = json.loads(output).get("items", [])
+            except ValueError:
+                return []
+        ids = {((item.get("metadata") or {}).get("labels") or {}).get(RECIPE_LABEL) for item in items}
+        # Only the shards holding these recipes are loaded
+        found = (self._find_recipe(i) for i in sorted((i for i in ids if i and i.isdigit()), key=int))
+        return [r for r in found if r]
+
+    def watch_health(self, targets: List[Dict], interval: float = 5.0, rounds: Optional[int] = None,
+                     timeout: float = 2.0, live: bool = True, forward: bool = True) -> Dict:
+        """Probe targets until Ctrl+C (or `rounds`), redrawing the status screen each round
+
+        With `forward`, every target backed by a Service is probed through a port-forward started here.
+        """
+        with PortForwarder(self.profile, backend=self.backend) as forwarder:
+            if forward:
+                targets = forwarder.start(targets)
+            return self._watch_health(targets, interval, rounds, timeout, live)
+
+    def _watch_health(self, targets: List[Dict], interval: float, rounds: Optional[int], timeout: float,
+                      live: bool) -> Dict:
+        prober = HealthProber(targets, timeout=timeout)
+
+        def render(summary: Dict):
+            print("\033[2J\033[H", end="")
+            self.print_section_header(f"Endpoint Health every {interval:g}s (Ctrl+C to return)", "🩺")
+            HealthProber.print_summary(summary)
+
+        try:
+            asyncio.run(prober.run(interval, rounds, render if live else None))
+        except KeyboardInterrupt:
+            pass
+        return prober.summary()
+
+    def _get_object(self, kind: str, name: str, namespace: str) -> Optional[Dict]:
+        """One live object through the API client, else kubectl; None when it is missing or unreadable"""
+        client = self.kube()
+        if client:
+            try:
+                return client.get(kind, name, namespace)
+            except (KubeAPIError, OSError, http.client.HTTPException):
+                return None
+        success, output = self._poll_command(["kubectl", "get", kind.lower(), name, "-n", namespace, "-o", "json"])
+        try:
+            return json.loads(output) if success else None
+        except ValueError:
+            return None
+
+    def _scaling_state(self, deployment: str, hpa: Optional[str], namespace: str) -> Dict:
+        """Replica counts, HPA CPU utilization and summed pod CPU for one deployment"""
+        objects: Dict[str, Dict] = {}
+        for kind, name in [("deployment", deployment)] + ([("HorizontalPodAutoscaler", hpa)] if hpa else []):
+            found = self._get_object(kind, name, namespace)
+            if found:
+                objects[kind] = found
+        deploy = objects.get("deployment") or {}
+        status = deploy.get("status") or {}
+        hpa_status = (objects.get("HorizontalPodAutoscaler") or {}).get("status") or {}
+        hpa_cpu = next(((m.get("resource") or {}).get("current", {}).get("averageUtilization")
+                        for m in hpa_status.get("currentMetrics") or []
+                        if (m.get("resource") or {}).get("name") == "cpu"), None)
+        usage = self.dashboard_data(namespace)["pod_usage"]
+        cpu_m = sum(cpu for (_, pod), (cpu, _) in usage.items() if pod.startswith(f"{deployment}-"))
+        return {"desired": hpa_status.get("desiredReplicas", (deploy.get("spec") or {}).get("replicas")),
+                "replicas": status.get("replicas", 0) if deploy else None,
+                "ready": status.get("readyReplicas", 0) if deploy else None,
+                "cpu_m": round(cpu_m) if usage else None, "hpa_cpu_pct": hpa_cpu}
+
+    def _apply_doc(self, doc: Dict, description: str) -> bool:
+        """Apply one object through the API client, else via a temporary file and kubectl"""
+        client = self.kube()
+        if client:
+            try:
+                client.apply(doc)
+                return True
+            except (KubeAPIError, OSError, http.client.HTTPException) as e:
+                logger.error(f"{description}: {e}")
+                return False
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump(doc, f)
+        try:
+            return self.run_command(["kubectl", "apply", "-f", f.name], description)[0]
+        finally:
+            os.unlink(f.name)
+
+    def autoscale_experiment(self, recipe: Dict, profile: LoadProfile, url: Optional[str] = None,
+                             cpu_target: Optional[int] = None, min_replicas: Optional[int] = None,
+                             max_replicas: Optional[int] = None, schedule: Optional[List[Tuple[float, int]]] = None,
+                             namespace: str = "default", sample_interval: float = 2.0,
+                             slo_p95_ms: float = 250.0, slo_error_pct: float = 1.0) -> Dict:
+        """Run a load profile against a recipe with an HPA (or a fixed replica schedule) and save the timeline"""
+        self.current_recipe = str(recipe['id'])
+        docs = load_manifest(recipe['yaml'])
+        hpa = next((d for d in docs if d.get("kind") == "HorizontalPodAutoscaler"), None)
+        deployment = ((hpa or {}).get("spec", {}).get("scaleTargetRef") or {}).get("name") or \
+            next((d["metadata"]["name"] for d in docs if d.get("kind") == "Deployment"), None)
+        if not deployment:
+            raise ValueError(f"{recipe['name']} has no Deployment to scale")
+        client = self.kube()
+        scale = None
+        original = None
+        if hpa and (schedule or cpu_target or min_replicas or max_replicas):
+            # The live HPA as deployed, put back once the experiment is over
+            live = self._get_object("HorizontalPodAutoscaler", hpa["metadata"]["name"], namespace)
+            if live:
+                meta = live.get("metadata") or {}
+                annotations = {k: v for k, v in (meta.get("annotations") or {}).items()
+                               if k != "kubectl.kubernetes.io/last-applied-configuration"}
+                original = {"apiVersion": live.get("apiVersion") or hpa.get("apiVersion"),
+                            "kind": "HorizontalPodAutoscaler", "spec": live.get("spec") or {},
+                            "metadata": {k: v for k, v in (("name", meta.get("name")), ("namespace", namespace),
+                                                           ("labels", meta.get("labels")),
+                                                           ("annotations", annotations)) if v}}
+        hpa_name = hpa["metadata"]["name"] if hpa else None
+        changed = False
+        try:
+            if schedule:
+                # A fixed schedule replaces the HPA so the two do not fight over replicas
+                if hpa:
+                    self._delete_hpa(hpa_name, namespace, "Removing HPA for scheduled scaling")
+                    changed = True
+                    hpa = None
+
+                def scale(replicas: int):
+                    if client:
+                        try:
+                            client.request("PATCH", client.path("deployment", deployment, namespace) + "/scale",
+                                           body={"spec": {"replicas": replicas}},
+                                           content_type="application/merge-patch+json")
+                            return
+                        except (KubeAPIError, OSError, http.client.HTTPException) as e:
+                            logger.warning(f"Scale via API failed, using kubectl: {e}")
+                    self._poll_command(["kubectl", "scale", f"deployment/{deployment}", f"--replicas={replicas}",
+                                        "-n", namespace])
+            elif hpa and (cpu_target or min_replicas or max_replicas):
+                hpa = json.loads(json.dumps(hpa))
+                spec = hpa["spec"]
+                spec["minReplicas"] = min_replicas or spec.get("minReplicas", 1)
+                spec["maxReplicas"] = max_replicas or spec.get("maxReplicas", 10)
+                if cpu_target:
+                    for metric in spec.get("metrics") or []:
+                        if (metric.get("resource") or {}).get("name") == "cpu":
+                            metric["resource"]["target"]["averageUtilization"] = cpu_target
+                hpa["metadata"] = dict(hpa["metadata"], namespace=namespace,
+                                       labels=dict(label.split("=", 1) for label in recipe_labels(recipe)))
+                changed = True
+                if not self._apply_doc(hpa, f"Configuring {hpa_name} (cpu {cpu_target or 'unchanged'}%, "
+                                            f"{spec['minReplicas']}-{spec['maxReplicas']})"):
+                    raise RuntimeError("Could not apply the HPA settings")
+            ports = recipe.get('ports') or []
+            if not url:
+                if not ports:
+                    raise ValueError(f"{recipe['name']} has no port to send load to; pass a URL")
+                url = f"http://127.0.0.1:{ports[0]['local']}/"
+            experiment = AutoscaleExperiment(
+                url, profile, lambda: self._scaling_state(deployment, hpa["metadata"]["name"] if hpa else None,
+                                                          namespace),
+                scale=scale, schedule=schedule, sample_interval=sample_interval,
+                slo_p95_ms=slo_p95_ms, slo_error_pct=slo_error_pct)
+            logger.info(f"Autoscale experiment on {deployment}: {profile.shape} {profile.base_rps:g}->"
+                        f"{profile.peak_rps:g} rps, {profile.duration:g}s against {url}")
+            report = experiment.run()
+        finally:
+            if changed:
+                if original:
+                    if not self._apply_doc(original, f"Restoring {hpa_name}"):
+                        logger.error(f"Could not restore HPA {hpa_name}; re-apply {recipe['yaml']}")
+                else:
+                    # There was no HPA before the experiment created one
+                    self._delete_hpa(hpa_name, namespace, f"Removing experiment HPA {hpa_name}")
+        out_dir = self.tutorial_dir / "experiments"
+        out_dir.mkdir(exist_ok=True)
+        stem = out_dir / f"{recipe['id']}-{profile.shape}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        stem.with_suffix(".csv").write_text(AutoscaleExperiment.to_csv(report))
+        stem.with_suffix(".json").write_text(json.dumps(report, indent=2))
+        report["files"] = [str(stem.with_suffix(".csv")), str(stem.with_suffix(".json"))]
+        return report
+
+    def _delete_hpa(self, name: str, namespace: str, description: str):
+        client = self.kube()
+        if client:
+            try:
+                client.delete("HorizontalPodAutoscaler", name, namespace)
+            except (KubeAPIError, OSError, http.client.HTTPException) as e:
+                logger.warning(f"{description}: {e}")
+        else:
+            self.run_command(["kubectl", "delete", "hpa", name, "-n", namespace, "--ignore-not-found"], description)
+
+    def _benchmark_target(self, recipe: Dict) -> Dict:
+        """Mode, namespace, Service, local port, credentials and container limits of a datastore recipe"""
+        docs = load_manifest(recipe['yaml']) if Path(recipe['yaml']).exists() else []
+        workloads = [(d, c) for d in docs for c in (((d.get("spec") or {}).get("template") or {}).get("spec") or {})
+                     .get("containers") or []]
+        mode, workload, container = "tcp", {}, None
+        for candidate in ("redis", "postgres"):
+            workload, container = next(((d, c) for d, c in workloads if candidate in str(c.get("image", ""))),
+                                       ({}, None))
+            if container:
+                mode = candidate
+                break
+        namespace = (workload.get("metadata") or {}).get("namespace")
+        env = container_env(container, docs, namespace) if container else {}
+        credentials = recipe.get('credentials') or {}
+        ports = recipe.get('ports') or []
+        service = service_port = None
+        if container:
+            # The recipe port that reaches the datastore, else its standard port (forwarded by hand)
+            container_ports = {p.get("containerPort") for p in container.get("ports") or []}
+            local = next((p['local'] for p in ports if p.get('container') in container_ports),
+                         {"redis": 6379, "postgres": 5432}[mode])
+            labels = (((workload.get("spec") or {}).get("template") or {}).get("metadata") or {}).get("labels") or {}
+            for doc in docs:
+                selector = (doc.get("spec") or {}).get("selector") or {}
+                if doc.get("kind") != "Service" or not selector or \
+                        (doc.get("metadata") or {}).get("namespace") != namespace or \
+                        any(labels.get(k) != v for k, v in selector.items()):
+                    continue
+                for port in doc["spec"].get("ports") or []:
+                    if port.get("targetPort", port.get("port")) in container_ports:
+                        service, service_port = doc["metadata"]["name"], port.get("port")
+                        break
+                if service:
+                    break
+        else:
+            local = ports[0]['local'] if ports else None
+        user = credentials.get('user') or env.get("POSTGRES_USER") or "postgres"
+        return {"mode": mode, "namespace": namespace, "service": service, "service_port": service_port,
+                "port": int(local) if local else None, "user": user,
+                "password": credentials.get('password') or env.get("POSTGRES_PASSWORD") or env.get("REDIS_PASSWORD"),
+                "database": env.get("POSTGRES_DB") or user,
+                "limits": ((container or {}).get("resources") or {}).get("limits")}
+
+    def _benchmark_port_forward(self, target: Dict) -> str:
+        """The port-forward command that makes a benchmark target reachable on its local port"""
+        if not target.get("service"):
+            return "kubectl port-forward"
+        namespace = f"-n {target['namespace']} " if target.get("namespace") else ""
+        return f"kubectl port-forward {namespace}svc/{target['service']} {target['port']}:{target['service_port']}"
+
+    def _cluster_shape(self) -> Dict:
+        """Driver, CPUs and memory of the active minikube profile"""
+        ok, output = self._poll_command(["minikube", "profile", "list", "-o", "json"])
+        try:
+            profiles = json.loads(output).get("valid") or [] if ok else []
+        except ValueError:
+            profiles = []
+        wanted = self.profile or "minikube"
+        config = next((p.get("Config") or {} for p in profiles if p.get("Name") == wanted), {})
+        return {"profile": wanted, "driver": config.get("Driver"), "cpus": config.get("CPUs"),
+                "memory_mb": config.get("Memory")}
+
+    def benchmark_datastore(self, recipe: Optional[Dict] = None, mode: Optional[str] = None,
+                            host: str = "127.0.0.1", port: Optional[int] = None, **options) -> Dict:
+        """Benchmark a datastore recipe (or any host:port) and save the report next to the cluster shape
+
+        Options are passed to DatastoreBenchmark; the recipe supplies mode, port and credentials
+        unless given. Reports from different drivers or limits can be compared side by side.
+        """
+        target = self._benchmark_target(recipe) if recipe else {}
+        mode = mode or target.get("mode") or "tcp"
+        port = port or target.get("port")
+        if not port:
+            raise ValueError("No port to benchmark; pass one or pick a recipe with ports")
+        if mode == "postgres":
+            options.setdefault("user", target.get("user") or "postgres")
+            options.setdefault("database", target.get("database") or "postgres")
+        if target.get("password"):
+            options.setdefault("password", target["password"])
+        if recipe:
+            self.current_recipe = str(recipe['id'])
+        benchmark = DatastoreBenchmark(mode, host, port, **options)
+        logger.info(f"Benchmark {mode} at {host}:{port}: {benchmark.connections} connections, "
+                    f"pipeline {benchmark.pipeline}, sizes {benchmark.value_sizes}")
+        report = benchmark.run()
+        report["environment"] = dict(self._cluster_shape(), recipe=recipe['id'] if recipe else None,
+                                     limits=target.get("limits"))
+        out_dir = self.tutorial_dir / "benchmarks"
+        out_dir.mkdir(exist_ok=True)
+        path = out_dir / f"{recipe['id'] if recipe else 'target'}-{mode}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+        path.write_text(json.dumps(report, indent=2))
+        report["files"] = [str(path)]
+        return report
+
+    def prefetch_images(self, recipes: List[Dict], max_workers: int = 4) -> Dict:
+        """Load every image the recipes reference into the node, skipping ones already there"""
+        images = []
+        for recipe in recipes:
+            if Path(recipe['yaml']).exists():
+                images += manifest_images(load_manifest(recipe['yaml']))
+        return ImagePrefetcher(self.run_command, max_workers=max_workers).prefetch(images)
+
+    def build_images(self, root: Path, compose_files: Optional[List[Path]] = None, deliver: str = "auto",
+                     registry: str = "localhost:5000", max_workers: int = 4, tag: str = "latest",
+                     force: bool = False, dry_run: bool = False) -> Dict:
+        """Build every changed Dockerfile/compose context under root and put the images on the node"""
+        builder = ImageBuilder(self.run_command, self.tutorial_dir / "build_cache.json", registry=registry,
+                               max_workers=max_workers, deliver=deliver, tag=tag)
+        return builder.run(ImageBuilder.discover(root, compose_files), force=force, dry_run=dry_run)
+
+    def follow_recipe_logs(self, recipe: Dict, duration: Optional[float] = None) -> bool:
+        """Follow the merged logs of every pod and container a recipe runs"""
+        targets = self._recipe_log_targets(recipe)
+        if not targets:
+            print(f"{Colors.FAIL}Could not determine pods for {recipe['name']}. Is it deployed?{Colors.ENDC}")
+            return False
+        LogAggregator(targets, profile=self.profile, backend=self.backend).follow(duration)
+        return True
+
+    def _stream_recipe_lines(self, recipe: Dict, tail: int = 100):
+        """Yield raw log lines from every pod of a recipe as they arrive"""
+        lines = queue.Queue(maxsize=10000)
+        processes = []
+
+        def pump(out):
+            for line in out:
+                lines.put(line)
+
+        for namespace, selector in self._recipe_log_targets(recipe):
+            cmd = ["kubectl", "logs", "-f", "-l", selector, "--all-containers", "--max-log-requests=50",
+                   f"--tail={tail}"] + (["-n", namespace] if namespace else [])
+            proc = self.backend.popen(with_profile(cmd, self.profile))
+            processes.append(proc)
+            threading.Thread(target=pump, args=(proc.stdout,), daemon=True).start()
+        try:
+            while processes and any(p.poll() is None for p in processes) or not lines.empty():
+                try:
+                    yield lines.get(timeout=0.5)
+                except queue.Empty:
+                    yield None
+        finally:
+            for proc in processes:
+                if proc.poll() is None:
+                    proc.terminate()
+
+    def analyze_recipe_logs(self, recipe: Dict, analyzer: LogAnalyzer, report_every: float = 10.0):
+        """Run a LogAnalyzer over a recipe's live logs, printing the summary periodically"""
+        last_report = time.monotonic()
+        try:
+            for line in self._stream_recipe_lines(recipe):
+                if line is not None:
+                    analyzer.feed(line)
+                if time.monotonic() - last_report >= report_every:
+                    LogAnalyzer.print_summary(analyzer.summary())
+                    last_report = time.monotonic()
+        except KeyboardInterrupt:
+            pass
+        LogAnalyzer.print_summary(analyzer.summary())
 
     def section_recipes(self):
         """Interactive minikube recipes section"""
+        page_number, text_filter = 1, ""
         while True:
             self.print_section_header("Minikube Recipes - Ready-to-Deploy Apps", "📋")
 
-            recipes = self._load_recipes()
+            catalog = self._catalog()
+            summaries = catalog.summaries()
 
-            if not recipes:
+            if not summaries:
                 print(f"{Colors.FAIL}Error: Could not load recipes.json{Colors.ENDC}\n")
                 input(f"{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
                 return
 
-            # Display recipe list
-            print(f"{Colors.BOLD}Available Recipes:{Colors.ENDC}\n")
+            # Display one page of the (optionally filtered) recipe list
+            rows, pages = catalog.page(catalog.filter(text_filter), page_number - 1)
+            page_number = min(page_number, pages)
+            heading = f"Available Recipes (filter: '{text_filter}')" if text_filter else "Available Recipes"
+            print(f"{Colors.BOLD}{heading}:{Colors.ENDC}\n")
 
-            for recipe in recipes:
+            for recipe in rows:
                 recipe_id = recipe['id']
                 name = recipe['name']
                 difficulty = recipe['difficulty']
                 time = recipe['time']
                 print(f"  {recipe_id:2d}. {name:35s} | {difficulty:12s} | {time}")
 
+            if pages > 1 or text_filter:
+                print(f"\n  Page {page_number}/{pages} ({len(summaries)} recipes)"
+                      f"  -  '>' next, '<' previous, '/text' filter, '/' clear filter")
             print(f"\n  L. List deployed recipes")
-            print(f"  D. Delete recipe")
+            print(f"  F. Follow logs from all pods of a recipe")
+            print(f"  J. Analyze JSON logs of a recipe (counts by level/component)")
+            print(f"  P. Prefetch images for recipes into the node")
+            print(f"  H. Health of deployed recipe endpoints (live)")
+            print(f"  D. Delete recipes (ids, category or all) and wait until gone")
+            print(f"  X. Autoscaling experiment (load profile vs. replicas and latency)")
+            print(f"  T. Throughput benchmark of a Redis/PostgreSQL recipe")
             print(f"  B. Back to menu")
             print(f"  Q. Quit\n")
 
-            choice = input(f"{Colors.BOLD}Select recipe to deploy (1-{len(recipes)}) or option: {Colors.ENDC}").strip().lower()
+            choice = input(f"{Colors.BOLD}Select recipe to deploy (1-{summaries[-1]['id']}) or option: {Colors.ENDC}").strip().lower()
 
-            if choice == 'b':
+            if choice in ('>', '<'):
+                page_number = max(1, min(pages, page_number + (1 if choice == '>' else -1)))
+                continue
+            elif choice.startswith('/'):
+                text_filter, page_number = choice[1:].strip(), 1
+                continue
+            elif choice == 'b':
                 break
             elif choice == 'q':
                 sys.exit(0)
@@ -1427,30 +7222,84 @@ spec:
                     print(output)
                 else:
                     print(f"{Colors.FAIL}Could not fetch pod list{Colors.ENDC}")
+                for recipe in self.deployed_recipes():
+                    self._print_recipe_warnings(recipe)
+                input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+                continue
+            elif choice == 'f':
+                follow_choice = input(f"{Colors.WARNING}Enter recipe number to follow (or 'c' to cancel): {Colors.ENDC}").strip()
+                recipe_to_follow = self._find_recipe(follow_choice)
+                if recipe_to_follow:
+                    print(f"{Colors.OKCYAN}Following {recipe_to_follow['name']} (Ctrl+C to stop)...{Colors.ENDC}\n")
+                    self.follow_recipe_logs(recipe_to_follow)
+                input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+                continue
+            elif choice == 'j':
+                analyze_choice = input(f"{Colors.WARNING}Enter recipe number to analyze (or 'c' to cancel): {Colors.ENDC}").strip()
+                recipe_to_analyze = self._find_recipe(analyze_choice)
+                if recipe_to_analyze:
+                    group_by = input(f"{Colors.BOLD}Group by fields (default: level,component): {Colors.ENDC}").strip()
+                    analyzer = LogAnalyzer([f.strip() for f in (group_by or "level,component").split(",")])
+                    print(f"{Colors.OKCYAN}Analyzing {recipe_to_analyze['name']} (Ctrl+C to stop)...{Colors.ENDC}")
+                    self.analyze_recipe_logs(recipe_to_analyze, analyzer)
+                input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+                continue
+            elif choice == 'p':
+                prefetch_choice = input(f"{Colors.WARNING}Recipe numbers to prefetch (e.g. 2,3,5 or 'all'): {Colors.ENDC}").strip()
+                selected = self._select_recipes(self._load_recipes(), prefetch_choice)
+                if selected:
+                    ImagePrefetcher.print_report(self.prefetch_images(selected))
+                input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+                continue
+            elif choice == 'h':
+                health_choice = input(f"{Colors.WARNING}Recipe numbers to probe (Enter for deployed ones): "
+                                      f"{Colors.ENDC}").strip()
+                selected = self._select_recipes(self._load_recipes(), health_choice) if health_choice \
+                    else self.deployed_recipes()
+                targets = HealthProber.targets_for(selected)
+                if targets:
+                    print(f"{Colors.OKCYAN}Port-forwarding each recipe's Service for the probes...{Colors.ENDC}")
+                    self.watch_health(targets)
+                else:
+                    print(f"{Colors.WARNING}No deployed recipes with ports found{Colors.ENDC}")
                 input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
                 continue
             elif choice == 'd':
-                # Delete recipe
-                delete_choice = input(f"{Colors.WARNING}Enter recipe number to delete (or 'c' to cancel): {Colors.ENDC}").strip()
-                if delete_choice.lower() != 'c':
-                    try:
-                        recipe_num = int(delete_choice)
-                        recipe_to_delete = next((r for r in recipes if r['id'] == recipe_num), None)
-                        if recipe_to_delete:
-                            confirm = input(f"{Colors.FAIL}Delete {recipe_to_delete['name']}? (y/n): {Colors.ENDC}").strip().lower()
-                            if confirm == 'y':
-                                yaml_path = recipe_to_delete['yaml']
-                                self.run_command(["kubectl", "delete", "-f", yaml_path], f"Deleting {recipe_to_delete['name']}")
-                                print(f"{Colors.OKGREEN}Recipe deleted.{Colors.ENDC}")
-                    except ValueError:
-                        pass
+                # Delete recipes: ids, a category, or everything the tutorial deployed
+                delete_choice = input(f"{Colors.WARNING}Recipe numbers (e.g. 2,3), a category (e.g. cache), "
+                                      f"'all', or 'c' to cancel: {Colors.ENDC}").strip()
+                if delete_choice and delete_choice.lower() != 'c':
+                    everything = delete_choice.lower() == 'all'
+                    if everything:
+                        selected = self._load_recipes()
+                    elif all(x.strip().isdigit() for x in delete_choice.split(",")):
+                        selected = self._select_recipes(self._load_recipes(), delete_choice)
+                    else:
+                        selected = BulkTeardown.select(self._load_recipes(), category=delete_choice)
+                    target = "everything deployed by this tutorial" if everything else \
+                        ", ".join(r['name'] for r in selected)
+                    if everything or selected:
+                        confirm = input(f"{Colors.FAIL}Delete {target}? (y/n): {Colors.ENDC}").strip().lower()
+                        if confirm == 'y':
+                            BulkTeardown.print_report(self.teardown(selected, everything))
+                    else:
+                        print(f"{Colors.FAIL}No matching recipes{Colors.ENDC}")
+                input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+                continue
+
+            elif choice == 'x':
+                self._run_autoscale_prompt()
+                input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+                continue
+            elif choice == 't':
+                self._run_benchmark_prompt()
                 input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
                 continue
 
             # Try to deploy selected recipe
             try:
                 recipe_num = int(choice)
-                selected_recipe = next((r for r in recipes if r['id'] == recipe_num), None)
+                selected_recipe = self._find_recipe(recipe_num)
 
                 if selected_recipe:
                     if self._deploy_recipe(selected_recipe):
@@ -1464,11 +7313,339 @@ spec:
                 print(f"{Colors.FAIL}Invalid choice{Colors.ENDC}")
                 input(f"{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
 
+    def _run_autoscale_prompt(self):
+        """Ask for an experiment's settings, run it on the recipe with an HPA and print the report"""
+        candidates = [r for r in self._load_recipes() if Path(r['yaml']).exists() and
+                      any(d.get("kind") == "HorizontalPodAutoscaler" for d in load_manifest(r['yaml']))]
+        if not candidates:
+            print(f"{Colors.FAIL}No recipe with a HorizontalPodAutoscaler found{Colors.ENDC}")
+            return
+        default = candidates[0]
+        recipe = self._find_recipe(input(f"{Colors.BOLD}Recipe (default {default['id']}. {default['name']}): "
+                                         f"{Colors.ENDC}").strip() or default['id'])
+        if not recipe:
+            print(f"{Colors.FAIL}Invalid recipe number{Colors.ENDC}")
+            return
+        shape = input(f"{Colors.BOLD}Load profile ramp/step/spike (default step): {Colors.ENDC}").strip() or "step"
+        try:
+            duration = parse_duration(input(f"{Colors.BOLD}Duration (default 5m): {Colors.ENDC}").strip() or "5m")
+            peak = float(input(f"{Colors.BOLD}Peak requests/s (default 50): {Colors.ENDC}").strip() or 50)
+            slo = float(input(f"{Colors.BOLD}p95 latency SLO in ms (default 250): {Colors.ENDC}").strip() or 250)
+            schedule_text = input(f"{Colors.BOLD}Replica schedule instead of the HPA, e.g. 0:1,1m:3 "
+                                  f"(Enter to keep the HPA): {Colors.ENDC}").strip()
+            profile = LoadProfile(shape, peak / 10, peak, duration)
+            schedule = parse_schedule(schedule_text) if schedule_text else None
+        except ValueError as e:
+            print(f"{Colors.FAIL}{e}{Colors.ENDC}")
+            return
+        print(f"{Colors.OKCYAN}Sending load to the recipe's local port; start its port-forward first "
+              f"(or use 'minikube service' and the CLI's --url to spread load over all pods).{Colors.ENDC}")
+        try:
+            report = self.autoscale_experiment(recipe, profile, schedule=schedule, slo_p95_ms=slo)
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"{Colors.FAIL}{e}{Colors.ENDC}")
+            return
+        except KeyboardInterrupt:
+            print(f"\n{Colors.WARNING}Experiment interrupted{Colors.ENDC}")
+            return
+        AutoscaleExperiment.print_report(report)
+        print(f"{Colors.OKGREEN}Timeline saved to {report['files'][0]}{Colors.ENDC}")
+
+    def _run_benchmark_prompt(self):
+        """Ask for a datastore recipe and workload, run the benchmark and print the report"""
+        candidates = [r for r in self._load_recipes() if Path(r['yaml']).exists()
+                      and self._benchmark_target(r)["mode"] != "tcp"]
+        if not candidates:
+            print(f"{Colors.FAIL}No Redis or PostgreSQL recipe found{Colors.ENDC}")
+            return
+        for recipe in candidates:
+            print(f"  {recipe['id']:2d}. {recipe['name']}")
+        default = candidates[0]
+        recipe = self._find_recipe(input(f"{Colors.BOLD}Recipe (default {default['id']}): {Colors.ENDC}").strip()
+                                   or default['id'])
+        if not recipe:
+            print(f"{Colors.FAIL}Invalid recipe number{Colors.ENDC}")
+            return
+        try:
+            connections = int(input(f"{Colors.BOLD}Connections (default 8): {Colors.ENDC}").strip() or 8)
+            pipeline = int(input(f"{Colors.BOLD}Pipeline depth (default 1): {Colors.ENDC}").strip() or 1)
+            sizes = [int(x) for x in (input(f"{Colors.BOLD}Value sizes in bytes (default 64,1024): "
+                                            f"{Colors.ENDC}").strip() or "64,1024").split(",")]
+            duration = parse_duration(input(f"{Colors.BOLD}Seconds per size (default 10s): {Colors.ENDC}").strip()
+                                      or "10s")
+        except ValueError as e:
+            print(f"{Colors.FAIL}{e}{Colors.ENDC}")
+            return
+        print(f"{Colors.OKCYAN}Connecting to the recipe's local port; start its port-forward first "
+              f"({self._benchmark_port_forward(self._benchmark_target(recipe))}).{Colors.ENDC}")
+        try:
+            report = self.benchmark_datastore(recipe, connections=connections, pipeline=pipeline,
+                                              value_sizes=sizes, duration=duration)
+        except (OSError, ValueError, BenchmarkError, asyncio.TimeoutError) as e:
+            print(f"{Colors.FAIL}Benchmark failed: {e}{Colors.ENDC}")
+            return
+        except KeyboardInterrupt:
+            print(f"\n{Colors.WARNING}Benchmark interrupted{Colors.ENDC}")
+            return
+        DatastoreBenchmark.print_report(report)
+
+    def _list_profiles(self) -> List[str]:
+        """List minikube profile names"""
+        success, output = self.run_command(["minikube", "profile", "list", "-o", "json"],
+                                           "Listing profiles")
+        if not success:
+            return []
+        try:
+            data = json.loads(output)
+        except ValueError:
+            return []
+        return [p["Name"] for group in ("valid", "invalid") for p in data.get(group) or [] if p.get("Name")]
+
+    def _select_recipes(self, recipes: List[Dict], selection: str) -> List[Dict]:
+        """Resolve a comma-separated list of recipe ids (or 'all'); an empty selection selects nothing"""
+        if selection.strip().lower() == "all":
+            return recipes
+        wanted = {int(x) for x in selection.split(",") if x.strip().isdigit()}
+        return [r for r in recipes if r['id'] in wanted]
+
+    def fanout(self, action: str, profiles: List[str], recipes: List[Dict],
+               per_profile_limit: int = 2) -> Dict:
+        """Run a deploy/verify/teardown on several profiles concurrently"""
+        return ProfileFanout(self.run_command, per_profile_limit=per_profile_limit).run(action, profiles, recipes)
+
+    def section_profiles(self):
+        """Fan deploy/verify/teardown out to several minikube profiles"""
+        self.print_section_header("Multi-Profile Operations", "🌐")
+
+        known = self._list_profiles()
+        if known:
+            print(f"{Colors.BOLD}Profiles:{Colors.ENDC} {', '.join(known)}\n")
+        else:
+            print(f"{Colors.WARNING}No profiles reported by 'minikube profile list'.{Colors.ENDC}\n")
+
+        entered = input(f"{Colors.BOLD}Profiles (comma-separated, 'all' for every profile): {Colors.ENDC}").strip()
+        profiles = known if entered.lower() == "all" else [p.strip() for p in entered.split(",") if p.strip()]
+        if not profiles:
+            print(f"{Colors.WARNING}No profiles selected.{Colors.ENDC}")
+            input(f"{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            return
+
+        action = input(f"{Colors.BOLD}Action ({'/'.join(ProfileFanout.ACTIONS)}): {Colors.ENDC}").strip().lower()
+        if action not in ProfileFanout.ACTIONS:
+            print(f"{Colors.FAIL}Invalid action{Colors.ENDC}")
+            input(f"{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            return
+
+        recipes = self._load_recipes()
+        for recipe in recipes:
+            print(f"  {recipe['id']:2d}. {recipe['name']}")
+        selection = input(f"\n{Colors.BOLD}Recipes (comma-separated ids or 'all'): {Colors.ENDC}").strip()
+        selected = self._select_recipes(recipes, selection)
+        if not selected and action != "verify":
+            print(f"{Colors.WARNING}No recipes selected.{Colors.ENDC}")
+            input(f"{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            return
+        if action == "teardown":
+            confirm = input(f"{Colors.FAIL}Delete {', '.join(r['name'] for r in selected)} on "
+                            f"{', '.join(profiles)}? (y/n): {Colors.ENDC}").strip().lower()
+            if confirm != 'y':
+                print(f"{Colors.WARNING}Teardown cancelled.{Colors.ENDC}")
+                input(f"{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+                return
+        limit = input(f"{Colors.BOLD}Concurrent commands per profile (default: 2): {Colors.ENDC}").strip()
+
+        report = self.fanout(action, profiles, selected, int(limit) if limit.isdigit() else 2)
+        ProfileFanout.print_report(report)
+        input(f"{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+
+    def _ensure_event_watcher(self) -> bool:
+        """Start the background event watcher once per session"""
+        if self.event_watcher is None:
+            self.event_watcher = EventWatcher(self.events, self.profile, self.backend)
+            # However the session ends (menu exit, 'q' in a section, an error), the kubectl watch goes with it
+            atexit.register(self.event_watcher.stop)
+        if not self.event_watcher.running:
+            try:
+                self.event_watcher.start()
+            except OSError as e:
+                logger.error(f"❌ Could not start event watcher: {str(e)}")
+                return False
+        return True
+
+    @staticmethod
+    def _recipe_name_prefixes(recipe: Dict) -> List[str]:
+        """Object names a recipe creates, taken from its kubectl commands"""
+        prefixes = set()
+        for command in (recipe.get('commands') or {}).values():
+            for token in command.split():
+                if "/" in token and not token.endswith((".yaml", ".yml")):
+                    prefixes.add(token.split("/", 1)[1])
+                elif token.startswith("app="):
+                    prefixes.add(token[4:])
+        return sorted(p for p in prefixes if p)
+
+    def _recipe_events(self, recipe: Dict) -> List[Dict]:
+        """Buffered events of a recipe's objects and of the ReplicaSets/Pods its workloads own, oldest first"""
+        try:
+            docs = [d for d in load_manifest(recipe['yaml']) if isinstance(d, dict) and d.get("metadata")]
+        except (OSError, ValueError):
+            docs = []
+        objects = {((d["metadata"].get("namespace") or "default"), d.get("kind", ""), d["metadata"].get("name", ""))
+                   for d in docs}
+        owners = [(namespace, name + "-") for namespace, kind, name in objects if kind in TieredDeploy.WORKLOADS]
+        for namespace, kind, name in self.events.objects():
+            if kind in ("ReplicaSet", "Pod") and any(namespace == ns and name.startswith(prefix)
+                                                     for ns, prefix in owners):
+                objects.add((namespace, kind, name))
+        return sorted((event for key in objects for event in self.events.for_object(*key)),
+                      key=lambda e: e["last_seen"])
+
+    def _print_recipe_warnings(self, recipe: Dict, limit: int = 5):
+        """Show recent warning events for a recipe from the event watcher's buffer"""
+        started = not (self.event_watcher and self.event_watcher.running)
+        if not self._ensure_event_watcher():
+            return
+        if started:
+            # Give the watch a moment to deliver its initial listing
+            deadline = time.monotonic() + 2.0
+            while not self.events.received and time.monotonic() < deadline:
+                time.sleep(0.05)
+        warnings = [e for e in self._recipe_events(recipe) if e["type"] == "Warning"][-limit:]
+        if warnings:
+            print(f"{Colors.WARNING}Recent warnings for {recipe['name']}:{Colors.ENDC}")
+            for event in warnings:
+                print(f"  {event['reason']:20s} {event['kind']}/{event['name']} (x{event['count']}): "
+                      f"{event['message']}")
+
+    def section_events(self):
+        """Live, filterable view of cluster events"""
+        self.print_section_header("Live Cluster Events", "📡")
+
+        if not self._ensure_event_watcher():
+            print(f"{Colors.FAIL}Could not start 'kubectl get events --watch'. Is kubectl installed?{Colors.ENDC}\n")
+            input(f"{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            return
+
+        namespace = input(f"{Colors.BOLD}Namespace filter (Enter for all): {Colors.ENDC}").strip() or None
+        reason = input(f"{Colors.BOLD}Reason filter, e.g. FailedScheduling, BackOff (Enter for all): "
+                       f"{Colors.ENDC}").strip() or None
+        recipe_id = input(f"{Colors.BOLD}Recipe id filter (Enter for all): {Colors.ENDC}").strip()
+        prefixes = None
+        if recipe_id.isdigit():
+            recipe = self._find_recipe(recipe_id)
+            prefixes = self._recipe_name_prefixes(recipe) if recipe else None
+
+        try:
+            while True:
+                events = self.events.query(namespace=namespace, reason=reason, name_prefixes=prefixes, limit=30)
+                print("\033[2J\033[H", end="")
+                self.print_section_header("Live Cluster Events (Ctrl+C to return)", "📡")
+                print(f"{Colors.BOLD}{'LAST SEEN':21s} {'TYPE':8s} {'REASON':20s} {'OBJECT':40s} COUNT{Colors.ENDC}")
+                for event in events:
+                    color = Colors.WARNING if event["type"] == "Warning" else ""
+                    obj = f"{event['namespace']}/{event['kind']}/{event['name']}"
+                    print(f"{color}{event['last_seen'][:20]:21s} {event['type'][:8]:8s} {event['reason'][:20]:20s} "
+                          f"{obj[:40]:40s} {event['count']}{Colors.ENDC}")
+                    print(f"    {event['message'][:110]}")
+                print(f"\n{len(self.events)} unique events buffered "
+                      f"({self.events.received} received, capacity {self.events.capacity})")
+                time.sleep(2)
+        except KeyboardInterrupt:
+            print()
+
+    def section_trace_collector(self):
+        """Run the built-in OTLP receiver and show latency summaries"""
+        self.print_section_header("Local Trace Collector & Latency Summary", "⏱️")
+
+        port = input(f"{Colors.BOLD}Listen port (default: 4318): {Colors.ENDC}").strip()
+        store = SpanStore()
+        collector = TraceCollector(store, port=int(port) if port.isdigit() else 4318)
+        try:
+            collector.start()
+        except OSError as e:
+            print(f"{Colors.FAIL}Could not listen: {e}{Colors.ENDC}\n")
+            input(f"{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            return
+        endpoint = f"http://{collector.host}:{collector.port}/v1/traces"
+        print(f"\n{Colors.OKGREEN}✓ Receiving OTLP/HTTP JSON spans at {endpoint}{Colors.ENDC}\n")
+
+        try:
+            while True:
+                choice = input(f"{Colors.BOLD}[R]eport, [G]enerate demo traces, [Q]uit collector: "
+                               f"{Colors.ENDC}").strip().lower()
+                if choice == 'q':
+                    break
+                if choice == 'g':
+                    sent = generate_demo_traces(endpoint, 100)
+                    print(f"{Colors.OKGREEN}✓ Sent {sent} demo traces{Colors.ENDC}")
+                else:
+                    SpanStore.print_report(store.latency_report())
+        finally:
+            collector.stop()
+
+    def search_index(self) -> SearchIndex:
+        """Search index over bundled and user guides plus recipes, refreshed incrementally"""
+        guides = sorted(Path(__file__).resolve().parent.glob("*.md"))
+        guides += sorted((self.tutorial_dir / "guides").glob("*.md"))
+        index = SearchIndex(self.tutorial_dir / "search_index.json")
+        changed = index.update(guides, self._catalog().shard_paths())
+        if changed:
+            logger.info(f"Search index updated ({changed} sections)")
+        return index
+
+    @staticmethod
+    def _print_search_results(query: str, results: List[Dict], elapsed_us: float):
+        print(f"{Colors.BOLD}🔎 {query}{Colors.ENDC}  {Colors.OKCYAN}({len(results)} results, "
+              f"{elapsed_us:.0f}µs){Colors.ENDC}\n")
+        for result in results:
+            print(f"  {Colors.OKGREEN}{result['title'][:60]}{Colors.ENDC}  {Colors.OKCYAN}"
+                  f"{Path(result['source']).name}{Colors.ENDC}")
+            if result["snippet"]:
+                print(f"    {result['snippet'][:100]}")
+
+    def section_search(self):
+        """Search-as-you-type over recipes and guides"""
+        self.print_section_header("Search Recipes & Guides", "🔎")
+        index = self.search_index()
+
+        if not sys.stdin.isatty() or termios is None:
+            query = input(f"{Colors.BOLD}Search: {Colors.ENDC}")
+            started = time.perf_counter()
+            results = index.search(query)
+            self._print_search_results(query, results, (time.perf_counter() - started) * 1e6)
+            input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            return
+
+        print(f"{Colors.OKCYAN}Type to search, Enter or Esc to return.{Colors.ENDC}")
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        query = ""
+        try:
+            tty.setcbreak(fd)
+            while True:
+                char = sys.stdin.read(1)
+                if char in ("\n", "\r", "\x1b"):
+                    break
+                if char in ("\x7f", "\b"):
+                    query = query[:-1]
+                elif char.isprintable():
+                    query += char
+                started = time.perf_counter()
+                results = index.search(query) if query.strip() else []
+                elapsed = (time.perf_counter() - started) * 1e6
+                print("\033[2J\033[H", end="")
+                self._print_search_results(query, results, elapsed)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
     def run(self):
         """Main tutorial loop"""
+        # Only the interactive session is long-lived enough to compact the journal ('journal compact' otherwise)
+        if self.journal:
+            self.journal.compact_in_background()
         while True:
             self.print_menu()
-            choice = input(f"{Colors.BOLD}Enter your choice (0-13): {Colors.ENDC}").strip()
+            choice = input(f"{Colors.BOLD}Enter your choice (0-19): {Colors.ENDC}").strip()
 
             menu_actions = {
                 "1": self.section_introduction,
@@ -1484,6 +7661,12 @@ spec:
                 "11": self.section_addons,
                 "12": self.section_helm_packages,
                 "13": self.section_recipes,
+                "14": self.section_profiles,
+                "15": self.section_events,
+                "16": self.section_trace_collector,
+                "17": self.section_search,
+                "18": self.section_dashboard,
+                "19": self.section_extra_guides,
                 "0": self.exit_tutorial,
             }
 
@@ -1523,13 +7706,618 @@ spec:
 Happy learning! 🚀
 """
         print(exit_msg)
+        if self.event_watcher:
+            self.event_watcher.stop()
         logger.info("Tutorial ended")
         sys.exit(0)
 
 
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line interface; without a subcommand the interactive menu starts"""
+    parser = argparse.ArgumentParser(description="Minikube Interactive Tutorial")
+    parser.add_argument("-p", "--profile", help="minikube profile / kubectl context to use")
+    session = parser.add_mutually_exclusive_group()
+    session.add_argument("--record", metavar="FILE", help="Record every command and its result to a session file")
+    session.add_argument("--replay", metavar="FILE", help="Serve commands from a recorded session file")
+    session.add_argument("--stub", metavar="FILE", help="Serve commands from a fixture file (argv prefix match)")
+    parser.add_argument("--replay-scale", type=float, default=1.0,
+                        help="Multiply recorded latencies when replaying (0 = instant)")
+    commands = parser.add_subparsers(dest="command")
+
+    fanout = commands.add_parser("fanout", help="Deploy, verify or tear down recipes on several profiles")
+    fanout.add_argument("action", choices=ProfileFanout.ACTIONS)
+    fanout.add_argument("--profiles", required=True, help="Comma-separated profile names, or 'all'")
+    fanout.add_argument("--recipes", default="all", help="Comma-separated recipe ids (default: all)")
+    fanout.add_argument("--limit", type=int, default=2, help="Concurrent commands per profile")
+    fanout.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    logs = commands.add_parser("logs", help="Follow merged logs from every pod of a recipe or selector")
+    logs.add_argument("--recipe", type=int, help="Recipe id")
+    logs.add_argument("-l", "--selector", help="Label selector (instead of a recipe)")
+    logs.add_argument("-n", "--namespace", help="Namespace for --selector")
+    logs.add_argument("--tail", type=int, default=10, help="Lines of history per container")
+    logs.add_argument("--duration", type=float, help="Stop after this many seconds")
+
+    analyze = commands.add_parser("analyze", help="Count and group JSON log lines from files or a recipe")
+    analyze.add_argument("files", nargs="*", help="Log files ('-' for stdin)")
+    analyze.add_argument("--recipe", type=int, help="Analyze a deployed recipe's live logs instead")
+    analyze.add_argument("--where", action="append", default=[], help="Filter, e.g. level=ERROR or level!=DEBUG")
+    analyze.add_argument("--group-by", default="level,component", help="Comma-separated fields to group by")
+    analyze.add_argument("--window", type=int, default=60, help="Window size in seconds")
+    analyze.add_argument("--horizon", type=int, default=10, help="Number of windows to keep")
+    analyze.add_argument("--json", action="store_true", help="Print the summary as JSON")
+
+    detect = commands.add_parser("detect", help="System check report (memory, disk, virtualization, tools)")
+    detect.add_argument("--json", action="store_true", help="Print the report as JSON")
+    detect.add_argument("--quick", action="store_true", help="Skip version and daemon probes")
+    detect.add_argument("--strict", action="store_true", help="Exit non-zero when a check fails")
+
+    advise = commands.add_parser("advise", help="Recommend 'minikube start' flags for this host and recipes")
+    advise.add_argument("--recipes", default="", help="Comma-separated recipe ids you plan to run ('all' for every)")
+    advise.add_argument("--driver", help="Force a driver instead of choosing one")
+    advise.add_argument("--container-runtime", choices=("docker", "containerd", "cri-o"), default="docker",
+                        help="Runtime to start with (default docker, which 'minikube docker-env' needs)")
+    advise.add_argument("--json", action="store_true", help="Print the recommendation as JSON")
+
+    setup = commands.add_parser("setup", help="Run the resumable setup steps recorded in .setup_state")
+    setup.add_argument("--status", action="store_true", help="Show step status instead of running")
+    setup.add_argument("--reset", action="store_true", help="Forget recorded progress")
+    setup.add_argument("--force", action="append", default=[], help="Re-run a step even if up to date")
+
+    search = commands.add_parser("search", help="Search recipes and guides")
+    search.add_argument("query", nargs="+")
+    search.add_argument("--limit", type=int, default=10, help="Maximum results")
+    search.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    prefetch = commands.add_parser("prefetch", help="Load recipe images into the minikube node in parallel")
+    prefetch.add_argument("--recipes", default="all", help="Comma-separated recipe ids (default: all)")
+    prefetch.add_argument("--workers", type=int, default=4, help="Images fetched at the same time")
+    prefetch.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    teardown = commands.add_parser("teardown", help="Delete recipes in one batch and wait until they are gone")
+    teardown.add_argument("--recipes", help="Comma-separated recipe ids")
+    teardown.add_argument("--category", help="Every recipe in this category")
+    teardown.add_argument("--all", action="store_true", help="Everything labeled as deployed by the tutorial")
+    teardown.add_argument("--timeout", type=int, default=180, help="Seconds to wait for deletion")
+    teardown.add_argument("--purge-volumes", action="store_true", help="Also delete leftover volume claims")
+    teardown.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    deploy = commands.add_parser("deploy", help="Deploy a recipe tier by tier, waiting for each tier to be ready")
+    deploy.add_argument("recipe", type=int, help="Recipe id")
+    deploy.add_argument("--plan", action="store_true", help="Only show the dependency levels")
+    deploy.add_argument("--timeout", type=int, default=300, help="Seconds to wait for each tier")
+    deploy.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    metrics = commands.add_parser("metrics", help="Record and query node/pod/container usage history")
+    metrics.add_argument("action", choices=("record", "list", "query", "export"))
+    metrics.add_argument("pattern", nargs="?", default="*", help="Series glob, e.g. 'pod/myapp/*/cpu_m'")
+    metrics.add_argument("--interval", type=float, default=15.0, help="Seconds between samples (record)")
+    metrics.add_argument("--duration", help="Stop recording after e.g. 30m (default: Ctrl+C)")
+    metrics.add_argument("--since", default="1h", help="Query window, e.g. 15m, 6h, 2d")
+    metrics.add_argument("--resolution", type=int, help="Force a tier: 15, 60 or 600 seconds")
+    metrics.add_argument("--format", choices=("csv", "json"), default="csv", help="Export format")
+    metrics.add_argument("-n", "--namespace", help="Only record this namespace")
+
+    top = commands.add_parser("top", help="Live dashboard of node/pod CPU, memory, status and restarts")
+    top.add_argument("--interval", type=float, default=2.0, help="Seconds between refreshes")
+    top.add_argument("--sort", choices=tuple(ClusterDashboard.SORT_KEYS), default="cpu", help="Sort pods by")
+    top.add_argument("--no-group", action="store_true", help="Do not group pods by recipe")
+    top.add_argument("-n", "--namespace", help="Only this namespace")
+    top.add_argument("--once", action="store_true", help="Print one frame and exit")
+
+    api = commands.add_parser("api", help="Talk to the API server directly (get, list, watch, apply, delete)")
+    api.add_argument("verb", choices=("get", "list", "watch", "apply", "delete"))
+    api.add_argument("kind", nargs="?", help="Resource kind, e.g. pods, deployment, svc")
+    api.add_argument("name", nargs="?", help="Object name (get, delete)")
+    api.add_argument("-n", "--namespace", help="Namespace (list/watch default: all namespaces)")
+    api.add_argument("-l", "--selector", help="Label selector (list, watch)")
+    api.add_argument("-f", "--filename", help="Manifest to apply")
+    api.add_argument("--timeout", type=int, default=60, help="Seconds to keep a watch open")
+    api.add_argument("--json", action="store_true", help="Print full objects as JSON")
+
+    health = commands.add_parser("health", help="Probe recipe endpoints concurrently and show latency")
+    health.add_argument("--recipes", help="Comma-separated recipe ids (default: deployed recipes)")
+    health.add_argument("--target", action="append", default=[],
+                        help="Extra endpoint, e.g. tcp://127.0.0.1:6379 or http://127.0.0.1:8080/")
+    health.add_argument("--host", default="127.0.0.1",
+                        help="Host the recipe ports are forwarded to (with --no-forward)")
+    health.add_argument("--no-forward", action="store_true",
+                        help="Probe the recipes' local ports (your own port-forwards) instead of forwarding "
+                             "each Service; ports shared by several recipes are not probed")
+    health.add_argument("--interval", type=float, default=5.0, help="Seconds between probe rounds")
+    health.add_argument("--rounds", type=int, help="Stop after this many rounds (default: Ctrl+C)")
+    health.add_argument("--timeout", type=float, default=2.0, help="Per-probe deadline in seconds")
+    health.add_argument("--json", action="store_true", help="Print the final summary as JSON")
+
+    experiment = commands.add_parser("experiment", help="Autoscaling experiment: load profile vs. replicas and latency")
+    experiment.add_argument("recipe", nargs="?", default="9", help="Recipe id with an HPA (default: 9, load testing)")
+    experiment.add_argument("--load", choices=LoadProfile.SHAPES, default="step", help="Load profile shape")
+    experiment.add_argument("--duration", default="5m", help="Experiment length (e.g. 300, 5m)")
+    experiment.add_argument("--base-rps", type=float, default=5.0, help="Request rate before/after the load")
+    experiment.add_argument("--peak-rps", type=float, default=50.0, help="Peak request rate")
+    experiment.add_argument("--url", help="Load target (default: the recipe's local port-forward)")
+    experiment.add_argument("--namespace", default="default", help="Namespace the recipe is deployed in")
+    experiment.add_argument("--cpu-target", type=int, help="Override the HPA CPU utilization target (%%)")
+    experiment.add_argument("--min", type=int, dest="min_replicas", help="Override the HPA minReplicas")
+    experiment.add_argument("--max", type=int, dest="max_replicas", help="Override the HPA maxReplicas")
+    experiment.add_argument("--schedule", help="Replace the HPA with fixed replicas over time, e.g. 0:1,1m:3,4m:1")
+    experiment.add_argument("--interval", type=float, default=2.0, help="Seconds between cluster samples")
+    experiment.add_argument("--slo-p95", type=float, default=250.0, help="p95 latency SLO in ms")
+    experiment.add_argument("--slo-errors", type=float, default=1.0, help="Error rate SLO in percent")
+    experiment.add_argument("--json", action="store_true", help="Print the report as JSON")
+    journal = commands.add_parser("journal", help="Query the history of every command the tool has run")
+    journal.add_argument("action", nargs="?", choices=("query", "compact"), default="query")
+    journal.add_argument("--since", default="7d", help="Only entries newer than this, e.g. 1h, 7d")
+    journal.add_argument("--command", dest="command_glob", help="Command glob, e.g. 'kubectl apply*' or 'minikube *'")
+    journal.add_argument("--section", help="Section glob, e.g. '*Recipes*' or 'cli deploy'")
+    journal.add_argument("--recipe", help="Only entries for this recipe id")
+    journal.add_argument("--failed", action="store_true", help="Only commands that failed")
+    journal.add_argument("--slowest", action="store_true", help="Sort by duration, longest first")
+    journal.add_argument("--limit", type=int, default=50, help="Maximum rows to show")
+    journal.add_argument("--json", action="store_true", help="Print the rows as JSON")
+    build = commands.add_parser("build", help="Build changed Dockerfile/compose images in parallel and load them into the node")
+    build.add_argument("path", nargs="?", type=Path, default=Path("."), help="Directory to search (default: .)")
+    build.add_argument("-f", "--compose", type=Path, action="append", help="Compose file(s) (default: found under path)")
+    build.add_argument("--deliver", choices=("auto", "load", "registry"), default="auto",
+                       help="minikube image load, registry addon push, or pick per image (default)")
+    build.add_argument("--registry", default="localhost:5000", help="Registry addon address on the host")
+    build.add_argument("--jobs", type=int, default=4, help="Parallel builds")
+    build.add_argument("--tag", default="latest", help="Extra local tag (the content-hash tag is what gets delivered)")
+    build.add_argument("--force", action="store_true", help="Rebuild even unchanged contexts")
+    build.add_argument("--dry-run", action="store_true", help="Only report which contexts changed")
+    build.add_argument("--json", action="store_true", help="Print the report as JSON")
+    content = commands.add_parser("content", help="Build, list or show the section content packs")
+    content.add_argument("action", choices=("build", "list", "show"))
+    content.add_argument("name", nargs="?", help="Section to show")
+    content.add_argument("--source", type=Path, help="Directory of <section>.txt sources (default: bundled content/)")
+    content.add_argument("--output", type=Path, help="Pack file to write (default: content/sections.pack)")
+    addons = commands.add_parser("addons", help="List, enable or disable add-ons concurrently and wait for their pods")
+    addons.add_argument("action", choices=("list", "enable", "disable"))
+    addons.add_argument("names", nargs="*", help="Add-ons (default for enable/disable: "
+                                                  f"{', '.join(AddonManager.STANDARD)})")
+    addons.add_argument("--jobs", type=int, default=3, help="Add-ons changed at the same time")
+    addons.add_argument("--timeout", type=float, default=300, help="Seconds to wait for each add-on's pods")
+    addons.add_argument("--refresh", action="store_true", help="Re-list add-ons instead of using the cache")
+    addons.add_argument("--json", action="store_true", help="Print the result as JSON")
+    bench = commands.add_parser("bench", help="Benchmark a Redis/PostgreSQL recipe or a raw TCP echo endpoint")
+    bench.add_argument("--recipe", type=int, help="Datastore recipe id (supplies mode, port and credentials)")
+    bench.add_argument("--mode", choices=DatastoreBenchmark.MODES, help="Protocol (default: from the recipe)")
+    bench.add_argument("--host", default="127.0.0.1", help="Target host (default: the local port-forward)")
+    bench.add_argument("--port", type=int, help="Target port (default: the recipe's local port)")
+    bench.add_argument("-c", "--connections", type=int, default=8, help="Concurrent connections")
+    bench.add_argument("-P", "--pipeline", type=int, default=1, help="Operations in flight per connection")
+    bench.add_argument("--duration", default="10s", help="Measured time per value size, e.g. 30s")
+    bench.add_argument("--warmup", default="1s", help="Unmeasured time before each phase")
+    bench.add_argument("--sizes", default="64", help="Comma-separated value sizes in bytes, one phase each")
+    bench.add_argument("--get-ratio", type=float, default=0.8, help="Share of reads in the GET/SET mix")
+    bench.add_argument("--keyspace", type=int, default=10000, help="Distinct keys (pre-filled before each phase)")
+    bench.add_argument("--query", help="PostgreSQL: run this query instead of the key/value mix")
+    bench.add_argument("--user", help="PostgreSQL user")
+    bench.add_argument("--password", help="Redis/PostgreSQL password")
+    bench.add_argument("--database", help="PostgreSQL database")
+    bench.add_argument("--keep", action="store_true", help="Leave the benchmark keys/table in place")
+    bench.add_argument("--json", action="store_true", help="Print the report as JSON")
+    manifests = commands.add_parser("manifests", help="Look up documents in example and generated manifests via the parse cache")
+    manifests.add_argument("paths", nargs="*", type=Path, help="Files or directories (default: examples/ and the tutorial dir)")
+    manifests.add_argument("--kind", help="Document kind (case-insensitive)")
+    manifests.add_argument("--name", help="metadata.name")
+    manifests.add_argument("-l", "--label", action="append", default=[], help="key=value label (repeatable)")
+    manifests.add_argument("--stats", action="store_true", help="Print cache statistics after the lookup")
+    manifests.add_argument("--json", action="store_true", help="Print matching documents as JSON")
+    traces = commands.add_parser("traces", help="Receive OTLP/HTTP JSON spans and summarize latency")
+    traces.add_argument("--host", default="127.0.0.1", help="Listen address")
+    traces.add_argument("--port", type=int, default=4318, help="Listen port")
+    traces.add_argument("--demo", type=int, default=0, help="Send this many synthetic traces on startup")
+    traces.add_argument("--duration", type=float, help="Stop after this many seconds (default: Ctrl+C)")
+    traces.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return parser
+
+
 def main():
     """Entry point"""
-    tutorial = MinikubeTutorial()
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.replay or args.stub:
+        backend = CommandBackend("replay" if args.replay else "stub", args.replay or args.stub, args.replay_scale)
+    else:
+        backend = CommandBackend(session_file=args.record)
+    if args.record or args.replay or args.stub:
+        started = time.perf_counter()
+
+        def report_session():
+            backend.close()
+            stats = backend.stats()
+            wall_ms = (time.perf_counter() - started) * 1000
+            # With instant replay or stubs every remaining millisecond is the tool's own overhead
+            instant = args.stub or (args.replay and args.replay_scale == 0)
+            logger.info(f"Command backend ({stats['mode']}): {stats['calls']} command(s), {stats['misses']} "
+                        f"unmatched, {stats['command_ms']:.0f}ms recorded command time, {wall_ms:.0f}ms wall"
+                        + (" (all tool overhead)" if instant else ""))
+        atexit.register(report_session)
+    tutorial = MinikubeTutorial(profile=args.profile, backend=backend)
+    if args.command:
+        tutorial.section = f"cli {args.command}"
+
+    if args.command == "fanout":
+        profiles = tutorial._list_profiles() if args.profiles == "all" else \
+            [p.strip() for p in args.profiles.split(",") if p.strip()]
+        recipes = tutorial._select_recipes(tutorial._load_recipes(), args.recipes)
+        report = tutorial.fanout(args.action, profiles, recipes, args.limit)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            ProfileFanout.print_report(report)
+        sys.exit(0 if report["ok"] else 1)
+
+    if args.command == "logs":
+        if args.selector:
+            LogAggregator([(args.namespace, args.selector)], profile=tutorial.profile,
+                          tail=args.tail, backend=tutorial.backend).follow(args.duration)
+            sys.exit(0)
+        recipe = tutorial._find_recipe(args.recipe)
+        if not recipe:
+            print(f"{Colors.FAIL}Specify --recipe <id> or --selector{Colors.ENDC}")
+            sys.exit(2)
+        sys.exit(0 if tutorial.follow_recipe_logs(recipe, args.duration) else 1)
+
+    if args.command == "analyze":
+        analyzer = LogAnalyzer([f.strip() for f in args.group_by.split(",") if f.strip()], args.where,
+                               window=args.window, horizon=args.horizon)
+        if args.recipe:
+            recipe = tutorial._find_recipe(args.recipe)
+            if not recipe:
+                print(f"{Colors.FAIL}Unknown recipe: {args.recipe}{Colors.ENDC}")
+                sys.exit(2)
+            tutorial.analyze_recipe_logs(recipe, analyzer)
+            sys.exit(0)
+        for name in args.files or ["-"]:
+            if name == "-":
+                analyzer.consume(sys.stdin)
+            else:
+                with open(name, errors="replace") as f:
+                    analyzer.consume(f)
+        if args.json:
+            print(json.dumps(analyzer.summary(), indent=2))
+        else:
+            LogAnalyzer.print_summary(analyzer.summary())
+        sys.exit(0)
+
+    if args.command == "detect":
+        report = SystemCheck(profile=tutorial.profile, backend=tutorial.backend).run(quick=args.quick)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            SystemCheck.print_report(report)
+        sys.exit(0 if report["ok"] or not args.strict else 1)
+
+    if args.command == "advise":
+        recipes = tutorial._select_recipes(tutorial._load_recipes(), args.recipes) if args.recipes else []
+        advice = StartAdvisor().advise(recipes, driver=args.driver, runtime=args.container_runtime)
+        if args.json:
+            print(json.dumps(advice, indent=2))
+        else:
+            StartAdvisor.print_advice(advice)
+        sys.exit(0)
+
+    if args.command == "setup":
+        engine = SetupEngine(Path(__file__).resolve().parent, backend=tutorial.backend)
+        if args.reset:
+            engine.reset()
+            print(f"{Colors.OKGREEN}✓ Setup state reset{Colors.ENDC}")
+            sys.exit(0)
+        if args.status:
+            marks = {"done": f"{Colors.OKGREEN}✓", "stale": f"{Colors.WARNING}↻", "pending": f"{Colors.FAIL}✗"}
+            for name, status in engine.status().items():
+                print(f"  {marks[status]} {name}{Colors.ENDC} ({status})")
+            sys.exit(0)
+        report = engine.run(force=tuple(args.force))
+        SetupEngine.print_report(report)
+        sys.exit(0 if report["ok"] else 1)
+
+    if args.command == "search":
+        query = " ".join(args.query)
+        index = tutorial.search_index()
+        started = time.perf_counter()
+        results = index.search(query, args.limit)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            tutorial._print_search_results(query, results, (time.perf_counter() - started) * 1e6)
+        sys.exit(0)
+
+    if args.command == "prefetch":
+        recipes = tutorial._select_recipes(tutorial._load_recipes(), args.recipes)
+        report = tutorial.prefetch_images(recipes, args.workers)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            ImagePrefetcher.print_report(report)
+        sys.exit(0 if report["ok"] else 1)
+
+    if args.command == "teardown":
+        if not (args.recipes or args.category or args.all):
+            parser.error("teardown needs --recipes, --category or --all")
+        recipes = tutorial._load_recipes()
+        if not args.all:
+            recipes = BulkTeardown.select(tutorial._select_recipes(recipes, args.recipes or "all"),
+                                          category=args.category)
+        report = tutorial.teardown(recipes, args.all, args.timeout, args.purge_volumes)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            BulkTeardown.print_report(report)
+        sys.exit(0 if report["ok"] and not report["remaining"] else 1)
+
+    if args.command == "deploy":
+        recipe = tutorial._find_recipe(args.recipe)
+        if not recipe:
+            parser.error(f"unknown recipe {args.recipe}")
+        plan = tutorial.deploy_plan(recipe)
+        if not plan:
+            parser.error(f"could not parse {recipe['yaml']}")
+        if args.plan:
+            TieredDeploy.print_plan(plan)
+            sys.exit(0)
+        report = TieredDeploy(tutorial.run_command, timeout=args.timeout,
+                              client=tutorial.kube()).run(plan, recipe_labels(recipe))
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            TieredDeploy.print_report(report)
+        sys.exit(0 if report["ok"] else 1)
+
+    if args.command == "metrics":
+        store = tutorial.metrics_store()
+        if not store:
+            sys.exit(1)
+        try:
+            if args.action == "record":
+                sampler = MetricsSampler(store, lambda: tutorial.dashboard_data(args.namespace))
+                print(f"{Colors.OKCYAN}Recording every {args.interval:g}s to {store.path} (Ctrl+C to stop){Colors.ENDC}")
+                sampler.run(max(1.0, args.interval), parse_duration(args.duration) if args.duration else None)
+                print(f"{Colors.OKGREEN}✓ {sampler.samples} sample(s), {len(store.series())} series, "
+                      f"{store.used_bytes() / 1048576:.1f}MB{Colors.ENDC}")
+                sys.exit(0)
+            keys = store.series(args.pattern)
+            end = time.time()
+            start = end - parse_duration(args.since)
+            if args.action == "list":
+                for key in keys:
+                    print(key)
+            elif args.action == "export":
+                sys.stdout.write(store.export(keys, start, end, args.format, args.resolution))
+            else:
+                for key in keys:
+                    resolution, points = store.query(key, start, end, args.resolution)
+                    if points:
+                        values = [v for _, v in points]
+                        print(f"{key:60s} {resolution:4d}s  n={len(values):4d}  min={min(values):9.1f}  "
+                              f"avg={sum(values) / len(values):9.1f}  max={max(values):9.1f}  last={values[-1]:9.1f}")
+        except ValueError as e:
+            parser.error(str(e))
+        sys.exit(0)
+
+    if args.command == "top":
+        tutorial.dashboard(max(0.5, args.interval), args.sort, not args.no_group, args.namespace, args.once)
+        sys.exit(0)
+
+    if args.command == "api":
+        client = tutorial.kube()
+        if not client:
+            print(f"{Colors.FAIL}No reachable API server in the kubeconfig; use kubectl instead{Colors.ENDC}")
+            sys.exit(1)
+        if args.verb != "apply" and not args.kind:
+            parser.error(f"api {args.verb} needs a kind")
+        if args.verb in ("get", "delete") and not args.name:
+            parser.error(f"api {args.verb} needs a name")
+        if args.verb == "apply" and not args.filename:
+            parser.error("api apply needs -f FILE")
+        started = time.perf_counter()
+        try:
+            if args.verb == "get":
+                items = [client.get(args.kind, args.name, args.namespace)]
+            elif args.verb == "list":
+                items = client.list(args.kind, args.namespace, args.selector)
+            elif args.verb == "delete":
+                found = client.delete(args.kind, args.name, args.namespace)
+                print(f"{args.kind}/{args.name} {'deleted' if found else 'not found'}")
+                items = []
+            elif args.verb == "apply":
+                items = []
+                for doc in load_manifest(args.filename):
+                    client.apply(doc)
+                    print(f"{doc['kind'].lower()}/{doc['metadata']['name']} applied")
+            else:
+                items = []
+                try:
+                    for event in client.watch(args.kind, args.namespace, args.selector, timeout=args.timeout):
+                        meta = (event.get("object") or {}).get("metadata") or {}
+                        print(json.dumps(event) if args.json else
+                              f"{event.get('type', ''):10s} {meta.get('namespace') or '':20s} {meta.get('name')}")
+                except KeyboardInterrupt:
+                    pass
+        except (KubeAPIError, OSError, ValueError, http.client.HTTPException) as e:
+            print(f"{Colors.FAIL}{e}{Colors.ENDC}")
+            sys.exit(1)
+        if args.json and args.verb in ("get", "list"):
+            print(json.dumps(items if args.verb == "list" else items[0], indent=2))
+        elif items:
+            print(f"{'NAMESPACE':20s} {'KIND':22s} NAME")
+            for item in items:
+                meta = item.get("metadata") or {}
+                print(f"{meta.get('namespace') or '':20s} {item.get('kind', ''):22s} {meta.get('name')}")
+        logger.info(f"api {args.verb}: {(time.perf_counter() - started) * 1000:.1f}ms, "
+                    f"{client.requests} request(s)")
+        sys.exit(0)
+
+    if args.command == "health":
+        recipes = tutorial._select_recipes(tutorial._load_recipes(), args.recipes) if args.recipes \
+            else ([] if args.target else tutorial.deployed_recipes())
+        try:
+            targets = HealthProber.targets_for(recipes, args.host) + [HealthProber.parse_target(t)
+                                                                      for t in args.target]
+        except ValueError as e:
+            parser.error(str(e))
+        if not targets:
+            parser.error("no endpoints to probe: deploy a recipe or pass --recipes/--target")
+        summary = tutorial.watch_health(targets, args.interval, args.rounds, args.timeout, live=not args.json,
+                                        forward=not args.no_forward)
+        if args.json:
+            print(json.dumps(summary, indent=2))
+        sys.exit(0 if summary["total"] and summary["up"] == summary["total"] else 1)
+
+    if args.command == "experiment":
+        recipe = tutorial._find_recipe(args.recipe)
+        if not recipe:
+            parser.error(f"unknown recipe '{args.recipe}'")
+        try:
+            profile = LoadProfile(args.load, args.base_rps, args.peak_rps, parse_duration(args.duration))
+            schedule = parse_schedule(args.schedule) if args.schedule else None
+            report = tutorial.autoscale_experiment(recipe, profile, args.url, args.cpu_target, args.min_replicas,
+                                                   args.max_replicas, schedule, args.namespace, args.interval,
+                                                   args.slo_p95, args.slo_errors)
+        except (OSError, ValueError, RuntimeError) as e:
+            parser.error(str(e))
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            AutoscaleExperiment.print_report(report)
+            print(f"Timeline: {', '.join(report['files'])}")
+        sys.exit(0 if not report["slo"]["violating_seconds"] else 1)
+
+    if args.command == "journal":
+        journal = tutorial.journal or SessionJournal(tutorial.tutorial_dir / "journal")
+        if args.action == "compact":
+            print(json.dumps(journal.compact()))
+            sys.exit(0)
+        try:
+            since = time.time() - parse_duration(args.since)
+        except ValueError as e:
+            parser.error(str(e))
+        started = time.perf_counter()
+        rows = journal.query(since=since, command=args.command_glob, section=args.section, recipe=args.recipe,
+                             failed=True if args.failed else None, sort="duration" if args.slowest else "recent",
+                             limit=args.limit)
+        if args.json:
+            print(json.dumps(rows, indent=2))
+        else:
+            SessionJournal.print_rows(rows)
+            scanned, total = journal.last_scan
+            print(f"\n{len(rows)} row(s), {scanned}/{total} segment(s) scanned in "
+                  f"{(time.perf_counter() - started) * 1000:.1f}ms")
+        sys.exit(0)
+
+    if args.command == "build":
+        try:
+            report = tutorial.build_images(args.path, args.compose, args.deliver, args.registry, args.jobs,
+                                           args.tag, args.force, args.dry_run)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            ImageBuilder.print_report(report)
+        sys.exit(0 if report["ok"] else 1)
+
+    if args.command == "content":
+        if args.action == "build":
+            source = args.source or MinikubeTutorial.CONTENT_DIR
+            output = args.output or (source / "sections.pack")
+            print(json.dumps(ContentPack.build(source, output)))
+            sys.exit(0)
+        pack = tutorial.content_pack()
+        if args.action == "list":
+            for name, entry in sorted(pack.sections.items()):
+                print(f"{name:20s} {entry['title']:35s} {len(entry['blocks']):3d} block(s) "
+                      f"{entry['raw_size']:>7d} -> {entry['size']:>6d} bytes  {entry['content_version']}  {entry['path']}")
+            sys.exit(0)
+        if not args.name or args.name not in pack.sections:
+            parser.error(f"unknown section '{args.name}' (see 'content list')")
+        print(pack.render_section(args.name))
+        sys.exit(0)
+
+    if args.command == "addons":
+        manager = tutorial.addon_manager(args.jobs, args.timeout)
+        if args.action == "list":
+            state = manager.status(args.refresh)
+            if args.json:
+                print(json.dumps(state, indent=2))
+            else:
+                AddonManager.print_status(state)
+            sys.exit(0 if state else 1)
+        try:
+            report = manager.apply(args.names or list(AddonManager.STANDARD), args.action == "enable", args.refresh)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            AddonManager.print_report(report)
+        sys.exit(0 if report["ok"] else 1)
+
+    if args.command == "bench":
+        recipe = tutorial._find_recipe(args.recipe) if args.recipe else None
+        if args.recipe and not recipe:
+            parser.error(f"unknown recipe {args.recipe}")
+        options = {k: v for k, v in (("user", args.user), ("password", args.password), ("database", args.database))
+                   if v}
+        try:
+            report = tutorial.benchmark_datastore(
+                recipe, args.mode, args.host, args.port, connections=args.connections, pipeline=args.pipeline,
+                duration=parse_duration(args.duration), warmup=parse_duration(args.warmup),
+                value_sizes=[int(x) for x in args.sizes.split(",")], get_ratio=args.get_ratio,
+                keyspace=args.keyspace, query=args.query, keep=args.keep, **options)
+        except ValueError as e:
+            parser.error(str(e))
+        except (OSError, BenchmarkError, asyncio.TimeoutError) as e:
+            print(f"{Colors.FAIL}Benchmark failed: {e}{Colors.ENDC}", file=sys.stderr)
+            sys.exit(1)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            DatastoreBenchmark.print_report(report)
+        sys.exit(0 if report["ok"] else 1)
+
+    if args.command == "manifests":
+        labels = {}
+        for label in args.label:
+            key, sep, value = label.partition("=")
+            if not sep:
+                parser.error(f"label '{label}' is not key=value")
+            labels[key] = value
+        files = []
+        for root in args.paths or [Path(__file__).parent / "examples", tutorial.tutorial_dir]:
+            files += [root] if root.is_file() else sorted(p for p in root.rglob("*.y*ml") if p.is_file())
+        found = MANIFEST_CACHE.find(files, args.kind, args.name, labels)
+        if args.json:
+            print(json.dumps([doc for _, doc in found], indent=2))
+        else:
+            for path, doc in found:
+                meta = doc.get("metadata") or {}
+                print(f"{doc.get('kind', ''):24s} {meta.get('namespace', '') or '-':12s} {meta.get('name', ''):32s} {path}")
+            print(f"{len(found)} document(s) in {len(files)} file(s)")
+        if args.stats:
+            print(json.dumps(MANIFEST_CACHE.stats()))
+        sys.exit(0)
+
+    if args.command == "traces":
+        store = SpanStore()
+        collector = TraceCollector(store, host=args.host, port=args.port)
+        collector.start()
+        if args.demo:
+            generate_demo_traces(f"http://127.0.0.1:{collector.port}/v1/traces", args.demo)
+        try:
+            time.sleep(args.duration if args.duration is not None else 10 ** 9)
+        except KeyboardInterrupt:
+            pass
+        collector.stop()
+        report = store.latency_report()
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            SpanStore.print_report(report)
+        sys.exit(0)
+
     try:
         tutorial.run()
     except KeyboardInterrupt:
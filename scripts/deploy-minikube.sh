@@ -195,95 +195,64 @@ check_requirements() {
     fi
 }
 
-# Recommend driver based on system
-recommend_driver() {
-    print_section "Driver Recommendation"
+# Recommendation from the Python advisor, so this script and 'minikube_tutorial.py advise' agree
+ADVISOR="$SCRIPT_DIR/../minikube_tutorial.py"
 
-    local recommended_driver=""
-    local driver_options=()
+ADVICE=""
 
-    case "$DETECTED_OS" in
-        macOS)
-            print_info "macOS detected"
-            recommended_driver="docker"
-            driver_options=("docker" "virtualbox" "hyperkit")
+# Ask the advisor once (args go to 'advise'); the fields below all come from the same answer
+get_advice() {
+    command_exists python3 || return 1
+    ADVICE=$(python3 "$ADVISOR" advise --json "$@" 2>/dev/null)
+}
 
-            if [[ "$DETECTED_ARCH" == "arm64" ]]; then
-                print_success "Apple Silicon detected - optimized for Docker Desktop"
-                recommended_driver="docker"
-            else
-                print_info "Intel Mac detected"
-            fi
-            ;;
-        Linux)
-            print_info "Linux detected"
-
-            if [[ "$DETECTED_ARCH" == "arm64" ]]; then
-                print_info "ARM64 Linux detected"
-                recommended_driver="docker"
-                driver_options=("docker" "kvm2")
-            else
-                print_info "x86_64 Linux detected"
-                recommended_driver="kvm2"
-                driver_options=("kvm2" "docker" "virtualbox")
-            fi
-            ;;
-    esac
+# Print one field of the advice (list fields one item per line)
+advice_field() {
+    printf '%s' "$ADVICE" | python3 -c '
+import json, sys
+value = json.load(sys.stdin)[sys.argv[1]]
+print("\n".join(value) if isinstance(value, list) else value)' "$1" 2>/dev/null
+}
 
-    echo
-    echo -e "${CYAN}Recommended Driver: ${GREEN}$recommended_driver${NC}"
-    echo -e "${CYAN}Available Options: ${GREEN}${driver_options[@]}${NC}"
+# Recommend driver and start flags based on system
+recommend_driver() {
+    print_section "Driver Recommendation"
+
+    if ! get_advice "$@"; then
+        print_error "Could not get a recommendation from $ADVISOR (needs python3)"
+        return 1
+    fi
+
+    echo -e "${CYAN}Recommended Driver: ${GREEN}$(advice_field driver)${NC}"
+    echo -e "${CYAN}Recommended Start: ${GREEN}$(advice_field command)${NC}"
+    advice_field warnings | while read -r warning; do
+        [ -n "$warning" ] && print_warning "$warning"
+    done
     echo
 }
 
-# Deploy Minikube with optimal settings
+# Deploy Minikube with the advisor's settings
 deploy_minikube() {
     print_section "Deploying Minikube"
 
-    # Get user's driver choice
-    echo "Available drivers for your system:"
-
-    case "$DETECTED_OS" in
-        macOS)
-            echo "  1. docker (recommended)"
-            echo "  2. virtualbox"
-            echo "  3. hyperkit"
-            ;;
-        Linux)
-            if [[ "$DETECTED_ARCH" == "arm64" ]]; then
-                echo "  1. docker (recommended)"
-                echo "  2. kvm2"
-            else
-                echo "  1. kvm2 (recommended)"
-                echo "  2. docker"
-                echo "  3. virtualbox"
-            fi
-            ;;
-    esac
-
-    read -p "Select driver (1-3): " driver_choice
-
-    local driver=""
-    case "$driver_choice" in
-        1) driver="docker" ;;
-        2) driver="virtualbox" ;;
-        3) driver="hyperkit" ;;
-        *)
-            print_error "Invalid choice"
-            return 1
-            ;;
-    esac
-
-    # Calculate optimal resources
-    local cpus=$CPU_COUNT
-    local memory=$((MEMORY_GB / 2))  # Use half of available memory
+    local recipes driver
+    read -p "Recipe ids you plan to run (comma-separated, 'all', or Enter for none): " recipes
+    local args=(--recipes "$recipes")
+    if ! get_advice "${args[@]}"; then
+        print_error "Could not get a recommendation from $ADVISOR (needs python3)"
+        return 1
+    fi
+    read -p "Driver (Enter for $(advice_field driver)): " driver
+    if [ -n "$driver" ]; then args+=(--driver "$driver"); fi
 
-    # Ensure minimum resources
-    if [ "$cpus" -lt 2 ]; then cpus=2; fi
-    if [ "$memory" -lt 2 ]; then memory=4; fi
-    if [ "$memory" -gt 8 ]; then memory=8; fi
+    recommend_driver "${args[@]}" || return 1
 
-    print_info "Configuring with: $cpus CPUs, ${memory}GB Memory"
+    # bash 3.2 (macOS) has no mapfile
+    local flags=()
+    local flag
+    while read -r flag; do
+        flags+=("$flag")
+    done < <(advice_field flags)
 
     # Stop existing cluster if running
     if minikube status >/dev/null 2>&1; then
@@ -291,32 +260,9 @@ deploy_minikube() {
         minikube stop || true
     fi
 
-    # Deploy based on architecture
-    print_info "Starting Minikube with $driver driver..."
+    print_info "Starting Minikube: minikube start ${flags[*]}"
 
-    if [[ "$DETECTED_ARCH" == "arm64" && "$driver" == "docker" ]]; then
-        print_info "ARM64 detected - using optimized settings"
-        minikube start \
-            --driver=$driver \
-            --cpus=$cpus \
-            --memory=${memory}gb \
-            --container-runtime=docker
-    elif [[ "$driver" == "kvm2" ]]; then
-        print_info "KVM2 driver - using optimized settings"
-        minikube start \
-            --driver=$driver \
-            --cpus=$cpus \
-            --memory=${memory}gb \
-            --disk-size=40gb
-    else
-        # Standard deployment
-        minikube start \
-            --driver=$driver \
-            --cpus=$cpus \
-            --memory=${memory}gb
-    fi
-
-    if [ $? -eq 0 ]; then
+    if minikube start "${flags[@]}"; then
         print_success "Minikube deployed successfully!"
 
         echo
@@ -478,23 +424,31 @@ show_menu() {
 advanced_deployment() {
     print_section "Advanced Deployment Options"
 
+    # Defaults are the advisor's recommendation
+    local default_cpus default_memory default_disk default_driver
+    get_advice || true
+    default_cpus=$(advice_field cpus) || default_cpus=$CPU_COUNT
+    default_memory=$(advice_field memory_mb) || default_memory=$((MEMORY_GB * 1024))
+    default_disk=$(advice_field disk_gb) || default_disk=40
+    default_driver=$(advice_field driver) || default_driver=docker
+
     echo "Custom Configuration:"
-    read -p "CPU cores (current: $CPU_COUNT): " custom_cpus
-    custom_cpus=${custom_cpus:-$CPU_COUNT}
+    read -p "CPU cores (recommended: $default_cpus): " custom_cpus
+    custom_cpus=${custom_cpus:-$default_cpus}
 
-    read -p "Memory in GB (current: $MEMORY_GB): " custom_memory
-    custom_memory=${custom_memory:-$MEMORY_GB}
+    read -p "Memory in MB (recommended: $default_memory): " custom_memory
+    custom_memory=${custom_memory:-$default_memory}
 
-    read -p "Disk size in GB (default: 40): " custom_disk
-    custom_disk=${custom_disk:-40}
+    read -p "Disk size in GB (recommended: $default_disk): " custom_disk
+    custom_disk=${custom_disk:-$default_disk}
 
-    read -p "Driver (docker/kvm2/virtualbox): " custom_driver
-    custom_driver=${custom_driver:-docker}
+    read -p "Driver (recommended: $default_driver): " custom_driver
+    custom_driver=${custom_driver:-$default_driver}
 
     echo
     print_info "Deploying with custom settings:"
     echo "  CPUs: $custom_cpus"
-    echo "  Memory: ${custom_memory}GB"
+    echo "  Memory: ${custom_memory}MB"
     echo "  Disk: ${custom_disk}GB"
     echo "  Driver: $custom_driver"
     echo
@@ -506,8 +460,8 @@ advanced_deployment() {
         minikube start \
             --driver=$custom_driver \
             --cpus=$custom_cpus \
-            --memory=${custom_memory}gb \
-            --disk-size=${custom_disk}gb
+            --memory=${custom_memory} \
+            --disk-size=${custom_disk}g
 
         print_success "Minikube deployed!"
         minikube status
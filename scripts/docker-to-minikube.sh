@@ -170,6 +170,18 @@ build_docker_image() {
         return 0
     fi
 
+    # Every Dockerfile and compose build context at once, skipping unchanged ones
+    local tutorial="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)/minikube_tutorial.py"
+    if command_exists python3 && [ -f "$tutorial" ]; then
+        read -p "Build all images under $WORK_DIR in parallel (only changed ones)? (Y/n): " build_all
+        if [ "${build_all:-y}" != "n" ]; then
+            python3 "$tutorial" build "$WORK_DIR"
+            local status=$?
+            echo
+            return $status
+        fi
+    fi
+
     local dockerfile_dir=$(dirname "$DOCKER_FILE_FOUND")
     local app_name=$(basename "$dockerfile_dir")
 
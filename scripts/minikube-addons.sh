@@ -233,6 +233,18 @@ full_setup() {
 
     check_minikube_status
 
+    # All add-ons at once, waiting for their pods (about as long as the slowest one)
+    local tutorial="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)/minikube_tutorial.py"
+    if command -v python3 > /dev/null 2>&1 && [ -f "$tutorial" ]; then
+        if python3 "$tutorial" addons enable dashboard metallb registry metrics-server ingress; then
+            echo -e "\n${GREEN}✓ All add-ons setup complete!${NC}"
+            log_message "INFO" "Full add-ons setup completed (concurrent)"
+            return 0
+        fi
+        echo -e "${YELLOW}Concurrent setup did not finish cleanly; enabling one at a time...${NC}"
+        log_message "WARN" "Concurrent add-on setup failed, falling back to sequential"
+    fi
+
     echo -e "\n${YELLOW}1. Enabling Dashboard...${NC}"
     enable_dashboard && sleep 2
 
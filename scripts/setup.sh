@@ -104,100 +104,13 @@ check_python() {
     exit 1
 }
 
-# Step 2: Install uv
-install_uv() {
-    log_step "Setting up uv package manager..."
-
-    if get_step_status "uv_install" | grep -q "done"; then
-        log_skip "uv already installed"
-        return 0
-    fi
-
-    if command -v uv &> /dev/null; then
-        local uv_version=$(uv --version 2>&1 | awk '{print $2}')
-        log_success "uv ${uv_version} is already installed"
-        mark_step_done "uv_install"
-        return 0
-    fi
-
-    echo "Installing uv package manager..."
-
-    if command -v curl &> /dev/null; then
-        curl -LsSf https://astral.sh/uv/install.sh | sh
-        mark_step_done "uv_install"
-        log_success "uv installed successfully"
-    else
-        log_error "curl not found. Installing uv via pip..."
-        python3 -m pip install --user uv
-        mark_step_done "uv_install"
-        log_success "uv installed via pip"
-    fi
-
-    # Add uv to PATH for this session
-    if [ -d "$HOME/.local/bin" ]; then
-        export PATH="$HOME/.local/bin:$PATH"
-    fi
-}
-
-# Step 3: Create virtual environment
-create_venv() {
-    log_step "Creating virtual environment..."
-
-    if get_step_status "venv_create" | grep -q "done"; then
-        if [ -d "$VENV_DIR" ] && [ -f "$VENV_DIR/bin/activate" ]; then
-            log_skip "Virtual environment already exists"
-            return 0
-        else
-            log_info "Virtual environment marked as done but directory missing. Recreating..."
-        fi
-    fi
-
-    if [ -d "$VENV_DIR" ]; then
-        log_skip "Virtual environment already exists at ${VENV_DIR}"
-        mark_step_done "venv_create"
-        return 0
-    fi
-
-    echo "Creating virtual environment at ${VENV_DIR}..."
-
-    if command -v uv &> /dev/null; then
-        uv venv "$VENV_DIR" --python python3
-    else
-        python3 -m venv "$VENV_DIR"
-    fi
-
-    mark_step_done "venv_create"
-    log_success "Virtual environment created"
-}
-
-# Step 4: Install requirements
-install_requirements() {
-    log_step "Installing Python dependencies..."
-
-    if get_step_status "requirements_install" | grep -q "done"; then
-        log_skip "Dependencies already installed"
-        return 0
-    fi
-
-    if [ ! -f "$PROJECT_DIR/requirements.txt" ]; then
-        log_info "No requirements.txt found. Skipping..."
-        mark_step_done "requirements_install"
-        return 0
-    fi
-
-    # Source the activate script
-    source "$VENV_DIR/bin/activate"
-
-    echo "Installing dependencies from requirements.txt..."
-
-    if command -v uv &> /dev/null; then
-        uv pip install -r "$PROJECT_DIR/requirements.txt"
-    else
-        pip install -r "$PROJECT_DIR/requirements.txt"
-    fi
-
-    mark_step_done "requirements_install"
-    log_success "Dependencies installed"
+# Steps 2-4: uv, virtual environment and requirements run through the
+# Python setup engine, which runs independent steps concurrently, re-runs
+# steps whose inputs changed (e.g. requirements.txt) and records each
+# step's hash and duration in .setup_state.
+run_setup_engine() {
+    log_step "Running setup steps (uv, virtual environment, dependencies)..."
+    python3 "$PROJECT_DIR/minikube_tutorial.py" setup
 }
 
 # Step 5: Show status
@@ -253,9 +166,7 @@ run_setup() {
 
     # Run setup steps
     check_python
-    install_uv
-    create_venv
-    install_requirements
+    run_setup_engine
 
     echo ""
     show_status
@@ -0,0 +1,105 @@
+import json
+import threading
+import time
+
+from minikube_tutorial import AddonManager
+
+READY = {"items": [{"status": {"phase": "Running", "containerStatuses": [{"ready": True}]}}]}
+STARTING = {"items": [{"status": {"phase": "Pending", "containerStatuses": [{"ready": False}]}}]}
+
+
+class FakeMinikube:
+    """Fake runner for 'minikube addons' and 'kubectl get pods' with call and concurrency counters"""
+
+    def __init__(self, addons, polls_until_ready=0, command_s=0.0, fail=None):
+        self.addons = dict(addons)
+        self.polls_until_ready = polls_until_ready
+        self.command_s = command_s
+        self.fail = fail
+        self.calls = []
+        self.polls = {}
+        self.running = self.most_running = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, cmd, description="", profile=None, timeout=30):
+        self.calls.append(cmd)
+        if cmd[:3] == ["minikube", "addons", "list"]:
+            return True, json.dumps({name: {"Status": state} for name, state in self.addons.items()})
+        if cmd[:2] == ["minikube", "addons"]:
+            with self.lock:
+                self.running += 1
+                self.most_running = max(self.most_running, self.running)
+            time.sleep(self.command_s)
+            with self.lock:
+                self.running -= 1
+            if self.fail:
+                return False, self.fail
+            self.addons[cmd[3]] = "enabled" if cmd[2] == "enable" else "disabled"
+            return True, ""
+        if cmd[:3] == ["kubectl", "get", "pods"]:
+            selector = cmd[cmd.index("-l") + 1]
+            self.polls[selector] = self.polls.get(selector, 0) + 1
+            return True, json.dumps(READY if self.polls[selector] > self.polls_until_ready else STARTING)
+        return False, "unexpected"
+
+    def toggles(self):
+        return [cmd for cmd in self.calls if cmd[:2] == ["minikube", "addons"] and cmd[2] != "list"]
+
+
+def manager(fake, tmp_path, **kwargs):
+    return AddonManager(fake, tmp_path / "addons.json", interval=0, **dict({"timeout": 5}, **kwargs))
+
+
+def test_status_is_served_from_the_cache_until_the_ttl_expires(tmp_path, monkeypatch):
+    fake = FakeMinikube({"dashboard": "disabled"})
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    addons = manager(fake, tmp_path, ttl=60)
+    assert addons.status() == {"dashboard": "disabled"}
+    now[0] += 30
+    assert manager(fake, tmp_path, ttl=60).status() == {"dashboard": "disabled"}
+    assert len(fake.calls) == 1
+    now[0] += 31
+    addons.status()
+    assert len(fake.calls) == 2
+    addons.status(refresh=True)
+    assert len(fake.calls) == 3
+
+
+def test_addons_already_in_the_wanted_state_are_skipped(tmp_path):
+    fake = FakeMinikube({"dashboard": "enabled", "metrics-server": "disabled", "registry": "disabled"})
+    report = manager(fake, tmp_path).apply(["dashboard", "metrics-server"])
+    assert report["ok"] and report["unchanged"] == ["dashboard"]
+    assert fake.toggles() == [["minikube", "addons", "enable", "metrics-server"]]
+    # The result is recorded in the cache, so a second run lists nothing and toggles nothing
+    fake.calls.clear()
+    report = manager(fake, tmp_path).apply(["dashboard", "metrics-server"])
+    assert report["unchanged"] == ["dashboard", "metrics-server"] and not fake.calls
+
+
+def test_enable_waits_until_pods_are_ready(tmp_path):
+    fake = FakeMinikube({"metrics-server": "disabled"}, polls_until_ready=3)
+    result = manager(fake, tmp_path).apply(["metrics-server"])["results"][0]
+    assert result["ok"] and result["detail"] == "1 pod(s) ready"
+    assert fake.polls["k8s-app=metrics-server"] == 4
+
+
+def test_readiness_wait_times_out(tmp_path):
+    fake = FakeMinikube({"metrics-server": "disabled"}, polls_until_ready=10 ** 6)
+    result = manager(fake, tmp_path, timeout=0.05).apply(["metrics-server"])["results"][0]
+    assert not result["ok"] and result["ready_s"] is None and "not ready" in result["detail"]
+
+
+def test_addons_commands_on_one_profile_run_one_at_a_time(tmp_path):
+    fake = FakeMinikube({name: "disabled" for name in AddonManager.STANDARD}, command_s=0.02)
+    report = manager(fake, tmp_path, max_workers=5).apply(list(AddonManager.STANDARD))
+    assert report["ok"] and len(fake.toggles()) == len(AddonManager.STANDARD)
+    assert fake.most_running == 1
+
+
+def test_profile_lock_errors_are_reported(tmp_path):
+    fake = FakeMinikube({"registry": "disabled"}, fail=(
+        "X Exiting due to MK_ADDON_ENABLE: enable failed: unable to acquire lock for "
+        "/root/.minikube/profiles/minikube/config.json: timed out"))
+    result = manager(fake, tmp_path).apply(["registry"])["results"][0]
+    assert not result["ok"] and "locked by another minikube command" in result["detail"]
@@ -0,0 +1,95 @@
+import pytest
+
+from minikube_tutorial import AutoscaleExperiment, LoadProfile, MinikubeTutorial
+
+MANIFEST = """apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: web
+---
+apiVersion: autoscaling/v2
+kind: HorizontalPodAutoscaler
+metadata:
+  name: web-hpa
+spec:
+  scaleTargetRef:
+    kind: Deployment
+    name: web
+  minReplicas: 1
+  maxReplicas: 5
+  metrics:
+  - type: Resource
+    resource:
+      name: cpu
+      target:
+        type: Utilization
+        averageUtilization: 70
+"""
+
+LIVE = {"apiVersion": "autoscaling/v2", "kind": "HorizontalPodAutoscaler",
+        "metadata": {"name": "web-hpa", "namespace": "default", "resourceVersion": "42", "uid": "u",
+                     "annotations": {"kubectl.kubernetes.io/last-applied-configuration": "{}"}},
+        "spec": {"minReplicas": 2, "maxReplicas": 4}, "status": {"desiredReplicas": 2}}
+
+
+class FakeTutorial(MinikubeTutorial):
+    def __init__(self, tmp_path, live):
+        self.tutorial_dir = tmp_path
+        self.current_recipe = None
+        self.live = live
+        self.actions = []
+
+    def kube(self):
+        return None
+
+    def _get_object(self, kind, name, namespace):
+        return self.live
+
+    def _apply_doc(self, doc, description):
+        self.actions.append(("apply", doc["spec"]))
+        return True
+
+    def _delete_hpa(self, name, namespace, description):
+        self.actions.append(("delete", name))
+
+    def _poll_command(self, cmd, timeout=30):
+        return True, ""
+
+
+@pytest.fixture
+def recipe(tmp_path):
+    (tmp_path / "web.yaml").write_text(MANIFEST)
+    return {"id": 1, "name": "Web", "yaml": str(tmp_path / "web.yaml"), "ports": [{"local": 8080}]}
+
+
+@pytest.fixture
+def fail_run(monkeypatch):
+    def run(self):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(AutoscaleExperiment, "run", run)
+
+
+@pytest.mark.parametrize("options, first", [
+    ({"schedule": [(0, 3)]}, ("delete", "web-hpa")),
+    ({"cpu_target": 20, "max_replicas": 9}, ("apply", {"minReplicas": 1, "maxReplicas": 9})),
+])
+def test_original_hpa_is_restored_even_when_interrupted(tmp_path, recipe, fail_run, options, first):
+    tutorial = FakeTutorial(tmp_path, LIVE)
+    with pytest.raises(KeyboardInterrupt):
+        tutorial.autoscale_experiment(recipe, LoadProfile("step", 1, 2, 1), **options)
+    assert tutorial.actions[0][0] == first[0]
+    assert tutorial.actions[-1] == ("apply", LIVE["spec"])
+
+
+def test_experiment_hpa_is_removed_when_none_was_deployed(tmp_path, recipe, fail_run):
+    tutorial = FakeTutorial(tmp_path, None)
+    with pytest.raises(KeyboardInterrupt):
+        tutorial.autoscale_experiment(recipe, LoadProfile("step", 1, 2, 1), cpu_target=20)
+    assert [a[0] for a in tutorial.actions] == ["apply", "delete"]
+
+
+def test_initial_replicas_come_from_the_first_sample():
+    experiment = AutoscaleExperiment("http://127.0.0.1:1/", LoadProfile("step", 1, 2, 2), observe=dict)
+    experiment._samples = [{"t": 0.0, "desired": 1, "replicas": 1, "ready": 1},
+                           {"t": 0.5, "desired": 3, "replicas": 3, "ready": 1}]
+    assert experiment.report()["initial_replicas"] == 1
@@ -0,0 +1,56 @@
+import json
+
+from minikube_tutorial import BulkTeardown, ProfileFanout
+
+STATEFUL = {"id": 1, "name": "Stateful", "yaml": "stateful.yaml"}
+
+
+def write_manifest(tmp_path):
+    (tmp_path / "stateful.yaml").write_text("""apiVersion: v1
+kind: Namespace
+metadata:
+  name: shop
+---
+apiVersion: v1
+kind: PersistentVolumeClaim
+metadata:
+  name: data
+  namespace: shop
+""")
+
+
+def recorder(calls, claims=()):
+    def runner(cmd, description, profile=None, timeout=30):
+        calls.append(cmd)
+        if cmd[:3] == ["kubectl", "get", "persistentvolumeclaim"]:
+            return True, json.dumps({"items": list(claims)})
+        return True, ""
+    return runner
+
+
+def test_prune_keeps_claims_and_namespaces_unless_purging(tmp_path, monkeypatch):
+    write_manifest(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    kept = BulkTeardown(recorder([])).delete_command([STATEFUL], everything=True)[2].split(",")
+    assert "persistentvolumeclaim" not in kept and "namespace" not in kept
+    purged = BulkTeardown(recorder([])).delete_command([STATEFUL], everything=True, purge_volumes=True)[2].split(",")
+    assert {"persistentvolumeclaim", "namespace"} <= set(purged)
+
+
+def test_labeled_claims_are_reported_not_deleted(tmp_path, monkeypatch):
+    write_manifest(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    claim = {"kind": "PersistentVolumeClaim", "metadata": {"name": "data", "namespace": "shop",
+                                                          "labels": {"minikube-tutorial/managed": "true"}}}
+    calls = []
+    report = BulkTeardown(recorder(calls, [claim])).run([STATEFUL], everything=True)
+    assert [v["name"] for v in report["volumes"]] == ["data"] and report["purged"] == []
+    assert not any(cmd[:2] == ["kubectl", "delete"] and "persistentvolumeclaim" in ",".join(cmd) for cmd in calls)
+
+
+def test_empty_selection_runs_no_delete(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    assert BulkTeardown(recorder(calls)).delete_command([STATEFUL]) == []
+    report = ProfileFanout(recorder(calls)).run("teardown", ["a", "b"], [STATEFUL])
+    assert report["ok"] and calls == []
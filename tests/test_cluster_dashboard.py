@@ -0,0 +1,97 @@
+import re
+
+import pytest
+
+import minikube_tutorial
+from minikube_tutorial import ClusterDashboard, RECIPE_LABEL
+
+
+def pod(name, namespace="default", phase="Running", restarts=0, ready=True, recipe=None, waiting=None):
+    state = {"waiting": {"reason": waiting}} if waiting else {"running": {}}
+    return {"metadata": {"name": name, "namespace": namespace, "labels": {RECIPE_LABEL: recipe} if recipe else {}},
+            "spec": {"containers": [{"name": "main"}], "nodeName": "minikube"},
+            "status": {"phase": phase, "containerStatuses": [{"ready": ready, "restartCount": restarts,
+                                                               "state": state}]}}
+
+
+def cluster(pods, usage=None):
+    return {"pods": pods, "pod_usage": usage or {},
+            "nodes": [{"name": "minikube", "cpu_m": 500, "cpu_pct": 25, "mem_mi": 1024, "mem_pct": 40}]}
+
+
+@pytest.fixture(autouse=True)
+def fixed_clock(monkeypatch):
+    monkeypatch.setattr(minikube_tutorial.time, "strftime", lambda fmt: "12:00:00")
+
+
+def pod_row(frame, name):
+    """Index of the frame line showing a pod"""
+    return next(i for i, line in enumerate(frame) if len(line) > 1 and line[1][2].strip() == name)
+
+
+def moves(output):
+    """(row, column) of every cursor move in a draw() string"""
+    return [(int(r), int(c)) for r, c in re.findall(r"\033\[(\d+);(\d+)H", output)]
+
+
+def test_first_draw_clears_and_paints_every_line():
+    dashboard = ClusterDashboard(lambda: None)
+    frame = dashboard.frame(cluster([pod("web-1"), pod("web-2")]), 140, 40, 2)
+    output = dashboard.draw(frame, (140, 40))
+    assert output.startswith("\033[2J")
+    assert {row for row, _ in moves(output)} == set(range(1, len(frame) + 1))
+
+
+def test_unchanged_frame_draws_nothing():
+    dashboard = ClusterDashboard(lambda: None)
+    data = cluster([pod("web-1"), pod("web-2")])
+    dashboard.draw(dashboard.frame(data, 140, 40, 2), (140, 40))
+    assert dashboard.draw(dashboard.frame(data, 140, 40, 2), (140, 40)) == ""
+
+
+def test_only_changed_cells_are_sent():
+    dashboard = ClusterDashboard(lambda: None, sort="name")
+    before = dashboard.frame(cluster([pod("web-1"), pod("web-2")]), 140, 40, 2)
+    dashboard.draw(before, (140, 40))
+    after = dashboard.frame(cluster([pod("web-1"), pod("web-2", restarts=3)]), 140, 40, 2)
+    output = dashboard.draw(after, (140, 40))
+    assert "\033[2J" not in output
+    row = pod_row(after, "web-2") + 1
+    # The header's problem count, and web-2's cells (restarts turn the whole row yellow); nothing on web-1
+    assert set(moves(output)) == {(1, 1)} | {(row, col + 1) for col, _, _ in after[row - 1]}
+    assert "\033[K" not in output and "web-1" not in output
+
+
+def test_a_shorter_cell_is_padded_over_the_old_text():
+    dashboard = ClusterDashboard(lambda: None)
+    dashboard.draw([[(0, "", "CrashLoopBackOff")]], (80, 24))
+    assert dashboard.draw([[(0, "", "Running")]], (80, 24)) == \
+        f"\033[1;1HRunning{minikube_tutorial.Colors.ENDC}" + " " * (len("CrashLoopBackOff") - len("Running"))
+
+
+def test_removed_lines_are_cleared_and_a_resize_repaints():
+    dashboard = ClusterDashboard(lambda: None)
+    dashboard.draw([[(0, "", "a")], [(0, "", "b")], [(0, "", "c")]], (80, 24))
+    assert dashboard.draw([[(0, "", "a")]], (80, 24)) == "\033[2;1H\033[K\033[3;1H\033[K"
+    assert dashboard.draw([[(0, "", "a")]], (100, 24)).startswith("\033[2J")
+
+
+def test_frame_is_cut_to_the_terminal_height_and_width():
+    dashboard = ClusterDashboard(lambda: None)
+    pods = [pod(f"worker-{i:03d}", recipe="7") for i in range(200)]
+    frame = dashboard.frame(cluster(pods), 60, 20, 2)
+    assert len(frame) <= 20
+    assert all(col < 60 and col + len(text) <= 60 for line in frame for col, _, text in line)
+    assert "more pods than fit" in frame[-1][0][2]
+    assert ClusterDashboard.plain(frame[0]).startswith(minikube_tutorial.Colors.BOLD + "Cluster dashboard")
+
+
+def test_frame_groups_pods_by_recipe_and_flags_bad_states():
+    dashboard = ClusterDashboard(lambda: None, recipe_names={"3": "Redis"}, sort="name")
+    data = cluster([pod("redis-0", recipe="3"), pod("api", waiting="CrashLoopBackOff")])
+    frame = dashboard.frame(data, 140, 40, 2)
+    text = ["".join(cell[2] for cell in line) for line in frame]
+    assert any(line.startswith("▸ Redis: 1 pods") for line in text)
+    assert "1 with problems" in text[0]
+    api = frame[pod_row(frame, "api")]
+    assert api[2][1] == minikube_tutorial.Colors.FAIL and api[2][2].strip() == "CrashLoopBackOff"
@@ -0,0 +1,89 @@
+import json
+import sys
+
+from minikube_tutorial import (CommandBackend, EventBuffer, EventWatcher, LogAggregator, PortForwarder,
+                               SetupEngine, SystemCheck)
+
+PRINT = [sys.executable, "-c", "print('one'); print('two')"]
+
+
+def write_session(path, *records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return str(path)
+
+
+def test_record_keeps_runs_and_streams(tmp_path):
+    session = tmp_path / "session.jsonl"
+    backend = CommandBackend(session_file=str(session))
+    assert not backend.direct
+    assert backend.run(PRINT).stdout == "one\ntwo\n"
+    proc = backend.popen(PRINT)
+    assert list(proc.stdout) == ["one\n", "two\n"]
+    assert proc.wait(timeout=5) == 0
+    backend.close()
+    run, stream = [json.loads(line) for line in session.read_text().splitlines()]
+    assert (run["cmd"], run["rc"], run["out"]) == (PRINT, 0, "one\ntwo\n") and "stream" not in run
+    assert (stream["cmd"], stream["rc"], stream["out"], stream["stream"]) == (PRINT, 0, "one\ntwo\n", True)
+    assert backend.stats()["calls"] == 2
+
+
+def test_replay_plays_a_stream_back_and_exits_after_it(tmp_path):
+    session = write_session(tmp_path / "s.jsonl", {"cmd": ["kubectl", "logs", "-f", "web"], "rc": 0,
+                                                     "out": "a\nb\n", "stream": True, "ms": 9000})
+    proc = CommandBackend("replay", session, scale=1.0).popen(["kubectl", "logs", "-f", "web"])
+    assert proc.poll() is None
+    assert list(proc.stdout) == ["a\n", "b\n"]
+    assert proc.poll() == 0 and proc.returncode == 0
+
+
+def test_stub_matches_prefixes_and_counts_misses(tmp_path):
+    session = write_session(tmp_path / "s.jsonl", {"cmd": ["kubectl", "logs"], "rc": 0, "out": "x\n"})
+    backend = CommandBackend("stub", session)
+    assert list(backend.popen(["kubectl", "--context", "dev", "logs", "-f", "db"]).stdout) == ["x\n"]
+    missing = backend.popen(["kubectl", "port-forward", "svc/db", ":5432"])
+    assert list(missing.stdout) == [] and missing.wait() == 127
+    assert backend.stats()["misses"] == 1
+
+
+def test_event_watcher_replays_a_watch(tmp_path):
+    event = {"kind": "Event", "reason": "BackOff", "type": "Warning", "message": "restarting",
+             "involvedObject": {"namespace": "default", "kind": "Pod", "name": "web-1"}}
+    listing = json.dumps({"kind": "EventList", "items": [event]}, indent=2) + "\n"
+    cmd = ["kubectl", "get", "events", "--all-namespaces", "--watch", "-o", "json"]
+    session = write_session(tmp_path / "s.jsonl", {"cmd": cmd, "rc": 0, "out": listing, "stream": True})
+    buffer = EventBuffer()
+    watcher = EventWatcher(buffer, backend=CommandBackend("replay", session, scale=0))
+    watcher.start()
+    watcher._thread.join(5)
+    assert [e["reason"] for e in buffer.for_object("default", "Pod", "web-1")] == ["BackOff"]
+
+
+def test_log_aggregator_follows_stubbed_pods(tmp_path):
+    pods = {"items": [{"metadata": {"name": "web-1", "namespace": "shop"}, "status": {
+        "phase": "Running", "containerStatuses": [{"name": "web", "state": {"running": {}}, "restartCount": 0}]}}]}
+    session = write_session(
+        tmp_path / "s.jsonl",
+        {"cmd": ["kubectl", "get", "pods", "-l", "app=web", "-o", "json", "-n", "shop"], "rc": 0,
+         "out": json.dumps(pods)},
+        {"cmd": ["kubectl", "logs", "-f"], "rc": 0, "stream": True,
+         "out": "2024-01-01T10:00:02Z second\n2024-01-01T10:00:01Z first\n"})
+    lines = []
+    LogAggregator([("shop", "app=web")], window=0.05, discovery_interval=0.05, output=lines.append,
+                  backend=CommandBackend("stub", session)).follow(1.0)
+    assert [line.rsplit(" ", 1)[1] for line in lines] == ["first", "second"]
+    assert all("[web-1/web]" in line for line in lines)
+
+
+def test_port_forwarder_reads_a_recorded_forward(tmp_path):
+    cmd = ["kubectl", "port-forward", "svc/web", ":80", "--address", "127.0.0.1"]
+    session = write_session(tmp_path / "s.jsonl", {"cmd": cmd, "rc": 0, "stream": True,
+                                                     "out": "Forwarding from 127.0.0.1:43210 -> 80\n"})
+    with PortForwarder(timeout=5, backend=CommandBackend("replay", session, scale=0)) as forwarder:
+        [target] = forwarder.start([{"service": "web", "service_port": 80, "port": 8080}])
+    assert target["port"] == 43210 and "error" not in target
+
+
+def test_setup_engine_runs_through_the_backend(tmp_path):
+    session = write_session(tmp_path / "s.jsonl", {"cmd": ["uv"], "rc": 0, "out": "Creating venv\n"})
+    engine = SetupEngine(tmp_path, SystemCheck(), backend=CommandBackend("stub", session))
+    assert engine._run(["uv", "venv", str(tmp_path / ".venv")]) == (True, "Creating venv")
@@ -0,0 +1,120 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from minikube_tutorial import Colors, ContentPack
+
+ROOT = Path(__file__).resolve().parent.parent
+
+INTRO = """title: Getting Started
+emoji: 🚀
+
+=== main ===
+{bold}Welcome{endc} to {name}.
+Run {code}{start_command}{endc} to begin.
+Braces like {this} or {} are left alone.
+
+=== tips ===
+Ünïcode stays intact.
+"""
+
+
+def sources(directory, **files):
+    directory.mkdir(exist_ok=True)
+    for name, text in files.items():
+        (directory / f"{name}.txt").write_text(text, encoding="utf-8")
+    return directory
+
+
+def test_parse_source_splits_metadata_and_blocks():
+    meta, blocks = ContentPack.parse_source(INTRO)
+    assert meta == {"title": "Getting Started", "emoji": "🚀"}
+    assert list(blocks) == ["main", "tips"]
+    assert blocks["tips"] == "Ünïcode stays intact.\n"
+
+
+def test_build_and_read_round_trip(tmp_path):
+    src = sources(tmp_path / "src", intro=INTRO, no_meta="=== main ===\nplain\n")
+    report = ContentPack.build(src, tmp_path / "out.pack")
+    assert report["sections"] == 2 and report["bytes"] == (tmp_path / "out.pack").stat().st_size
+    pack = ContentPack([tmp_path / "out.pack"])
+    assert pack.sections["intro"]["title"] == "Getting Started" and pack.sections["intro"]["emoji"] == "🚀"
+    assert pack.sections["no_meta"]["title"] == "No Meta"
+    assert pack.has("intro", "tips") and not pack.has("intro", "missing") and not pack.has("missing")
+    assert pack._blocks("intro") == ContentPack.parse_source(INTRO)[1]
+
+
+def test_build_is_byte_identical_for_identical_sources(tmp_path):
+    src = sources(tmp_path / "src", intro=INTRO)
+    ContentPack.build(src, tmp_path / "a.pack")
+    ContentPack.build(src, tmp_path / "b.pack")
+    assert (tmp_path / "a.pack").read_bytes() == (tmp_path / "b.pack").read_bytes()
+
+
+def test_sections_are_decompressed_on_first_use(tmp_path):
+    ContentPack.build(sources(tmp_path / "src", intro=INTRO, other="=== main ===\nx\n"), tmp_path / "out.pack")
+    pack = ContentPack([tmp_path / "out.pack"])
+    assert not pack._blobs
+    pack.render("intro", "tips")
+    assert list(pack._blobs) == ["intro"]
+
+
+def test_render_fills_colors_and_values(tmp_path, monkeypatch):
+    ContentPack.build(sources(tmp_path / "src", intro=INTRO), tmp_path / "out.pack")
+    pack = ContentPack([tmp_path / "out.pack"])
+    text = pack.render("intro", name="minikube", start_command="minikube start")
+    assert text == (f"{Colors.BOLD}Welcome{Colors.ENDC} to minikube.\n"
+                    f"Run {Colors.OKGREEN}minikube start{Colors.ENDC} to begin.\n"
+                    "Braces like {this} or {} are left alone.\n")
+    # Unfilled values stay as written; a colour change is not served from the cache
+    assert "{start_command}" in pack.render("intro", name="x")
+    monkeypatch.setattr(Colors, "BOLD", "")
+    assert pack.render("intro", name="minikube", start_command="s").startswith("Welcome")
+    assert pack.render_section("intro", name="n", start_command="s").endswith("Ünïcode stays intact.\n")
+
+
+def test_render_cache_is_bounded(tmp_path):
+    ContentPack.build(sources(tmp_path / "src", intro=INTRO), tmp_path / "out.pack")
+    pack = ContentPack([tmp_path / "out.pack"], max_rendered=2)
+    for i in range(5):
+        pack.render("intro", name=str(i))
+    assert len(pack._rendered) == 2
+
+
+def test_later_packs_override_sections(tmp_path):
+    ContentPack.build(sources(tmp_path / "base", intro=INTRO, logging="=== main ===\nbase logs\n"),
+                      tmp_path / "base.pack")
+    ContentPack.build(sources(tmp_path / "user", logging="title: Mine\n=== main ===\nuser logs\n"),
+                      tmp_path / "user.pack")
+    pack = ContentPack([tmp_path / "base.pack", tmp_path / "user.pack"])
+    assert pack.render("logging") == "user logs\n" and pack.sections["logging"]["title"] == "Mine"
+    assert pack.has("intro")
+
+
+def test_not_a_pack(tmp_path):
+    (tmp_path / "bad.pack").write_bytes(b"NOPE" + bytes(10))
+    with pytest.raises(ValueError):
+        ContentPack([tmp_path / "bad.pack"])
+
+
+def test_ensure_built_rebuilds_only_when_a_source_is_newer(tmp_path):
+    src = sources(tmp_path / "src", intro=INTRO)
+    pack = tmp_path / "out.pack"
+    assert ContentPack.ensure_built(src, pack) == pack
+    built = pack.stat().st_mtime
+    os.utime(pack, (built + 10, built + 10))
+    assert ContentPack.ensure_built(src, pack) == pack and pack.stat().st_mtime == built + 10
+    os.utime(src / "intro.txt", (built + 20, built + 20))
+    ContentPack.ensure_built(src, pack)
+    assert pack.stat().st_mtime != built + 10
+    assert ContentPack.ensure_built(tmp_path / "none", tmp_path / "none.pack") is None
+
+
+def test_shipped_pack_matches_its_sources(tmp_path):
+    ContentPack.build(ROOT / "content", tmp_path / "sections.pack")
+    shipped = ContentPack([ROOT / "content" / "sections.pack"])
+    rebuilt = ContentPack([tmp_path / "sections.pack"])
+    assert set(shipped.sections) == set(rebuilt.sections)
+    for name in rebuilt.sections:
+        assert shipped.render_section(name) == rebuilt.render_section(name)
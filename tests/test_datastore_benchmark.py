@@ -0,0 +1,274 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+import re
+import struct
+import threading
+from pathlib import Path
+
+import pytest
+
+from minikube_tutorial import BenchmarkError, DatastoreBenchmark, MinikubeTutorial, PostgresConnection
+
+REDIS_PASSWORD = "secret"
+PG_PASSWORD = "postgres123"
+
+
+async def resp_server(reader, writer, store):
+    """Just enough RESP for AUTH/SET/GET/DEL"""
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            args = []
+            for _ in range(int(line[1:-2])):
+                size = await reader.readline()
+                args.append((await reader.readexactly(int(size[1:-2]) + 2))[:-2])
+            command = args[0].upper()
+            if command == b"AUTH":
+                writer.write(b"+OK\r\n" if args[-1] == REDIS_PASSWORD.encode() else b"-WRONGPASS invalid password\r\n")
+            elif command == b"SET":
+                store[args[1]] = args[2]
+                writer.write(b"+OK\r\n")
+            elif command == b"GET":
+                value = store.get(args[1])
+                writer.write(b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value))
+            elif command == b"DEL":
+                writer.write(b":%d\r\n" % sum(store.pop(k, None) is not None for k in args[1:]))
+            else:
+                writer.write(b"-ERR unknown command\r\n")
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    writer.close()
+
+
+def pg_message(kind: bytes, payload: bytes) -> bytes:
+    return kind + struct.pack("!I", len(payload) + 4) + payload
+
+
+async def pg_read(reader):
+    header = await reader.readexactly(5)
+    return header[:1], await reader.readexactly(struct.unpack("!I", header[1:])[0] - 4)
+
+
+async def pg_server(reader, writer, table):
+    """SCRAM-SHA-256 login and the simple queries the benchmark sends"""
+    salt, iterations = os.urandom(16), 4096
+    salted = hashlib.pbkdf2_hmac("sha256", PG_PASSWORD.encode(), salt, iterations)
+    stored_key = hashlib.sha256(hmac.new(salted, b"Client Key", hashlib.sha256).digest()).digest()
+    server_key = hmac.new(salted, b"Server Key", hashlib.sha256).digest()
+    try:
+        length = struct.unpack("!I", await reader.readexactly(4))[0]
+        await reader.readexactly(length - 4)
+        writer.write(pg_message(b"R", struct.pack("!I", 10) + b"SCRAM-SHA-256\0\0"))
+        _, body = await pg_read(reader)
+        client_first_bare = body[body.index(b"\0") + 5:].decode()[3:]
+        nonce = client_first_bare.split("r=")[1] + base64.b64encode(os.urandom(12)).decode()
+        server_first = f"r={nonce},s={base64.b64encode(salt).decode()},i={iterations}"
+        writer.write(pg_message(b"R", struct.pack("!I", 11) + server_first.encode()))
+        _, body = await pg_read(reader)
+        without_proof, proof = body.decode().rsplit(",p=", 1)
+        auth_message = f"{client_first_bare},{server_first},{without_proof}".encode()
+        signature = hmac.new(stored_key, auth_message, hashlib.sha256).digest()
+        client_key = bytes(a ^ b for a, b in zip(base64.b64decode(proof), signature))
+        if hashlib.sha256(client_key).digest() != stored_key:
+            writer.write(pg_message(b"E", b"SFATAL\0C28P01\0Mpassword authentication failed\0\0"))
+            await writer.drain()
+            writer.close()
+            return
+        verifier = base64.b64encode(hmac.new(server_key, auth_message, hashlib.sha256).digest())
+        writer.write(pg_message(b"R", struct.pack("!I", 12) + b"v=" + verifier) +
+                     pg_message(b"R", struct.pack("!I", 0)) +
+                     pg_message(b"S", b"server_version\x0015.4 (stand-in)\0") + pg_message(b"Z", b"I"))
+        while True:
+            kind, body = await pg_read(reader)
+            if kind == b"X":
+                break
+            query = body[:-1].decode()
+            if query.startswith("SELECT v FROM"):
+                value = table.get(int(query.rsplit("= ", 1)[1]))
+                out = pg_message(b"T", b"\0\x01v\0" + b"\0" * 18)
+                if value is not None:
+                    out += pg_message(b"D", struct.pack("!Hi", 1, len(value)) + value)
+                out += pg_message(b"C", b"SELECT 1\0")
+            elif query.startswith("UPDATE"):
+                table[int(query.rsplit("= ", 1)[1])] = query.split("'")[1].encode()
+                out = pg_message(b"C", b"UPDATE 1\0")
+            elif query.startswith("INSERT"):
+                first, last = map(int, re.search(r"generate_series\((\d+), (\d+)\)", query).groups())
+                table.update(dict.fromkeys(range(first, last + 1), query.split("'")[1].encode()))
+                out = pg_message(b"C", b"INSERT 0 1\0")
+            elif query.startswith(("CREATE", "DROP")):
+                out = pg_message(b"C", b"OK\0")
+            else:
+                out = pg_message(b"E", b"SERROR\0C42601\0Msyntax error\0\0")
+            writer.write(out + pg_message(b"Z", b"I"))
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    writer.close()
+
+
+async def echo_server(reader, writer):
+    try:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    writer.close()
+
+
+@pytest.fixture(scope="module")
+def servers():
+    """Stand-in Redis, PostgreSQL and echo servers on an event loop in a background thread"""
+    loop = asyncio.new_event_loop()
+    store, table = {}, {}
+
+    async def start():
+        started = [await asyncio.start_server(lambda r, w: resp_server(r, w, store), "127.0.0.1", 0),
+                   await asyncio.start_server(lambda r, w: pg_server(r, w, table), "127.0.0.1", 0),
+                   await asyncio.start_server(echo_server, "127.0.0.1", 0)]
+        return started, {name: server.sockets[0].getsockname()[1]
+                         for name, server in zip(("redis", "postgres", "tcp"), started)}
+
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    started, ports = asyncio.run_coroutine_threadsafe(start(), loop).result(5)
+    yield dict(ports, store=store, table=table)
+    for server in started:
+        loop.call_soon_threadsafe(server.close)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+
+
+def bench(mode, port, **options):
+    options.setdefault("duration", 0.2)
+    return DatastoreBenchmark(mode, "127.0.0.1", port, connections=2, keyspace=50, warmup=0, **options).run()
+
+
+@pytest.mark.parametrize("pipeline", [1, 8])
+def test_redis_benchmark_pipelines_and_cleans_up(servers, pipeline):
+    report = bench("redis", servers["redis"], pipeline=pipeline, password=REDIS_PASSWORD, value_sizes=[16, 256])
+    assert report["ok"] and [p["value_size"] for p in report["phases"]] == [16, 256]
+    assert servers["store"] == {}
+
+
+def test_redis_wrong_password_fails(servers):
+    with pytest.raises(BenchmarkError):
+        bench("redis", servers["redis"], password="wrong")
+
+
+def test_postgres_benchmark_logs_in_with_scram(servers):
+    report = bench("postgres", servers["postgres"], pipeline=4, password=PG_PASSWORD)
+    assert report["ok"] and report["server_version"] == "15.4 (stand-in)"
+    assert len(servers["table"]) == 50
+
+
+def test_postgres_wrong_password_fails(servers):
+    with pytest.raises(BenchmarkError):
+        bench("postgres", servers["postgres"], password="wrong")
+
+
+def test_tcp_echo_benchmark(servers):
+    report = bench("tcp", servers["tcp"], value_sizes=[1024])
+    assert report["ok"] and report["phases"][0]["ops"] > 0
+
+
+def test_scram_matches_rfc7677_vector():
+    server_first = "r=rOprNGfwEbeRWgbNEkqO%hvYDpWUa2RaTCAfuxFIlj)hNlF$k0,s=W22ZaJ0SNY7soEsUEjb6gQ==,i=4096"
+    # The vector's client-first-bare carries n=user; PostgreSQL sends an empty name
+    final, signature = PostgresConnection.scram_client_final("pencil", "rOprNGfwEbeRWgbNEkqO", server_first)
+    assert final.startswith("c=biws,r=rOprNGfwEbeRWgbNEkqO%hvYDpWUa2RaTCAfuxFIlj)hNlF$k0,p=")
+    salted = hashlib.pbkdf2_hmac("sha256", b"pencil", base64.b64decode("W22ZaJ0SNY7soEsUEjb6gQ=="), 4096)
+    auth_message = f"n=,r=rOprNGfwEbeRWgbNEkqO,{server_first},{final.rsplit(',p=', 1)[0]}".encode()
+    server_key = hmac.new(salted, b"Server Key", hashlib.sha256).digest()
+    assert signature == hmac.new(server_key, auth_message, hashlib.sha256).digest()
+
+
+def test_benchmark_target_resolves_container_env(tmp_path):
+    secret = base64.b64encode(b"s3cret").decode()
+    (tmp_path / "app.yaml").write_text(f"""apiVersion: v1
+kind: Secret
+metadata:
+  name: db
+  namespace: shop
+data:
+  PASSWORD: {secret}
+---
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: db-config
+  namespace: shop
+data:
+  NAME: orders
+---
+apiVersion: v1
+kind: Service
+metadata:
+  name: db-service
+  namespace: shop
+spec:
+  selector:
+    app: db
+  ports:
+  - port: 5433
+    targetPort: 5432
+---
+apiVersion: apps/v1
+kind: StatefulSet
+metadata:
+  name: db
+  namespace: shop
+spec:
+  template:
+    metadata:
+      labels:
+        app: db
+    spec:
+      containers:
+      - name: db
+        image: postgres:16
+        ports:
+        - containerPort: 5432
+        env:
+        - name: POSTGRES_USER
+          value: shop
+        - name: POSTGRES_PASSWORD
+          valueFrom:
+            secretKeyRef:
+              name: db
+              key: PASSWORD
+        - name: POSTGRES_DB
+          valueFrom:
+            configMapKeyRef:
+              name: db-config
+              key: NAME
+""")
+    tutorial = MinikubeTutorial.__new__(MinikubeTutorial)
+    target = tutorial._benchmark_target({"id": 1, "yaml": str(tmp_path / "app.yaml")})
+    assert {k: target[k] for k in ("mode", "namespace", "service", "port", "user", "password", "database")} == {
+        "mode": "postgres", "namespace": "shop", "service": "db-service", "port": 5432,
+        "user": "shop", "password": "s3cret", "database": "orders"}
+    assert tutorial._benchmark_port_forward(target) == "kubectl port-forward -n shop svc/db-service 5432:5433"
+
+
+@pytest.mark.parametrize("recipe_id, expected", [
+    (5, ("myapp", "postgres", "yourpassword123", "myappdb")),
+    (12, (None, "kong", "kong", "kong")),
+])
+def test_benchmark_target_for_bundled_recipes(recipe_id, expected, monkeypatch):
+    root = Path(__file__).resolve().parent.parent
+    monkeypatch.chdir(root)
+    recipe = next(r for r in json.loads((root / "recipes.json").read_text())["recipes"] if r["id"] == recipe_id)
+    target = MinikubeTutorial.__new__(MinikubeTutorial)._benchmark_target(recipe)
+    assert (target["namespace"], target["user"], target["password"], target["database"]) == expected
@@ -0,0 +1,62 @@
+import io
+import json
+
+from minikube_tutorial import EventBuffer, EventWatcher, MinikubeTutorial
+
+
+def event(name, reason="BackOff", kind="Pod", count=3, type_="Warning"):
+    return {"kind": "Event", "metadata": {"namespace": "default", "name": f"{name}.1"},
+            "involvedObject": {"kind": kind, "name": name, "namespace": "default"},
+            "reason": reason, "message": f"{reason} for {name}", "type": type_, "count": count,
+            "lastTimestamp": "2024-01-01T10:00:00Z"}
+
+
+def test_consume_recovers_after_an_undecodable_document():
+    good = json.dumps(event("web-1"), indent=4)
+    stream = io.StringIO("{\n  \"broken\": \n}\n" + good + "\n")
+    buffer = EventBuffer()
+    EventWatcher(buffer)._consume(stream)
+    assert [e["name"] for e in buffer.query()] == ["web-1"]
+
+
+class BufferedTutorial(MinikubeTutorial):
+    """The watcher is already running; its buffer holds the given events"""
+
+    def __init__(self, events):
+        self.events = EventBuffer()
+        for item in events:
+            self.events.add(item)
+        self.event_watcher = None
+        self.watchers_started = 0
+
+    def _ensure_event_watcher(self):
+        self.watchers_started += 1
+        return True
+
+
+def test_recipe_warnings_come_from_its_objects_and_their_pods(tmp_path, capsys):
+    (tmp_path / "web.yaml").write_text(
+        "apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: web\n---\n"
+        "apiVersion: v1\nkind: Service\nmetadata:\n  name: web-svc\n")
+    tutorial = BufferedTutorial([event("web-5d9c7-x2x4q"), event("web", kind="Deployment", reason="FailedCreate"),
+                                 event("webhook-1"), event("web-5d9c7-x2x4q", reason="Pulled", type_="Normal"),
+                                 event("db-1")])
+    recipe = {"name": "Web", "yaml": str(tmp_path / "web.yaml")}
+    assert {(e["kind"], e["name"]) for e in tutorial._recipe_events(recipe)} == {
+        ("Pod", "web-5d9c7-x2x4q"), ("Deployment", "web")}
+    tutorial._print_recipe_warnings(recipe)
+    out = capsys.readouterr().out
+    assert "BackOff for web-5d9c7-x2x4q" in out and "FailedCreate for web" in out
+    assert "webhook-1" not in out and "db-1" not in out and "Pulled" not in out
+    assert tutorial.watchers_started == 1
+
+
+def test_watcher_is_stopped_at_exit(monkeypatch):
+    registered = []
+    monkeypatch.setattr("atexit.register", registered.append)
+    tutorial = MinikubeTutorial.__new__(MinikubeTutorial)
+    tutorial.events, tutorial.event_watcher, tutorial.profile = EventBuffer(), None, None
+    tutorial.backend = None
+    monkeypatch.setattr(EventWatcher, "start", lambda self: None)
+    tutorial._ensure_event_watcher()
+    assert registered == [tutorial.event_watcher.stop]
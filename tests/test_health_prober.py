@@ -0,0 +1,59 @@
+import asyncio
+import os
+import sys
+
+from minikube_tutorial import HealthProber, PortForwarder
+
+FAKE_KUBECTL = """#!{python}
+import socket, sys
+service = sys.argv[2]
+if service == "svc/missing":
+    print('Error from server (NotFound): services "missing" not found', flush=True)
+    sys.exit(1)
+server = socket.socket()
+server.bind(("127.0.0.1", 0))
+server.listen()
+print(f"Forwarding from 127.0.0.1:{{server.getsockname()[1]}} -> {{sys.argv[3][1:]}}", flush=True)
+while True:
+    server.accept()[0].close()
+"""
+
+
+def recipe(tmp_path, number, name, service, container):
+    path = tmp_path / f"{name}.yaml"
+    path.write_text(f"""apiVersion: v1
+kind: Service
+metadata:
+  name: {name}
+spec:
+  ports:
+  - port: {container}
+""")
+    return {"id": number, "name": name, "yaml": str(path),
+            "ports": [{"service": service, "local": 8080, "container": container, "probe": "tcp"}]}
+
+
+def test_shared_local_ports_are_flagged_and_not_probed(tmp_path):
+    targets = HealthProber.targets_for([recipe(tmp_path, 1, "nginx", "nginx", 80),
+                                        recipe(tmp_path, 2, "jenkins", "jenkins", 8080)])
+    assert [(t["service"], t["service_port"], t["shared_with"]) for t in targets] == [
+        ("nginx", 80, ["jenkins: jenkins"]), ("jenkins", 8080, ["nginx: nginx"])]
+    results = asyncio.run(HealthProber(targets).probe_all())
+    assert all(not r["ok"] and "shared with" in r["error"] for r in results)
+
+
+def test_forwarded_targets_get_their_own_ports(tmp_path, monkeypatch):
+    kubectl = tmp_path / "bin" / "kubectl"
+    kubectl.parent.mkdir()
+    kubectl.write_text(FAKE_KUBECTL.format(python=sys.executable))
+    kubectl.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{kubectl.parent}{os.pathsep}{os.environ['PATH']}")
+    targets = HealthProber.targets_for([recipe(tmp_path, 1, "nginx", "nginx", 80),
+                                        recipe(tmp_path, 2, "jenkins", "jenkins", 8080),
+                                        recipe(tmp_path, 3, "missing", "missing", 9000)])
+    with PortForwarder(timeout=10) as forwarder:
+        forwarded = forwarder.start(targets)
+        results = asyncio.run(HealthProber(forwarded).probe_all())
+    assert forwarded[0]["port"] != forwarded[1]["port"] and 8080 not in (forwarded[0]["port"], forwarded[1]["port"])
+    assert [r["ok"] for r in results] == [True, True, False]
+    assert "NotFound" in results[2]["error"]
@@ -0,0 +1,106 @@
+import os
+import subprocess
+
+import pytest
+
+from minikube_tutorial import ImageBuilder, MinikubeTutorial
+
+
+class StubDocker:
+    """Stands in for docker and minikube: records commands and keeps the node's image list"""
+
+    def __init__(self):
+        self.commands = []
+        self.envs = []
+        self.node = set()
+
+    def __call__(self, cmd, description="", timeout=30, env=None):
+        self.commands.append(cmd)
+        self.envs.append(env)
+        if cmd[:3] == ["minikube", "image", "ls"]:
+            return True, "\n".join(sorted(self.node))
+        if cmd[:3] == ["minikube", "image", "load"]:
+            self.node.add(cmd[-1])
+        if cmd[:3] == ["docker", "image", "inspect"]:
+            return True, str(50 << 20)
+        return True, ""
+
+    def builds(self):
+        return [c for c in self.commands if c[:2] == ["docker", "build"]]
+
+
+@pytest.mark.parametrize("pattern, path, ignored", [
+    ("*.log", "x.log", True),
+    ("*.log", "sub/x.log", False),
+    ("**/*.log", "sub/deep/x.log", True),
+    ("**/*.log", "x.log", True),
+    ("docs", "docs/guide/a.md", True),
+    ("/build", "build/out.bin", True),
+    ("*/temp*", "sub/temporary", True),
+    ("*/temp*", "sub/deep/temporary", False),
+    ("file?.txt", "file1.txt", True),
+    ("file?.txt", "file/.txt", False),
+    ("[a-c].py", "b.py", True),
+    ("[!a-c].py", "b.py", False),
+])
+def test_dockerignore_matches_like_docker(tmp_path, pattern, path, ignored):
+    (tmp_path / ".dockerignore").write_text(pattern + "\n")
+    assert ImageBuilder._ignored(path, ImageBuilder._ignore_patterns(tmp_path)) is ignored
+
+
+def test_exceptions_reinclude_files_below_ignored_directory(tmp_path):
+    (tmp_path / ".dockerignore").write_text("docs\n!docs/README.md\n")
+    patterns = ImageBuilder._ignore_patterns(tmp_path)
+    assert ImageBuilder._ignored("docs/guide.md", patterns)
+    assert not ImageBuilder._ignored("docs/README.md", patterns)
+
+
+def test_pipeline_rebuilds_on_nested_change_and_delivers_hash_tag(tmp_path):
+    context = tmp_path / "app"
+    (context / "sub").mkdir(parents=True)
+    (context / "Dockerfile").write_text("FROM scratch\nCOPY . /\n")
+    (context / ".dockerignore").write_text("*.log\n")
+    (context / "debug.log").write_text("ignored")
+    (context / "sub" / "x.log").write_text("v1")
+    docker = StubDocker()
+
+    def run():
+        builder = ImageBuilder(docker, tmp_path / "cache.json", deliver="load")
+        report = builder.run(ImageBuilder.discover(context))
+        assert report["ok"]
+        return report["results"][0]
+
+    first = run()
+    assert first["status"] == "built"
+    assert first["ref"] == f"app:{first['hash']}"
+    assert ["minikube", "image", "load", "--overwrite=true", first["ref"]] in docker.commands
+
+    assert run()["status"] == "unchanged"
+    (context / "debug.log").write_text("root logs are ignored")
+    assert run()["status"] == "unchanged"
+
+    (context / "sub" / "x.log").write_text("v2")
+    os.utime(context / "sub" / "x.log", ns=(1, 1))
+    second = run()
+    assert second["status"] == "built" and second["hash"] != first["hash"]
+    assert second["ref"] == f"app:{second['hash']}"
+    assert len(docker.builds()) == 2
+    assert all(env == {"DOCKER_BUILDKIT": "1"} for cmd, env in zip(docker.commands, docker.envs)
+               if cmd[:2] == ["docker", "build"])
+
+
+def test_run_command_adds_env_to_the_process_environment(monkeypatch):
+    seen = []
+
+    class Backend:
+        def run(self, cmd, timeout=None, **kwargs):
+            seen.append(kwargs)
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setenv("PATH", "/usr/bin")
+    tutorial = MinikubeTutorial.__new__(MinikubeTutorial)
+    tutorial.backend, tutorial.profile, tutorial.journal = Backend(), None, None
+    tutorial.run_command(["docker", "build", "."], env={"DOCKER_BUILDKIT": "1"})
+    tutorial.run_command(["docker", "ps"])
+    assert seen[0]["env"]["DOCKER_BUILDKIT"] == "1" and seen[0]["env"]["PATH"] == "/usr/bin"
+    assert seen[1] == {}
@@ -0,0 +1,173 @@
+import http.client
+import json
+import select
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from minikube_tutorial import CommandBackend, KubeClient, ManifestParser, MinikubeTutorial
+
+ROOT = Path(__file__).resolve().parent.parent
+
+RESOURCES = {
+    "/api/v1": [("namespaces", "Namespace", False), ("configmaps", "ConfigMap", True),
+                ("secrets", "Secret", True), ("services", "Service", True), ("pods", "Pod", True),
+                ("resourcequotas", "ResourceQuota", True)],
+    "/apis/apps/v1": [("deployments", "Deployment", True), ("statefulsets", "StatefulSet", True)],
+    "/apis/autoscaling/v2": [("horizontalpodautoscalers", "HorizontalPodAutoscaler", True)],
+    "/apis/networking.k8s.io/v1": [("networkpolicies", "NetworkPolicy", True)],
+}
+
+
+class StubAPIServer(ThreadingHTTPServer):
+    """Keep-alive API server stand-in: discovery, list, apply and delete; can drop chosen requests unanswered"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubAPIHandler)
+        self.connections = 0
+        self.requests = []
+        self.drop = set()
+        self.close_after = False
+        self.objects = {}
+
+
+class StubAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        # An idle timeout on the server side: the client is not told, the socket just closes
+        self.close_connection = self.server.close_after
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        self.server.requests.append((self.command, self.path, self.headers.get("Content-Type"), body))
+        if self.command in self.server.drop:
+            # The request arrived; the connection dies before any response
+            self.close_connection = True
+            return
+        path = self.path.split("?")[0]
+        if path == "/version":
+            return self._reply(200, {"gitVersion": "v1.30.0"})
+        if path == "/apis":
+            return self._reply(200, {"groups": [{"name": gv.split("/")[2], "preferredVersion": {
+                "groupVersion": "/".join(gv.split("/")[2:])}} for gv in RESOURCES if gv != "/api/v1"]})
+        if path in RESOURCES:
+            return self._reply(200, {"resources": [{"name": name, "kind": kind, "namespaced": namespaced}
+                                                   for name, kind, namespaced in RESOURCES[path]]})
+        if self.command == "PATCH":
+            self.server.objects[path] = body
+            return self._reply(200, {"metadata": {"name": path.rsplit("/", 1)[1]}})
+        if self.command == "DELETE":
+            return self._reply(200 if self.server.objects.pop(path, None) else 404, {"message": "gone"})
+        if self.command == "GET":
+            return self._reply(200, {"items": [{"metadata": {"name": key.rsplit("/", 1)[1]}}
+                                               for key in self.server.objects if key.startswith(path + "/")]})
+        return self._reply(405, {"message": "unsupported"})
+
+    do_GET = do_PATCH = do_DELETE = _handle
+
+
+@pytest.fixture
+def server():
+    stub = StubAPIServer()
+    thread = threading.Thread(target=stub.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+@pytest.fixture
+def client(server, tmp_path):
+    kube = KubeClient(f"http://127.0.0.1:{server.server_address[1]}", cache_file=tmp_path / "discovery.json")
+    yield kube
+    kube.close()
+
+
+def test_requests_share_one_keep_alive_connection(server, client):
+    docs = [d for d in ManifestParser((ROOT / "examples" / "multi-service-app.yaml").read_text()).documents()
+            if isinstance(d, dict)]
+    for doc in docs:
+        client.apply(doc)
+    assert len(client.list("deployment", "myapp")) == 2
+    assert server.connections == 1
+    assert sum(1 for method, *_ in server.requests if method == "PATCH") == len(docs)
+
+
+def test_discovery_is_cached_across_clients(server, client, tmp_path):
+    client.list("pod")
+    discovery_requests = len(server.requests) - 1
+    again = KubeClient(client.server, cache_file=tmp_path / "discovery.json")
+    again.list("pod")
+    assert discovery_requests >= 1 and len(server.requests) == discovery_requests + 2
+
+
+def test_get_is_retried_after_a_dropped_connection(server, client):
+    client.list("pod")
+    server.drop = {"GET"}
+    with pytest.raises((http.client.HTTPException, ConnectionError)):
+        client.list("pod")
+    gets = [r for r in server.requests if r[0] == "GET"]
+    assert gets[-1][1] == gets[-2][1]
+
+
+@pytest.mark.parametrize("method", ["PATCH", "DELETE"])
+def test_writes_are_not_resent_once_delivered(server, client, method):
+    client.path("configmap")
+    server.drop = {method}
+    with pytest.raises((http.client.HTTPException, ConnectionError)):
+        if method == "PATCH":
+            client.apply({"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "c"}, "data": {}})
+        else:
+            client.delete("configmap", "c")
+    assert sum(1 for r in server.requests if r[0] == method) == 1
+
+
+def test_a_server_closed_pooled_connection_is_not_reused(server, client):
+    server.close_after = True
+    client.path("configmap")
+    server.close_after = False
+    assert select.select([client._pool.queue[0].sock], [], [], 2)[0]
+    server.connections = 0
+    client.apply({"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "c"}, "data": {}})
+    assert server.connections == 1
+    assert sum(1 for r in server.requests if r[0] == "PATCH") == 1
+
+
+def test_yaml_source_is_sent_unchanged(server, client):
+    source = "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: c\ndata:\n  mode: \"0755\"\n"
+    client.apply(ManifestParser(source).documents()[0], source=source)
+    method, path, content_type, body = server.requests[-1]
+    assert (method, content_type, body) == ("PATCH", "application/apply-patch+yaml", source.encode())
+
+
+def test_recorded_sessions_use_kubectl(tmp_path, monkeypatch):
+    def no_client(*args, **kwargs):
+        raise AssertionError("API client built while recording")
+
+    monkeypatch.setattr(KubeClient, "from_kubeconfig", no_client)
+    tutorial = MinikubeTutorial.__new__(MinikubeTutorial)
+    tutorial._kube = None
+    tutorial.backend = CommandBackend(session_file=str(tmp_path / "session.jsonl"))
+    try:
+        assert tutorial.kube() is None
+    finally:
+        tutorial.backend.close()
@@ -0,0 +1,36 @@
+import asyncio
+
+from minikube_tutorial import LogAggregator
+
+
+class ScriptedAggregator(LogAggregator):
+    """Discovery answers come from a script; followers finish immediately like a completed container"""
+
+    def __init__(self, rounds):
+        super().__init__([(None, "app=demo")], discovery_interval=0, output=lambda line: None)
+        self.rounds = rounds
+        self.started = []
+
+    async def _discover(self):
+        if not self.rounds:
+            await asyncio.sleep(3600)
+        return self.rounds.pop(0)
+
+    async def _follow(self, key):
+        self.started.append(key)
+
+
+def test_finished_containers_are_not_retailed_and_gone_ones_are_pruned():
+    web, job = ("ns", "web-1", "web"), ("ns", "job-1", "job")
+    aggregator = ScriptedAggregator([{web: 0, job: 0}, {web: 0, job: 0}, {web: 1}, {web: 1}, {}])
+
+    async def drive():
+        task = asyncio.ensure_future(aggregator._discovery_loop())
+        while aggregator.rounds:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+    asyncio.run(drive())
+    assert aggregator.started == [web, job, web]
+    assert aggregator._followers == {} and aggregator._queues == {} and aggregator._generations == {}
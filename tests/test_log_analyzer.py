@@ -0,0 +1,41 @@
+import pytest
+
+from minikube_tutorial import LogAnalyzer
+
+
+@pytest.mark.parametrize("value", [
+    "2024-01-01T10:00:00Z",
+    "2024-01-01T10:00:00.123456789Z",
+    "2024-01-01T12:00:00.5+02:00",
+    "2024-01-01T05:00:00-05:00",
+    "2024-01-01T10:00:00",
+])
+def test_timestamp_honours_offset(value):
+    assert LogAnalyzer(["level"])._timestamp(value) == 1704103200.0
+
+
+def test_timestamp_cache_keys_on_offset():
+    analyzer = LogAnalyzer(["level"])
+    assert analyzer._timestamp("2024-01-01T10:00:00Z") == 1704103200.0
+    assert analyzer._timestamp("2024-01-01T10:00:00+01:00") == 1704103200.0 - 3600
+
+
+def test_object_and_list_fields_group_by_their_json():
+    analyzer = LogAnalyzer(["ctx", "tags"]).consume([
+        '{"ctx": {"b": 1, "a": 2}, "tags": ["x"]}',
+        '{"ctx": {"a": 2, "b": 1}, "tags": ["x"]}',
+        '{"ctx": "plain", "tags": null}',
+    ])
+    totals = {tuple(t["key"].values()): t["count"] for t in analyzer.summary()["totals"]}
+    assert totals == {('{"a": 2, "b": 1}', '["x"]'): 2, ("plain", None): 1}
+
+
+@pytest.mark.parametrize("where, matched", [
+    (["ok=true"], 2), (["ok=false"], 1), (["ok!=true"], 1), (["code=500"], 1),
+    (["user=null"], 2), (["level=ERROR", "ok=false"], 1), (["msg=say \"hi\""], 1),
+])
+def test_filters_match_non_string_values(where, matched):
+    lines = ['{"level": "INFO", "ok": true, "code": 200, "msg": "say \\"hi\\""}',
+             '{"level": "INFO", "ok": true, "code": 201}',
+             '{"level": "ERROR", "ok": false, "code": 500, "user": "ann"}']
+    assert LogAnalyzer(["level"], where).consume(lines).matched == matched
@@ -0,0 +1,35 @@
+import marshal
+
+from minikube_tutorial import ManifestCache, ManifestParser
+
+
+def test_cache_serves_same_documents_and_reparses_on_change(tmp_path):
+    manifest = tmp_path / "app.yaml"
+    manifest.write_text("kind: Service\nmetadata:\n  name: web\n  labels:\n    app: web\n")
+    cache = ManifestCache(tmp_path / "cache")
+    first = cache.load(manifest)
+    first[0]["kind"] = "changed by caller"
+    assert cache.load(manifest) == [{"kind": "Service", "metadata": {"name": "web", "labels": {"app": "web"}}}]
+    assert cache.stats()["parses"] == 1
+
+    assert ManifestCache(tmp_path / "cache").load(manifest)[0]["kind"] == "Service"
+    manifest.write_text("kind: Deployment\nmetadata:\n  name: web\n")
+    assert cache.load(manifest)[0]["kind"] == "Deployment"
+    assert [doc["metadata"]["name"] for _, doc in cache.find([manifest], kind="deployment")] == ["web"]
+
+
+def test_key_includes_parser_version():
+    assert f":{ManifestParser.VERSION}:" in ManifestCache.FORMAT
+
+
+def test_paths_of_deleted_files_are_pruned(tmp_path):
+    cache = ManifestCache(tmp_path / "cache")
+    temp = tmp_path / "temp.yaml"
+    temp.write_text("kind: ConfigMap\n")
+    cache.load(temp)
+    temp.unlink()
+    kept = tmp_path / "kept.yaml"
+    kept.write_text("kind: Secret\n")
+    cache.load(kept)
+    stored = marshal.loads((tmp_path / "cache" / "paths.marshal").read_bytes())
+    assert list(stored["paths"]) == [str(kept)]
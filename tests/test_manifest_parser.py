@@ -0,0 +1,79 @@
+import math
+from pathlib import Path
+
+import pytest
+
+from minikube_tutorial import ManifestParser
+
+yaml = pytest.importorskip("yaml")
+
+EXAMPLES = sorted(p for p in (Path(__file__).resolve().parent.parent / "examples").iterdir()
+                  if p.suffix in (".yaml", ".yml"))
+
+
+def parse(text):
+    return ManifestParser(text).documents()
+
+
+@pytest.mark.parametrize("path", EXAMPLES, ids=lambda p: p.name)
+def test_examples_match_pyyaml(path):
+    text = path.read_text()
+    assert parse(text) == [doc for doc in yaml.safe_load_all(text) if doc is not None]
+
+
+@pytest.mark.parametrize("text", [
+    "desc: a long\n      wrapped value\nmetadata:\n  name: x\nspec:\n  replicas: 2\n",
+    "- one\n  two\n- three\n",
+    "k: first\n\n  second\nz: 1\n",
+    'k: "quoted\n  across lines"\nz: 2\n',
+    "x:\n  - a: long\n      text\n    b: 2\n",
+    "a: 1 # comment\nb: 'it''s'\nc: [1, two, {d: 3}]\n",
+    "script: |\n  line one\n    indented\nnext: >-\n  folded\n  text\n",
+    "- - a\n  - b\n- - c\n  - - d\n- e\n",
+    "matrix:\n- - 1\n  - 2\n- - 3\n",
+    "text: >-\n  one\n\n  two\n\n\n  three\n    indented\n  four\nz: 1\n",
+    "text: >\n  a\n  b\n\nz: 1\n",
+    "keep: |+\n  line\n\n\nz: 1\n",
+    "keep: >+\n  folded\n  line\n\n",
+    "strip: |-\n  line\n\n",
+    "clip: |\n  a\n\n  b\n\n\nz: 1\n",
+    "mode: 0644\nhex: 0x1F\nneg: -0x1F\nbits: 0b101\nbig: 1_000\nzero: 0\nnot_octal: '08'\n",
+    "up: .inf\ndown: -.Inf\nflag: yes\ndisabled: Off\n",
+])
+def test_cases_match_pyyaml(text):
+    assert parse(text) == list(yaml.safe_load_all(text))
+
+
+@pytest.mark.parametrize("text, line", [
+    ("a: 1\n b: 2\nc: 3\n", 2),
+    ("a:\n    b: 1\n  c: 2\n", 3),
+    ("desc: wrapped\n  key: value\n", 2),
+])
+def test_unplaceable_lines_raise(text, line):
+    with pytest.raises(ValueError, match=f"line {line}"):
+        parse(text)
+    with pytest.raises(yaml.YAMLError):
+        list(yaml.safe_load_all(text))
+
+
+def test_not_a_number():
+    assert math.isnan(parse("x: .nan\n")[0]["x"])
+
+
+@pytest.mark.parametrize("text", [
+    "base: &base\n  a: 1\n",
+    "copy: *base\n",
+    "<<: *base\n",
+    "- *item\n",
+    "value: !!str 5\n",
+    "value: !secret x\n",
+    "? complex\n: value\n",
+    "&anchor key: 1\n",
+    "list: [1, *two]\n",
+    "map: {a: &x 1}\n",
+    "%YAML 1.2\n---\na: 1\n",
+    "text: |2\n  indented\n",
+])
+def test_unsupported_constructs_raise(text):
+    with pytest.raises(ValueError):
+        parse(text)
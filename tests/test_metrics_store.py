@@ -0,0 +1,48 @@
+import pytest
+
+from minikube_tutorial import MetricsSampler, MetricsStore
+
+TIERS = ((15, 4), (60, 4), (600, 4))
+NOW = 1_700_000_000.0
+
+
+def open_store(tmp_path, max_series=4):
+    return MetricsStore(tmp_path / "metrics.tsdb", max_series=max_series, tiers=TIERS)
+
+
+def test_stale_series_are_reclaimed_when_full(tmp_path):
+    store = open_store(tmp_path)
+    for pod in range(4):
+        store.record(f"pod/default/web-{pod}/cpu_m", NOW, pod)
+    with pytest.raises(ValueError, match="full"):
+        store.record("pod/default/web-new/cpu_m", NOW, 1)
+
+    later = NOW + 600 * 4 + 600
+    store.record("pod/default/web-0/cpu_m", later, 7)
+    store.record("pod/default/web-new/cpu_m", later, 9)
+    assert store.series() == ["pod/default/web-0/cpu_m", "pod/default/web-new/cpu_m"]
+    assert store.query("pod/default/web-new/cpu_m", later - 15, later)[1] == [(later // 15 * 15, 9.0)]
+    assert store.query("pod/default/web-1/cpu_m", NOW - 15, later) == (0, [])
+    store.close()
+
+
+def test_sampler_drops_samples_instead_of_raising(tmp_path):
+    store = open_store(tmp_path, max_series=2)
+    sampler = MetricsSampler(store, lambda: {})
+    sampler.record({"pod_usage": {("default", f"web-{i}"): (10.0, 20.0) for i in range(3)}}, NOW)
+    assert sampler.samples == 1 and sampler.dropped == 4
+    store.close()
+
+
+def test_two_writers_never_share_a_slot(tmp_path):
+    first, second = open_store(tmp_path), open_store(tmp_path)
+    first.record("node/a/cpu_m", NOW, 1)
+    second.record("node/b/cpu_m", NOW, 2)
+    first.record("node/c/cpu_m", NOW, 3)
+    second.record("node/a/cpu_m", NOW + 15, 4)
+    assert first.series() == second.series() == ["node/a/cpu_m", "node/b/cpu_m", "node/c/cpu_m"]
+    assert [v for _, v in first.query("node/b/cpu_m", NOW - 15, NOW + 15, 15)[1]] == [2.0]
+    assert [v for _, v in second.query("node/a/cpu_m", NOW - 15, NOW + 15, 15)[1]] == [1.0, 4.0]
+    assert [v for _, v in second.query("node/c/cpu_m", NOW - 15, NOW + 15, 15)[1]] == [3.0]
+    first.close()
+    second.close()
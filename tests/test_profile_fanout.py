@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from minikube_tutorial import MinikubeTutorial, ProfileFanout, recipe_labels
+
+ROOT = Path(__file__).resolve().parent.parent
+RECIPES = {r["id"]: r for r in json.loads((ROOT / "recipes.json").read_text())["recipes"]}
+
+
+def recorder(calls):
+    def runner(cmd, description, profile=None, timeout=30):
+        calls.append((profile, cmd))
+        if cmd[:3] == ["kubectl", "label", "--local"]:
+            return True, json.dumps({"kind": "List", "items": []})
+        return True, ""
+    return runner
+
+
+@pytest.mark.parametrize("recipe_id", [1, 5])
+def test_fanout_deploy_labels_every_object(recipe_id, monkeypatch):
+    monkeypatch.chdir(ROOT)
+    calls = []
+    report = ProfileFanout(recorder(calls)).run("deploy", ["a", "b"], [RECIPES[recipe_id]])
+    assert report["ok"]
+    for profile in ("a", "b"):
+        commands = [cmd for p, cmd in calls if p == profile]
+        applies = [cmd for cmd in commands if cmd[:2] == ["kubectl", "apply"]]
+        labels = [cmd for cmd in commands if cmd[:2] == ["kubectl", "label"]]
+        assert applies and len(labels) == len(applies)
+        assert all("--local" in cmd and cmd[-3:] == recipe_labels(RECIPES[recipe_id]) for cmd in labels)
+        # Each apply is of the labelled output, never of the unlabelled manifest
+        assert all(cmd[3].endswith(".json") and "minikube-tutorial-" in cmd[3] for cmd in applies)
+
+
+def test_fanout_deploy_fails_when_labelling_fails(monkeypatch):
+    monkeypatch.chdir(ROOT)
+
+    calls = []
+
+    def runner(cmd, description, profile=None, timeout=30):
+        calls.append(cmd)
+        return (False, "forbidden") if cmd[:2] == ["kubectl", "label"] else (True, "")
+
+    report = ProfileFanout(runner).run("deploy", ["a"], [RECIPES[1]])
+    assert not report["ok"] and report["profiles"]["a"]["steps"][0]["output"] == "forbidden"
+    assert not any(cmd[:2] == ["kubectl", "apply"] for cmd in calls)
+
+
+@pytest.mark.parametrize("selection, expected", [("", []), ("  ", []), ("1,3", [1, 3]), ("all", list(RECIPES))])
+def test_select_recipes(selection, expected):
+    tutorial = MinikubeTutorial.__new__(MinikubeTutorial)
+    assert [r["id"] for r in tutorial._select_recipes(list(RECIPES.values()), selection)] == expected
+
+
+def profiles_session(monkeypatch, answers):
+    tutorial = MinikubeTutorial.__new__(MinikubeTutorial)
+    tutorial.print_section_header = lambda *args: None
+    tutorial._list_profiles = lambda: ["a", "b"]
+    tutorial._load_recipes = lambda: list(RECIPES.values())
+    runs = []
+    tutorial.fanout = lambda *args: runs.append(args) or {"action": args[0], "profiles": {}, "duration": 0}
+    replies = iter(answers)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(replies))
+    tutorial.section_profiles()
+    return runs
+
+
+@pytest.mark.parametrize("action", ["deploy", "teardown"])
+def test_empty_recipe_selection_does_nothing(monkeypatch, action):
+    assert profiles_session(monkeypatch, ["all", action, "", ""]) == []
+
+
+def test_fanout_teardown_asks_first(monkeypatch):
+    assert profiles_session(monkeypatch, ["all", "teardown", "1", "n", ""]) == []
+    runs = profiles_session(monkeypatch, ["all", "teardown", "1", "y", "", ""])
+    assert [(action, profiles, [r["id"] for r in recipes]) for action, profiles, recipes, _ in runs] == \
+        [("teardown", ["a", "b"], [1])]
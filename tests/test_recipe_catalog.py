@@ -0,0 +1,15 @@
+import json
+
+from minikube_tutorial import RecipeCatalog
+
+
+def test_pages_are_zero_based_and_cover_every_recipe(tmp_path):
+    recipes = [{"id": i, "name": f"Recipe {i}", "category": "Web", "difficulty": "Beginner", "time": "1 min",
+                "yaml": "examples/simple-web-server.yaml"} for i in range(1, 41)]
+    (tmp_path / "recipes.json").write_text(json.dumps({"recipes": recipes}))
+    catalog = RecipeCatalog(tmp_path)
+    rows = catalog.summaries()
+    pages = [catalog.page(rows, number)[0] for number in range(3)]
+    assert [[r["id"] for r in page][::len(page) - 1] for page in pages] == [[1, 15], [16, 30], [31, 40]]
+    assert catalog.page(rows, 0)[1] == 3
+    assert catalog.page(rows, 5)[0] == pages[2]
@@ -0,0 +1,49 @@
+import pytest
+
+from minikube_tutorial import SearchIndex
+
+GUIDE = """# Installing kubectl
+Download kubectl and put it on your PATH.
+
+# Kubernetes dashboard
+Run minikube dashboard to open the kubernetes web UI.
+
+# Redis cache
+A redis deployment with a service on port 6379.
+"""
+
+
+@pytest.fixture
+def index(tmp_path):
+    guide = tmp_path / "GUIDE.md"
+    guide.write_text(GUIDE)
+    idx = SearchIndex(tmp_path / "index.json")
+    assert idx.update([guide], []) == 3
+    return idx
+
+
+def titles(results):
+    return [r["title"] for r in results]
+
+
+@pytest.mark.parametrize("first, second", [("kube", "kube "), ("kube ", "kube"), ("Redis  cach", "redis cach ")])
+def test_prefix_and_finished_queries_are_cached_apart(tmp_path, index, first, second):
+    index.search(first)
+    fresh = SearchIndex(tmp_path / "index.json")
+    assert index.search(second) == fresh.search(second)
+
+
+def test_finished_word_is_not_prefix_matched(index):
+    assert set(titles(index.search("kube"))) == {"Kubernetes dashboard", "Installing kubectl"}
+    assert titles(index.search("kube ")) == ["Installing kubectl"]
+
+
+def test_typo_still_finds_the_section(index):
+    assert titles(index.search("kubernets dashbord ")) == ["Kubernetes dashboard"]
+
+
+def test_changed_guide_is_reindexed_and_saved(tmp_path, index):
+    guide = tmp_path / "GUIDE.md"
+    guide.write_text(GUIDE + "\n# Helm charts\nInstall helm.\n")
+    assert index.update([guide], []) >= 1
+    assert titles(SearchIndex(tmp_path / "index.json").search("helm ")) == ["Helm charts"]
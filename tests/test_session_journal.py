@@ -0,0 +1,99 @@
+import os
+
+import minikube_tutorial
+from minikube_tutorial import SessionJournal
+
+
+def write(journal, count, start=1700000000.0):
+    for i in range(count):
+        journal.append("deploy", "kubectl apply", f"-f recipe-{i}.yaml", i % 3, 0.5, 1024 * i,
+                       recipe=str(i), timestamp=start + i)
+
+
+def test_rollovers_within_one_millisecond_get_their_own_segments(tmp_path, monkeypatch):
+    monkeypatch.setattr(minikube_tutorial.time, "time", lambda: 1700000000.0)
+    journal = SessionJournal(tmp_path, segment_bytes=400)
+    write(journal, 10)
+    journal.close()
+    rows = journal.query()
+    assert [row["args"] for row in rows] == [f"-f recipe-{i}.yaml" for i in range(10)]
+    index = journal._read_index()["segments"]
+    assert sorted(index) == sorted(path.name for path in tmp_path.glob("*.seg"))
+    assert sum(meta["count"] for meta in index.values()) == 10
+
+
+def test_query_skips_segments_outside_the_range(tmp_path):
+    journal = SessionJournal(tmp_path, segment_bytes=400)
+    write(journal, 10)
+    journal.close()
+    rows = journal.query(since=1700000008.0)
+    assert [row["recipe"] for row in rows] == ["8", "9"]
+    assert journal.last_scan[0] < journal.last_scan[1]
+
+
+def test_compact_merges_segments_and_keeps_every_record(tmp_path):
+    journal = SessionJournal(tmp_path, segment_bytes=400, retention_days=10 ** 5)
+    write(journal, 10)
+    journal.close()
+    before = len(list(tmp_path.glob("*.seg")))
+    report = SessionJournal(tmp_path, segment_bytes=4000, retention_days=10 ** 5).compact()
+    assert report["merged"] == before and report["segments"] == 1
+    assert len(journal.query()) == 10
+    assert f"-c{os.getpid()}-" in next(tmp_path.glob("*.seg")).name
+
+
+class Crash(Exception):
+    pass
+
+
+def interrupted_compaction(tmp_path, monkeypatch, target, when):
+    journal = SessionJournal(tmp_path, segment_bytes=400, retention_days=10 ** 5)
+    write(journal, 10)
+    journal.close()
+    real = getattr(target, when)
+
+    def crash(*args, **kwargs):
+        if str(args[-1 if target is os else 0]).endswith(".seg"):
+            raise Crash()
+        return real(*args, **kwargs)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(target, when, crash)
+        try:
+            SessionJournal(tmp_path, segment_bytes=4000, retention_days=10 ** 5).compact()
+        except Crash:
+            pass
+    return SessionJournal(tmp_path, segment_bytes=4000, retention_days=10 ** 5)
+
+
+def test_crash_after_publishing_merge_does_not_duplicate_rows(tmp_path, monkeypatch):
+    journal = interrupted_compaction(tmp_path, monkeypatch, minikube_tutorial.Path, "unlink")
+    assert len(list(tmp_path.glob("*.seg"))) > 1
+    assert len(journal.query()) == 10
+    journal.compact()
+    assert len(list(tmp_path.glob("*.seg"))) == 1 and len(journal.query()) == 10
+    assert not any("merged_from" in meta for meta in journal._read_index()["segments"].values())
+
+
+def test_crash_before_merged_file_appears_keeps_sources(tmp_path, monkeypatch):
+    journal = interrupted_compaction(tmp_path, monkeypatch, os, "replace")
+    assert list(tmp_path.glob("*-c*.tmp"))
+    assert len(journal.query()) == 10
+    report = journal.compact()
+    assert report["segments"] == 1 and len(journal.query()) == 10
+    assert not list(tmp_path.glob("*-c*.tmp"))
+
+
+def test_only_the_interactive_session_compacts(tmp_path, monkeypatch):
+    started = []
+    monkeypatch.setattr(SessionJournal, "compact_in_background", lambda self: started.append(self))
+    monkeypatch.setattr(minikube_tutorial.MinikubeTutorial, "TUTORIAL_DIR", tmp_path)
+    tutorial = minikube_tutorial.MinikubeTutorial()
+    assert not started
+    monkeypatch.setattr(tutorial, "print_menu", lambda: None)
+    monkeypatch.setattr("builtins.input", lambda prompt="": (_ for _ in ()).throw(KeyboardInterrupt))
+    try:
+        tutorial.run()
+    except KeyboardInterrupt:
+        pass
+    assert started == [tutorial.journal]
@@ -0,0 +1,65 @@
+from minikube_tutorial import SetupEngine, SystemCheck
+
+LEGACY = "python_check=done\nuv_install=done\nvenv_create=done\nrequirements_install=done\n"
+
+
+class FakeSetup(SetupEngine):
+    """Records which steps ran; the venv step creates the interpreter file a real venv would"""
+
+    def __init__(self, project_dir):
+        self.ran = []
+        super().__init__(project_dir, SystemCheck())
+
+    def _install_uv(self):
+        self.ran.append("uv_install")
+        return True, "uv already installed"
+
+    def _create_venv(self):
+        self.ran.append("venv_create")
+        (self.venv_dir / "bin").mkdir(parents=True, exist_ok=True)
+        (self.venv_dir / "bin" / "python").touch()
+        return True, "created"
+
+    def _install_requirements(self):
+        self.ran.append("requirements_install")
+        return True, "installed"
+
+
+def test_legacy_state_without_a_venv_recreates_it(tmp_path):
+    (tmp_path / ".setup_state").write_text(LEGACY)
+    engine = FakeSetup(tmp_path)
+    status = engine.status()
+    assert status["venv_create"] == "pending" and status["requirements_install"] == "pending"
+    assert status["python_check"] == "stale"
+    report = engine.run()
+    assert report["ok"] and "venv_create" in engine.ran and "requirements_install" in engine.ran
+    assert (tmp_path / ".venv" / "bin" / "python").exists()
+    assert set(engine.status().values()) == {"done"}
+
+
+def test_legacy_state_with_a_venv_is_stale_not_done(tmp_path):
+    (tmp_path / ".setup_state").write_text(LEGACY)
+    (tmp_path / ".venv" / "bin").mkdir(parents=True)
+    (tmp_path / ".venv" / "bin" / "python").touch()
+    assert set(FakeSetup(tmp_path).status().values()) == {"stale"}
+
+
+def test_missing_venv_after_a_recorded_run_is_pending(tmp_path):
+    engine = FakeSetup(tmp_path)
+    engine.run()
+    (tmp_path / ".venv" / "bin" / "python").unlink()
+    engine = FakeSetup(tmp_path)
+    assert engine.status()["venv_create"] == "pending"
+    engine.run()
+    assert engine.ran[-2:] == ["venv_create", "requirements_install"]
+
+
+def test_changed_requirements_rerun_only_the_install(tmp_path):
+    (tmp_path / "requirements.txt").write_text("requests==2.31.0\n")
+    FakeSetup(tmp_path).run()
+    (tmp_path / "requirements.txt").write_text("requests==2.32.0\n")
+    engine = FakeSetup(tmp_path)
+    assert engine.status()["requirements_install"] == "stale"
+    report = engine.run()
+    assert engine.ran == ["requirements_install"]
+    assert report["steps"]["venv_create"]["skipped"]
@@ -0,0 +1,107 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from minikube_tutorial import SpanStore, TraceCollector, generate_demo_traces
+
+MS = 1000000
+
+
+def span(trace_id, span_id, parent, name, start_ms, end_ms):
+    return {"traceId": trace_id, "spanId": span_id, "parentSpanId": parent, "name": name,
+            "startTimeUnixNano": str(start_ms * MS), "endTimeUnixNano": str(end_ms * MS)}
+
+
+def payload(service, *spans):
+    return {"resourceSpans": [{
+        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service}}]},
+        "scopeSpans": [{"spans": list(spans)}]}]}
+
+
+def store_with_trace():
+    store = SpanStore()
+    store.add_otlp(payload("frontend", span("t1", "a", "", "GET /", 0, 100)))
+    store.add_otlp(payload("backend", span("t1", "b", "a", "GET /api", 10, 90),
+                           span("t1", "c", "b", "cache.get", 12, 15)))
+    store.add_otlp(payload("postgres", span("t1", "d", "b", "SELECT", 15, 85)))
+    return store
+
+
+def test_spans_of_a_trace_arrive_across_payloads_and_come_back_in_start_order():
+    store = store_with_trace()
+    spans = store.trace("t1")
+    assert [(s["service"], s["operation"]) for s in spans] == [
+        ("frontend", "GET /"), ("backend", "GET /api"), ("backend", "cache.get"), ("postgres", "SELECT")]
+    assert spans[3]["duration_ms"] == 70.0 and spans[3]["parent_id"] == "b"
+    assert store.trace("missing") == []
+
+
+def test_trace_ids_by_service():
+    store = store_with_trace()
+    store.add_otlp(payload("frontend", span("t2", "x", "", "GET /health", 0, 1)))
+    assert store.trace_ids() == ["t1", "t2"]
+    assert sorted(store.trace_ids("frontend")) == ["t1", "t2"]
+    assert store.trace_ids("postgres") == ["t1"]
+    assert store.trace_ids("unknown-service") == []
+
+
+def test_spans_without_a_trace_id_or_service_name():
+    store = SpanStore()
+    accepted = store.add_otlp({"resourceSpans": [{"scopeSpans": [{"spans": [
+        span("", "a", "", "dropped", 0, 1), span("t1", "b", "", "kept", 0, 1)]}]}]})
+    assert accepted == 1 and store.trace("t1")[0]["service"] == "unknown"
+
+
+def test_critical_path_follows_the_child_finishing_last():
+    path = store_with_trace().critical_path("t1")
+    assert [s["operation"] for s in path] == ["GET /", "GET /api", "SELECT"]
+    assert path[0]["self_ms"] == 20.0 and path[1]["self_ms"] == 7.0
+
+
+def test_oldest_traces_are_evicted_past_max_spans():
+    store = SpanStore(max_spans=3)
+    for i in range(3):
+        store.add_otlp(payload("svc", span(f"t{i}", "a", "", "op", 0, 1), span(f"t{i}", "b", "a", "op", 0, 1)))
+    assert store.trace_ids() == ["t2"] and store.span_count == 2
+    assert store.trace_ids("svc") == ["t2"]
+
+
+def test_latency_report():
+    report = store_with_trace().latency_report()
+    assert report["traces"] == 1 and report["spans"] == 4
+    assert report["services"]["postgres"] == {"count": 1, "p50": 70.0, "p90": 70.0, "p99": 70.0, "max": 70.0}
+    assert report["slowest"][0]["trace_id"] == "t1" and report["slowest"][0]["duration_ms"] == 100.0
+
+
+@pytest.fixture
+def collector():
+    collector = TraceCollector(SpanStore(), port=0)
+    collector.start()
+    yield collector
+    collector.stop()
+
+
+def post(collector, body, path="/v1/traces", content_type="application/json"):
+    request = urllib.request.Request(f"http://127.0.0.1:{collector.port}{path}", data=body,
+                                     headers={"Content-Type": content_type})
+    return urllib.request.urlopen(request, timeout=5).status
+
+
+def test_collector_ingests_otlp_json(collector):
+    assert post(collector, json.dumps(payload("frontend", span("t1", "a", "", "GET /", 0, 5))).encode()) == 200
+    assert collector.store.trace_ids("frontend") == ["t1"]
+    assert generate_demo_traces(f"http://127.0.0.1:{collector.port}/v1/traces", traces=5, batch=2) == 5
+    assert len(collector.store.trace_ids("postgres")) == 5
+
+
+@pytest.mark.parametrize("path, body, content_type, status", [
+    ("/v1/metrics", b"{}", "application/json", 404),
+    ("/v1/traces", b"\x0a\x00", "application/x-protobuf", 415),
+    ("/v1/traces", b"not json", "application/json", 400),
+])
+def test_collector_rejects(collector, path, body, content_type, status):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        post(collector, body, path, content_type)
+    assert error.value.code == status
@@ -0,0 +1,89 @@
+import sys
+
+import pytest
+
+import minikube_tutorial
+from minikube_tutorial import StartAdvisor, parse_quantity
+
+
+@pytest.mark.parametrize("value, unit, expected", [
+    ("250m", "cpu", 0.25), ("2", "cpu", 2.0), ("500000u", "cpu", 0.5),
+    ("512Mi", "mem", 512), ("1Gi", "mem", 1024), ("1Pi", "mem", 1024 ** 3), ("1Ei", "mem", 1024 ** 4),
+    ("1P", "mem", 1e15 / 1048576), ("2E", "mem", 2e18 / 1048576), ("1048576", "mem", 1),
+])
+def test_parse_quantity(value, unit, expected):
+    assert parse_quantity(value, unit) == pytest.approx(expected)
+
+
+def test_docker_runtime_is_default_and_containerd_only_on_request():
+    advisor = StartAdvisor()
+    default = advisor.advise([], driver="docker")
+    assert default["container_runtime"] == "docker"
+    assert "--container-runtime=docker" in default["flags"]
+    assert not any("docker-env" in w for w in default["warnings"])
+    containerd = advisor.advise([], driver="docker", runtime="containerd")
+    assert "--container-runtime=containerd" in containerd["flags"]
+    assert any("docker-env" in w for w in containerd["warnings"])
+
+
+class FakeCheck:
+    def __init__(self, total_mb, available_mb):
+        self.meminfo = {"MemTotal": total_mb * 1024, "MemAvailable": available_mb * 1024}
+
+    def read_meminfo(self):
+        return self.meminfo
+
+    def read_cpu_flags(self):
+        return set()
+
+    def which(self, name):
+        return None
+
+
+def manifest(tmp_path):
+    path = tmp_path / "app.yaml"
+    path.write_text("kind: ConfigMap\nmetadata:\n  name: app\n")
+    return path
+
+
+@pytest.fixture
+def linux(monkeypatch):
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(minikube_tutorial, "read_cgroup_limits", lambda: (None, None))
+
+
+def test_memory_is_sized_from_available_not_total(linux):
+    host = StartAdvisor(FakeCheck(16384, 3072)).host()
+    assert host["memory_mb"] == 16384
+    assert host["available_memory_mb"] == host["usable_memory_mb"] == 3072
+
+
+def test_busy_host_caps_memory_at_available_minus_reserve(linux, tmp_path):
+    recipes_need = {"cpu": 0.0, "memory_mb": 8192.0, "storage_gb": 0.0, "images": 0}
+    advisor = StartAdvisor(FakeCheck(16384, 4096))
+    advisor.workload_requests = lambda docs: recipes_need
+    advice = advisor.advise([{"yaml": str(manifest(tmp_path))}], driver="docker")
+    assert advice["memory_mb"] == 4096 - StartAdvisor.HOST_RESERVE_MB
+    assert any("capped" in w for w in advice["warnings"])
+
+
+def test_idle_host_still_keeps_a_quarter_of_total(linux, tmp_path):
+    recipes_need = {"cpu": 0.0, "memory_mb": 16384.0, "storage_gb": 0.0, "images": 0}
+    advisor = StartAdvisor(FakeCheck(16384, 16000))
+    advisor.workload_requests = lambda docs: recipes_need
+    assert advisor.advise([{"yaml": str(manifest(tmp_path))}], driver="docker")["memory_mb"] == 12288
+
+
+def test_too_little_available_memory_warns(linux):
+    advice = StartAdvisor(FakeCheck(16384, 2048)).advise([], driver="docker")
+    assert advice["memory_mb"] == StartAdvisor.MIN_MEMORY_MB
+    assert any("Only 2048MB is available" in w for w in advice["warnings"])
+
+
+def test_vm_stat_available():
+    output = ("Mach Virtual Memory Statistics: (page size of 16384 bytes)\n"
+              "Pages free:                               65536.\n"
+              "Pages active:                            400000.\n"
+              "Pages inactive:                           65536.\n"
+              "Pages speculative:                            0.\n")
+    assert StartAdvisor.vm_stat_available(output) == 2048
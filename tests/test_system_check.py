@@ -0,0 +1,37 @@
+import sys
+
+import pytest
+
+import minikube_tutorial
+from minikube_tutorial import SystemCheck
+
+
+@pytest.mark.parametrize("status, state", [
+    ({"Name": "minikube", "Host": "Running"}, "Running"),
+    ([{"Name": "minikube", "Host": "Running"}, {"Name": "minikube-m02", "Host": "Running"}], "Running"),
+    ([{"Name": "minikube", "Host": "Running"}, {"Name": "minikube-m02", "Host": "Stopped"}], "Stopped"),
+    ([], "Unknown"),
+    ("oops", "Unknown"),
+])
+def test_cluster_state_handles_single_and_multi_node_status(status, state):
+    assert SystemCheck.cluster_state(status) == state
+
+
+@pytest.mark.parametrize("content, nested", [("Y\n", True), ("1\n", True), ("N\n", False), ("0\n", False)])
+def test_nested_reads_the_parameter_value(tmp_path, content, nested):
+    (tmp_path / "nested").write_text(content)
+    assert SystemCheck.read_nested((str(tmp_path / "missing"), str(tmp_path / "nested"))) is nested
+
+
+def test_nested_is_unknown_without_kvm(tmp_path):
+    assert SystemCheck.read_nested((str(tmp_path / "missing"),)) is None
+
+
+@pytest.mark.parametrize("flags, code", [([], 0), (["--strict"], 1)])
+def test_detect_is_informational_unless_strict(monkeypatch, tmp_path, capsys, flags, code):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(SystemCheck, "run", lambda self, quick=False: {"ok": False, "checks": []})
+    monkeypatch.setattr(sys, "argv", ["minikube_tutorial.py", "detect", "--json"] + flags)
+    with pytest.raises(SystemExit) as exit_info:
+        minikube_tutorial.main()
+    assert exit_info.value.code == code
@@ -0,0 +1,100 @@
+import json
+from pathlib import Path
+
+from minikube_tutorial import ManifestParser, TieredDeploy, apply_labelled
+
+MANIFEST = """# Database
+apiVersion: v1
+kind: Service
+metadata:
+  name: db
+spec:
+  selector:
+    app: db
+  ports:
+  - port: 5432
+---
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: db
+spec:
+  template:
+    metadata:
+      labels:
+        app: db
+    spec:
+      containers:
+      - name: db
+        image: postgres:16
+        env:
+        - name: PGDATA
+          value: "0755"   # stays a string only in the source text
+---
+---
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: web
+spec:
+  template:
+    metadata:
+      labels:
+        app: web
+    spec:
+      containers:
+      - name: web
+        image: nginx
+        env:
+        - name: DATABASE_HOST
+          value: db
+"""
+
+
+def test_sections_keep_each_documents_text():
+    sections = ManifestParser(MANIFEST).sections()
+    assert [doc["metadata"]["name"] for doc, _ in sections] == ["db", "db", "web"]
+    assert "".join(text for _, text in sections) == MANIFEST.replace("---\n", "")
+
+
+def test_run_labels_original_text_before_applying():
+    sections = ManifestParser(MANIFEST).sections()
+    plan = TieredDeploy.plan([doc for doc, _ in sections], sources=[text for _, text in sections])
+    assert [level["name"] for level in plan] == ["config, storage and services", "tier 1: db", "tier 2: web"]
+    labelled, applied, calls = [], [], []
+
+    def runner(cmd, description, timeout=30):
+        calls.append(cmd[:2])
+        if cmd[1] == "label":
+            # kubectl reads the object's own YAML text and prints it relabelled
+            assert cmd[2] == "--local" and cmd[-1] == "managed-by=minikube-tutorial"
+            with open(cmd[4]) as f:
+                labelled.append(f.read())
+            return True, json.dumps({"source": labelled[-1]})
+        if cmd[1] == "apply":
+            with open(cmd[3]) as f:
+                applied.append(json.load(f)["source"])
+        return True, ""
+
+    report = TieredDeploy(runner).run(plan, ["managed-by=minikube-tutorial"])
+    assert report["ok"]
+    assert sorted(labelled) == sorted(applied) == sorted(text for _, text in sections)
+    assert calls.count(["kubectl", "label"]) == 3 and calls.count(["kubectl", "rollout"]) == 2
+    assert all("labels" not in (doc.get("metadata") or {}) or "managed-by" not in doc["metadata"]["labels"]
+               for doc, _ in sections)
+
+
+def test_apply_labelled_stages_kubectl_output_and_removes_it():
+    staged = []
+
+    def runner(cmd, description, timeout=30):
+        if cmd[1] == "label":
+            return True, '{"kind": "List", "items": []}'
+        staged.append(Path(cmd[3]))
+        assert staged[-1].read_text() == '{"kind": "List", "items": []}'
+        return True, "applied"
+
+    assert apply_labelled(runner, "app.yaml", ["a=b"], "Deploying") == (True, "applied")
+    assert staged and not staged[0].exists()
+    assert apply_labelled(lambda cmd, description, timeout=30: (True, "not json"), "app.yaml", ["a=b"],
+                          "Deploying")[0] is False